@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark concurrent Drive uploads with PooledGoogleDriveClient.
+
+Usage:
+    poetry run python benchmarks/bench_drive_upload.py [--workers 1 4 16]
+        [--uploads N] [--size BYTES] [--latency SECONDS]
+
+Uploads are sent through the real googleapiclient request path, but to a
+local HTTP/1.1 stand-in for the Drive API that answers every upload after
+the given latency. Reported are uploads/sec per worker count and the number
+of TCP connections the stand-in accepted, which stays at one per worker
+when keep-alive connections are reused.
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+import httplib2  # type: ignore
+from google.oauth2.credentials import Credentials
+
+from solution_desk_engine.integrations.google_drive import PooledGoogleDriveClient
+
+DRIVE_ROOT = "https://www.googleapis.com/"
+
+
+class DriveStandIn(ThreadingHTTPServer):
+    """Local HTTP server answering Drive file create requests."""
+
+    daemon_threads = True
+
+    def __init__(self, latency: float) -> None:
+        super().__init__(("127.0.0.1", 0), _DriveHandler)
+        self.latency = latency
+        self.connections = 0
+        self.uploads = 0
+        self.lock = threading.Lock()
+
+    @property
+    def root_url(self) -> str:
+        """Base URL standing in for https://www.googleapis.com/."""
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+
+class _DriveHandler(BaseHTTPRequestHandler):
+    """Request handler with HTTP/1.1 keep-alive."""
+
+    protocol_version = "HTTP/1.1"
+    server: DriveStandIn
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.server.latency)
+        with self.server.lock:
+            self.server.uploads += 1
+            file_id = f"file-{self.server.uploads}"
+
+        body = json.dumps(
+            {"id": file_id, "name": file_id, "webViewLink": f"https://docs/{file_id}"}
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the benchmark output quiet."""
+
+
+def http_factory(root_url: str) -> Callable[[], httplib2.Http]:
+    """Build transports that send Drive API requests to the stand-in."""
+
+    class _StandInHttp(httplib2.Http):  # type: ignore[misc]
+        def request(self, uri: str, *args: Any, **kwargs: Any) -> Any:
+            return super().request(uri.replace(DRIVE_ROOT, root_url), *args, **kwargs)
+
+    return _StandInHttp
+
+
+class _BenchClient(PooledGoogleDriveClient):
+    """Pooled client authenticated with a static token."""
+
+    def _authenticate(self) -> Credentials:
+        return Credentials(token="benchmark")
+
+
+def bench(server: DriveStandIn, workers: int, uploads: int, size: int) -> float:
+    """Upload documents concurrently and return the elapsed seconds."""
+    client = _BenchClient(http_factory=http_factory(server.root_url))
+    content = b"\0" * size
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(
+            executor.map(
+                lambda index: client.upload_docx_bytes_as_google_doc(
+                    content, f"SOW {index}"
+                ),
+                range(uploads),
+            )
+        )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print uploads/sec per worker count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--uploads", type=int, default=64)
+    parser.add_argument("--size", type=int, default=50_000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    server = DriveStandIn(args.latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(
+        f"{args.uploads} uploads of {args.size} bytes, "
+        f"{args.latency * 1000:.0f} ms server latency"
+    )
+    print(
+        f"{'workers':>7} {'seconds':>8} {'uploads/s':>10} {'speedup':>8} {'conns':>6}"
+    )
+    baseline = None
+    try:
+        for workers in args.workers:
+            connections = server.connections
+            elapsed = bench(server, workers, args.uploads, args.size)
+            baseline = baseline or elapsed
+            print(
+                f"{workers:>7} {elapsed:>8.3f} {args.uploads / elapsed:>10.1f} "
+                f"{baseline / elapsed:>7.2f}x {server.connections - connections:>6}"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
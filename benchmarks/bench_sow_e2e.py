@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""End-to-end SOW generation benchmark against an offline Drive stand-in.
+
+Usage:
+    poetry run python benchmarks/bench_sow_e2e.py [--pages 1 20 200]
+        [--iterations N] [--batch N] [--latency SECONDS]
+        [--output FILE] [--compare BASELINE] [--tolerance 0.25]
+
+For each synthetic template size (pages of text, a table and an image), a
+fresh process seeds a LocalDriveClient directory and drives SOWGenerator
+through download, render and upload. It reports single-SOW latency
+(p50/p95), mean per-stage time, batch renders/sec and peak RSS. Results are
+written as JSON; with --compare, metrics that regressed by more than the
+tolerance are listed and the exit status is non-zero.
+"""
+
+import argparse
+import io
+import json
+import platform
+import resource
+import statistics
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, List
+
+from docx import Document  # type: ignore
+from docx.enum.text import WD_BREAK  # type: ignore
+from docx.shared import Inches  # type: ignore
+
+from solution_desk_engine.integrations.local_drive import LocalDriveClient
+from solution_desk_engine.sow.generation_manifest import ENGINE_VERSION
+from solution_desk_engine.sow.sow_generator import (
+    SOWBatchItem,
+    SOWContext,
+    SOWGenerator,
+)
+
+DEFAULT_OUTPUT = Path(__file__).parent / "baselines" / "sow_e2e.json"
+
+# Metrics where a larger value is a regression; renders/sec is the opposite
+LOWER_IS_BETTER = ("latency_p50_seconds", "latency_p95_seconds", "peak_rss_mb")
+
+
+def build_png(width: int = 64, height: int = 64) -> bytes:
+    """Build a small gradient PNG without any imaging dependency."""
+    rows = b"".join(
+        b"\x00"
+        + bytes(
+            value for x in range(width) for value in (x * 4 % 256, y * 4 % 256, 128)
+        )
+        for y in range(height)
+    )
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+def build_template(pages: int) -> bytes:
+    """Build a synthetic SOW template of roughly the given number of pages."""
+    image = build_png()
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "{{ customer_name }} - Confidential"
+
+    for page in range(pages):
+        doc.add_heading(
+            f"{page + 1}. {{{{ project_name }}}} for {{{{ customer_name }}}}"
+        )
+        for index in range(6):
+            doc.add_paragraph(
+                f"{page + 1}.{index + 1} {{{{ contractor_name }}}} will deliver "
+                "{{ project_name }} for {{ customer_name }} by {{ sow_end_date }}, "
+                "within a budget of {{ max_total_cost }}."
+            )
+        table = doc.add_table(rows=4, cols=3)
+        for row in table.rows:
+            row.cells[0].text = "{{ contractor_poc_name }}"
+            row.cells[1].text = "{{ google_poc_name }}"
+            row.cells[2].text = "{{ max_total_cost }}"
+        doc.add_picture(io.BytesIO(image), width=Inches(1.5))
+        if page < pages - 1:
+            doc.add_paragraph().add_run().add_break(WD_BREAK.PAGE)
+
+    output = io.BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+def context(index: int) -> SOWContext:
+    """Create a distinct SOW context."""
+    return SOWContext(
+        customer_name=f"Customer {index}",
+        project_name="Franchise Lease Management",
+        contractor_poc_name="Jane Smith",
+        google_poc_name="John Doe",
+        max_total_cost=f"${index * 1000:,}",
+        sow_end_date="June 30, 2025",
+    )
+
+
+def peak_rss_mb() -> float:
+    """Get this process's peak resident set size in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def bench_template(
+    pages: int, iterations: int, batch: int, latency: float
+) -> Dict[str, Any]:
+    """Benchmark one template size; run in a fresh process per size."""
+    template_bytes = build_template(pages)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root_dir = Path(temp_dir)
+        (root_dir / "template.docx").write_bytes(template_bytes)
+        drive = LocalDriveClient(root_dir, latency_seconds=latency)
+
+        generator = SOWGenerator(drive, in_memory=True, collect_timings=True)
+        latencies: List[float] = []
+        stages: Dict[str, List[float]] = {}
+        for index in range(iterations):
+            start = time.perf_counter()
+            result = generator.generate_sow("template", context(index), f"SOW {index}")
+            latencies.append(time.perf_counter() - start)
+            for name, stage in result["timings"]["stages"].items():
+                stages.setdefault(name, []).append(stage["seconds"])
+
+        items = [
+            SOWBatchItem(context(index), f"Batch SOW {index}") for index in range(batch)
+        ]
+        start = time.perf_counter()
+        results = SOWGenerator(drive, in_memory=True).generate_many("template", items)
+        batch_seconds = time.perf_counter() - start
+        failures = sum(1 for item in results if not item.success)
+
+    latencies.sort()
+    return {
+        "template_bytes": len(template_bytes),
+        "latency_p50_seconds": round(statistics.median(latencies), 6),
+        "latency_p95_seconds": round(
+            latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 6
+        ),
+        "stage_mean_seconds": {
+            name: round(statistics.mean(values), 6) for name, values in stages.items()
+        },
+        "batch_size": batch,
+        "batch_failures": failures,
+        "renders_per_second": round(batch / batch_seconds, 2),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """List metrics that regressed by more than the tolerance."""
+    regressions = []
+    for pages, current in results["templates"].items():
+        previous = baseline.get("templates", {}).get(pages)
+        if previous is None:
+            continue
+        for metric in LOWER_IS_BETTER:
+            if current[metric] > previous[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{pages} pages: {metric} {previous[metric]} -> {current[metric]}"
+                )
+        if current["renders_per_second"] < previous["renders_per_second"] * (
+            1 - tolerance
+        ):
+            regressions.append(
+                f"{pages} pages: renders_per_second "
+                f"{previous['renders_per_second']} -> {current['renders_per_second']}"
+            )
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark, print a summary and write the JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 20, 200])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--batch", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    # Read the baseline up front, since it may be the file about to be written
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    results: Dict[str, Any] = {
+        "engine_version": ENGINE_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "iterations": args.iterations,
+            "batch": args.batch,
+            "latency_seconds": args.latency,
+        },
+        "templates": {},
+    }
+
+    print(
+        f"{'pages':>5} {'bytes':>9} {'p50 s':>8} {'p95 s':>8} "
+        f"{'renders/s':>10} {'rss MB':>7}  stages (mean s)"
+    )
+    for pages in args.pages:
+        # A fresh process per size keeps peak RSS attributable to that size
+        with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor:
+            metrics = executor.submit(
+                bench_template, pages, args.iterations, args.batch, args.latency
+            ).result()
+        results["templates"][str(pages)] = metrics
+        stages = ", ".join(
+            f"{name}={seconds:.4f}"
+            for name, seconds in metrics["stage_mean_seconds"].items()
+        )
+        print(
+            f"{pages:>5} {metrics['template_bytes']:>9} "
+            f"{metrics['latency_p50_seconds']:>8.4f} "
+            f"{metrics['latency_p95_seconds']:>8.4f} "
+            f"{metrics['renders_per_second']:>10.1f} "
+            f"{metrics['peak_rss_mb']:>7.1f}  {stages}"
+        )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"Results written to {args.output}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} of {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark SOW template rendering: per-render DocxTemplate vs CompiledTemplate.
+
+Usage:
+    poetry run python benchmarks/bench_sow_render.py [--paragraphs N] [--counts ...]
+
+The "current" path mirrors SOWGenerator._process_template: a new DocxTemplate
+is loaded from disk and saved back to disk for every context. The "compiled"
+path parses the template once and renders every context from memory.
+"""
+
+import argparse
+import io
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from docx import Document  # type: ignore
+
+from solution_desk_engine.sow.compiled_template import CompiledTemplate
+from solution_desk_engine.sow.sow_generator import SOWContext, SOWGenerator
+
+
+def build_template(paragraphs: int) -> bytes:
+    """Build a synthetic SOW template with the given number of paragraphs."""
+    doc = Document()
+    doc.add_heading("Statement of Work - {{ customer_name }}", level=1)
+    for index in range(paragraphs):
+        doc.add_paragraph(
+            f"{index}. {{{{ contractor_name }}}} will deliver {{{{ project_name }}}} "
+            "for {{ customer_name }} by {{ sow_end_date }}."
+        )
+    table = doc.add_table(rows=10, cols=3)
+    for row in table.rows:
+        row.cells[0].text = "{{ contractor_poc_name }}"
+        row.cells[1].text = "{{ google_poc_name }}"
+        row.cells[2].text = "{{ max_total_cost }}"
+    doc.sections[0].header.paragraphs[0].text = "{{ customer_name }} - Confidential"
+    output = io.BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+def contexts(count: int) -> List[SOWContext]:
+    """Create distinct SOW contexts."""
+    return [
+        SOWContext(
+            customer_name=f"Customer {index}",
+            project_name="Franchise Lease Management",
+            max_total_cost=f"${index * 1000:,}",
+        )
+        for index in range(count)
+    ]
+
+
+def bench_current(template_bytes: bytes, items: List[SOWContext]) -> float:
+    """Render with a fresh DocxTemplate per context, via temporary files."""
+    generator = SOWGenerator(google_drive_client=object())  # type: ignore
+    with tempfile.TemporaryDirectory() as temp_dir:
+        template_path = Path(temp_dir) / "template.docx"
+        template_path.write_bytes(template_bytes)
+        output_path = str(Path(temp_dir) / "generated_sow.docx")
+
+        start = time.perf_counter()
+        for context in items:
+            generator._process_template(str(template_path), context, output_path)
+        return time.perf_counter() - start
+
+
+def bench_compiled(template_bytes: bytes, items: List[SOWContext]) -> float:
+    """Compile the template once, then render every context from memory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        template_path = Path(temp_dir) / "template.docx"
+        template_path.write_bytes(template_bytes)
+        output_path = str(Path(temp_dir) / "generated_sow.docx")
+
+        start = time.perf_counter()
+        template = CompiledTemplate(str(template_path))
+        for context in items:
+            template.render(context.to_dict(), output_path)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print renders/sec per path and context count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=100)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 10, 500])
+    args = parser.parse_args()
+
+    template_bytes = build_template(args.paragraphs)
+    paths: Dict[str, Callable[[bytes, List[SOWContext]], float]] = {
+        "current": bench_current,
+        "compiled": bench_compiled,
+    }
+
+    print(f"Template: {args.paragraphs} paragraphs, {len(template_bytes)} bytes")
+    print(
+        f"{'contexts':>8}  {'path':<9} {'seconds':>9} {'renders/s':>10} {'speedup':>8}"
+    )
+    for count in args.counts:
+        items = contexts(count)
+        baseline = None
+        for name, bench in paths.items():
+            elapsed = bench(template_bytes, items)
+            baseline = baseline or elapsed
+            print(
+                f"{count:>8}  {name:<9} {elapsed:>9.3f} {count / elapsed:>10.1f} "
+                f"{baseline / elapsed:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
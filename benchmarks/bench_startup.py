@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Benchmark cold-start time to the first Drive request of the CLI.
+
+Usage:
+    poetry run python benchmarks/bench_startup.py [--runs N]
+
+Each run starts a fresh interpreter executing
+``solution-desk-engine sow validate-template``, authenticated with a static
+token and with Drive API requests sent to a local stand-in that timestamps
+the first request it receives. Runs are repeated with services built the
+way googleapiclient does by default (``build()``, rebuilding nested
+resources on every call) and with the cached discovery documents and
+memoized services, and the median time-to-first-request of each is
+reported. Per-call service construction costs are reported as well.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Run in the child interpreter: route Drive requests to the stand-in and,
+# for the baseline, build services with googleapiclient's build()
+CHILD = """
+import sys, httplib2
+root_url = sys.argv[1]
+request = httplib2.Http.request
+httplib2.Http.request = lambda self, uri, *a, **k: request(
+    self, uri.replace("https://www.googleapis.com/", root_url), *a, **k
+)
+if sys.argv[2] == "build":
+    from googleapiclient.discovery import build
+    from solution_desk_engine.integrations import google_drive
+    google_drive.build_service = lambda api, version, credentials=None, http=None: (
+        build(api, version, http=http)
+        if http is not None
+        else build(api, version, credentials=credentials)
+    )
+from solution_desk_engine.cli import cli
+cli(["sow", "validate-template", "--template-id", "template"])
+"""
+
+
+class DriveStandIn(ThreadingHTTPServer):
+    """Local HTTP server recording when the first request arrives."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _DriveHandler)
+        self.first_request: Optional[float] = None
+
+    @property
+    def root_url(self) -> str:
+        """Base URL standing in for https://www.googleapis.com/."""
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+
+class _DriveHandler(BaseHTTPRequestHandler):
+    """Answers every request with a 404, ending the CLI run."""
+
+    server: DriveStandIn
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.server.first_request is None:
+            self.server.first_request = time.perf_counter()
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"error": {"code": 404, "message": "Not found"}})
+        self.send_response(404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+    do_GET = do_POST  # noqa: N815
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the benchmark output quiet."""
+
+
+def time_to_first_request(server: DriveStandIn, home: Path, mode: str) -> float:
+    """Run the CLI in a fresh interpreter and time its first Drive request."""
+    env = {**os.environ, "HOME": str(home)}
+    server.first_request = None
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", CHILD, server.root_url, mode],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    if server.first_request is None:
+        raise RuntimeError("The CLI did not send any request to the stand-in")
+    return server.first_request - start
+
+
+def write_token(home: Path) -> None:
+    """Store a token the Drive client accepts without an OAuth flow."""
+    token_path = home / ".solution-desk-engine" / "google_token.json"
+    token_path.parent.mkdir(parents=True)
+    token_path.write_text(
+        json.dumps(
+            {
+                "token": "benchmark",
+                "refresh_token": "benchmark",
+                "client_id": "benchmark",
+                "client_secret": "benchmark",
+                "expiry": "2099-01-01T00:00:00Z",
+            }
+        )
+    )
+
+
+def per_call(function: Callable[[], Any], repeat: int = 20) -> float:
+    """Get the mean seconds of a call after the first."""
+    function()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def construction_costs() -> Dict[str, float]:
+    """Measure service construction and nested resource access."""
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import build
+
+    from solution_desk_engine.integrations.discovery import build_service
+
+    credentials = Credentials(token="benchmark")
+    drive = build("drive", "v3", credentials=credentials)
+    docs = build("docs", "v1", credentials=credentials)
+    cached_drive = build_service("drive", "v3", credentials=credentials)
+    cached_docs = build_service("docs", "v1", credentials=credentials)
+    return {
+        "build('drive', 'v3')": per_call(
+            lambda: build("drive", "v3", credentials=credentials)
+        ),
+        "build_service('drive', 'v3')": per_call(
+            lambda: build_service("drive", "v3", credentials=credentials)
+        ),
+        "drive.files()": per_call(drive.files),
+        "cached drive.files()": per_call(cached_drive.files),
+        "docs.documents()": per_call(docs.documents),
+        "cached docs.documents()": per_call(cached_docs.documents),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    server = DriveStandIn()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    results: Dict[str, List[float]] = {"build": [], "cached": []}
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            home = Path(temp_dir)
+            write_token(home)
+            # Alternate modes so that disk caches warm both equally
+            for _ in range(args.runs):
+                for mode, timings in results.items():
+                    timings.append(time_to_first_request(server, home, mode))
+    finally:
+        server.shutdown()
+
+    print(f"Time to first request of sow validate-template ({args.runs} runs)")
+    for mode, timings in results.items():
+        print(
+            f"  {mode:<8} median {statistics.median(timings) * 1000:7.1f} ms  "
+            f"min {min(timings) * 1000:7.1f} ms"
+        )
+
+    print("Service construction (mean per call)")
+    for name, seconds in construction_costs().items():
+        print(f"  {name:<30} {seconds * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,9 @@ Extends convert_to_docx.py functionality with Google Drive integration.
 """
 
 import argparse
+import importlib.util
 import json
+import shutil
 import sys
 import tempfile
 from datetime import datetime
@@ -28,7 +30,6 @@ try:
     from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
     from googleapiclient.http import MediaFileUpload
 except ImportError:
@@ -38,11 +39,42 @@ except ImportError:
     )
     sys.exit(1)
 
+# Cached service construction, rate-limited, retrying request execution,
+# resumable uploads and folder resolution shared with solution-desk-engine,
+# imported from the repository's src tree when the package is not installed
+if importlib.util.find_spec("solution_desk_engine") is None:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+try:
+    from solution_desk_engine.integrations.content_hash import (
+        app_properties,
+        content_hash_query,
+        hash_bytes,
+    )
+    from solution_desk_engine.integrations.discovery import build_service
+    from solution_desk_engine.integrations.folder_resolver import FolderResolver
+    from solution_desk_engine.integrations.request_executor import (
+        DOCS_WRITES_PER_MINUTE,
+        RequestExecutor,
+    )
+    from solution_desk_engine.integrations.resumable_upload import (
+        DEFAULT_CHUNK_SIZE,
+        UploadJournal,
+        upload_resumable,
+        validate_chunk_size,
+    )
+except ImportError:
+    print("Error: solution_desk_engine package not found.")
+    print("Run: poetry install (from the repository root)")
+    sys.exit(1)
+
 # Configuration
 OUTPUT_DIR = Path("../googledocs")
 CREDENTIALS_DIR = Path("../../credentials")
 METADATA_DIR = Path("../_metadata")
 
+# Bump when the DOCX conversion changes so unchanged sources are uploaded again
+CONVERTER_VERSION = 1
+
 # Google API scopes
 SCOPES = [
     "https://www.googleapis.com/auth/documents",
@@ -53,14 +85,33 @@ SCOPES = [
 class GoogleDocsProcessor(DocxProcessor):
     """Extends DocumentProcessor to create Google Docs via DOCX upload."""
 
-    def __init__(self, output_dir: Path, credentials_path: Path, verbose: bool = False):
+    def __init__(
+        self,
+        output_dir: Path,
+        credentials_path: Path,
+        verbose: bool = False,
+        deduplicate: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
         super().__init__(output_dir, verbose)
         self.credentials_path = credentials_path
+        self.deduplicate = deduplicate
+        self.chunk_size = validate_chunk_size(chunk_size)
         self.temp_dir = Path(tempfile.mkdtemp())
+        # DOCX files whose upload has not completed are kept here, so an
+        # interrupted upload resumes with exactly the bytes it started with
+        self.pending_dir = output_dir / ".pending-uploads"
+        self.upload_journal = UploadJournal(self.pending_dir / "upload_journal.json")
+        self.upload_reports = []
         self.service = None
         self.drive_service = None
         self.created_docs = []
-        self.folder_cache = {}
+        # Folder IDs survive across runs; parallel workers share one lookup
+        # or creation per folder
+        self.folder_resolver = FolderResolver(METADATA_DIR / "drive_folders.json")
+        # Parallel workers share these, keeping the whole run within quota
+        self.drive_executor = RequestExecutor()
+        self.docs_executor = RequestExecutor(DOCS_WRITES_PER_MINUTE, burst=1)
 
         # Setup Google API services
         self._setup_google_services()
@@ -69,8 +120,8 @@ class GoogleDocsProcessor(DocxProcessor):
         """Authenticate and setup Google API services."""
         try:
             creds = self._authenticate()
-            self.service = build("docs", "v1", credentials=creds)
-            self.drive_service = build("drive", "v3", credentials=creds)
+            self.service = build_service("docs", "v1", credentials=creds)
+            self.drive_service = build_service("drive", "v3", credentials=creds)
             self.logger.info("Google API services initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to setup Google services: {e}")
@@ -107,46 +158,83 @@ class GoogleDocsProcessor(DocxProcessor):
         folder_structure = self.branding.create_google_drive_folder_structure()
         branded_name = folder_structure.get("phases", {}).get(folder_name, folder_name)
 
-        cache_key = f"{parent_id}:{branded_name}"
-        if cache_key in self.folder_cache:
-            return self.folder_cache[cache_key]
-
         try:
-            # Search for existing folder
-            query = f"name='{branded_name}' and mimeType='application/vnd.google-apps.folder'"
-            if parent_id:
-                query += f" and '{parent_id}' in parents"
+            return self.folder_resolver.resolve(
+                [branded_name], self._find_folder, self._create_folder, parent_id
+            )
+        except HttpError as e:
+            self.logger.error(f"Error creating/getting folder {branded_name}: {e}")
+            return None
 
-            results = self.drive_service.files().list(q=query).execute()
-            items = results.get("files", [])
+    def _find_folder(self, name: str, parent_id: Optional[str]) -> Optional[str]:
+        """Search Google Drive for an existing folder."""
+        escaped = name.replace("\\", "\\\\").replace("'", "\\'")
+        query = (
+            f"name='{escaped}' and mimeType='application/vnd.google-apps.folder' "
+            "and trashed=false"
+        )
+        if parent_id:
+            query += f" and '{parent_id}' in parents"
 
-            if items:
-                folder_id = items[0]["id"]
-                self.logger.info(f"Found existing folder: {branded_name}")
-            else:
-                # Create new folder
-                folder_metadata = {
-                    "name": branded_name,
-                    "mimeType": "application/vnd.google-apps.folder",
-                }
-                if parent_id:
-                    folder_metadata["parents"] = [parent_id]
+        results = self.drive_executor.execute(
+            self.drive_service.files().list(q=query, fields="files(id)"),
+            "drive.files.list",
+        )
+        items = results.get("files", [])
+        if items:
+            self.logger.info(f"Found existing folder: {name}")
+            return items[0]["id"]
+        return None
+
+    def _create_folder(self, name: str, parent_id: Optional[str]) -> str:
+        """Create a Google Drive folder."""
+        folder_metadata = {
+            "name": name,
+            "mimeType": "application/vnd.google-apps.folder",
+        }
+        if parent_id:
+            folder_metadata["parents"] = [parent_id]
 
-                folder = (
-                    self.drive_service.files().create(body=folder_metadata).execute()
-                )
-                folder_id = folder.get("id")
-                self.logger.info(f"Created new folder: {branded_name}")
+        folder = self.drive_executor.execute(
+            self.drive_service.files().create(body=folder_metadata, fields="id"),
+            "drive.files.create",
+        )
+        self.logger.info(f"Created new folder: {name}")
+        return folder.get("id")
 
-            self.folder_cache[cache_key] = folder_id
-            return folder_id
+    def _find_uploaded_doc(
+        self, content_hash: str, folder_id: str = None
+    ) -> Optional[dict]:
+        """Find a Google Doc an earlier run uploaded from the same source."""
+        try:
+            results = self.drive_executor.execute(
+                self.drive_service.files().list(
+                    q=content_hash_query(content_hash, folder_id),
+                    fields="files(id,name,webViewLink)",
+                    pageSize=1,
+                ),
+                "drive.files.list",
+            )
+            files = results.get("files", [])
+            if not files:
+                return None
+            return {
+                "id": files[0]["id"],
+                "name": files[0]["name"],
+                "link": files[0].get("webViewLink"),
+            }
 
         except HttpError as e:
-            self.logger.error(f"Error creating/getting folder {branded_name}: {e}")
+            self.logger.warning(f"Could not search for uploaded documents: {e}")
             return None
 
     def _upload_docx_as_google_doc(
-        self, docx_path: Path, title: str, folder_id: str = None
+        self,
+        docx_path: Path,
+        title: str,
+        folder_id: str = None,
+        properties: Optional[dict] = None,
+        journal_key: Optional[str] = None,
     ) -> Optional[str]:
         """Upload DOCX file to Google Drive and convert to Google Docs."""
         try:
@@ -155,6 +243,8 @@ class GoogleDocsProcessor(DocxProcessor):
                 "name": title,
                 "mimeType": "application/vnd.google-apps.document",  # Convert to Google Doc
             }
+            if properties:
+                file_metadata["appProperties"] = properties
 
             if folder_id:
                 file_metadata["parents"] = [folder_id]
@@ -163,21 +253,39 @@ class GoogleDocsProcessor(DocxProcessor):
             media = MediaFileUpload(
                 str(docx_path),
                 mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                chunksize=self.chunk_size,
                 resumable=True,
             )
 
-            file = (
-                self.drive_service.files()
-                .create(
-                    body=file_metadata, media_body=media, fields="id,name,webViewLink"
-                )
-                .execute()
+            request = self.drive_service.files().create(
+                body=file_metadata, media_body=media, fields="id,name,webViewLink"
             )
+            # Send the upload chunk by chunk so a failed chunk is retried
+            # from where the resumable session left off, and a session
+            # interrupted in an earlier run is resumed
+            file, report = upload_resumable(
+                request,
+                self.drive_executor,
+                title,
+                "drive.files.create.upload",
+                self.upload_journal,
+                journal_key,
+            )
+            self.upload_reports.append(report)
 
             doc_id = file.get("id")
             web_link = file.get("webViewLink")
 
-            self.logger.info(f"Successfully uploaded: {title} (ID: {doc_id})")
+            resumed = (
+                f", resumed at {report.resumed_from / 1024:.1f} KB"
+                if report.resumed_from
+                else ""
+            )
+            self.logger.info(
+                f"Successfully uploaded: {title} (ID: {doc_id}) - "
+                f"{report.bytes / 1024:.1f} KB in {report.seconds:.2f}s "
+                f"({report.throughput / 1024:.1f} KB/s{resumed})"
+            )
 
             return {"id": doc_id, "name": file.get("name"), "link": web_link}
 
@@ -188,14 +296,6 @@ class GoogleDocsProcessor(DocxProcessor):
     def convert_file(self, input_path: Path, output_path: Path) -> bool:
         """Convert markdown file to Google Doc via DOCX."""
         try:
-            # Create temporary DOCX file
-            temp_docx = self.temp_dir / f"{input_path.stem}.docx"
-
-            # Use parent class to create DOCX
-            success = super().convert_file(input_path, temp_docx)
-            if not success:
-                return False
-
             # Extract metadata for naming
             with open(input_path, "r", encoding="utf-8") as f:
                 content = f.read()
@@ -218,8 +318,40 @@ class GoogleDocsProcessor(DocxProcessor):
             else:
                 title = brand_metadata["title"]
 
-            # Upload to Google Drive as Google Doc
-            doc_info = self._upload_docx_as_google_doc(temp_docx, title, folder_id)
+            # A source unchanged since an earlier run, converted by the same
+            # converter and branding, keeps its Google Doc, found by the hash
+            # stamped on it at upload
+            content_hash = hash_bytes(
+                f"{CONVERTER_VERSION}\n{brand_metadata['version']}\n"
+                f"{title}\n{content}".encode("utf-8")
+            )
+            doc_info = None
+            if self.deduplicate:
+                doc_info = self._find_uploaded_doc(content_hash, folder_id)
+
+            temp_docx = None
+            if doc_info:
+                self.logger.info(f"Unchanged, reusing: {title} (ID: {doc_info['id']})")
+            else:
+                # Use parent class to create the DOCX file, unless an
+                # interrupted upload of the same source left one behind
+                temp_docx = self.pending_dir / f"{content_hash}.docx"
+                if not temp_docx.exists():
+                    built_docx = self.temp_dir / f"{content_hash}.docx"
+                    success = super().convert_file(input_path, built_docx)
+                    if not success:
+                        return False
+                    self.pending_dir.mkdir(parents=True, exist_ok=True)
+                    shutil.move(str(built_docx), str(temp_docx))
+
+                # Upload to Google Drive as Google Doc
+                doc_info = self._upload_docx_as_google_doc(
+                    temp_docx,
+                    title,
+                    folder_id,
+                    app_properties(content_hash, input_path),
+                    journal_key=content_hash,
+                )
 
             if doc_info:
                 # Log success with Google Doc info
@@ -230,7 +362,7 @@ class GoogleDocsProcessor(DocxProcessor):
                         "google_doc_id": doc_info["id"],
                         "google_doc_name": doc_info["name"],
                         "google_doc_link": doc_info["link"],
-                        "status": "success",
+                        "status": "success" if temp_docx else "reused",
                         "metadata": metadata,
                         "timestamp": datetime.now().isoformat(),
                     }
@@ -239,7 +371,8 @@ class GoogleDocsProcessor(DocxProcessor):
                 self.created_docs.append(doc_info)
 
                 # Clean up temp file
-                temp_docx.unlink()
+                if temp_docx is not None:
+                    temp_docx.unlink()
 
                 if self.verbose:
                     self.logger.info(f"Created Google Doc: {title}")
@@ -269,7 +402,9 @@ class GoogleDocsProcessor(DocxProcessor):
             # Create index document
             index_title = f"[CLIENT] F&I Documentation Index - {datetime.now().strftime('%Y-%m-%d')}"
             doc_body = {"title": index_title}
-            doc = self.service.documents().create(body=doc_body).execute()
+            doc = self.docs_executor.execute(
+                self.service.documents().create(body=doc_body), "docs.documents.create"
+            )
             doc_id = doc.get("documentId")
 
             # Build content
@@ -308,23 +443,28 @@ class GoogleDocsProcessor(DocxProcessor):
             content = "".join(content_lines)
             requests = [{"insertText": {"location": {"index": 1}, "text": content}}]
 
-            self.service.documents().batchUpdate(
-                documentId=doc_id, body={"requests": requests}
-            ).execute()
+            self.docs_executor.execute(
+                self.service.documents().batchUpdate(
+                    documentId=doc_id, body={"requests": requests}
+                ),
+                "docs.documents.batchUpdate",
+            )
 
             # Move to branded root folder
             folder_structure = self.branding.create_google_drive_folder_structure()
             root_folder_id = self._create_or_get_folder(folder_structure["root"])
             if root_folder_id:
-                self.drive_service.files().update(
-                    fileId=doc_id, addParents=root_folder_id, removeParents="root"
-                ).execute()
+                self.drive_executor.execute(
+                    self.drive_service.files().update(
+                        fileId=doc_id, addParents=root_folder_id, removeParents="root"
+                    ),
+                    "drive.files.update",
+                )
 
             # Get web link
-            file_info = (
-                self.drive_service.files()
-                .get(fileId=doc_id, fields="webViewLink")
-                .execute()
+            file_info = self.drive_executor.execute(
+                self.drive_service.files().get(fileId=doc_id, fields="webViewLink"),
+                "drive.files.get",
             )
 
             self.logger.info(f"Created master index: {file_info['webViewLink']}")
@@ -380,11 +520,36 @@ class GoogleDocsProcessor(DocxProcessor):
         with open(index_file, "w", encoding="utf-8") as f:
             json.dump(index, f, indent=2, ensure_ascii=False)
 
+    def print_api_stats(self) -> None:
+        """Print per-endpoint API call, retry and throttling counters."""
+        stats = {**self.drive_executor.stats, **self.docs_executor.stats}
+        if not stats:
+            return
+        print("\nAPI requests:")
+        for endpoint, counters in sorted(stats.items()):
+            print(
+                f"  {endpoint}: {counters.calls} calls, {counters.retries} retries, "
+                f"{counters.rate_limited} rate limited, {counters.failures} failed, "
+                f"{counters.wait_seconds:.1f}s waiting"
+            )
+
+    def print_upload_stats(self) -> None:
+        """Print the total size and throughput of this run's uploads."""
+        if not self.upload_reports:
+            return
+        total_bytes = sum(report.bytes for report in self.upload_reports)
+        total_seconds = sum(report.seconds for report in self.upload_reports)
+        resumed = sum(1 for report in self.upload_reports if report.resumed_from)
+        throughput = total_bytes / total_seconds if total_seconds else 0.0
+        print(
+            f"\nUploads: {len(self.upload_reports)} files, "
+            f"{total_bytes / 1024:.1f} KB in {total_seconds:.2f}s "
+            f"({throughput / 1024:.1f} KB/s), {resumed} resumed"
+        )
+
     def cleanup(self):
         """Clean up temporary files."""
         try:
-            import shutil
-
             shutil.rmtree(self.temp_dir)
         except Exception as e:
             self.logger.warning(f"Could not clean up temp directory: {e}")
@@ -414,6 +579,22 @@ def main():
     parser.add_argument(
         "--create-index", action="store_true", help="Create master index document"
     )
+    parser.add_argument(
+        "--force-upload",
+        action="store_true",
+        help="Upload every file, even if an unchanged copy was uploaded before",
+    )
+    parser.add_argument(
+        "--refresh-folders",
+        action="store_true",
+        help="Look up Drive folders again instead of using IDs from earlier runs",
+    )
+    parser.add_argument(
+        "--chunk-size-mb",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE // (1024 * 1024),
+        help="Upload chunk size in MiB",
+    )
 
     args = parser.parse_args()
 
@@ -439,11 +620,20 @@ def main():
 
     # Create processor
     try:
-        processor = GoogleDocsProcessor(output_dir, credentials_path, args.verbose)
+        processor = GoogleDocsProcessor(
+            output_dir,
+            credentials_path,
+            args.verbose,
+            deduplicate=not args.force_upload,
+            chunk_size=args.chunk_size_mb * 1024 * 1024,
+        )
     except Exception as e:
         print(f"Error initializing Google Docs processor: {e}")
         sys.exit(1)
 
+    if args.refresh_folders:
+        processor.folder_resolver.clear()
+
     print("Converting [CLIENT] F&I documentation to Google Docs...")
     print(f"Parallel workers: {args.parallel}")
 
@@ -488,6 +678,10 @@ def main():
         print(f"Total files: {results['total']}")
         print(f"Successful: {results['successful']}")
         print(f"Failed: {results['failed']}")
+        reused = sum(
+            1 for entry in processor.conversion_log if entry["status"] == "reused"
+        )
+        print(f"Reused unchanged: {reused}")
 
         if results["successful"] > 0:
             print(f"\nCreated {len(processor.created_docs)} Google Docs:")
@@ -503,6 +697,8 @@ def main():
             )
 
         print(f"\nMetadata saved to: {METADATA_DIR}")
+        processor.print_api_stats()
+        processor.print_upload_stats()
 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
@@ -1,15 +1,135 @@
 """CLI commands for solution-desk-engine."""
 
-from typing import Optional
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import click
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
 
-from .sow.sow_generator import SOWContext, SOWGenerator
+from .export.document_exporter import DocumentExporter, ExportFormat
+from .integrations.downloads import DownloadProgress
+from .integrations.drive_index import FOLDER_MIME_TYPE, DriveIndex
+from .integrations.folder_resolver import FolderResolver
+from .integrations.google_drive import GoogleDriveClient, PooledGoogleDriveClient
+from .integrations.local_drive import LocalDriveClient
+from .integrations.metadata_cache import SQLiteMetadataCache
+from .integrations.resumable_upload import UploadJournal, UploadReport
+from .integrations.template_cache import TemplateCache
+from .sow.batch import load_batch_file
+from .sow.generation_manifest import GenerationManifest
+from .sow.sow_generator import SOWBatchItem, SOWContext, SOWGenerator
+from .sow.template_schema import validate_context
+from .timing import append_timings_record
 
 console = Console()
 
 
+def _backend_options(command: Callable[..., Any]) -> Callable[..., Any]:
+    """Add the --backend, --local-root and --use-index options to a command."""
+    command = click.option(
+        "--use-index",
+        is_flag=True,
+        help="Answer Drive metadata lookups for folders kept by 'drive sync' "
+        "from the local index",
+    )(command)
+    command = click.option(
+        "--local-root",
+        type=click.Path(file_okay=False, path_type=Path),
+        help="Directory backing --backend local "
+        "(default: ~/.solution-desk-engine/local_drive)",
+    )(command)
+    return click.option(
+        "--backend",
+        type=click.Choice(["google", "local"]),
+        default="google",
+        show_default=True,
+        help="Document store: the Google Drive API or a local directory",
+    )(command)
+
+
+def _create_generator(
+    no_cache: bool = False,
+    in_memory: bool = True,
+    check_variables: bool = True,
+    collect_timings: bool = False,
+    backend: str = "google",
+    local_root: Optional[Path] = None,
+    use_index: bool = False,
+    upload_chunk_mb: Optional[int] = None,
+) -> SOWGenerator:
+    """Create a SOW generator, caching template exports unless disabled."""
+    template_cache = None if no_cache else TemplateCache()
+    drive_client: Any
+    if backend == "local":
+        drive_client = LocalDriveClient(local_root, template_cache=template_cache)
+    else:
+        # A short TTL keeps template edits visible to the next run quickly
+        metadata_cache = None if no_cache else SQLiteMetadataCache(default_ttl=60)
+        drive_client = PooledGoogleDriveClient(
+            template_cache=template_cache,
+            metadata_cache=metadata_cache,
+            drive_index=DriveIndex() if use_index else None,
+            chunk_size=upload_chunk_mb * 1024 * 1024 if upload_chunk_mb else None,
+            upload_journal=UploadJournal() if upload_chunk_mb else None,
+            folder_resolver=FolderResolver(),
+        )
+    return SOWGenerator(
+        drive_client,
+        in_memory=in_memory,
+        check_variables=check_variables,
+        manifest=GenerationManifest(),
+        collect_timings=collect_timings,
+        # Finds SOWs generated before the manifest was lost or on another host
+        deduplicate=True,
+    )
+
+
+def _print_timings(timings: Dict[str, Any]) -> None:
+    """Print per-stage timings of a SOW run."""
+    console.print(f"⏱️  Timings (total {timings['total_seconds']:.3f}s):")
+    for name, stage in timings["stages"].items():
+        size = f"  {stage['bytes'] / 1024:.1f} KB" if stage["bytes"] else ""
+        console.print(
+            f"  {name:<22} {stage['seconds']:>8.3f}s  {stage['calls']} calls{size}"
+        )
+
+
+def _print_uploads(reports: List[UploadReport]) -> None:
+    """Print the size and throughput of each upload."""
+    for report in reports:
+        resumed = (
+            f"  resumed at {report.resumed_from / 1024:.1f} KB"
+            if report.resumed_from
+            else ""
+        )
+        console.print(
+            f"⬆️  {report.name}: {report.bytes / 1024:.1f} KB in "
+            f"{report.seconds:.2f}s ({report.throughput / 1024:.1f} KB/s){resumed}"
+        )
+
+
+def _output_folder_path_option(command: Callable[..., Any]) -> Callable[..., Any]:
+    """Add the output folder path option to a command."""
+    return click.option(
+        "--output-folder-path",
+        help="Folder path such as 'Customers/Penske/SOWs' to save SOWs in, "
+        "created if missing (inside --output-folder-id if given)",
+    )(command)
+
+
+def _upload_chunk_option(command: Callable[..., Any]) -> Callable[..., Any]:
+    """Add the upload chunk size option to a command."""
+    return click.option(
+        "--upload-chunk-mb",
+        default=8,
+        show_default=True,
+        type=click.IntRange(min=0),
+        help="Upload chunk size in MiB for resumable uploads; 0 uploads in one request",
+    )(command)
+
+
 @click.group()
 @click.version_option(version="0.1.0", prog_name="solution-desk-engine")
 @click.pass_context
@@ -55,17 +175,58 @@ def sow() -> None:
 @click.option("--google-poc-name", help="Google point of contact name")
 @click.option("--google-poc-email", help="Google point of contact email")
 @click.option("--max-total-cost", help="Maximum total cost for the SOW")
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always re-export the template and re-fetch metadata from Drive",
+)
+@click.option(
+    "--in-memory/--on-disk",
+    default=True,
+    show_default=True,
+    help="Keep documents in memory; use --on-disk for very large templates",
+)
+@click.option(
+    "--skip-variable-check",
+    is_flag=True,
+    help="Do not check contexts against the template's variables first",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Regenerate even if the template and context are unchanged",
+)
+@_output_folder_path_option
+@_backend_options
+@_upload_chunk_option
+@click.option("--timings", is_flag=True, help="Print per-stage timings")
+@click.option(
+    "--timings-log",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Append per-stage timings to this JSON-lines file",
+)
 def generate(
     template_id: str,
     customer_name: str,
     project_name: str,
     output_name: Optional[str],
     output_folder_id: Optional[str],
+    output_folder_path: Optional[str],
     contractor_poc_name: Optional[str],
     contractor_poc_email: Optional[str],
     google_poc_name: Optional[str],
     google_poc_email: Optional[str],
     max_total_cost: Optional[str],
+    no_cache: bool,
+    in_memory: bool,
+    skip_variable_check: bool,
+    force: bool,
+    timings: bool,
+    timings_log: Optional[Path],
+    backend: str,
+    local_root: Optional[Path],
+    use_index: bool,
+    upload_chunk_mb: int,
 ) -> None:
     """Generate a SOW document from a Google Docs template."""
     try:
@@ -87,7 +248,20 @@ def generate(
             output_name = f"{customer_name} SOW - {project_name}"
 
         # Initialize generator and create SOW
-        generator = SOWGenerator()
+        generator = _create_generator(
+            no_cache,
+            in_memory,
+            not skip_variable_check,
+            collect_timings=timings or timings_log is not None,
+            backend=backend,
+            local_root=local_root,
+            use_index=use_index,
+            upload_chunk_mb=upload_chunk_mb,
+        )
+        if output_folder_path:
+            output_folder_id = generator.google_drive.resolve_folder_path(
+                output_folder_path, output_folder_id
+            )
 
         console.print(f"📥 Downloading template: {template_id}")
         console.print("✏️  Processing template with customer data...")
@@ -97,42 +271,598 @@ def generate(
             context=context,
             output_name=output_name,
             output_folder_id=output_folder_id,
+            force=force,
         )
 
-        console.print("✅ SOW generated successfully!")
+        if result.get("status") == "unchanged":
+            console.print("♻️  SOW is up to date; nothing to regenerate")
+        elif result.get("status") == "updated":
+            console.print("✅ SOW updated in place!")
+        else:
+            console.print("✅ SOW generated successfully!")
         console.print(f"📄 Document Name: {result['name']}")
         console.print(f"🔗 View Link: {result['web_view_link']}")
         console.print(f"🆔 Document ID: {result['id']}")
 
+        if timings:
+            _print_timings(result["timings"])
+            metadata_cache = getattr(generator.google_drive, "metadata_cache", None)
+            if metadata_cache is not None:
+                stats = metadata_cache.stats
+                console.print(
+                    f"🗂️  Metadata cache: {stats.hits} hits, {stats.misses} misses, "
+                    f"{stats.revalidations} revalidations"
+                )
+            request_executor = getattr(generator.google_drive, "request_executor", None)
+            if request_executor is not None:
+                for endpoint, counters in sorted(request_executor.stats.items()):
+                    console.print(
+                        f"🔁 {endpoint}: {counters.calls} calls, "
+                        f"{counters.retries} retries, "
+                        f"{counters.rate_limited} rate limited"
+                    )
+            _print_uploads(getattr(generator.google_drive, "upload_reports", []))
+        if timings_log:
+            append_timings_record(
+                timings_log,
+                {
+                    "command": "sow generate",
+                    "template_id": template_id,
+                    "output_name": output_name,
+                    "status": result.get("status", "created"),
+                    "timings": result["timings"],
+                },
+            )
+
     except Exception as error:
         console.print(f"❌ Failed to generate SOW: {error}")
         raise click.ClickException(str(error))
 
 
 @sow.command()
-@click.option("--template-id", required=True, help="Google Drive file ID to validate")
-def validate_template(template_id: str) -> None:
-    """Validate a Google Docs template for SOW generation."""
+@click.option(
+    "--template-id", required=True, help="Google Drive file ID of the SOW template"
+)
+@click.option(
+    "--input",
+    "input_path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="CSV, YAML or JSONL file with one SOW context per row",
+)
+@click.option(
+    "--output-folder-id",
+    help="Default Google Drive folder ID for rows without output_folder_id",
+)
+@click.option(
+    "--max-workers",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of concurrent renders/uploads",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always re-export the template and re-fetch metadata from Drive",
+)
+@click.option(
+    "--in-memory/--on-disk",
+    default=True,
+    show_default=True,
+    help="Keep documents in memory; use --on-disk for very large templates",
+)
+@click.option(
+    "--skip-variable-check",
+    is_flag=True,
+    help="Do not check contexts against the template's variables first",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Regenerate even if the template and context are unchanged",
+)
+@_output_folder_path_option
+@_backend_options
+@_upload_chunk_option
+def batch(
+    template_id: str,
+    input_path: Path,
+    output_folder_id: Optional[str],
+    output_folder_path: Optional[str],
+    max_workers: int,
+    no_cache: bool,
+    in_memory: bool,
+    skip_variable_check: bool,
+    force: bool,
+    backend: str,
+    local_root: Optional[Path],
+    use_index: bool,
+    upload_chunk_mb: int,
+) -> None:
+    """Generate many SOW documents from one Google Docs template."""
+    try:
+        items = load_batch_file(input_path)
+    except Exception as error:
+        console.print(f"❌ Failed to load batch file: {error}")
+        raise click.ClickException(str(error))
+
+    console.print(f"🔨 Generating {len(items)} SOW documents...")
+    console.print(f"📥 Downloading template: {template_id}")
+
     try:
+        generator = _create_generator(
+            no_cache,
+            in_memory,
+            not skip_variable_check,
+            backend=backend,
+            local_root=local_root,
+            use_index=use_index,
+            upload_chunk_mb=upload_chunk_mb,
+        )
+        if output_folder_path:
+            output_folder_id = generator.google_drive.resolve_folder_path(
+                output_folder_path, output_folder_id
+            )
+        results = generator.generate_many(
+            template_file_id=template_id,
+            items=items,
+            output_folder_id=output_folder_id,
+            max_workers=max_workers,
+            force=force,
+        )
+    except Exception as error:
+        console.print(f"❌ Failed to generate SOW batch: {error}")
+        raise click.ClickException(str(error))
+
+    for result in results:
+        if result.success and result.document:
+            icon = "♻️ " if result.document.get("status") == "unchanged" else "✅"
+            console.print(
+                f"{icon} [{result.index + 1}] {result.output_name}: "
+                f"{result.document.get('web_view_link')}"
+            )
+        else:
+            console.print(
+                f"❌ [{result.index + 1}] {result.output_name}: {result.error}"
+            )
+
+    _print_uploads(getattr(generator.google_drive, "upload_reports", []))
+
+    failed = sum(1 for result in results if not result.success)
+    console.print(f"📊 {len(results) - failed} succeeded, {failed} failed")
+
+    if failed:
+        raise click.ClickException(f"{failed} of {len(results)} SOWs failed")
+
+
+@sow.command()
+@click.option(
+    "--template-id",
+    "template_ids",
+    required=True,
+    multiple=True,
+    help="Google Drive file ID to validate (repeat to audit several templates)",
+)
+@click.option(
+    "--show-variables", is_flag=True, help="List the template's Jinja variables"
+)
+@click.option(
+    "--input",
+    "input_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="CSV, YAML or JSONL batch file to check against the template variables",
+)
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Use the cached variable schema without contacting Google Drive",
+)
+@_backend_options
+def validate_template(
+    template_ids: Tuple[str, ...],
+    show_variables: bool,
+    input_path: Optional[Path],
+    offline: bool,
+    backend: str,
+    local_root: Optional[Path],
+    use_index: bool,
+) -> None:
+    """Validate Google Docs templates for SOW generation."""
+    items = None
+    if input_path:
+        try:
+            items = load_batch_file(input_path)
+        except Exception as error:
+            console.print(f"❌ Failed to load batch file: {error}")
+            raise click.ClickException(str(error))
+
+    generator = None
+    templates_info: Dict[str, Optional[Dict[str, Any]]] = {}
+    if not offline:
+        try:
+            generator = _create_generator(
+                backend=backend, local_root=local_root, use_index=use_index
+            )
+            # One batched metadata lookup serves every template below
+            templates_info = generator.validate_templates(list(template_ids))
+        except Exception as error:
+            console.print(f"❌ Failed to validate template: {error}")
+            raise click.ClickException(str(error))
+
+    valid_templates = 0
+    invalid_contexts = 0
+    for template_id in template_ids:
         console.print(f"🔍 Validating template: {template_id}")
 
-        generator = SOWGenerator()
+        if generator is None:
+            cached = TemplateCache().get_latest_schema(template_id)
+            if cached is None:
+                raise click.ClickException(
+                    "No cached variable schema for this template; "
+                    "run once without --offline first"
+                )
+            variables = set(cached)
+        else:
+            template_info = templates_info.get(template_id)
+            if template_info is None:
+                console.print("❌ Template is not valid or not accessible")
+                console.print(
+                    "Make sure the file ID is correct and you have access to the document."
+                )
+                continue
 
-        if generator.validate_template(template_id):
-            template_info = generator.get_template_info(template_id)
             console.print("✅ Template is valid!")
             console.print(f"📄 Name: {template_info.get('name')}")
             console.print(f"📅 Modified: {template_info.get('modifiedTime')}")
             console.print(f"🔗 Link: {template_info.get('webViewLink')}")
-        else:
-            console.print("❌ Template is not valid or not accessible")
+
+            if not (show_variables or items is not None):
+                valid_templates += 1
+                continue
+
+            try:
+                variables = generator.get_template_variables(
+                    template_id, template_info.get("modifiedTime")
+                )
+            except Exception as error:
+                console.print(f"❌ Failed to validate template: {error}")
+                raise click.ClickException(str(error))
+
+        valid_templates += 1
+        if show_variables:
+            _print_template_variables(variables)
+        if items is not None:
+            invalid_contexts += _check_contexts(variables, items)
+
+    if len(template_ids) > 1:
+        console.print(
+            f"📊 {valid_templates} of {len(template_ids)} templates are valid"
+        )
+    if invalid_contexts:
+        raise click.ClickException(f"{invalid_contexts} contexts are missing variables")
+
+
+def _print_template_variables(variables: Set[str]) -> None:
+    """List a template's variables, flagging those SOWContext does not fill."""
+    context_fields = set(SOWContext("", "").to_dict())
+    console.print(f"🧩 Template variables ({len(variables)}):")
+    for name in sorted(variables):
+        marker = "" if name in context_fields else " (not a SOWContext field)"
+        console.print(f"  - {name}{marker}")
+
+
+def _check_contexts(variables: Set[str], items: List[SOWBatchItem]) -> int:
+    """Check batch contexts against template variables.
+
+    Returns:
+        Number of contexts missing template variables
+    """
+    invalid = 0
+    for number, item in enumerate(items, start=1):
+        validation = validate_context(variables, item.context.to_dict())
+        if not validation.is_valid:
+            invalid += 1
             console.print(
-                "Make sure the file ID is correct and you have access to the document."
+                f"❌ [{number}] {item.output_name}: missing "
+                f"{', '.join(validation.missing)}"
             )
+        elif validation.blank:
+            console.print(
+                f"⚠️  [{number}] {item.output_name}: blank "
+                f"{', '.join(validation.blank)}"
+            )
+
+    console.print(f"📊 {len(items) - invalid} of {len(items)} contexts are valid")
+    return invalid
+
+
+@cli.group()
+def cache() -> None:
+    """Local template cache commands."""
+    pass
+
+
+@cache.command()
+def info() -> None:
+    """Show template cache location and size."""
+    template_cache = TemplateCache()
+    size_mb = template_cache.size() / (1024 * 1024)
+    limit_mb = template_cache.max_size_bytes / (1024 * 1024)
+    console.print(f"📁 Location: {template_cache.cache_dir}")
+    console.print(f"💾 Size: {size_mb:.1f} MB of {limit_mb:.0f} MB")
+
+    metadata_cache = SQLiteMetadataCache()
+    console.print(
+        f"🗂️  Metadata: {len(metadata_cache)} entries in {metadata_cache.db_path}"
+    )
+    metadata_cache.close()
+
 
+@cache.command()
+def clear() -> None:
+    """Remove all cached template exports and Drive metadata."""
+    removed = TemplateCache().clear()
+    console.print(f"🧹 Removed {removed} cached templates")
+    metadata_cache = SQLiteMetadataCache()
+    removed = metadata_cache.clear()
+    metadata_cache.close()
+    console.print(f"🧹 Removed {removed} cached metadata entries")
+
+
+@cli.group()
+def drive() -> None:
+    """Google Drive index and download commands."""
+    pass
+
+
+@drive.command()
+@click.option(
+    "--folder-id",
+    "folder_ids",
+    required=True,
+    multiple=True,
+    help="Google Drive folder ID to index (repeat for several folder trees)",
+)
+@click.option(
+    "--full", is_flag=True, help="List the whole tree again instead of changes"
+)
+def sync(folder_ids: Tuple[str, ...], full: bool) -> None:
+    """Mirror folder trees into the local Drive index.
+
+    The first sync of a folder lists the whole tree; later syncs apply only
+    the changes reported by the Drive Changes API since the previous one.
+    """
+    drive_index = DriveIndex()
+    client = GoogleDriveClient(drive_index=drive_index)
+    try:
+        for folder_id in folder_ids:
+            result = client.sync_folder(folder_id, full=full)
+            mode = "full listing" if result.full else "changes"
+            console.print(
+                f"🔄 {folder_id}: {result.added} added, {result.updated} updated, "
+                f"{result.removed} removed ({mode})"
+            )
     except Exception as error:
-        console.print(f"❌ Failed to validate template: {error}")
+        console.print(f"❌ Failed to sync folder: {error}")
         raise click.ClickException(str(error))
+    finally:
+        drive_index.close()
+
+
+@drive.command()
+@click.option(
+    "--folder-id",
+    "folder_ids",
+    multiple=True,
+    help="Download every file directly inside this folder (repeatable)",
+)
+@click.option(
+    "--file-id", "file_ids", multiple=True, help="Download this file (repeatable)"
+)
+@click.option(
+    "--dest",
+    required=True,
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory to save the files in",
+)
+@click.option(
+    "--max-workers",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of concurrent downloads",
+)
+@click.option(
+    "--chunk-mb",
+    default=100,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Download chunk size in MiB",
+)
+def download(
+    folder_ids: Tuple[str, ...],
+    file_ids: Tuple[str, ...],
+    dest: Path,
+    max_workers: int,
+    chunk_mb: int,
+) -> None:
+    """Download Drive files, exporting Google Docs, Sheets and Slides."""
+    if not folder_ids and not file_ids:
+        raise click.UsageError("Give at least one --folder-id or --file-id")
+
+    client = PooledGoogleDriveClient()
+    try:
+        ids = list(file_ids)
+        for folder_id in folder_ids:
+            ids.extend(
+                file["id"]
+                for file in client.list_files_in_folder(folder_id)
+                if file.get("mimeType") != FOLDER_MIME_TYPE
+            )
+
+        with Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("📥 Downloading", total=len(set(ids)))
+
+            def on_progress(update: DownloadProgress) -> None:
+                if update.done:
+                    progress.advance(task)
+
+            results = client.download_many(
+                ids,
+                dest,
+                max_workers=max_workers,
+                chunk_size=chunk_mb * 1024 * 1024,
+                progress=on_progress,
+            )
+            # Files that failed never reported completion
+            progress.update(task, completed=len(results))
+    except Exception as error:
+        console.print(f"❌ Failed to download files: {error}")
+        raise click.ClickException(str(error))
+
+    for result in results:
+        if not result.success:
+            console.print(f"❌ {result.name}: {result.error}")
+    downloaded = [result for result in results if result.success]
+    total_bytes = sum(result.bytes for result in downloaded)
+    console.print(
+        f"📊 {len(downloaded)} downloaded ({total_bytes / 1024:.1f} KB), "
+        f"{len(results) - len(downloaded)} failed"
+    )
+    if len(downloaded) < len(results):
+        raise click.ClickException(
+            f"{len(results) - len(downloaded)} of {len(results)} downloads failed"
+        )
+
+
+@cli.command("export")
+@click.argument(
+    "sources",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+)
+@click.option(
+    "--format",
+    "format_names",
+    type=click.Choice([format_type.value for format_type in ExportFormat]),
+    multiple=True,
+    default=[ExportFormat.PDF.value],
+    show_default=True,
+    help="Export format (repeatable; several formats share one parse per file)",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path("output"),
+    show_default=True,
+    help="Directory for exported documents",
+)
+@click.option(
+    "--max-workers",
+    default=os.cpu_count() or 1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of worker processes",
+)
+@click.option(
+    "--pandoc-server/--no-pandoc-server",
+    default=True,
+    show_default=True,
+    help="Convert on long-lived pandoc servers (pandoc 3+) instead of "
+    "running pandoc once per document",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Export every document, even outputs that are up to date",
+)
+@click.option(
+    "--shared-css",
+    is_flag=True,
+    help="Link HTML pages to one stylesheet in the output directory "
+    "instead of inlining it into each page",
+)
+def export_documents(
+    sources: Tuple[Path, ...],
+    format_names: Tuple[str, ...],
+    output_dir: Path,
+    max_workers: int,
+    pandoc_server: bool,
+    force: bool,
+    shared_css: bool,
+) -> None:
+    """Export markdown files, or every markdown file in directories.
+
+    Files found in a directory are exported to the same relative path under
+    the output directory. Outputs whose source, format and styling are
+    unchanged since they were last exported there are skipped.
+    """
+    source_files: List[Path] = []
+    output_names: Dict[Path, str] = {}
+    for source in sources:
+        if source.is_dir():
+            for source_file in sorted(source.rglob("*.md")):
+                source_files.append(source_file)
+                output_names[source_file] = (
+                    source_file.relative_to(source).with_suffix("").as_posix()
+                )
+        else:
+            source_files.append(source)
+    if not source_files:
+        raise click.ClickException("No markdown files to export")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    exporter = DocumentExporter(
+        output_dir,
+        use_pandoc_server=pandoc_server,
+        incremental=True,
+        shared_css=shared_css,
+    )
+    formats = [ExportFormat(name) for name in dict.fromkeys(format_names)]
+    try:
+        if len(formats) == 1:
+            results = exporter.export_multiple_documents(
+                source_files,
+                formats[0],
+                max_workers=max_workers,
+                force=force,
+                output_names=output_names,
+            )
+        else:
+            results = {
+                output_dir / f"{output_names.get(source_file, source_file.stem)}"
+                f".{format_type.value}": result
+                for source_file, format_results in (
+                    exporter.export_multiple_documents_multi(
+                        source_files,
+                        formats,
+                        max_workers=max_workers,
+                        force=force,
+                        output_names=output_names,
+                    ).items()
+                )
+                for format_type, result in format_results.items()
+            }
+    except ValueError as error:
+        raise click.ClickException(str(error))
+
+    summary = exporter.get_export_summary(results)
+    unchanged = f", {summary['skipped']} unchanged" if summary["skipped"] else ""
+    console.print(
+        f"📊 {summary['successful'] - summary['skipped']} exported, "
+        f"{summary['failed']} failed ({summary['success_rate']:.0f}%){unchanged}"
+    )
+    if summary["failed"]:
+        raise click.ClickException(
+            f"{summary['failed']} of {summary['total_files']} exports failed"
+        )
 
 
 if __name__ == "__main__":
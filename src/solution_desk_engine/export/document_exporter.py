@@ -1,14 +1,126 @@
 """Document export functionality for technical sales proposals."""
 
+import html
+import multiprocessing
+import os
+import re
 import subprocess  # nosec
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from xml.etree.ElementTree import Element  # nosec
 
 from rich.console import Console  # type: ignore
+from rich.progress import (  # type: ignore
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TextColumn,
+    TimeElapsedColumn,
+)
+
+from ..integrations.content_hash import hash_bytes, hash_file
+from .manifest import ExportManifest
+from .pandoc import PandocError, PandocServerPool, get_server_pool, probe_pandoc
+from .render_context import PdfRenderContext
 
 console = Console()
 
+# Stylesheet and reference document pandoc uses when they exist
+PDF_CSS = Path("styles/professional.css")
+REFERENCE_DOC = Path("styles/reference.docx")
+
+# Stylesheet HTML pages link to when it is shared instead of inlined
+SHARED_HTML_CSS = "document-export.css"
+
+# Part of every export key; bump it when a change here changes the output
+EXPORTER_VERSION = "2"
+
+# Export keys tell apart the two ways a format can be rendered
+_PER_FORMAT = "per-format"
+_SINGLE_PARSE = "single-parse"
+
+# Exporter used by each worker process of a parallel export
+_worker_exporter: Optional["DocumentExporter"] = None
+
+# Markdown extensions of the shared parse behind export_document_multi()
+MARKDOWN_EXTENSIONS = ["tables", "toc", "fenced_code", "codehilite"]
+
+# Raw HTML that python-markdown stashes away while parsing
+_STASH_PLACEHOLDER = re.compile("\x02wzxhzdk:([0-9]+)\x03")
+_HTML_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+
+# Style of exported HTML pages, inlined or shared as SHARED_HTML_CSS
+HTML_STYLESHEET = """\
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    line-height: 1.6;
+    max-width: 1000px;
+    margin: 0 auto;
+    padding: 2rem;
+    color: #333;
+}
+h1, h2, h3, h4, h5, h6 { color: #2c3e50; margin-top: 2rem; }
+h1 { border-bottom: 3px solid #3498db; padding-bottom: 0.5rem; }
+h2 { border-bottom: 2px solid #ecf0f1; padding-bottom: 0.3rem; }
+table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 1.5rem 0;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+th, td {
+    border: 1px solid #ddd;
+    padding: 12px;
+    text-align: left;
+}
+th {
+    background-color: #3498db;
+    color: white;
+    font-weight: bold;
+}
+tr:nth-child(even) { background-color: #f8f9fa; }
+code {
+    background-color: #f4f4f4;
+    padding: 2px 4px;
+    border-radius: 3px;
+    font-family: 'Monaco', 'Menlo', monospace;
+}
+pre {
+    background-color: #f8f9fa;
+    padding: 1rem;
+    border-radius: 5px;
+    overflow-x: auto;
+    border-left: 4px solid #3498db;
+}
+blockquote {
+    border-left: 4px solid #3498db;
+    margin: 1rem 0;
+    padding: 0.5rem 1rem;
+    background-color: #f8f9fa;
+}
+.toc {
+    background-color: #ecf0f1;
+    padding: 1rem;
+    border-radius: 5px;
+    margin: 2rem 0;
+}
+"""
+
+# Style of PDFs printed with weasyprint from rendered markdown
+PDF_STYLESHEET = """\
+body { font-family: Arial, sans-serif; line-height: 1.6; margin: 2cm; }
+h1, h2, h3 { color: #2c3e50; }
+table { border-collapse: collapse; width: 100%; margin: 1em 0; }
+th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+th { background-color: #f2f2f2; }
+code { background-color: #f4f4f4; padding: 2px 4px; }
+pre { background-color: #f4f4f4; padding: 1em; overflow-x: auto; }
+"""
+
 
 class ExportFormat(Enum):
     """Supported document export formats."""
@@ -27,36 +139,158 @@ class ExportResult:
         success: bool,
         output_path: Optional[Path] = None,
         error: Optional[str] = None,
+        skipped: bool = False,
     ):
         self.success = success
         self.output_path = output_path
         self.error = error
+        # True when the output was current and not written again
+        self.skipped = skipped
+
+
+class ParsedDocument:
+    """A markdown source read and parsed once, shared by every output format."""
+
+    def __init__(
+        self, source: bytes, root: Element, html: str, stash: List[str]
+    ) -> None:
+        """Initialize a parsed document.
+
+        Args:
+            source: Raw bytes of the markdown file
+            root: Element tree of the parsed markdown
+            html: HTML rendered from the tree
+            stash: Raw HTML blocks the tree refers to by placeholder
+        """
+        self.source = source
+        self.root = root
+        self.html = html
+        self.stash = stash
+
+    def text(self, fragment: Optional[str]) -> str:
+        """Get the plain text of a tree fragment, resolving raw HTML."""
+        return _STASH_PLACEHOLDER.sub(
+            lambda match: html.unescape(
+                _HTML_TAG.sub("", self.stash[int(match.group(1))])
+            ),
+            fragment or "",
+        )
+
+    def raw_block(self, element: Element) -> Optional[str]:
+        """Get the raw HTML an element stands for, if it holds nothing else."""
+        match = _STASH_PLACEHOLDER.fullmatch((element.text or "").strip())
+        if match is None or len(element):
+            return None
+        return self.stash[int(match.group(1))]
+
+
+class _TreeCapture:
+    """Markdown tree processor that keeps the final element tree."""
+
+    def __init__(self) -> None:
+        self.root: Optional[Element] = None
+
+    def run(self, root: Element) -> None:
+        self.root = root
 
 
 class DocumentExporter:
     """Handles export of technical sales documents to various formats."""
 
-    def __init__(self, output_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        output_dir: Optional[Path] = None,
+        use_pandoc_server: bool = False,
+        incremental: bool = False,
+        shared_css: bool = False,
+    ) -> None:
         """Initialize the document exporter.
 
         Args:
             output_dir: Directory for exported documents. Defaults to ./output/
+            use_pandoc_server: Whether to convert with long-lived pandoc
+                servers instead of one pandoc process per document, when the
+                installed pandoc supports it
+            incremental: Whether to record exports in a manifest in the
+                output directory and skip outputs that are current
+            shared_css: Whether HTML pages link to one stylesheet written to
+                the output directory instead of each inlining it
         """
         self.output_dir = output_dir or Path("output")
         self.output_dir.mkdir(exist_ok=True)
+        self.use_pandoc_server = use_pandoc_server
+        self.manifest = ExportManifest(self.output_dir) if incremental else None
+        self.shared_css = shared_css
+        self._shared_css_written = False
+        self._pdf_context: Optional[PdfRenderContext] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Leave the manifest and PDF render context behind in a worker.
+
+        Only the process that owns the manifest reads and writes it, so
+        workers of a parallel export never race on the file. weasyprint
+        objects cannot be pickled, so each worker makes its own context
+        and reuses it for every PDF it prints.
+        """
+        state = self.__dict__.copy()
+        state["manifest"] = None
+        state["_pdf_context"] = None
+        return state
+
+    def _render_context(self) -> PdfRenderContext:
+        """Get the PDF render context, parsing stylesheets on first use.
+
+        Raises:
+            ImportError: If weasyprint is not installed
+        """
+        if self._pdf_context is None:
+            self._pdf_context = PdfRenderContext(PDF_STYLESHEET, PDF_CSS)
+        return self._pdf_context
+
+    def _write_shared_css(self, formats: Sequence[ExportFormat]) -> None:
+        """Write the shared HTML stylesheet once, if HTML pages link to it."""
+        if (
+            not self.shared_css
+            or self._shared_css_written
+            or ExportFormat.HTML not in formats
+        ):
+            return
+        css_path = self.output_dir / SHARED_HTML_CSS
+        try:
+            current = css_path.read_text(encoding="utf-8")
+        except OSError:
+            current = None
+        if current != HTML_STYLESHEET:
+            fd, temp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(HTML_STYLESHEET)
+            os.replace(temp_path, css_path)
+        self._shared_css_written = True
+
+    def _html_document(self, title: str, html_content: str, output_path: Path) -> str:
+        """Wrap rendered markdown in this exporter's HTML page."""
+        href = None
+        if self.shared_css:
+            href = Path(
+                os.path.relpath(self.output_dir / SHARED_HTML_CSS, output_path.parent)
+            ).as_posix()
+        return _html_page(title, html_content, href)
 
     def export_document(
         self,
         source_path: Path,
         format_type: ExportFormat,
         output_name: Optional[str] = None,
+        force: bool = False,
     ) -> ExportResult:
         """Export a single document to the specified format.
 
         Args:
             source_path: Path to the source markdown file
             format_type: Target export format
-            output_name: Optional custom output filename (without extension)
+            output_name: Optional custom output filename (without extension),
+                which may name a subdirectory of the output directory
+            force: Export even if the manifest records the output as current
 
         Returns:
             ExportResult with success status and output path
@@ -66,14 +300,23 @@ class DocumentExporter:
                 success=False, error=f"Source file not found: {source_path}"
             )
 
-        # Determine output filename
-        if output_name:
-            output_filename = f"{output_name}.{format_type.value}"
-        else:
-            output_filename = f"{source_path.stem}.{format_type.value}"
+        self._write_shared_css([format_type])
+        current, keys = self._check_manifest(
+            source_path, [format_type], output_name, _PER_FORMAT, force
+        )
+        if current:
+            return current[format_type]
 
-        output_path = self.output_dir / output_filename
+        output_path = self._output_path(source_path, format_type, output_name)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        result = self._export_format(source_path, format_type, output_path)
+        self._record_exports(source_path, keys, {format_type: result})
+        return result
 
+    def _export_format(
+        self, source_path: Path, format_type: ExportFormat, output_path: Path
+    ) -> ExportResult:
+        """Export a document to one format with that format's backend."""
         try:
             if format_type == ExportFormat.MARKDOWN:
                 # Simple copy for markdown
@@ -99,58 +342,563 @@ class DocumentExporter:
         except Exception as e:
             return ExportResult(success=False, error=f"Export failed: {str(e)}")
 
+    def _output_path(
+        self,
+        source_path: Path,
+        format_type: ExportFormat,
+        output_name: Optional[str] = None,
+    ) -> Path:
+        """Get the path a document is exported to in one format."""
+        return (
+            self.output_dir / f"{output_name or source_path.stem}.{format_type.value}"
+        )
+
+    def _check_output_names(
+        self,
+        source_files: List[Path],
+        format_type: ExportFormat,
+        output_names: Dict[Path, str],
+    ) -> None:
+        """Make sure no two sources of a batch are exported to one file.
+
+        Raises:
+            ValueError: If two sources would be exported to the same file
+        """
+        exported_from: Dict[Path, Path] = {}
+        for source_file in dict.fromkeys(source_files):
+            output_path = self._output_path(
+                source_file, format_type, output_names.get(source_file)
+            )
+            other = exported_from.setdefault(output_path, source_file)
+            if other != source_file:
+                raise ValueError(
+                    f"{other} and {source_file} would both be exported to "
+                    f"{output_path.with_suffix('')}"
+                )
+
+    def _export_key(
+        self, source_hash: str, format_type: ExportFormat, renderer: str
+    ) -> str:
+        """Hash everything an output depends on into its export key."""
+        parts = [EXPORTER_VERSION, renderer, format_type.value, source_hash]
+        if format_type == ExportFormat.HTML and self.shared_css:
+            parts.append(SHARED_HTML_CSS)
+        style = {ExportFormat.PDF: PDF_CSS, ExportFormat.DOCX: REFERENCE_DOC}.get(
+            format_type
+        )
+        if style is not None:
+            parts.append(hash_file(style) if style.exists() else "")
+            pandoc = probe_pandoc()
+            parts.append(
+                ".".join(str(part) for part in pandoc.version) if pandoc else ""
+            )
+        return hash_bytes("\n".join(parts).encode("utf-8"))
+
+    def _check_manifest(
+        self,
+        source_path: Path,
+        formats: Sequence[ExportFormat],
+        output_name: Optional[str],
+        renderer: str,
+        force: bool,
+    ) -> Tuple[Dict[ExportFormat, ExportResult], Dict[ExportFormat, Optional[str]]]:
+        """Split formats into current outputs and outputs to export.
+
+        Returns:
+            Skipped results of the outputs that are current, and the export
+            keys of the formats to export (None without a manifest)
+        """
+        if self.manifest is None or not source_path.exists():
+            return {}, {format_type: None for format_type in formats}
+
+        current: Dict[ExportFormat, ExportResult] = {}
+        keys: Dict[ExportFormat, Optional[str]] = {}
+        source_hash = hash_file(source_path)
+        for format_type in formats:
+            key = self._export_key(source_hash, format_type, renderer)
+            output_path = self._output_path(source_path, format_type, output_name)
+            if not force and self.manifest.is_current(output_path, key, source_path):
+                current[format_type] = ExportResult(
+                    success=True, output_path=output_path, skipped=True
+                )
+            else:
+                keys[format_type] = key
+        return current, keys
+
+    def _record_exports(
+        self,
+        source_path: Path,
+        keys: Dict[ExportFormat, Optional[str]],
+        results: Dict[ExportFormat, ExportResult],
+    ) -> None:
+        """Record the export keys of outputs that were written."""
+        if self.manifest is None:
+            return
+        for format_type, key in keys.items():
+            result = results.get(format_type)
+            if key is not None and result is not None and result.output_path:
+                if result.success:
+                    self.manifest.record(result.output_path, key, source_path)
+                else:
+                    self.manifest.forget(result.output_path)
+
+    def export_document_multi(
+        self,
+        source_path: Path,
+        formats: Sequence[ExportFormat],
+        output_name: Optional[str] = None,
+        force: bool = False,
+    ) -> Dict[ExportFormat, ExportResult]:
+        """Export a single document to several formats from one parse.
+
+        The source is read once and parsed into one markdown tree, and every
+        format is rendered from that tree: HTML and PDF from its HTML, DOCX
+        by walking its elements with python-docx. Unlike export_document(),
+        PDF and DOCX are therefore not handed to pandoc, which would parse
+        the source again; pandoc is only used when weasyprint or python-docx
+        is not installed. They are styled with the same PDF_CSS and
+        REFERENCE_DOC as pandoc would use.
+
+        Args:
+            source_path: Path to the source markdown file
+            formats: Target export formats
+            output_name: Optional custom output filename (without extension),
+                which may name a subdirectory of the output directory
+            force: Export even if the manifest records outputs as current
+
+        Returns:
+            Dictionary mapping each format to its export result
+        """
+        formats = list(dict.fromkeys(formats))
+        if not source_path.exists():
+            return {
+                format_type: ExportResult(
+                    success=False, error=f"Source file not found: {source_path}"
+                )
+                for format_type in formats
+            }
+
+        self._write_shared_css(formats)
+        results, keys = self._check_manifest(
+            source_path, formats, output_name, _SINGLE_PARSE, force
+        )
+        if not keys:
+            # Every output is current, so the source is not even parsed
+            return {format_type: results[format_type] for format_type in formats}
+
+        try:
+            parsed: Optional[ParsedDocument] = self._parse_markdown(source_path)
+        except ImportError:
+            parsed = None
+        except Exception as e:
+            for format_type in keys:
+                results[format_type] = ExportResult(
+                    success=False, error=f"Export failed: {str(e)}"
+                )
+            return {format_type: results[format_type] for format_type in formats}
+
+        for format_type in keys:
+            output_path = self._output_path(source_path, format_type, output_name)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if parsed is None and format_type != ExportFormat.MARKDOWN:
+                # Without the markdown library, fall back to the single-format
+                # backends, which report what to install
+                results[format_type] = self._export_format(
+                    source_path, format_type, output_path
+                )
+                continue
+            try:
+                results[format_type] = self._render(
+                    parsed, source_path, format_type, output_path
+                )
+            except Exception as e:
+                results[format_type] = ExportResult(
+                    success=False, error=f"Export failed: {str(e)}"
+                )
+
+        self._record_exports(source_path, keys, results)
+        return {format_type: results[format_type] for format_type in formats}
+
+    def _parse_markdown(self, source_path: Path) -> ParsedDocument:
+        """Read a markdown file once and parse it into a shared tree."""
+        import markdown  # type: ignore
+
+        source = source_path.read_bytes()
+        md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+        # Lowest priority, so the tree is kept after every other processor
+        capture = _TreeCapture()
+        md.treeprocessors.register(capture, "capture_tree", -1)
+        html_content = md.convert(source.decode("utf-8"))
+
+        return ParsedDocument(
+            source=source,
+            root=capture.root if capture.root is not None else Element("div"),
+            html=html_content,
+            stash=list(md.htmlStash.rawHtmlBlocks),
+        )
+
+    def _render(
+        self,
+        parsed: Optional[ParsedDocument],
+        source_path: Path,
+        format_type: ExportFormat,
+        output_path: Path,
+    ) -> ExportResult:
+        """Write one format of a parsed document."""
+        if format_type == ExportFormat.MARKDOWN:
+            if parsed is None:
+                import shutil
+
+                shutil.copy2(source_path, output_path)
+            else:
+                output_path.write_bytes(parsed.source)
+            return ExportResult(success=True, output_path=output_path)
+
+        assert parsed is not None  # nosec - only markdown is rendered unparsed
+
+        if format_type == ExportFormat.HTML:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(self._html_document(source_path.stem, parsed.html, output_path))
+            return ExportResult(success=True, output_path=output_path)
+
+        elif format_type == ExportFormat.PDF:
+            try:
+                context = self._render_context()
+            except ImportError:
+                return self._export_to_pdf(source_path, output_path)
+
+            # PDF_CSS styles these PDFs as it does pandoc's, over the defaults
+            context.write_pdf(
+                _pdf_page(parsed.html),
+                output_path,
+                context.stylesheets + context.custom_stylesheets,
+                base_url=str(Path.cwd()),
+            )
+            return ExportResult(success=True, output_path=output_path)
+
+        elif format_type == ExportFormat.DOCX:
+            try:
+                from docx import Document  # type: ignore
+            except ImportError:
+                return self._export_to_docx(source_path, output_path)
+
+            doc = _reference_document(Document)
+            _add_docx_blocks(doc, parsed.root, parsed)
+            doc.save(str(output_path))
+            return ExportResult(success=True, output_path=output_path)
+
+        return ExportResult(success=False, error=f"Unsupported format: {format_type}")
+
     def export_multiple_documents(
-        self, source_files: List[Path], format_type: ExportFormat
+        self,
+        source_files: List[Path],
+        format_type: ExportFormat,
+        max_workers: int = 1,
+        force: bool = False,
+        output_names: Optional[Dict[Path, str]] = None,
     ) -> Dict[Path, ExportResult]:
         """Export multiple documents to the specified format.
 
+        With more than one worker, documents are exported on a pool of
+        worker processes, since the PDF and DOCX backends are CPU-bound.
+        Progress is shown in one live progress bar, and a document that
+        fails does not stop the others.
+
         Args:
             source_files: List of source markdown files
             format_type: Target export format
+            max_workers: Number of worker processes. With 1, documents are
+                exported one after another in this process.
+            force: Export even the outputs the manifest records as current
+            output_names: Output filenames (without extension) of sources,
+                which may name subdirectories of the output directory.
+                Other sources are exported under their file stem.
 
         Returns:
-            Dictionary mapping source paths to export results
+            Dictionary mapping source paths to export results, in input order
+
+        Raises:
+            ValueError: If two sources would be exported to the same file
         """
+        output_names = output_names or {}
+        self._check_output_names(source_files, format_type, output_names)
+        if max_workers > 1 and len(source_files) > 1:
+            parallel_results = self._export_in_parallel(
+                source_files, [format_type], max_workers, False, force, output_names
+            )
+            return {
+                source_file: format_results[format_type]
+                for source_file, format_results in parallel_results.items()
+            }
+
         results = {}
 
         for source_file in source_files:
             console.print(f"Exporting {source_file.name} to {format_type.value}...")
-            result = self.export_document(source_file, format_type)
+            result = self.export_document(
+                source_file, format_type, output_names.get(source_file), force
+            )
             results[source_file] = result
+            _print_result(result)
 
-            if result.success:
-                console.print(f"✓ Exported to: {result.output_path}", style="green")
-            else:
-                console.print(f"✗ Failed: {result.error}", style="red")
+        return results
+
+    def export_multiple_documents_multi(
+        self,
+        source_files: List[Path],
+        formats: Sequence[ExportFormat],
+        max_workers: int = 1,
+        force: bool = False,
+        output_names: Optional[Dict[Path, str]] = None,
+    ) -> Dict[Path, Dict[ExportFormat, ExportResult]]:
+        """Export multiple documents to several formats, parsing each once.
+
+        Every document goes through export_document_multi(), on a pool of
+        worker processes when there is more than one worker.
+
+        Args:
+            source_files: List of source markdown files
+            formats: Target export formats
+            max_workers: Number of worker processes
+            force: Export even the outputs the manifest records as current
+            output_names: Output filenames (without extension) of sources,
+                as for export_multiple_documents()
+
+        Returns:
+            Dictionary mapping source paths to their results per format,
+            in input order
+
+        Raises:
+            ValueError: If two sources would be exported to the same file
+        """
+        formats = list(dict.fromkeys(formats))
+        output_names = output_names or {}
+        if formats:
+            self._check_output_names(source_files, formats[0], output_names)
+        if max_workers > 1 and len(source_files) > 1:
+            return self._export_in_parallel(
+                source_files, formats, max_workers, True, force, output_names
+            )
+
+        results = {}
+        names = ", ".join(format_type.value for format_type in formats)
+
+        for source_file in source_files:
+            console.print(f"Exporting {source_file.name} to {names}...")
+            results[source_file] = self.export_document_multi(
+                source_file, formats, output_names.get(source_file), force
+            )
+            for result in results[source_file].values():
+                _print_result(result)
 
         return results
 
-    def _export_to_pdf(self, source_path: Path, output_path: Path) -> ExportResult:
-        """Export markdown to PDF using pandoc or weasyprint."""
-        try:
-            # Try pandoc first
+    def _export_in_parallel(
+        self,
+        source_files: List[Path],
+        formats: List[ExportFormat],
+        max_workers: int,
+        single_parse: bool,
+        force: bool,
+        output_names: Dict[Path, str],
+    ) -> Dict[Path, Dict[ExportFormat, ExportResult]]:
+        """Export documents on a process pool, collecting results in order.
+
+        With single_parse, workers use export_document_multi(); otherwise
+        each format goes through export_document(). Current outputs are
+        skipped here, and only this process records exports in the manifest.
+        """
+        unique_files = list(dict.fromkeys(source_files))
+        results: Dict[Path, Dict[ExportFormat, ExportResult]] = {}
+        names = ", ".join(format_type.value for format_type in formats)
+
+        # Written here, so workers find the stylesheet already in place
+        self._write_shared_css(formats)
+        pending: Dict[Path, Dict[ExportFormat, Optional[str]]] = {}
+        for source_file in unique_files:
+            results[source_file], keys = self._check_manifest(
+                source_file,
+                formats,
+                output_names.get(source_file),
+                _SINGLE_PARSE if single_parse else _PER_FORMAT,
+                force,
+            )
+            if keys:
+                pending[source_file] = keys
+
+        with Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task(
+                f"Exporting to {names}",
+                total=len(unique_files),
+                completed=len(unique_files) - len(pending),
+            )
+            if not pending:
+                return self._in_order(results, unique_files, formats)
+
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(pending)),
+                # Forking a process with live threads (like the progress
+                # bar's) can deadlock the children
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_export_worker,
+                initargs=(self,),
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _export_in_worker,
+                        source_file,
+                        list(keys),
+                        single_parse,
+                        output_names.get(source_file),
+                    ): source_file
+                    for source_file, keys in pending.items()
+                }
+                for future in as_completed(futures):
+                    source_file = futures[future]
+                    try:
+                        format_results = future.result()
+                    except Exception as e:
+                        format_results = {
+                            format_type: ExportResult(
+                                success=False, error=f"Export failed: {str(e)}"
+                            )
+                            for format_type in pending[source_file]
+                        }
+                    results[source_file].update(format_results)
+                    self._record_exports(
+                        source_file, pending[source_file], format_results
+                    )
+
+                    for result in format_results.values():
+                        if not result.success:
+                            progress.console.print(
+                                f"✗ {source_file.name}: {result.error}", style="red"
+                            )
+                    progress.advance(task)
+
+        return self._in_order(results, unique_files, formats)
+
+    @staticmethod
+    def _in_order(
+        results: Dict[Path, Dict[ExportFormat, ExportResult]],
+        source_files: List[Path],
+        formats: List[ExportFormat],
+    ) -> Dict[Path, Dict[ExportFormat, ExportResult]]:
+        """Order results by source file and format as they were requested."""
+        return {
+            source_file: {
+                format_type: results[source_file][format_type]
+                for format_type in formats
+            }
+            for source_file in source_files
+        }
+
+    def _run_pandoc(
+        self, source_path: Path, output_path: Path, format_type: ExportFormat
+    ) -> None:
+        """Convert a document with pandoc, on a pooled server when enabled.
+
+        Raises:
+            PandocError: If pandoc is not installed
+            subprocess.CalledProcessError: If the pandoc command fails
+        """
+        pandoc = probe_pandoc()
+        if pandoc is None:
+            raise PandocError("pandoc is not installed")
+
+        pool = get_server_pool() if self.use_pandoc_server else None
+        if pool is not None:
+            try:
+                if self._convert_on_server(pool, source_path, output_path, format_type):
+                    return
+            except PandocError:
+                # The command line reports the same problem in more detail,
+                # and works when this pandoc has no server mode
+                pass
+
+        if format_type == ExportFormat.PDF:
             cmd = [
-                "pandoc",
+                pandoc.path,
                 str(source_path),
                 "-o",
                 str(output_path),
                 "--pdf-engine=weasyprint",
-                (
-                    "--css=styles/professional.css"
-                    if Path("styles/professional.css").exists()
-                    else ""
-                ),
+                f"--css={PDF_CSS}" if PDF_CSS.exists() else "",
+            ]
+        else:
+            cmd = [
+                pandoc.path,
+                str(source_path),
+                "-o",
+                str(output_path),
+                f"--reference-doc={REFERENCE_DOC}" if REFERENCE_DOC.exists() else "",
             ]
-            cmd = [arg for arg in cmd if arg]  # Remove empty args
+        cmd = [arg for arg in cmd if arg]  # Remove empty args
+
+        subprocess.run(cmd, check=True, capture_output=True, text=True)  # nosec
+
+    def _convert_on_server(
+        self,
+        pool: PandocServerPool,
+        source_path: Path,
+        output_path: Path,
+        format_type: ExportFormat,
+    ) -> bool:
+        """Convert a document on a pandoc server.
+
+        Servers cannot run a PDF engine, so a PDF is printed with weasyprint
+        from the standalone HTML the server makes.
+
+        Returns:
+            False if the conversion needs the command line instead
+        """
+        with open(source_path, "r", encoding="utf-8") as f:
+            md_content = f.read()
+
+        if format_type == ExportFormat.PDF:
+            try:
+                context = self._render_context()
+            except ImportError:
+                return False
+
+            page = pool.convert(md_content, "html5", {"standalone": True})
+            # Like the pandoc command line, resolve resources from the
+            # working directory
+            context.write_pdf(
+                page.decode("utf-8"),
+                output_path,
+                context.custom_stylesheets,
+                base_url=str(Path.cwd()),
+            )
+            return True
 
-            subprocess.run(cmd, check=True, capture_output=True, text=True)  # nosec
+        options: Dict[str, Any] = {}
+        files = None
+        if REFERENCE_DOC.exists():
+            options["reference-doc"] = REFERENCE_DOC.name
+            files = {REFERENCE_DOC.name: REFERENCE_DOC}
+        output_path.write_bytes(pool.convert(md_content, "docx", options, files))
+        return True
+
+    def _export_to_pdf(self, source_path: Path, output_path: Path) -> ExportResult:
+        """Export markdown to PDF using pandoc or weasyprint."""
+        try:
+            # Try pandoc first
+            self._run_pandoc(source_path, output_path, ExportFormat.PDF)
             return ExportResult(success=True, output_path=output_path)
 
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.CalledProcessError, OSError, PandocError):
             # Fallback to weasyprint directly
             try:
                 import markdown  # type: ignore
-                import weasyprint  # type: ignore
+
+                context = self._render_context()
 
                 # Convert markdown to HTML first
                 with open(source_path, "r", encoding="utf-8") as f:
@@ -160,30 +908,13 @@ class DocumentExporter:
                     md_content, extensions=["tables", "toc"]
                 )
 
-                # Add basic styling
-                styled_html = f"""
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <meta charset="utf-8">
-                    <style>
-                        body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 2cm; }}
-                        h1, h2, h3 {{ color: #2c3e50; }}
-                        table {{ border-collapse: collapse; width: 100%; margin: 1em 0; }}
-                        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                        th {{ background-color: #f2f2f2; }}
-                        code {{ background-color: #f4f4f4; padding: 2px 4px; }}
-                        pre {{ background-color: #f4f4f4; padding: 1em; overflow-x: auto; }}
-                    </style>
-                </head>
-                <body>
-                    {html_content}
-                </body>
-                </html>
-                """
-
                 # Convert to PDF
-                weasyprint.HTML(string=styled_html).write_pdf(output_path)
+                context.write_pdf(
+                    _pdf_page(html_content),
+                    output_path,
+                    context.stylesheets + context.custom_stylesheets,
+                    base_url=str(Path.cwd()),
+                )
                 return ExportResult(success=True, output_path=output_path)
 
             except ImportError:
@@ -198,23 +929,10 @@ class DocumentExporter:
         """Export markdown to DOCX using pandoc or python-docx."""
         try:
             # Try pandoc first
-            cmd = [
-                "pandoc",
-                str(source_path),
-                "-o",
-                str(output_path),
-                (
-                    "--reference-doc=styles/reference.docx"
-                    if Path("styles/reference.docx").exists()
-                    else ""
-                ),
-            ]
-            cmd = [arg for arg in cmd if arg]  # Remove empty args
-
-            subprocess.run(cmd, check=True, capture_output=True, text=True)  # nosec
+            self._run_pandoc(source_path, output_path, ExportFormat.DOCX)
             return ExportResult(success=True, output_path=output_path)
 
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.CalledProcessError, OSError, PandocError):
             # Fallback to python-docx
             try:
                 from docx import Document  # type: ignore
@@ -266,78 +984,10 @@ class DocumentExporter:
                 md_content, extensions=["tables", "toc", "fenced_code", "codehilite"]
             )
 
-            # Add basic HTML structure and styling
-            styled_html = f"""
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="utf-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>{source_path.stem}</title>
-                <style>
-                    body {{
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                        line-height: 1.6;
-                        max-width: 1000px;
-                        margin: 0 auto;
-                        padding: 2rem;
-                        color: #333;
-                    }}
-                    h1, h2, h3, h4, h5, h6 {{ color: #2c3e50; margin-top: 2rem; }}
-                    h1 {{ border-bottom: 3px solid #3498db; padding-bottom: 0.5rem; }}
-                    h2 {{ border-bottom: 2px solid #ecf0f1; padding-bottom: 0.3rem; }}
-                    table {{
-                        border-collapse: collapse;
-                        width: 100%;
-                        margin: 1.5rem 0;
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                    }}
-                    th, td {{
-                        border: 1px solid #ddd;
-                        padding: 12px;
-                        text-align: left;
-                    }}
-                    th {{
-                        background-color: #3498db;
-                        color: white;
-                        font-weight: bold;
-                    }}
-                    tr:nth-child(even) {{ background-color: #f8f9fa; }}
-                    code {{
-                        background-color: #f4f4f4;
-                        padding: 2px 4px;
-                        border-radius: 3px;
-                        font-family: 'Monaco', 'Menlo', monospace;
-                    }}
-                    pre {{
-                        background-color: #f8f9fa;
-                        padding: 1rem;
-                        border-radius: 5px;
-                        overflow-x: auto;
-                        border-left: 4px solid #3498db;
-                    }}
-                    blockquote {{
-                        border-left: 4px solid #3498db;
-                        margin: 1rem 0;
-                        padding: 0.5rem 1rem;
-                        background-color: #f8f9fa;
-                    }}
-                    .toc {{
-                        background-color: #ecf0f1;
-                        padding: 1rem;
-                        border-radius: 5px;
-                        margin: 2rem 0;
-                    }}
-                </style>
-            </head>
-            <body>
-                {html_content}
-            </body>
-            </html>
-            """
-
             with open(output_path, "w", encoding="utf-8") as f:
-                f.write(styled_html)
+                f.write(
+                    self._html_document(source_path.stem, html_content, output_path)
+                )
 
             return ExportResult(success=True, output_path=output_path)
 
@@ -364,6 +1014,7 @@ class DocumentExporter:
         return {
             "total_files": len(results),
             "successful": successful,
+            "skipped": sum(1 for result in results.values() if result.skipped),
             "failed": failed,
             "success_rate": (successful / len(results) * 100) if results else 0,
             "output_files": [
@@ -377,3 +1028,240 @@ class DocumentExporter:
                 if not result.success and result.error
             ],
         }
+
+
+def _print_result(result: ExportResult) -> None:
+    """Print the outcome of one export."""
+    if result.skipped:
+        console.print(f"= Unchanged: {result.output_path}", style="dim")
+    elif result.success:
+        console.print(f"✓ Exported to: {result.output_path}", style="green")
+    else:
+        console.print(f"✗ Failed: {result.error}", style="red")
+
+
+def _init_export_worker(exporter: DocumentExporter) -> None:
+    """Keep the exporter a worker process exports with."""
+    global _worker_exporter
+    _worker_exporter = exporter
+
+
+def _export_in_worker(
+    source_path: Path,
+    formats: List[ExportFormat],
+    single_parse: bool,
+    output_name: Optional[str],
+) -> Dict[ExportFormat, ExportResult]:
+    """Export one document in a worker process."""
+    exporter: DocumentExporter = _worker_exporter  # type: ignore[assignment]
+    if single_parse:
+        return exporter.export_document_multi(source_path, formats, output_name)
+    return {
+        format_type: exporter.export_document(source_path, format_type, output_name)
+        for format_type in formats
+    }
+
+
+def _html_page(
+    title: str, html_content: str, stylesheet_href: Optional[str] = None
+) -> str:
+    """Wrap rendered markdown in a styled standalone HTML page.
+
+    The page links to stylesheet_href if given, and otherwise inlines
+    HTML_STYLESHEET.
+    """
+    if stylesheet_href is not None:
+        style = f'<link rel="stylesheet" href="{html.escape(stylesheet_href)}">'
+    else:
+        style = f"<style>\n{HTML_STYLESHEET}</style>"
+    return f"""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>{title}</title>
+        {style}
+    </head>
+    <body>
+        {html_content}
+    </body>
+    </html>
+    """
+
+
+def _pdf_page(html_content: str) -> str:
+    """Wrap rendered markdown in the HTML page PDFs are printed from.
+
+    The page is unstyled: PDF_STYLESHEET is applied by the render context.
+    """
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="utf-8">
+    </head>
+    <body>
+        {html_content}
+    </body>
+    </html>
+    """
+
+
+# python-docx default template styles of list levels 1 to 3
+_LIST_STYLES = {"ul": "List Bullet", "ol": "List Number"}
+_MAX_LIST_DEPTH = 3
+_CODE_FONT = "Courier New"
+
+
+def _reference_document(document_class: Any) -> Any:
+    """Create an empty python-docx document with REFERENCE_DOC's styles.
+
+    Like pandoc, only the reference document's styles and page setup are
+    used; its content is dropped.
+    """
+    if not REFERENCE_DOC.exists():
+        return document_class()
+    doc = document_class(str(REFERENCE_DOC))
+    body = doc.element.body
+    for child in list(body):
+        if not child.tag.endswith("}sectPr"):
+            body.remove(child)
+    return doc
+
+
+def _style(doc: Any, name: Optional[str]) -> Optional[str]:
+    """Get a paragraph or table style if the document defines it.
+
+    Reference documents need not define every style of python-docx's
+    default template, and text in a missing style falls back to Normal.
+    """
+    return name if name is not None and name in doc.styles else None
+
+
+def _add_docx_blocks(
+    doc: Any, element: Element, parsed: ParsedDocument, style: Optional[str] = None
+) -> None:
+    """Add the block elements of a markdown tree to a python-docx document."""
+    for child in element:
+        tag = child.tag
+        if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+            doc.add_paragraph(
+                _inline_text(parsed, "".join(child.itertext())),
+                style=_style(doc, f"Heading {tag[1]}"),
+            )
+        elif tag == "p":
+            raw = parsed.raw_block(child)
+            if raw is None:
+                _add_runs(doc.add_paragraph(style=_style(doc, style)), child, parsed)
+            elif "<pre" in raw:
+                # Fenced code blocks reach the tree as stashed raw HTML
+                _add_code(doc, html.unescape(_HTML_TAG.sub("", raw)))
+            elif _HTML_TAG.sub("", raw).strip():
+                doc.add_paragraph(
+                    html.unescape(_HTML_TAG.sub("", raw)).strip(),
+                    style=_style(doc, style),
+                )
+        elif tag in _LIST_STYLES:
+            _add_list(doc, child, parsed, depth=1)
+        elif tag == "pre":
+            _add_code(doc, parsed.text("".join(child.itertext())))
+        elif tag == "blockquote":
+            _add_docx_blocks(doc, child, parsed, style="Quote")
+        elif tag == "table":
+            _add_table(doc, child, parsed)
+        elif tag == "div":
+            _add_docx_blocks(doc, child, parsed, style)
+        elif tag != "hr":
+            text = _inline_text(parsed, "".join(child.itertext()))
+            if text:
+                doc.add_paragraph(text, style=_style(doc, style))
+
+
+def _add_list(doc: Any, element: Element, parsed: ParsedDocument, depth: int) -> None:
+    """Add a bulleted or numbered list, one paragraph per item."""
+    list_style = _LIST_STYLES[element.tag]
+    if depth > 1:
+        list_style += f" {min(depth, _MAX_LIST_DEPTH)}"
+    style = _style(doc, list_style)
+
+    for item in element:
+        paragraph = doc.add_paragraph(style=style)
+        _add_runs(paragraph, item, parsed)
+        for block in item:
+            if block.tag == "p":
+                # Items of loose lists wrap their text in paragraphs
+                _add_runs(paragraph, block, parsed)
+            elif block.tag in _LIST_STYLES:
+                _add_list(doc, block, parsed, depth + 1)
+
+
+def _add_table(doc: Any, element: Element, parsed: ParsedDocument) -> None:
+    """Add a markdown table as a Word table with bold header cells."""
+    rows = list(element.iter("tr"))
+    if not rows:
+        return
+    columns = max(len(row) for row in rows)
+    table = doc.add_table(rows=len(rows), cols=columns)
+    table.style = _style(doc, "Table Grid")
+
+    for row, cells in zip(table.rows, rows):
+        for cell, source_cell in zip(row.cells, cells):
+            _add_runs(
+                cell.paragraphs[0], source_cell, parsed, bold=source_cell.tag == "th"
+            )
+
+
+def _add_code(doc: Any, code: str) -> None:
+    """Add a code block as one paragraph in a monospaced font."""
+    run = doc.add_paragraph().add_run(code.rstrip("\n"))
+    run.font.name = _CODE_FONT
+
+
+def _add_runs(
+    paragraph: Any,
+    element: Element,
+    parsed: ParsedDocument,
+    bold: bool = False,
+    italic: bool = False,
+    code: bool = False,
+) -> None:
+    """Add an element's inline text to a paragraph as formatted runs."""
+
+    def add(fragment: Optional[str]) -> None:
+        text = _WHITESPACE.sub(" ", parsed.text(fragment))
+        # Whitespace only separates runs, so none is added before the first
+        if text.strip() or (text and paragraph.runs):
+            run = paragraph.add_run(text)
+            # Unset properties are inherited; setting them costs an element
+            if bold:
+                run.bold = True
+            if italic:
+                run.italic = True
+            if code:
+                run.font.name = _CODE_FONT
+
+    add(element.text)
+    for child in element:
+        if child.tag in ("p", "ul", "ol"):
+            # Blocks inside list items are added by _add_list()
+            continue
+        if child.tag == "br":
+            paragraph.add_run().add_break()
+        elif child.tag == "img":
+            add(child.get("alt"))
+        else:
+            _add_runs(
+                paragraph,
+                child,
+                parsed,
+                bold=bold or child.tag in ("strong", "b"),
+                italic=italic or child.tag in ("em", "i"),
+                code=code or child.tag == "code",
+            )
+        add(child.tail)
+
+
+def _inline_text(parsed: ParsedDocument, fragment: str) -> str:
+    """Get the plain text of an inline fragment on a single line."""
+    return _WHITESPACE.sub(" ", parsed.text(fragment)).strip()
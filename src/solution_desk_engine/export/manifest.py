@@ -0,0 +1,108 @@
+"""Manifest of exported documents, for skipping exports that are current."""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+MANIFEST_NAME = ".export-manifest.json"
+
+
+class ExportManifest:
+    """Records the export key each output in a directory was written from.
+
+    An export key hashes everything an output depends on: the source
+    content, the format, the stylesheet or reference document and the
+    exporter version. An output whose recorded key matches the key of a
+    new export from the same source, and which still exists, is current
+    and need not be written again.
+
+    The manifest is a JSON file in the output directory, so it travels
+    with the outputs it describes. Outputs are recorded by their path
+    relative to that directory.
+    """
+
+    def __init__(self, output_dir: Path, manifest_name: str = MANIFEST_NAME):
+        """Initialize export manifest.
+
+        Args:
+            output_dir: Directory the exported documents are written to
+            manifest_name: File name of the manifest in that directory
+        """
+        self.output_dir = output_dir
+        self.manifest_path = output_dir / manifest_name
+        self._lock = threading.Lock()
+        self._outputs: Dict[str, Dict[str, str]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        """Load recorded outputs, starting empty if the file is unreadable."""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return dict(json.load(f).get("outputs", {}))
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def is_current(
+        self, output_path: Path, key: str, source_path: Optional[Path] = None
+    ) -> bool:
+        """Check whether an output exists and was written from a key.
+
+        Args:
+            output_path: Path of the output
+            key: Export key of the new export
+            source_path: Source of the new export; if given, the output must
+                have been written from it
+        """
+        with self._lock:
+            entry = self._outputs.get(self._entry_name(output_path))
+        return (
+            entry is not None
+            and entry.get("key") == key
+            and (source_path is None or entry.get("source") == _source(source_path))
+            and output_path.exists()
+        )
+
+    def record(
+        self, output_path: Path, key: str, source_path: Optional[Path] = None
+    ) -> None:
+        """Record the key and source an output was just written from."""
+        entry = {"key": key}
+        if source_path is not None:
+            entry["source"] = _source(source_path)
+        with self._lock:
+            self._outputs[self._entry_name(output_path)] = entry
+            self._save()
+
+    def forget(self, output_path: Path) -> None:
+        """Drop an output, so its next export writes it again."""
+        with self._lock:
+            if self._outputs.pop(self._entry_name(output_path), None) is not None:
+                self._save()
+
+    def __len__(self) -> int:
+        """Get the number of recorded outputs."""
+        with self._lock:
+            return len(self._outputs)
+
+    def _entry_name(self, output_path: Path) -> str:
+        """Get the name an output is recorded under."""
+        try:
+            return output_path.relative_to(self.output_dir).as_posix()
+        except ValueError:
+            return output_path.as_posix()
+
+    def _save(self) -> None:
+        """Write the manifest atomically. Callers must hold self._lock."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"outputs": self._outputs}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.manifest_path)
+
+
+def _source(source_path: Path) -> str:
+    """Get how a source is recorded, the same from any working directory."""
+    return str(source_path.resolve())
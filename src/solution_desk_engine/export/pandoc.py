@@ -0,0 +1,337 @@
+"""Process-wide pandoc detection and a pool of long-lived pandoc servers."""
+
+import atexit
+import base64
+import functools
+import http.client
+import json
+import multiprocessing.util
+import queue
+import re
+import shutil
+import socket
+import subprocess  # nosec
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# `pandoc server` ships with pandoc 3.0 and later
+SERVER_MIN_VERSION = (3, 0)
+
+# Seconds a server may take to accept connections after starting
+SERVER_START_TIMEOUT = 10.0
+
+# Seconds pandoc may spend on one conversion before the server aborts it
+SERVER_CONVERSION_TIMEOUT = 120
+
+_VERSION = re.compile(r"pandoc(?:\.exe)?\s+(\d+(?:\.\d+)*)")
+
+
+class PandocError(Exception):
+    """Raised when pandoc cannot convert a document."""
+
+
+@dataclass(frozen=True)
+class PandocInfo:
+    """An installed pandoc and what it supports."""
+
+    path: str
+    version: Tuple[int, ...]
+
+    @property
+    def has_server(self) -> bool:
+        """Whether this pandoc can run as an HTTP conversion server."""
+        return self.version >= SERVER_MIN_VERSION
+
+
+@functools.lru_cache(maxsize=None)
+def probe_pandoc() -> Optional[PandocInfo]:
+    """Find pandoc on PATH and read its version, once per process.
+
+    Returns:
+        The installed pandoc, or None if it is missing or does not run
+    """
+    path = shutil.which("pandoc")
+    if path is None:
+        return None
+    try:
+        completed = subprocess.run(  # nosec
+            [path, "--version"], check=True, capture_output=True, text=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    match = _VERSION.search(completed.stdout)
+    version = tuple(int(part) for part in match.group(1).split(".")) if match else ()
+    return PandocInfo(path=path, version=version)
+
+
+class _PandocServer:
+    """One `pandoc server` process listening on a local port."""
+
+    def __init__(self, pandoc: PandocInfo, timeout: int) -> None:
+        self.port = _free_port()
+        self.process = subprocess.Popen(  # nosec
+            [
+                pandoc.path,
+                "server",
+                "--port",
+                str(self.port),
+                "--timeout",
+                str(timeout),
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            self._wait_until_listening()
+        except PandocError:
+            self.close()
+            raise
+
+    def _wait_until_listening(self) -> None:
+        """Wait until the server accepts connections."""
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise PandocError(
+                    f"pandoc server exited with code {self.process.returncode}"
+                )
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.05)
+        raise PandocError("pandoc server did not start listening")
+
+    @property
+    def alive(self) -> bool:
+        """Whether the server process is still running."""
+        return self.process.poll() is None
+
+    def convert(self, options: Dict[str, Any]) -> bytes:
+        """Send one conversion to the server and return its output."""
+        connection = http.client.HTTPConnection(
+            "127.0.0.1", self.port, timeout=SERVER_CONVERSION_TIMEOUT + 5
+        )
+        try:
+            connection.request(
+                "POST",
+                "/",
+                body=json.dumps(options),
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
+            )
+            response = connection.getresponse()
+            body = response.read()
+        finally:
+            connection.close()
+
+        if response.status != 200:
+            raise PandocError(
+                f"pandoc server returned {response.status}: "
+                f"{body.decode('utf-8', 'replace').strip()}"
+            )
+        try:
+            result = json.loads(body)
+        except ValueError:
+            # Servers answer plain text when they cannot produce JSON
+            raise PandocError(body.decode("utf-8", "replace").strip())
+        if "error" in result:
+            raise PandocError(str(result["error"]))
+
+        output = result.get("output", "")
+        if result.get("base64"):
+            return base64.b64decode(output)
+        return str(output).encode("utf-8")
+
+    def close(self) -> None:
+        """Stop the server process."""
+        if self.alive:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+
+class PandocServerPool:
+    """Pool of long-lived `pandoc server` processes.
+
+    Starting pandoc costs far more than converting a typical document, so
+    instead of running pandoc once per file, conversions are sent over HTTP
+    to servers that stay up for the life of the process. Servers are
+    started on demand, up to max_servers at once, so a single-threaded
+    exporter runs one server and N concurrent threads at most N.
+
+    Unlike the pandoc command line, a server cannot read local files or run
+    a PDF engine: files a conversion needs, such as a reference document,
+    are sent with the request, and PDFs are printed from server-made HTML.
+    """
+
+    def __init__(
+        self,
+        pandoc: PandocInfo,
+        max_servers: int = 1,
+        timeout: int = SERVER_CONVERSION_TIMEOUT,
+    ) -> None:
+        """Initialize pandoc server pool.
+
+        Args:
+            pandoc: The pandoc to run servers of
+            max_servers: Most servers running at once
+            timeout: Seconds one conversion may take
+
+        Raises:
+            ValueError: If this pandoc has no server mode
+        """
+        if not pandoc.has_server:
+            raise ValueError("pandoc server requires pandoc 3.0 or later")
+        self.pandoc = pandoc
+        self.max_servers = max(1, max_servers)
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[_PandocServer]" = queue.LifoQueue()
+        self._servers: List[_PandocServer] = []
+        self._starting = 0
+        self._start_error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def convert(
+        self,
+        text: str,
+        to: str,
+        options: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Path]] = None,
+    ) -> bytes:
+        """Convert markdown text on a pooled server.
+
+        Args:
+            text: Markdown source
+            to: Pandoc output format, e.g. "docx" or "html5"
+            options: Further pandoc server options, e.g. {"standalone": True}
+            files: Local files the conversion refers to, by the name used
+                in options
+
+        Returns:
+            The converted document
+
+        Raises:
+            PandocError: If no server could be started or the conversion fails
+        """
+        request: Dict[str, Any] = {"text": text, "from": "markdown", "to": to}
+        request.update(options or {})
+        if files:
+            request["files"] = {
+                name: base64.b64encode(path.read_bytes()).decode("ascii")
+                for name, path in files.items()
+            }
+
+        server = self._acquire()
+        try:
+            return server.convert(request)
+        except (OSError, http.client.HTTPException) as error:
+            raise PandocError(f"pandoc server request failed: {error}")
+        finally:
+            self._release(server)
+
+    def _acquire(self) -> _PandocServer:
+        """Take an idle server, starting one if the pool has room."""
+        while True:
+            try:
+                server = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    if self._closed:
+                        raise PandocError("pandoc server pool is closed")
+                    if self._start_error is not None and not self._servers:
+                        # A pandoc whose server failed to start once is not
+                        # retried for every document
+                        raise PandocError(self._start_error)
+                    start = len(self._servers) + self._starting < self.max_servers
+                    if start:
+                        self._starting += 1
+                if not start:
+                    server = self._idle.get()
+                else:
+                    try:
+                        server = _PandocServer(self.pandoc, self.timeout)
+                    except (OSError, PandocError) as error:
+                        with self._lock:
+                            self._start_error = str(error)
+                        raise PandocError(str(error))
+                    finally:
+                        with self._lock:
+                            self._starting -= 1
+                    with self._lock:
+                        self._servers.append(server)
+                    return server
+
+            if server.alive:
+                return server
+            # A server that died is replaced on the next pass
+            with self._lock:
+                self._servers.remove(server)
+
+    def _release(self, server: _PandocServer) -> None:
+        """Return a server to the pool, or stop it if the pool is closed."""
+        with self._lock:
+            closed = self._closed
+        if closed:
+            server.close()
+        else:
+            self._idle.put(server)
+
+    def close(self) -> None:
+        """Stop every server in the pool."""
+        with self._lock:
+            self._closed = True
+            servers, self._servers = self._servers, []
+        for server in servers:
+            server.close()
+
+    def __len__(self) -> int:
+        """Get the number of running servers."""
+        with self._lock:
+            return len(self._servers)
+
+
+_server_pool: Optional[PandocServerPool] = None
+_server_pool_lock = threading.Lock()
+
+
+def get_server_pool(max_servers: int = 1) -> Optional[PandocServerPool]:
+    """Get the process-wide pandoc server pool, creating it on first use.
+
+    The pool's servers are stopped when the process exits, including
+    worker processes of a multiprocessing pool, which skip atexit hooks.
+
+    Args:
+        max_servers: Most servers running at once; only used when the pool
+            is created
+
+    Returns:
+        The pool, or None if pandoc is missing or has no server mode
+    """
+    global _server_pool
+    with _server_pool_lock:
+        if _server_pool is None:
+            pandoc = probe_pandoc()
+            if pandoc is None or not pandoc.has_server:
+                return None
+            _server_pool = PandocServerPool(pandoc, max_servers)
+            atexit.register(_server_pool.close)
+            multiprocessing.util.Finalize(None, _server_pool.close, exitpriority=10)
+        return _server_pool
+
+
+def _free_port() -> int:
+    """Get a local TCP port that is free right now."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
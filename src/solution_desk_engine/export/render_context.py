@@ -0,0 +1,73 @@
+"""Stylesheets and fonts shared by every PDF of an export batch."""
+
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+
+class PdfRenderContext:
+    """Parsed stylesheets and a font configuration for printing PDFs.
+
+    Printing a page with weasyprint parses every stylesheet it is given and
+    sets up fonts, which for the short documents of a proposal costs about
+    as much as laying them out. A context does both once: its stylesheets
+    are parsed into weasyprint CSS objects when it is created, and every
+    PDF it writes shares them and one FontConfiguration, so fonts loaded by
+    @font-face rules are loaded once per batch rather than once per page.
+
+    A context holds weasyprint objects, so it is created per process.
+    """
+
+    def __init__(self, stylesheet: str, custom_stylesheet: Optional[Path] = None):
+        """Initialize PDF render context.
+
+        Args:
+            stylesheet: CSS of the pages printed from rendered markdown
+            custom_stylesheet: Stylesheet file of pages printed from
+                pandoc's standalone HTML; ignored if it does not exist
+
+        Raises:
+            ImportError: If weasyprint is not installed
+        """
+        import weasyprint  # type: ignore
+
+        self._weasyprint = weasyprint
+        self.font_config = _font_configuration()
+        self.stylesheets: List[Any] = [
+            weasyprint.CSS(string=stylesheet, font_config=self.font_config)
+        ]
+        self.custom_stylesheets: List[Any] = []
+        if custom_stylesheet is not None and custom_stylesheet.exists():
+            self.custom_stylesheets.append(
+                weasyprint.CSS(
+                    filename=str(custom_stylesheet), font_config=self.font_config
+                )
+            )
+
+    def write_pdf(
+        self,
+        page: str,
+        output_path: Path,
+        stylesheets: Sequence[Any],
+        base_url: Optional[str] = None,
+    ) -> None:
+        """Print an HTML page to a PDF file.
+
+        Args:
+            page: The HTML page
+            output_path: Path of the PDF to write
+            stylesheets: Parsed stylesheets of this context to apply
+            base_url: Where relative links in the page are resolved from
+        """
+        self._weasyprint.HTML(string=page, base_url=base_url).write_pdf(
+            output_path, stylesheets=list(stylesheets), font_config=self.font_config
+        )
+
+
+def _font_configuration() -> Any:
+    """Create a weasyprint font configuration."""
+    try:
+        from weasyprint.text.fonts import FontConfiguration  # type: ignore
+    except ImportError:
+        # weasyprint before 53 kept fonts in a top-level module
+        from weasyprint.fonts import FontConfiguration  # type: ignore
+    return FontConfiguration()
@@ -0,0 +1,66 @@
+"""Content hashes stamped on uploaded Drive files to deduplicate uploads."""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+APP_PROPERTY_HASH = "sdeContentSha256"
+APP_PROPERTY_SOURCE = "sdeSourcePath"
+
+# Drive limits each app property to 124 bytes of UTF-8, key and value together
+MAX_APP_PROPERTY_BYTES = 124
+
+
+def hash_bytes(content: bytes) -> str:
+    """Get the SHA-256 hex digest of some content."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """Get the SHA-256 hex digest of a file, reading it in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def app_properties(
+    content_hash: str, source_path: Optional[Union[str, Path]] = None
+) -> Dict[str, str]:
+    """Build the appProperties recording where an upload came from.
+
+    Source paths too long for a Drive app property keep their last part.
+
+    Args:
+        content_hash: Hash identifying the uploaded content
+        source_path: Optional path of the file the upload was made from
+
+    Returns:
+        appProperties for a Drive file create or update request
+    """
+    properties = {APP_PROPERTY_HASH: content_hash}
+    if source_path is not None:
+        budget = MAX_APP_PROPERTY_BYTES - len(APP_PROPERTY_SOURCE.encode("utf-8"))
+        source = str(source_path).encode("utf-8")[-budget:]
+        properties[APP_PROPERTY_SOURCE] = source.decode("utf-8", errors="ignore")
+    return properties
+
+
+def content_hash_query(content_hash: str, folder_id: Optional[str] = None) -> str:
+    """Build a Drive search query for files stamped with a content hash.
+
+    Args:
+        content_hash: Hash identifying the uploaded content
+        folder_id: Optional folder the file must be in
+
+    Returns:
+        Drive files.list query
+    """
+    query = (
+        f"appProperties has {{ key='{APP_PROPERTY_HASH}' and "
+        f"value='{content_hash}' }} and trashed=false"
+    )
+    if folder_id:
+        query += f" and '{folder_id}' in parents"
+    return query
@@ -0,0 +1,127 @@
+"""Process-wide cache of Google API discovery documents and services."""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from googleapiclient.discovery import build_from_document  # type: ignore
+from googleapiclient.discovery_cache import get_static_doc  # type: ignore
+
+# Services hold their credentials, so only those of the most recently used
+# credentials are kept: a long-running process that keeps re-authenticating
+# does not accumulate one service per credentials object
+MAX_CACHED_SERVICES = 16
+
+_services: "OrderedDict[Tuple[str, str, Any], CachedResource]" = OrderedDict()
+_services_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_discovery_document(api: str, version: str) -> str:
+    """Get the discovery document bundled with googleapiclient.
+
+    Building from the bundled document never fetches discovery JSON over
+    the network, and the file is read once per process.
+
+    Args:
+        api: API name, e.g. "drive"
+        version: API version, e.g. "v3"
+
+    Returns:
+        Discovery document JSON
+
+    Raises:
+        ValueError: If no discovery document is bundled for the API
+    """
+    content = get_static_doc(api, version)
+    if content is None:
+        raise ValueError(f"No bundled discovery document for {api} {version}")
+    return str(content)
+
+
+def build_service(
+    api: str,
+    version: str,
+    credentials: Optional[Any] = None,
+    http: Optional[Any] = None,
+) -> "CachedResource":
+    """Build a Google API service from the bundled discovery document.
+
+    Services built from credentials are memoized per credentials object, so
+    every client in a process sharing credentials shares one service; the
+    least recently used of more than MAX_CACHED_SERVICES are dropped. A
+    service built on an explicit HTTP transport is not memoized, since
+    transports are not shared between threads.
+
+    Args:
+        api: API name, e.g. "drive"
+        version: API version, e.g. "v3"
+        credentials: Credentials to authorize requests with
+        http: Authorized httplib2.Http transport, instead of credentials
+
+    Returns:
+        Google API service resource
+    """
+    # googleapiclient normalizes the parsed document in place while building
+    # resources, so every service parses its own copy
+    document = get_discovery_document(api, version)
+    if http is not None:
+        return CachedResource(build_from_document(document, http=http))
+
+    key = (api, version, credentials)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = CachedResource(
+                build_from_document(document, credentials=credentials)
+            )
+            _services[key] = service
+            if len(_services) > MAX_CACHED_SERVICES:
+                _services.popitem(last=False)
+        else:
+            _services.move_to_end(key)
+    return service
+
+
+def clear_service_cache() -> None:
+    """Forget the memoized services, e.g. after credentials were revoked."""
+    with _services_lock:
+        _services.clear()
+
+
+class CachedResource:
+    """Google API resource whose nested resources are built only once.
+
+    googleapiclient builds a new resource object, including the request
+    methods and their docstrings, every time a nested resource such as
+    ``service.files()`` is called. The built resources only hold the
+    service's HTTP transport, so they are kept and reused instead.
+    """
+
+    def __init__(self, resource: Any) -> None:
+        """Initialize cached resource.
+
+        Args:
+            resource: googleapiclient resource to wrap
+        """
+        self._resource = resource
+        self._children: Dict[str, CachedResource] = {}
+        self._lock = threading.Lock()
+        self._child_names = set(resource._resourceDesc.get("resources", {}))
+
+    def __getattr__(self, name: str) -> Any:
+        """Get a resource attribute, caching nested resource collections."""
+        attribute = getattr(self._resource, name)
+        if name not in self._child_names:
+            return attribute
+        return functools.partial(self._get_child, name, attribute)
+
+    def _get_child(self, name: str, build_child: Any) -> "CachedResource":
+        """Get a nested resource, building it on first use."""
+        with self._lock:
+            child = self._children.get(name)
+            if child is None:
+                child = CachedResource(build_child())
+                self._children[name] = child
+        return child
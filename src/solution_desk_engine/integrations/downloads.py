@@ -0,0 +1,82 @@
+"""Naming, export formats and results for bulk Drive downloads."""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+from googleapiclient.http import DEFAULT_CHUNK_SIZE  # type: ignore
+
+# Chunk size of MediaIoBaseDownload unless a caller picks another
+DEFAULT_DOWNLOAD_CHUNK_SIZE: int = DEFAULT_CHUNK_SIZE
+
+# Google Workspace files have no binary content; they are exported instead
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "application/vnd.google-apps.document": (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        ".docx",
+    ),
+    "application/vnd.google-apps.spreadsheet": (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        ".xlsx",
+    ),
+    "application/vnd.google-apps.presentation": (
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        ".pptx",
+    ),
+    "application/vnd.google-apps.drawing": ("application/pdf", ".pdf"),
+}
+
+GOOGLE_APPS_PREFIX = "application/vnd.google-apps."
+
+_UNSAFE_NAME_CHARACTERS = re.compile(r'[\x00-\x1f/\\:*?"<>|]')
+
+
+@dataclass
+class DownloadProgress:
+    """Progress of one file download, reported after every chunk."""
+
+    file_id: str
+    name: str
+    bytes_done: int
+    total_bytes: Optional[int]
+    done: bool = False
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of downloading one file within a download_many() call."""
+
+    file_id: str
+    name: str
+    success: bool
+    path: Optional[Path] = None
+    bytes: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def download_file_name(file: Dict[str, Any], used_names: Set[str]) -> str:
+    """Get a local file name for a Drive file, unique within a download.
+
+    Characters that are unsafe in file names are replaced, exported files
+    get their format's extension, and a name already used by another file
+    gets the file ID appended.
+
+    Args:
+        file: Drive file metadata with id, name and mimeType
+        used_names: Lower-cased names already taken; the new name is added
+
+    Returns:
+        The file name
+    """
+    name = _UNSAFE_NAME_CHARACTERS.sub("_", file.get("name") or "").strip(" .")
+    name = name or file["id"]
+    export = EXPORT_FORMATS.get(file.get("mimeType", ""))
+    if export is not None and not name.lower().endswith(export[1]):
+        name += export[1]
+    if name.lower() in used_names:
+        path = Path(name)
+        name = f"{path.stem} ({file['id']}){path.suffix}"
+    used_names.add(name.lower())
+    return name
@@ -0,0 +1,250 @@
+"""Local SQLite index of Google Drive folder trees."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+
+@dataclass
+class SyncResult:
+    """Summary of one folder tree sync."""
+
+    folder_id: str
+    full: bool
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+
+
+class DriveIndex:
+    """Metadata of synced Drive folder trees, stored in a SQLite file.
+
+    Each synced root folder keeps the Changes API page token up to which its
+    files are current, so the next sync only applies later changes. Reads
+    never contact Drive and are as fresh as the last sync.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        """Initialize Drive index.
+
+        Args:
+            db_path: Path to the SQLite database. Defaults to
+                ~/.solution-desk-engine/cache/drive_index.sqlite3
+        """
+        self.db_path = db_path or self._get_default_db_path()
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def _get_default_db_path(self) -> Path:
+        """Get default Drive index database path."""
+        return Path(
+            os.path.expanduser("~/.solution-desk-engine/cache/drive_index.sqlite3")
+        )
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Get the database connection, creating the database on first use.
+
+        Callers must hold self._lock.
+        """
+        if self._db is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(
+                self.db_path, check_same_thread=False, timeout=30
+            )
+            with self._db:
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS roots ("
+                    "folder_id TEXT PRIMARY KEY, page_token TEXT NOT NULL, "
+                    "synced_at REAL NOT NULL)"
+                )
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS files ("
+                    "id TEXT PRIMARY KEY, root_id TEXT NOT NULL, parent_id TEXT, "
+                    "mime_type TEXT, metadata TEXT NOT NULL)"
+                )
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS files_parent ON files (parent_id)"
+                )
+        return self._db
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def roots(self) -> Dict[str, float]:
+        """Get the synced root folders and when each was last synced."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT folder_id, synced_at FROM roots ORDER BY folder_id"
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def get_page_token(self, root_id: str) -> Optional[str]:
+        """Get the Changes API page token a root folder is current up to."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT page_token FROM roots WHERE folder_id = ?", (root_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_page_token(self, root_id: str, page_token: str) -> None:
+        """Record that a root folder is current up to a page token."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO roots (folder_id, page_token, synced_at) "
+                "VALUES (?, ?, ?)",
+                (root_id, page_token, time.time()),
+            )
+
+    def root_of(self, item_id: str) -> Optional[str]:
+        """Get the synced root folder containing a file or folder.
+
+        Args:
+            item_id: Drive file or folder ID
+
+        Returns:
+            The root folder ID (item_id itself for a root), or None if the
+            item is not indexed
+        """
+        with self._lock:
+            if self._connection.execute(
+                "SELECT 1 FROM roots WHERE folder_id = ?", (item_id,)
+            ).fetchone():
+                return item_id
+            row = self._connection.execute(
+                "SELECT root_id FROM files WHERE id = ?", (item_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def contains_folder(self, root_id: str, folder_id: str) -> bool:
+        """Whether a folder is a root folder or an indexed folder under it."""
+        if folder_id == root_id:
+            return True
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM files WHERE id = ? AND root_id = ? AND mime_type = ?",
+                (folder_id, root_id, FOLDER_MIME_TYPE),
+            ).fetchone()
+        return row is not None
+
+    def get_file(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """Get the indexed metadata of a file."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT metadata FROM files WHERE id = ?", (file_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list_children(self, folder_id: str) -> List[Dict[str, Any]]:
+        """Get the indexed metadata of the files directly inside a folder."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT metadata FROM files WHERE parent_id = ? ORDER BY rowid",
+                (folder_id,),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def upsert(self, root_id: str, file: Dict[str, Any]) -> bool:
+        """Store a file's metadata under a root folder.
+
+        Args:
+            root_id: Synced root folder containing the file
+            file: Drive file metadata, including its parents
+
+        Returns:
+            True if the file was not indexed before
+        """
+        with self._lock, self._connection:
+            return self._upsert(root_id, file)
+
+    def _upsert(self, root_id: str, file: Dict[str, Any]) -> bool:
+        """Store a file's metadata. Callers must hold self._lock."""
+        existed = self._connection.execute(
+            "SELECT 1 FROM files WHERE id = ?", (file["id"],)
+        ).fetchone()
+        parents = file.get("parents") or [None]
+        self._connection.execute(
+            "INSERT OR REPLACE INTO files (id, root_id, parent_id, mime_type, "
+            "metadata) VALUES (?, ?, ?, ?, ?)",
+            (
+                file["id"],
+                root_id,
+                parents[0],
+                file.get("mimeType"),
+                json.dumps({k: v for k, v in file.items() if k != "trashed"}),
+            ),
+        )
+        return existed is None
+
+    def remove(self, file_id: str) -> int:
+        """Remove a file and, for a folder, everything indexed inside it.
+
+        Returns:
+            Number of removed files
+        """
+        with self._lock, self._connection:
+            return self._connection.execute(
+                "DELETE FROM files WHERE id IN ("
+                "WITH RECURSIVE tree(id) AS (SELECT ? UNION "
+                "SELECT files.id FROM files JOIN tree ON files.parent_id = tree.id) "
+                "SELECT id FROM tree)",
+                (file_id,),
+            ).rowcount
+
+    def replace_root(
+        self, root_id: str, files: Iterable[Dict[str, Any]], page_token: str
+    ) -> int:
+        """Replace everything indexed under a root folder.
+
+        Args:
+            root_id: Root folder ID
+            files: Metadata of every file in the folder tree
+            page_token: Changes API page token the listing is current up to
+
+        Returns:
+            Number of indexed files
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM files WHERE root_id = ?", (root_id,))
+            count = 0
+            for file in files:
+                self._upsert(root_id, file)
+                count += 1
+            self._connection.execute(
+                "INSERT OR REPLACE INTO roots (folder_id, page_token, synced_at) "
+                "VALUES (?, ?, ?)",
+                (root_id, page_token, time.time()),
+            )
+        return count
+
+    def forget(self, root_id: str) -> int:
+        """Stop indexing a root folder.
+
+        Returns:
+            Number of removed files
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM roots WHERE folder_id = ?", (root_id,)
+            )
+            return self._connection.execute(
+                "DELETE FROM files WHERE root_id = ?", (root_id,)
+            ).rowcount
+
+    def __len__(self) -> int:
+        """Get the number of indexed files."""
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM files").fetchone()
+        return int(row[0])
@@ -0,0 +1,303 @@
+"""Persistent resolution of Drive folder paths to folder IDs."""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set, Union
+
+# find(name, parent_id) returns the ID of an existing folder, or None
+FindFolder = Callable[[str, Optional[str]], Optional[str]]
+# create(name, parent_id) creates a folder and returns its ID
+CreateFolder = Callable[[str, Optional[str]], str]
+# exists(folder_id) tells whether a folder is still on Drive and not trashed
+FolderExists = Callable[[str], bool]
+
+ROOT_KEY = "root"
+
+
+class _Flight:
+    """One in-progress lookup or creation that other threads wait for."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.folder_id: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+class FolderResolver:
+    """Maps folder paths to Drive folder IDs, creating missing folders once.
+
+    Every folder is stored under its parent's ID and its name, so a path is
+    resolved one level at a time and each level is looked up on Drive at
+    most once. When several threads resolve the same missing folder, one of
+    them looks it up or creates it and the others wait for its result, so
+    concurrent workers never create duplicate folders.
+
+    Resolved IDs are written to a JSON file, so later runs need no Drive
+    requests for folders resolved before. A folder deleted or trashed since
+    is noticed on first use when resolve() is given an exists check, and
+    resolved again. Each write merges this resolver's changes into the file
+    as it is on disk, so concurrent runs keep each other's folders.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None, persist: bool = True):
+        """Initialize folder resolver.
+
+        Args:
+            cache_path: Path to the JSON file of resolved folder IDs.
+                Defaults to ~/.solution-desk-engine/cache/drive_folders.json
+            persist: Whether to load and save resolved IDs. When False,
+                they are kept in memory only.
+        """
+        self.cache_path = cache_path or self._get_default_cache_path()
+        self.persist = persist
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._folders: Dict[str, str] = self._load() if persist else {}
+        # Changes not yet written, with None for dropped entries
+        self._changes: Dict[str, Optional[str]] = {}
+        self._cleared = False
+        # Folders looked up, created or checked on Drive by this resolver
+        self._verified: Set[str] = set()
+
+    def _get_default_cache_path(self) -> Path:
+        """Get default folder ID cache path."""
+        return Path(
+            os.path.expanduser("~/.solution-desk-engine/cache/drive_folders.json")
+        )
+
+    def _load(self) -> Dict[str, str]:
+        """Load resolved IDs, starting empty if the file is unreadable."""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return dict(json.load(f).get("folders", {}))
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def resolve(
+        self,
+        path: Union[str, Sequence[str]],
+        find: FindFolder,
+        create: CreateFolder,
+        root_id: Optional[str] = None,
+        exists: Optional[FolderExists] = None,
+    ) -> str:
+        """Get the ID of a folder path, creating missing folders.
+
+        Args:
+            path: Folder names from the root down, as a sequence or a
+                "/"-separated string
+            find: Looks up an existing folder by name and parent ID
+            create: Creates a folder by name and parent ID
+            root_id: Folder the path starts in. Defaults to My Drive.
+            exists: Checks a stored folder is still on Drive. When given, a
+                stored ID is checked the first time this resolver returns
+                it; if it is gone, the first gone folder of the path is
+                forgotten with everything under it and the path resolved
+                again.
+
+        Returns:
+            ID of the last folder in the path
+
+        Raises:
+            ValueError: If the path is empty
+        """
+        names = self._split(path)
+        if not names:
+            raise ValueError("Folder path must name at least one folder")
+
+        try:
+            folder_ids = self._resolve_path(names, find, create, root_id)
+        except Exception:
+            # A lookup or creation fails in a stored parent that is gone
+            if exists is None or not self._forget_gone(
+                self._stored_ids(names, root_id), exists
+            ):
+                raise
+            return self._resolve_path(names, find, create, root_id)[-1]
+
+        folder_id = folder_ids[-1]
+        if exists is None or folder_id in self._verified:
+            return folder_id
+        if exists(folder_id):
+            self._verified.add(folder_id)
+            return folder_id
+        if not self._forget_gone(folder_ids[:-1], exists):
+            self.forget(folder_id)
+        return self._resolve_path(names, find, create, root_id)[-1]
+
+    def _forget_gone(self, folder_ids: List[str], exists: FolderExists) -> bool:
+        """Forget the first folder of a path that is gone from Drive.
+
+        Returns:
+            Whether a folder was forgotten
+        """
+        for folder_id in folder_ids:
+            if folder_id in self._verified:
+                continue
+            if not exists(folder_id):
+                self.forget(folder_id)
+                return True
+            self._verified.add(folder_id)
+        return False
+
+    def _stored_ids(self, names: List[str], root_id: Optional[str]) -> List[str]:
+        """Get the stored IDs of a path's folders, from the top down."""
+        folder_ids: List[str] = []
+        parent_id = root_id
+        with self._lock:
+            for name in names:
+                parent_id = self._folders.get(self._key(parent_id, name))
+                if parent_id is None:
+                    break
+                folder_ids.append(parent_id)
+        return folder_ids
+
+    def _resolve_path(
+        self,
+        names: List[str],
+        find: FindFolder,
+        create: CreateFolder,
+        root_id: Optional[str],
+    ) -> List[str]:
+        """Get the ID of every folder of a path, from the top down."""
+        folder_ids: List[str] = []
+        parent_id = root_id
+        for name in names:
+            parent_id = self._resolve_child(parent_id, name, find, create)
+            folder_ids.append(parent_id)
+        return folder_ids
+
+    def get(
+        self, path: Union[str, Sequence[str]], root_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Get the stored ID of a folder path without contacting Drive.
+
+        Returns:
+            The folder ID, or None if some folder in the path is unresolved
+        """
+        parent_id = root_id
+        with self._lock:
+            for name in self._split(path):
+                parent_id = self._folders.get(self._key(parent_id, name))
+                if parent_id is None:
+                    return None
+        return parent_id
+
+    def forget(self, folder_id: str) -> int:
+        """Drop a folder and everything resolved inside it.
+
+        Use this when a stored folder was deleted or trashed on Drive, so
+        the next resolution looks it up or creates it again.
+
+        Returns:
+            Number of dropped entries
+        """
+        with self._lock:
+            doomed = {key for key, id_ in self._folders.items() if id_ == folder_id}
+            pending = [folder_id]
+            while pending:
+                prefix = f"{pending.pop()}/"
+                for key, child_id in self._folders.items():
+                    if key.startswith(prefix) and key not in doomed:
+                        doomed.add(key)
+                        pending.append(child_id)
+            for key in doomed:
+                self._verified.discard(self._folders.pop(key))
+                self._changes[key] = None
+            if doomed:
+                self._save()
+        return len(doomed)
+
+    def clear(self) -> None:
+        """Drop every resolved folder."""
+        with self._lock:
+            self._folders.clear()
+            self._changes.clear()
+            self._verified.clear()
+            self._cleared = True
+            self._save()
+
+    def __len__(self) -> int:
+        """Get the number of resolved folders."""
+        with self._lock:
+            return len(self._folders)
+
+    def _resolve_child(
+        self,
+        parent_id: Optional[str],
+        name: str,
+        find: FindFolder,
+        create: CreateFolder,
+    ) -> str:
+        """Get the ID of one folder, single-flighting its lookup."""
+        key = self._key(parent_id, name)
+        with self._lock:
+            folder_id = self._folders.get(key)
+            if folder_id is not None:
+                return folder_id
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.folder_id  # type: ignore[return-value]
+
+        try:
+            folder_id = find(name, parent_id) or create(name, parent_id)
+            flight.folder_id = folder_id
+            with self._lock:
+                self._folders[key] = folder_id
+                self._changes[key] = folder_id
+                self._verified.add(folder_id)
+                self._save()
+            return folder_id
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    @staticmethod
+    def _split(path: Union[str, Sequence[str]]) -> List[str]:
+        """Split a folder path into its folder names."""
+        names = path.split("/") if isinstance(path, str) else list(path)
+        return [name for name in names if name]
+
+    @staticmethod
+    def _key(parent_id: Optional[str], name: str) -> str:
+        """Get the storage key of a folder name under a parent."""
+        return f"{parent_id or ROOT_KEY}/{name}"
+
+    def _save(self) -> None:
+        """Merge changes into the file and write it atomically.
+
+        The file is read again first, so folders another process resolved
+        since this one loaded it are kept. Callers must hold self._lock.
+        """
+        if not self.persist:
+            self._changes.clear()
+            return
+        folders = {} if self._cleared else self._load()
+        for key, folder_id in self._changes.items():
+            if folder_id is None:
+                folders.pop(key, None)
+            else:
+                folders[key] = folder_id
+        self._folders = folders
+        self._changes.clear()
+        self._cleared = False
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"folders": self._folders}, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.cache_path)
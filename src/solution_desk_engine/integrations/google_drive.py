@@ -2,34 +2,134 @@
 
 import io
 import os
-from typing import Any, Dict, Optional
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
+import httplib2  # type: ignore
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp  # type: ignore
 from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
-from googleapiclient.discovery import build  # type: ignore
 from googleapiclient.errors import HttpError  # type: ignore
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload  # type: ignore
+from googleapiclient.http import (  # type: ignore
+    MediaFileUpload,
+    MediaIoBaseDownload,
+    MediaIoBaseUpload,
+)
+
+from ..timing import timed_stage
+from .content_hash import (
+    APP_PROPERTY_HASH,
+    app_properties,
+    content_hash_query,
+    hash_bytes,
+    hash_file,
+)
+from .discovery import build_service
+from .downloads import (
+    DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    EXPORT_FORMATS,
+    GOOGLE_APPS_PREFIX,
+    DownloadProgress,
+    DownloadResult,
+    download_file_name,
+)
+from .drive_index import FOLDER_MIME_TYPE, DriveIndex, SyncResult
+from .folder_resolver import FolderResolver
+from .metadata_cache import MetadataCache
+from .request_executor import (
+    RequestExecutor,
+    is_not_found_error,
+    is_retryable_error,
+)
+from .resumable_upload import (
+    UploadJournal,
+    UploadReport,
+    upload_resumable,
+    validate_chunk_size,
+)
+from .template_cache import TemplateCache
 
 # Scopes required for Google Drive API access
 SCOPES = ["https://www.googleapis.com/auth/drive.file"]
 
+DOCX_MIME_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
+GOOGLE_DOC_MIME_TYPE = "application/vnd.google-apps.document"
+
+FILE_INFO_FIELDS = "id,name,mimeType,createdTime,modifiedTime,webViewLink"
+INDEX_FIELDS = f"{FILE_INFO_FIELDS},version,parents"
+CHANGES_FIELDS = (
+    "nextPageToken,newStartPageToken,"
+    f"changes(fileId,removed,file({INDEX_FIELDS},trashed))"
+)
+
+# Maximum number of calls Drive accepts in one batch request
+MAX_BATCH_SIZE = 100
+
 
 class GoogleDriveClient:
     """Google Drive API client for downloading and uploading documents."""
 
+    # Whether one client may serve requests from several threads at once
+    thread_safe = False
+
     def __init__(
-        self, credentials_path: Optional[str] = None, token_path: Optional[str] = None
+        self,
+        credentials_path: Optional[str] = None,
+        token_path: Optional[str] = None,
+        template_cache: Optional[TemplateCache] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        request_executor: Optional[RequestExecutor] = None,
+        drive_index: Optional[DriveIndex] = None,
+        chunk_size: Optional[int] = None,
+        upload_journal: Optional[UploadJournal] = None,
+        folder_resolver: Optional[FolderResolver] = None,
     ) -> None:
         """Initialize Google Drive client.
 
         Args:
             credentials_path: Path to OAuth2 credentials JSON file
             token_path: Path to store/load user token
+            template_cache: Optional cache for DOCX exports of Google Docs
+            metadata_cache: Optional cache for file metadata and folder
+                listings. Expired file metadata is revalidated against the
+                file's Drive version before being fetched again.
+            request_executor: Executor rate-limiting and retrying API
+                requests. Defaults to one sized to Drive's per-user quota.
+            drive_index: Optional local index of folder trees kept current
+                by sync_folder(). Files and folders in a synced tree are
+                looked up in the index instead of on Drive.
+            chunk_size: Optional upload chunk size in bytes, a multiple of
+                256 KiB. When set, DOCX uploads are resumable and sent in
+                chunks of this size; a failed chunk is retried on its own.
+            upload_journal: Optional journal of resumable upload sessions,
+                used with chunk_size to resume uploads interrupted in an
+                earlier run
+            folder_resolver: Resolver of folder paths to folder IDs used by
+                resolve_folder_path(). Defaults to one kept in memory; pass
+                a persistent one to reuse resolved IDs across runs.
         """
         self.credentials_path = credentials_path or self._get_default_credentials_path()
         self.token_path = token_path or self._get_default_token_path()
-        self._service = None
+        self.template_cache = template_cache
+        self.metadata_cache = metadata_cache
+        self.request_executor = request_executor or RequestExecutor()
+        self.drive_index = drive_index
+        self.chunk_size = validate_chunk_size(chunk_size) if chunk_size else None
+        self.upload_journal = upload_journal
+        self.folder_resolver = folder_resolver or FolderResolver(persist=False)
+        # Size and duration of every upload made by this client
+        self.upload_reports: List[UploadReport] = []
+        # Synced trees this client changed, brought up to date on next read
+        self._stale_roots: Set[str] = set()
+        self._service: Any = None
 
     def _get_default_credentials_path(self) -> str:
         """Get default path for Google OAuth2 credentials."""
@@ -81,13 +181,18 @@ class GoogleDriveClient:
     def _get_service(self) -> Any:
         """Get authenticated Google Drive service instance."""
         if self._service is None:
-            creds = self._authenticate()
-            self._service = build("drive", "v3", credentials=creds)
+            with timed_stage("drive.auth"):
+                creds = self._authenticate()
+                self._service = build_service("drive", "v3", credentials=creds)
         return self._service
 
     def download_doc_as_docx(self, file_id: str, output_path: str) -> None:
         """Download Google Doc as DOCX file.
 
+        When a template cache is configured, the document's modifiedTime is
+        checked first and an unchanged document is served from the cache
+        instead of being exported again.
+
         Args:
             file_id: Google Drive file ID
             output_path: Local path to save DOCX file
@@ -96,36 +201,243 @@ class GoogleDriveClient:
             HttpError: If Google Drive API request fails
             IOError: If file write fails
         """
+        version = None
+        if self.template_cache is not None:
+            version = self.get_file_info(file_id).get("modifiedTime")
+            cached_path = self.template_cache.get(file_id, version) if version else None
+            if cached_path is not None:
+                with timed_stage("template_cache.hit") as stage:
+                    shutil.copyfile(cached_path, output_path)
+                    stage.add_bytes(os.path.getsize(output_path))
+                return
+
+        self._export_doc_as_docx(file_id, output_path)
+
+        if self.template_cache is not None and version:
+            self.template_cache.put(file_id, version, output_path)
+
+    def download_doc_as_bytes(self, file_id: str) -> bytes:
+        """Download Google Doc as DOCX content held in memory.
+
+        Uses the template cache the same way as download_doc_as_docx, but
+        never writes the export to a local file.
+
+        Args:
+            file_id: Google Drive file ID
+
+        Returns:
+            DOCX file content
+
+        Raises:
+            HttpError: If Google Drive API request fails
+        """
+        version = None
+        if self.template_cache is not None:
+            version = self.get_file_info(file_id).get("modifiedTime")
+            cached_path = self.template_cache.get(file_id, version) if version else None
+            if cached_path is not None:
+                with timed_stage("template_cache.hit") as stage:
+                    content = cached_path.read_bytes()
+                    stage.add_bytes(len(content))
+                return content
+
+        buffer = io.BytesIO()
+        self._export_doc_to_stream(file_id, buffer)
+        content = buffer.getvalue()
+
+        if self.template_cache is not None and version:
+            self.template_cache.put_bytes(file_id, version, content)
+
+        return content
+
+    def _export_doc_as_docx(self, file_id: str, output_path: str) -> None:
+        """Export Google Doc as DOCX file via the Drive API."""
+        try:
+            with io.FileIO(output_path, "wb") as fh:
+                self._export_doc_to_stream(file_id, fh)
+        except HttpError:
+            raise
+        except Exception as error:
+            raise IOError(f"Failed to save file to {output_path}: {error}")
+
+    def _export_doc_to_stream(self, file_id: str, fh: Any) -> None:
+        """Export Google Doc as DOCX into a writable binary stream."""
         try:
             service = self._get_service()
 
             # Export Google Doc as DOCX
             request = service.files().export_media(
-                fileId=file_id,
-                mimeType="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                fileId=file_id, mimeType=DOCX_MIME_TYPE
             )
 
             # Download file
-            with io.FileIO(output_path, "wb") as fh:
+            with timed_stage("drive.export") as stage:
+                start = fh.tell()
                 downloader = MediaIoBaseDownload(fh, request)
                 done = False
                 while not done:
-                    status, done = downloader.next_chunk()
+                    status, done = self.request_executor.call(
+                        downloader.next_chunk, "drive.files.export"
+                    )
+                stage.add_bytes(fh.tell() - start)
 
         except HttpError as error:
             raise HttpError(f"Failed to download Google Doc {file_id}: {error}")
-        except Exception as error:
-            raise IOError(f"Failed to save file to {output_path}: {error}")
+
+    def download_many(
+        self,
+        file_ids: List[str],
+        dest_dir: Union[str, Path],
+        max_workers: int = 8,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[Callable[[DownloadProgress], None]] = None,
+    ) -> List[DownloadResult]:
+        """Download many files into a local directory concurrently.
+
+        The metadata of all files is fetched with one batched lookup. Google
+        Docs, Sheets, Slides and Drawings are exported as DOCX, XLSX, PPTX
+        and PDF; other files are downloaded as they are. Each file is written
+        to a temporary file and renamed into place once complete, and a file
+        that fails is reported in its result without stopping the others.
+
+        Only thread-safe clients (PooledGoogleDriveClient) download several
+        files at once; this client downloads one file at a time.
+
+        Args:
+            file_ids: Google Drive file IDs
+            dest_dir: Directory to save the files in, created if missing
+            max_workers: Maximum number of concurrent downloads
+            chunk_size: Bytes requested per download chunk
+            progress: Optional callback receiving a DownloadProgress after
+                every chunk. It is called from worker threads.
+
+        Returns:
+            One DownloadResult per unique file ID, in input order
+
+        Raises:
+            HttpError: If the metadata lookup fails
+        """
+        dest = Path(dest_dir)
+        dest.mkdir(parents=True, exist_ok=True)
+        unique_ids = list(dict.fromkeys(file_ids))
+        files = self.get_files_info(unique_ids)
+
+        # Names are assigned up front, so duplicates resolve the same way
+        # however the downloads are scheduled
+        used_names: Set[str] = set()
+        jobs = []
+        for file_id in unique_ids:
+            file = files.get(file_id)
+            name = download_file_name(file, used_names) if file else file_id
+            jobs.append((file_id, file, name))
+
+        def run(job: Tuple[str, Optional[Dict[str, Any]], str]) -> DownloadResult:
+            file_id, file, name = job
+            if file is None:
+                return DownloadResult(
+                    file_id, name, False, error="File not found or not accessible"
+                )
+            start = time.perf_counter()
+            try:
+                size = self._download_file(file, dest / name, chunk_size, progress)
+                return DownloadResult(
+                    file_id, name, True, dest / name, size, time.perf_counter() - start
+                )
+            except Exception as error:
+                return DownloadResult(
+                    file_id,
+                    name,
+                    False,
+                    seconds=time.perf_counter() - start,
+                    error=str(error),
+                )
+
+        workers = max(1, max_workers) if self.thread_safe else 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, jobs))
+
+    def _download_file(
+        self,
+        file: Dict[str, Any],
+        path: Path,
+        chunk_size: int,
+        progress: Optional[Callable[[DownloadProgress], None]],
+    ) -> int:
+        """Download or export one file to a local path.
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            HttpError: If Google Drive API request fails
+            ValueError: If the file type cannot be downloaded
+        """
+        mime_type = file.get("mimeType", "")
+        service = self._get_service()
+
+        export = EXPORT_FORMATS.get(mime_type)
+        if export is not None:
+            request = service.files().export_media(
+                fileId=file["id"], mimeType=export[0]
+            )
+            endpoint = "drive.files.export"
+        elif mime_type.startswith(GOOGLE_APPS_PREFIX):
+            raise ValueError(f"Files of type {mime_type} cannot be downloaded")
+        else:
+            request = service.files().get_media(
+                fileId=file["id"], supportsAllDrives=True
+            )
+            endpoint = "drive.files.get_media"
+
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                downloader = MediaIoBaseDownload(fh, request, chunksize=chunk_size)
+                done = False
+                while not done:
+                    status, done = self.request_executor.call(
+                        downloader.next_chunk, endpoint
+                    )
+                    if progress is not None:
+                        progress(
+                            DownloadProgress(
+                                file["id"],
+                                path.name,
+                                status.resumable_progress,
+                                status.total_size,
+                                done,
+                            )
+                        )
+                size = fh.tell()
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return size
 
     def upload_docx_as_google_doc(
-        self, docx_path: str, name: str, folder_id: Optional[str] = None
+        self,
+        docx_path: str,
+        name: str,
+        folder_id: Optional[str] = None,
+        deduplicate: bool = False,
+        content_hash: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Upload DOCX file as Google Doc.
 
+        The new Google Doc is stamped with appProperties holding the source
+        path and a content hash. Rendered DOCX files embed timestamps, so
+        callers that render documents should pass a hash of their inputs
+        instead for deduplication to ever match.
+
         Args:
             docx_path: Path to DOCX file to upload
             name: Name for the new Google Doc
             folder_id: Optional Google Drive folder ID to upload to
+            deduplicate: Reuse a Google Doc stamped earlier with the same
+                content hash (in the same folder) instead of uploading again
+            content_hash: Hash identifying the content. Defaults to a hash
+                of the DOCX file
 
         Returns:
             Dictionary containing file ID and web view link
@@ -137,32 +449,140 @@ class GoogleDriveClient:
         if not os.path.exists(docx_path):
             raise FileNotFoundError(f"DOCX file not found: {docx_path}")
 
+        properties = app_properties(content_hash or hash_file(docx_path), docx_path)
+        media = self._docx_file_media(docx_path)
+        return self._create_google_doc(media, name, folder_id, properties, deduplicate)
+
+    def upload_docx_bytes_as_google_doc(
+        self,
+        content: bytes,
+        name: str,
+        folder_id: Optional[str] = None,
+        deduplicate: bool = False,
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Upload in-memory DOCX content as Google Doc.
+
+        Args:
+            content: DOCX file content
+            name: Name for the new Google Doc
+            folder_id: Optional Google Drive folder ID to upload to
+            deduplicate: Reuse a Google Doc stamped earlier with the same
+                content hash (in the same folder) instead of uploading again
+            content_hash: Hash identifying the content. Defaults to a hash
+                of the DOCX content
+
+        Returns:
+            Dictionary containing file ID and web view link
+
+        Raises:
+            HttpError: If Google Drive API request fails
+        """
+        properties = app_properties(content_hash or hash_bytes(content))
+        media = self._docx_bytes_media(content)
+        return self._create_google_doc(media, name, folder_id, properties, deduplicate)
+
+    def _docx_file_media(self, docx_path: str) -> Any:
+        """Build upload media for a DOCX file, chunked if configured."""
+        if self.chunk_size is None:
+            return MediaFileUpload(docx_path, mimetype=DOCX_MIME_TYPE)
+        return MediaFileUpload(
+            docx_path,
+            mimetype=DOCX_MIME_TYPE,
+            chunksize=self.chunk_size,
+            resumable=True,
+        )
+
+    def _docx_bytes_media(self, content: bytes) -> Any:
+        """Build upload media for DOCX content, chunked if configured."""
+        if self.chunk_size is None:
+            return MediaIoBaseUpload(io.BytesIO(content), mimetype=DOCX_MIME_TYPE)
+        return MediaIoBaseUpload(
+            io.BytesIO(content),
+            mimetype=DOCX_MIME_TYPE,
+            chunksize=self.chunk_size,
+            resumable=True,
+        )
+
+    def _send_upload(
+        self, request: Any, media: Any, name: str, endpoint: str, journal_key: str
+    ) -> Dict[str, Any]:
+        """Send a request carrying upload media and record its throughput.
+
+        Args:
+            request: Drive files.create or files.update request
+            media: The request's upload media
+            name: File name for the upload report
+            endpoint: Counter name for the request executor
+            journal_key: Key identifying the upload in the upload journal
+
+        Returns:
+            The API response
+        """
+        if self.chunk_size is not None:
+            file, report = upload_resumable(
+                request,
+                self.request_executor,
+                name,
+                endpoint,
+                self.upload_journal,
+                journal_key,
+            )
+        else:
+            start = time.perf_counter()
+            file = self.request_executor.execute(request, endpoint)
+            report = UploadReport(name, media.size(), time.perf_counter() - start)
+        self.upload_reports.append(report)
+        return file
+
+    def _create_google_doc(
+        self,
+        media: Any,
+        name: str,
+        folder_id: Optional[str],
+        properties: Dict[str, str],
+        deduplicate: bool = False,
+    ) -> Dict[str, Any]:
+        """Create a Google Doc from DOCX media, converting on upload."""
+        if deduplicate:
+            existing = self.find_file_by_content_hash(
+                properties[APP_PROPERTY_HASH], folder_id
+            )
+            if existing is not None:
+                return self._reuse_google_doc(existing, name)
+
         try:
             service = self._get_service()
 
             # File metadata
-            file_metadata = {
+            file_metadata: Dict[str, Any] = {
                 "name": name,
-                "mimeType": "application/vnd.google-apps.document",  # Convert to Google Doc
+                "mimeType": GOOGLE_DOC_MIME_TYPE,  # Convert to Google Doc
+                "appProperties": properties,
             }
 
             # Add to folder if specified
             if folder_id:
-                file_metadata["parents"] = [folder_id]  # type: ignore
-
-            # Upload file
-            media = MediaFileUpload(
-                docx_path,
-                mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            )
+                file_metadata["parents"] = [folder_id]
 
-            file = (
-                service.files()
-                .create(
-                    body=file_metadata, media_body=media, fields="id,webViewLink,name"
+            with timed_stage("drive.upload") as stage:
+                file = self._send_upload(
+                    service.files().create(
+                        body=file_metadata,
+                        media_body=media,
+                        fields="id,webViewLink,name",
+                    ),
+                    media,
+                    name,
+                    "drive.files.create",
+                    f"create:{folder_id or ''}:{name}:{properties[APP_PROPERTY_HASH]}",
                 )
-                .execute()
-            )
+                stage.add_bytes(media.size())
+
+            if self.metadata_cache is not None and folder_id:
+                self.metadata_cache.invalidate(f"folder:{folder_id}")
+            if folder_id:
+                self._mark_index_stale(folder_id)
 
             return {
                 "id": file.get("id"),
@@ -173,6 +593,140 @@ class GoogleDriveClient:
         except HttpError as error:
             raise HttpError(f"Failed to upload DOCX as Google Doc: {error}")
 
+    def find_file_by_content_hash(
+        self, content_hash: str, folder_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Find a file stamped with a content hash on upload.
+
+        Args:
+            content_hash: Content hash from the file's appProperties
+            folder_id: Optional Google Drive folder ID the file must be in
+
+        Returns:
+            The file's id, name and webViewLink, or None if there is none
+
+        Raises:
+            HttpError: If Google Drive API request fails
+        """
+        service = self._get_service()
+
+        with timed_stage("drive.find_duplicate"):
+            results = self.request_executor.execute(
+                service.files().list(
+                    q=content_hash_query(content_hash, folder_id),
+                    fields="files(id,name,webViewLink)",
+                    pageSize=1,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                ),
+                "drive.files.list",
+            )
+
+        files = results.get("files", [])
+        return files[0] if files else None
+
+    def _reuse_google_doc(self, file: Dict[str, Any], name: str) -> Dict[str, Any]:
+        """Return an already uploaded Google Doc, renaming it if needed."""
+        if file.get("name") != name:
+            service = self._get_service()
+
+            file = self.request_executor.execute(
+                service.files().update(
+                    fileId=file["id"],
+                    body={"name": name},
+                    fields="id,webViewLink,name",
+                ),
+                "drive.files.update",
+            )
+            self.invalidate_metadata(file_id=file["id"])
+            self._mark_index_stale(file["id"])
+
+        return {
+            "id": file.get("id"),
+            "web_view_link": file.get("webViewLink"),
+            "name": file.get("name"),
+        }
+
+    def update_google_doc_from_docx(
+        self, file_id: str, docx_path: str, content_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Replace the content of an existing Google Doc with a DOCX file.
+
+        Args:
+            file_id: Google Drive file ID of the Google Doc to update
+            docx_path: Path to DOCX file with the new content
+            content_hash: Hash identifying the new content. Defaults to a
+                hash of the DOCX file
+
+        Returns:
+            Dictionary containing file ID and web view link
+
+        Raises:
+            FileNotFoundError: If DOCX file not found
+            HttpError: If Google Drive API request fails
+        """
+        if not os.path.exists(docx_path):
+            raise FileNotFoundError(f"DOCX file not found: {docx_path}")
+
+        properties = app_properties(content_hash or hash_file(docx_path), docx_path)
+        media = self._docx_file_media(docx_path)
+        return self._update_google_doc(file_id, media, properties)
+
+    def update_google_doc_from_docx_bytes(
+        self, file_id: str, content: bytes, content_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Replace the content of an existing Google Doc with DOCX content.
+
+        Args:
+            file_id: Google Drive file ID of the Google Doc to update
+            content: DOCX file content
+            content_hash: Hash identifying the new content. Defaults to a
+                hash of the DOCX content
+
+        Returns:
+            Dictionary containing file ID and web view link
+
+        Raises:
+            HttpError: If Google Drive API request fails
+        """
+        properties = app_properties(content_hash or hash_bytes(content))
+        media = self._docx_bytes_media(content)
+        return self._update_google_doc(file_id, media, properties)
+
+    def _update_google_doc(
+        self, file_id: str, media: Any, properties: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Upload DOCX media as the new content of an existing Google Doc.
+
+        Errors are raised unwrapped, so callers can tell a document that is
+        gone (404 or 410) from other failures.
+        """
+        service = self._get_service()
+
+        with timed_stage("drive.update") as stage:
+            file = self._send_upload(
+                service.files().update(
+                    fileId=file_id,
+                    body={"appProperties": properties},
+                    media_body=media,
+                    fields="id,webViewLink,name",
+                ),
+                media,
+                file_id,
+                "drive.files.update",
+                f"update:{file_id}:{properties[APP_PROPERTY_HASH]}",
+            )
+            stage.add_bytes(media.size())
+
+        self.invalidate_metadata(file_id=file_id)
+        self._mark_index_stale(file_id)
+
+        return {
+            "id": file.get("id"),
+            "web_view_link": file.get("webViewLink"),
+            "name": file.get("name"),
+        }
+
     def get_file_info(self, file_id: str) -> Dict[str, Any]:
         """Get file information from Google Drive.
 
@@ -185,26 +739,132 @@ class GoogleDriveClient:
         Raises:
             HttpError: If Google Drive API request fails
         """
+        indexed = self._get_indexed_file(file_id)
+        if indexed is not None:
+            return indexed
+
+        if self.metadata_cache is None:
+            return self._fetch_file_info(file_id, FILE_INFO_FIELDS)
+
+        def fetch() -> Tuple[Dict[str, Any], Optional[str]]:
+            file_info = self._fetch_file_info(file_id, f"{FILE_INFO_FIELDS},version")
+            return file_info, file_info.get("version")
+
+        def revalidate(version: str) -> bool:
+            return self._fetch_file_info(file_id, "version").get("version") == version
+
+        return self.metadata_cache.get_or_fetch(  # type: ignore
+            f"file:{file_id}", fetch, revalidate
+        )
+
+    def _fetch_file_info(self, file_id: str, fields: str) -> Dict[str, Any]:
+        """Fetch selected metadata fields of a file from the Drive API."""
         try:
             service = self._get_service()
 
-            file_info = (
-                service.files()
-                .get(
-                    fileId=file_id,
-                    fields="id,name,mimeType,createdTime,modifiedTime,webViewLink",
+            with timed_stage("drive.get_file_info"):
+                file_info = self.request_executor.execute(
+                    service.files().get(fileId=file_id, fields=fields),
+                    "drive.files.get",
                 )
-                .execute()
-            )
 
             return file_info  # type: ignore
 
         except HttpError as error:
             raise HttpError(f"Failed to get file info for {file_id}: {error}")
 
+    def get_files_info(
+        self, file_ids: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get information about many files using Drive batch requests.
+
+        Lookups are grouped into batches of up to MAX_BATCH_SIZE calls, so
+        each batch costs a single HTTP round-trip. Files in the Drive index
+        or with fresh entries in the metadata cache are not requested at all. Lookups rejected
+        inside a batch with a rate-limit or server error are sent again in a
+        later batch after a backoff.
+
+        Args:
+            file_ids: Google Drive file IDs
+
+        Returns:
+            Dictionary mapping each file ID to its metadata, or to None if
+            the file does not exist or is not accessible
+
+        Raises:
+            HttpError: If a Google Drive batch request fails, or lookups are
+                still rate-limited once every retry is used
+        """
+        unique_ids = list(dict.fromkeys(file_ids))
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        for file_id in unique_ids:
+            indexed = self._get_indexed_file(file_id)
+            if indexed is not None:
+                results[file_id] = indexed
+        fields = FILE_INFO_FIELDS
+        if self.metadata_cache is not None:
+            fields += ",version"
+            for file_id in unique_ids:
+                if file_id in results:
+                    continue
+                cached = self.metadata_cache.get(f"file:{file_id}")
+                if cached is not None:
+                    results[file_id] = cached
+        to_fetch = [file_id for file_id in unique_ids if file_id not in results]
+        retry_ids: List[str] = []
+        last_error: List[Exception] = []
+
+        def callback(request_id: str, response: Any, exception: Any) -> None:
+            file_id = to_fetch[int(request_id)]
+            if exception is not None and is_retryable_error(exception):
+                retry_ids.append(file_id)
+                last_error[:] = [exception]
+                return
+            results[file_id] = None if exception is not None else response
+            if exception is None and self.metadata_cache is not None:
+                self.metadata_cache.put(
+                    f"file:{file_id}", response, response.get("version")
+                )
+
+        if not to_fetch:
+            return {file_id: results.get(file_id) for file_id in unique_ids}
+
+        service = self._get_service()
+
+        attempt = 0
+        while to_fetch:
+            for start in range(0, len(to_fetch), MAX_BATCH_SIZE):
+                batch = service.new_batch_http_request(callback=callback)
+                end = min(start + MAX_BATCH_SIZE, len(to_fetch))
+                for index in range(start, end):
+                    batch.add(
+                        service.files().get(fileId=to_fetch[index], fields=fields),
+                        request_id=str(index),
+                    )
+                with timed_stage("drive.batch_get_file_info"):
+                    self.request_executor.execute(batch, "drive.batch")
+
+            attempt += 1
+            if not retry_ids or attempt >= self.request_executor.policy.max_attempts:
+                break
+            self.request_executor.wait_before_retry(
+                attempt, last_error[0], "drive.batch"
+            )
+            to_fetch, retry_ids = retry_ids, []
+
+        if retry_ids:
+            # Lookups still throttled after every attempt are not missing
+            # files, so the quota error is raised instead of reporting None
+            raise last_error[0]
+        return {file_id: results.get(file_id) for file_id in unique_ids}
+
     def list_files_in_folder(self, folder_id: str) -> list[Dict[str, Any]]:
         """List files in a Google Drive folder.
 
+        Folders in a synced tree are listed from the Drive index. Otherwise,
+        with a metadata cache the listing is cached until its TTL expires or
+        a document is uploaded to the folder through this client.
+
         Args:
             folder_id: Google Drive folder ID
 
@@ -214,19 +874,464 @@ class GoogleDriveClient:
         Raises:
             HttpError: If Google Drive API request fails
         """
+        root_id = self._get_synced_root(folder_id)
+        if root_id is not None and self.drive_index.contains_folder(  # type: ignore
+            root_id, folder_id
+        ):
+            return self.drive_index.list_children(folder_id)  # type: ignore
+
+        if self.metadata_cache is None:
+            return list(self.iter_files_in_folder(folder_id))
+
+        return self.metadata_cache.get_or_fetch(  # type: ignore
+            f"folder:{folder_id}",
+            lambda: (list(self.iter_files_in_folder(folder_id)), None),
+        )
+
+    def resolve_folder_path(self, path: str, root_id: Optional[str] = None) -> str:
+        """Get the ID of a folder path such as "Customers/Penske/SOWs".
+
+        Missing folders are created. Resolved IDs are remembered by the
+        folder resolver, and concurrent calls for the same missing folder
+        create it only once. A remembered folder is checked on Drive the
+        first time it is used, and resolved again if it was deleted or
+        trashed.
+
+        Args:
+            path: "/"-separated folder names
+            root_id: Folder the path starts in. Defaults to My Drive.
+
+        Returns:
+            ID of the last folder in the path
+
+        Raises:
+            HttpError: If Google Drive API request fails
+        """
+        return self.folder_resolver.resolve(
+            path, self.find_folder, self.create_folder, root_id, self.folder_exists
+        )
+
+    def folder_exists(self, folder_id: str) -> bool:
+        """Check whether a folder is still on Drive and not trashed.
+
+        Args:
+            folder_id: Google Drive folder ID
+
+        Returns:
+            False if the folder was deleted or trashed
+
+        Raises:
+            HttpError: If Google Drive API request fails for another reason
+        """
+        service = self._get_service()
         try:
-            service = self._get_service()
+            with timed_stage("drive.get_file_info"):
+                folder = self.request_executor.execute(
+                    service.files().get(
+                        fileId=folder_id, fields="id,trashed", supportsAllDrives=True
+                    ),
+                    "drive.files.get",
+                )
+        except HttpError as error:
+            if is_not_found_error(error):
+                return False
+            raise
+        return not folder.get("trashed", False)
+
+    def find_folder(self, name: str, parent_id: Optional[str] = None) -> Optional[str]:
+        """Find a folder by name, in a parent folder or anywhere.
+
+        Args:
+            name: Folder name
+            parent_id: Optional Google Drive folder ID to look in
+
+        Returns:
+            The ID of the first matching folder, or None if there is none
+
+        Raises:
+            HttpError: If Google Drive API request fails
+        """
+        root_id = self._get_synced_root(parent_id) if parent_id else None
+        if root_id is not None and self.drive_index.contains_folder(  # type: ignore
+            root_id, parent_id  # type: ignore[arg-type]
+        ):
+            for file in self.drive_index.list_children(parent_id):  # type: ignore
+                if file.get("mimeType") == FOLDER_MIME_TYPE and file["name"] == name:
+                    return str(file["id"])
+            return None
+
+        escaped = name.replace("\\", "\\\\").replace("'", "\\'")
+        query = f"name='{escaped}' and mimeType='{FOLDER_MIME_TYPE}' and trashed=false"
+        if parent_id:
+            query += f" and '{parent_id}' in parents"
+
+        service = self._get_service()
+
+        with timed_stage("drive.find_folder"):
+            results = self.request_executor.execute(
+                service.files().list(
+                    q=query,
+                    fields="files(id)",
+                    pageSize=1,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                ),
+                "drive.files.list",
+            )
+
+        files = results.get("files", [])
+        return files[0]["id"] if files else None
+
+    def create_folder(self, name: str, parent_id: Optional[str] = None) -> str:
+        """Create a folder.
+
+        Args:
+            name: Folder name
+            parent_id: Optional Google Drive folder ID to create it in
+
+        Returns:
+            The new folder's ID
 
-            results = (
-                service.files()
-                .list(
-                    q=f"'{folder_id}' in parents and trashed=false",
-                    fields="files(id,name,mimeType,createdTime,modifiedTime,webViewLink)",
+        Raises:
+            HttpError: If Google Drive API request fails
+        """
+        metadata: Dict[str, Any] = {"name": name, "mimeType": FOLDER_MIME_TYPE}
+        if parent_id:
+            metadata["parents"] = [parent_id]
+
+        service = self._get_service()
+
+        with timed_stage("drive.create_folder"):
+            folder = self.request_executor.execute(
+                service.files().create(
+                    body=metadata, fields="id", supportsAllDrives=True
+                ),
+                "drive.files.create",
+            )
+
+        if parent_id:
+            if self.metadata_cache is not None:
+                self.metadata_cache.invalidate(f"folder:{parent_id}")
+            self._mark_index_stale(parent_id)
+
+        return str(folder["id"])
+
+    def invalidate_metadata(
+        self, file_id: Optional[str] = None, folder_id: Optional[str] = None
+    ) -> None:
+        """Drop cached metadata, e.g. after changing files outside this client.
+
+        Invalidating a file also drops every cached folder listing, since
+        listings include the file's metadata. Without arguments the whole
+        metadata cache is cleared.
+
+        Args:
+            file_id: Optional Google Drive file ID
+            folder_id: Optional Google Drive folder ID
+        """
+        if self.metadata_cache is None:
+            return
+
+        if file_id is None and folder_id is None:
+            self.metadata_cache.clear()
+            return
+        if file_id is not None:
+            self.metadata_cache.invalidate(f"file:{file_id}")
+            self.metadata_cache.invalidate_prefix("folder:")
+        if folder_id is not None:
+            self.metadata_cache.invalidate(f"folder:{folder_id}")
+
+    def sync_folder(self, folder_id: str, full: bool = False) -> SyncResult:
+        """Bring the Drive index of a folder tree up to date.
+
+        The first sync of a folder lists the whole tree and stores the
+        Changes API start page token from just before the listing. Later
+        syncs only request the changes made since the stored token and apply
+        those within the tree: new and modified files are stored, and
+        trashed, deleted or moved-out files are removed. A folder moved into
+        the tree is listed in full, and so is the whole tree if Drive no
+        longer accepts the stored token.
+
+        Args:
+            folder_id: Google Drive folder ID of the tree's root
+            full: List the whole tree again instead of applying changes
+
+        Returns:
+            Counts of added, updated and removed files
+
+        Raises:
+            ValueError: If the client has no Drive index
+            HttpError: If a Google Drive API request fails
+        """
+        if self.drive_index is None:
+            raise ValueError("A Drive index is required to sync folders")
+
+        page_token = None if full else self.drive_index.get_page_token(folder_id)
+        if page_token is None:
+            start_token = self._get_start_page_token()
+            files = list(self._iter_index_files(folder_id))
+            count = self.drive_index.replace_root(folder_id, files, start_token)
+            return SyncResult(folder_id, full=True, added=count)
+
+        result = SyncResult(folder_id, full=False)
+        service = self._get_service()
+
+        while True:
+            try:
+                with timed_stage("drive.changes"):
+                    response = self.request_executor.execute(
+                        service.changes().list(
+                            pageToken=page_token,
+                            fields=CHANGES_FIELDS,
+                            pageSize=1000,
+                            includeRemoved=True,
+                            supportsAllDrives=True,
+                            includeItemsFromAllDrives=True,
+                        ),
+                        "drive.changes.list",
+                    )
+            except HttpError as error:
+                if not is_not_found_error(error):
+                    raise
+                # The stored page token expired or is no longer valid, so
+                # the changes since it are unknown: list the tree again
+                return self.sync_folder(folder_id, full=True)
+
+            for change in response.get("changes", []):
+                self._apply_change(folder_id, change, result)
+
+            # Store progress per page, so an interrupted sync resumes
+            page_token = response.get("nextPageToken")
+            if page_token is None:
+                self.drive_index.set_page_token(
+                    folder_id, response["newStartPageToken"]
                 )
-                .execute()
+                return result
+            self.drive_index.set_page_token(folder_id, page_token)
+
+    def _get_start_page_token(self) -> str:
+        """Get the Changes API token for changes made from now on."""
+        service = self._get_service()
+
+        with timed_stage("drive.changes"):
+            response = self.request_executor.execute(
+                service.changes().getStartPageToken(supportsAllDrives=True),
+                "drive.changes.getStartPageToken",
             )
+        return str(response["startPageToken"])
+
+    def _iter_index_files(self, folder_id: str) -> Iterator[Dict[str, Any]]:
+        """List a folder tree with the fields stored in the Drive index."""
+        return self.iter_files_in_folder(
+            folder_id, fields=INDEX_FIELDS.split(","), recursive=True
+        )
+
+    def _apply_change(
+        self, root_id: str, change: Dict[str, Any], result: SyncResult
+    ) -> None:
+        """Apply one Changes API entry to the index of a folder tree."""
+        index: DriveIndex = self.drive_index  # type: ignore
+        file = change.get("file")
+        if change.get("removed") or file is None or file.get("trashed"):
+            result.removed += index.remove(change["fileId"])
+            return
+
+        if not any(
+            index.contains_folder(root_id, parent) for parent in file.get("parents", [])
+        ):
+            # Changes to files outside the tree, or moved out of it
+            if index.root_of(file["id"]) == root_id:
+                result.removed += index.remove(file["id"])
+            return
 
-            return results.get("files", [])  # type: ignore
+        if not index.upsert(root_id, file):
+            result.updated += 1
+            return
+        result.added += 1
+        if file.get("mimeType") == FOLDER_MIME_TYPE:
+            for child in self._iter_index_files(file["id"]):
+                result.added += int(index.upsert(root_id, child))
+
+    def _get_synced_root(self, item_id: str) -> Optional[str]:
+        """Get the synced tree containing an item, syncing it if stale."""
+        if self.drive_index is None:
+            return None
+        root_id = self.drive_index.root_of(item_id)
+        if root_id is not None and root_id in self._stale_roots:
+            self._stale_roots.discard(root_id)
+            self.sync_folder(root_id)
+        return root_id
+
+    def _get_indexed_file(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """Get a file's metadata from the Drive index, if it is indexed."""
+        if self._get_synced_root(file_id) is None:
+            return None
+        return self.drive_index.get_file(file_id)  # type: ignore
+
+    def _mark_index_stale(self, item_id: str) -> None:
+        """Sync the tree containing an item before it is read again."""
+        if self.drive_index is None:
+            return
+        root_id = self.drive_index.root_of(item_id)
+        if root_id is not None:
+            self._stale_roots.add(root_id)
+
+    def iter_files_in_folder(
+        self,
+        folder_id: str,
+        page_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        recursive: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the files in a Google Drive folder page by page.
+
+        Only one page of results is held at a time, and the next page is
+        requested once the caller has consumed the current one, so memory use
+        stays flat however large the folder is.
+
+        Args:
+            folder_id: Google Drive folder ID
+            page_size: Files requested per page (Drive allows up to 1000)
+            fields: File fields to return. Defaults to FILE_INFO_FIELDS
+            recursive: Also walk subfolders, each after the folder containing
+                it. Subfolders are yielded like any other file
+
+        Yields:
+            File dictionaries
+
+        Raises:
+            HttpError: If Google Drive API request fails
+        """
+        file_fields = list(fields) if fields else FILE_INFO_FIELDS.split(",")
+        if recursive:
+            # Folders can only be recognized and walked with these fields
+            file_fields += [
+                name for name in ("id", "mimeType") if name not in file_fields
+            ]
+        fields_mask = f"nextPageToken,files({','.join(file_fields)})"
+
+        pending = [folder_id]
+        seen = {folder_id}
+        while pending:
+            current_id = pending.pop()
+            for file in self._iter_folder_pages(current_id, page_size, fields_mask):
+                if (
+                    recursive
+                    and file.get("mimeType") == FOLDER_MIME_TYPE
+                    and file["id"] not in seen
+                ):
+                    seen.add(file["id"])
+                    pending.append(file["id"])
+                yield file
+
+    def _iter_folder_pages(
+        self, folder_id: str, page_size: int, fields_mask: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the direct children of one folder, following page tokens."""
+        try:
+            service = self._get_service()
+
+            page_token = None
+            while True:
+                with timed_stage("drive.list_files"):
+                    results = self.request_executor.execute(
+                        service.files().list(
+                            q=f"'{folder_id}' in parents and trashed=false",
+                            fields=fields_mask,
+                            pageSize=page_size,
+                            pageToken=page_token,
+                            supportsAllDrives=True,
+                            includeItemsFromAllDrives=True,
+                        ),
+                        "drive.files.list",
+                    )
+
+                yield from results.get("files", [])
+
+                page_token = results.get("nextPageToken")
+                if not page_token:
+                    return
 
         except HttpError as error:
             raise HttpError(f"Failed to list files in folder {folder_id}: {error}")
+
+
+class PooledGoogleDriveClient(GoogleDriveClient):
+    """Google Drive client that is safe to share across worker threads.
+
+    GoogleDriveClient caches a single Drive service wrapping one httplib2
+    ``Http`` object, which is not thread-safe. This client authenticates
+    once and shares the credentials, but gives every thread its own
+    authorized HTTP transport and Drive service. A thread keeps its transport
+    for its lifetime, so thread pool workers reuse their keep-alive
+    connections across calls.
+    """
+
+    thread_safe = True
+
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        token_path: Optional[str] = None,
+        template_cache: Optional[TemplateCache] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        http_factory: Optional[Callable[[], Any]] = None,
+        request_executor: Optional[RequestExecutor] = None,
+        drive_index: Optional[DriveIndex] = None,
+        chunk_size: Optional[int] = None,
+        upload_journal: Optional[UploadJournal] = None,
+        folder_resolver: Optional[FolderResolver] = None,
+    ) -> None:
+        """Initialize pooled Google Drive client.
+
+        Args:
+            credentials_path: Path to OAuth2 credentials JSON file
+            token_path: Path to store/load user token
+            template_cache: Optional cache for DOCX exports of Google Docs
+            metadata_cache: Optional cache for file metadata and folder listings
+            http_factory: Optional factory for each thread's unauthorized
+                httplib2.Http transport
+            request_executor: Executor rate-limiting and retrying API
+                requests, shared by all threads
+            drive_index: Optional local index of synced folder trees
+            chunk_size: Optional upload chunk size for resumable uploads
+            upload_journal: Optional journal of resumable upload sessions
+            folder_resolver: Resolver of folder paths to folder IDs, shared
+                by all threads
+        """
+        super().__init__(
+            credentials_path,
+            token_path,
+            template_cache,
+            metadata_cache,
+            request_executor,
+            drive_index,
+            chunk_size,
+            upload_journal,
+            folder_resolver,
+        )
+        self.http_factory = http_factory or httplib2.Http
+        self._credentials: Optional[Credentials] = None
+        self._credentials_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _get_credentials(self) -> Credentials:
+        """Get the shared credentials, refreshing them at most once at a time."""
+        with self._credentials_lock:
+            if self._credentials is None:
+                with timed_stage("drive.auth"):
+                    self._credentials = self._authenticate()
+            elif not self._credentials.valid and self._credentials.refresh_token:
+                with timed_stage("drive.auth"):
+                    self._credentials.refresh(Request())
+            return self._credentials
+
+    def _get_service(self) -> Any:
+        """Get the calling thread's authenticated Drive service instance."""
+        credentials = self._get_credentials()
+        service = getattr(self._local, "service", None)
+        if service is None:
+            http = AuthorizedHttp(credentials, http=self.http_factory())
+            service = build_service("drive", "v3", http=http)
+            self._local.service = service
+        return service
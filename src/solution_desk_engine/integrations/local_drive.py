@@ -0,0 +1,505 @@
+"""Filesystem-backed stand-in for the Google Drive client."""
+
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..timing import timed_stage
+from .content_hash import APP_PROPERTY_HASH, app_properties, hash_bytes
+from .google_drive import GOOGLE_DOC_MIME_TYPE, MAX_BATCH_SIZE
+from .template_cache import TemplateCache
+
+
+class SimulatedDriveError(Exception):
+    """Error injected by LocalDriveClient to simulate a failing Drive call."""
+
+
+def _now() -> str:
+    """Get the current time in Drive's RFC 3339 format."""
+    return (
+        datetime.now(timezone.utc)
+        .isoformat(timespec="milliseconds")
+        .replace("+00:00", "Z")
+    )
+
+
+class LocalDriveClient:
+    """Drive client storing documents in a local directory.
+
+    Implements the GoogleDriveClient interface used by SOWGenerator so the
+    SOW pipeline can run offline, in CI and in benchmarks. Google Docs are
+    stored as DOCX files named ``<file ID>.docx`` with a ``<file ID>.json``
+    metadata sidecar; a DOCX dropped into the directory without a sidecar is
+    served as a Google Doc whose ID is its file name stem.
+
+    Every simulated API call can be slowed down by ``latency_seconds`` and
+    made to fail with probability ``error_rate``.
+    """
+
+    # Calls only touch files of their own document, so threads may share one
+    thread_safe = True
+
+    def __init__(
+        self,
+        root_dir: Optional[Path] = None,
+        latency_seconds: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+        template_cache: Optional[TemplateCache] = None,
+    ) -> None:
+        """Initialize local Drive client.
+
+        Args:
+            root_dir: Directory holding the documents. Defaults to
+                ~/.solution-desk-engine/local_drive
+            latency_seconds: Delay added to every simulated API call
+            error_rate: Probability (0-1) that a simulated API call fails
+            seed: Optional seed for reproducible error injection
+            template_cache: Accepted for interface parity; exports are local
+                file copies, so only variable schemas are cached
+        """
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError(f"error_rate must be between 0 and 1: {error_rate}")
+
+        self.root_dir = root_dir or self._get_default_root_dir()
+        self.latency_seconds = latency_seconds
+        self.error_rate = error_rate
+        self.template_cache = template_cache
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _get_default_root_dir(self) -> Path:
+        """Get default local Drive directory."""
+        return Path(os.path.expanduser("~/.solution-desk-engine/local_drive"))
+
+    def _doc_path(self, file_id: str) -> Path:
+        """Get the DOCX path for a file ID."""
+        return self.root_dir / f"{file_id}.docx"
+
+    def _metadata_path(self, file_id: str) -> Path:
+        """Get the metadata sidecar path for a file ID."""
+        return self.root_dir / f"{file_id}.json"
+
+    def _simulate_call(self, operation: str) -> None:
+        """Apply the configured latency and error rate to an API call."""
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        if self.error_rate:
+            with self._lock:
+                failed = self._random.random() < self.error_rate
+            if failed:
+                raise SimulatedDriveError(f"Simulated Drive failure during {operation}")
+
+    def _read_metadata(self, file_id: str) -> Dict[str, Any]:
+        """Read a file's metadata, deriving it from the DOCX if there is none."""
+        doc_path = self._doc_path(file_id)
+        if not doc_path.exists():
+            raise FileNotFoundError(f"File not found in local Drive: {file_id}")
+
+        metadata_path = self._metadata_path(file_id)
+        if metadata_path.exists():
+            with open(metadata_path, "r", encoding="utf-8") as f:
+                return json.load(f)  # type: ignore
+
+        modified = datetime.fromtimestamp(doc_path.stat().st_mtime, timezone.utc)
+        timestamp = modified.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        return {
+            "id": file_id,
+            "name": file_id,
+            "mimeType": GOOGLE_DOC_MIME_TYPE,
+            "createdTime": timestamp,
+            "modifiedTime": timestamp,
+            "webViewLink": doc_path.as_uri(),
+            "parents": [],
+        }
+
+    def _write_metadata(self, metadata: Dict[str, Any]) -> None:
+        """Write a metadata sidecar atomically."""
+        fd, temp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(temp_path, self._metadata_path(metadata["id"]))
+
+    def _write_doc(self, file_id: str, content: bytes) -> None:
+        """Write document content atomically."""
+        fd, temp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, self._doc_path(file_id))
+
+    def _document_result(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the result returned by upload and update calls."""
+        return {
+            "id": metadata["id"],
+            "web_view_link": metadata["webViewLink"],
+            "name": metadata["name"],
+        }
+
+    def add_file(
+        self,
+        docx_path: str,
+        name: Optional[str] = None,
+        folder_id: Optional[str] = None,
+    ) -> str:
+        """Add a DOCX file to the local Drive, e.g. to seed a template.
+
+        Args:
+            docx_path: Path to the DOCX file
+            name: Document name. Defaults to the file name without extension
+            folder_id: Optional simulated folder ID
+
+        Returns:
+            Simulated file ID of the new document
+        """
+        with open(docx_path, "rb") as f:
+            content = f.read()
+        return str(self._create(content, name or Path(docx_path).stem, folder_id)["id"])
+
+    def _create(
+        self,
+        content: bytes,
+        name: str,
+        folder_id: Optional[str],
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Store new document content and return its metadata."""
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        file_id = f"local-{uuid.uuid4().hex[:16]}"
+        timestamp = _now()
+
+        self._write_doc(file_id, content)
+        metadata = {
+            "id": file_id,
+            "name": name,
+            "mimeType": GOOGLE_DOC_MIME_TYPE,
+            "createdTime": timestamp,
+            "modifiedTime": timestamp,
+            "webViewLink": self._doc_path(file_id).as_uri(),
+            "parents": [folder_id] if folder_id else [],
+            "appProperties": app_properties(content_hash or hash_bytes(content)),
+        }
+        self._write_metadata(metadata)
+        return metadata
+
+    def _find_by_content_hash(
+        self, content_hash: str, folder_id: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Find the metadata of a document stamped with a content hash."""
+        if not self.root_dir.exists():
+            return None
+        for doc_path in sorted(self.root_dir.glob("*.docx")):
+            metadata = self._read_metadata(doc_path.stem)
+            stamped = metadata.get("appProperties", {}).get(APP_PROPERTY_HASH)
+            if stamped == content_hash and (
+                not folder_id or folder_id in metadata.get("parents", [])
+            ):
+                return metadata
+        return None
+
+    def download_doc_as_docx(self, file_id: str, output_path: str) -> None:
+        """Copy a local document to a DOCX file.
+
+        Args:
+            file_id: Simulated file ID
+            output_path: Local path to save DOCX file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            SimulatedDriveError: If an error is injected
+        """
+        with timed_stage("drive.export") as stage:
+            self._simulate_call("export")
+            doc_path = self._doc_path(file_id)
+            if not doc_path.exists():
+                raise FileNotFoundError(f"File not found in local Drive: {file_id}")
+            shutil.copyfile(doc_path, output_path)
+            stage.add_bytes(os.path.getsize(output_path))
+
+    def download_doc_as_bytes(self, file_id: str) -> bytes:
+        """Read a local document as DOCX content.
+
+        Args:
+            file_id: Simulated file ID
+
+        Returns:
+            DOCX file content
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            SimulatedDriveError: If an error is injected
+        """
+        with timed_stage("drive.export") as stage:
+            self._simulate_call("export")
+            doc_path = self._doc_path(file_id)
+            if not doc_path.exists():
+                raise FileNotFoundError(f"File not found in local Drive: {file_id}")
+            content = doc_path.read_bytes()
+            stage.add_bytes(len(content))
+        return content
+
+    def upload_docx_as_google_doc(
+        self,
+        docx_path: str,
+        name: str,
+        folder_id: Optional[str] = None,
+        deduplicate: bool = False,
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Store a DOCX file as a new local document.
+
+        Args:
+            docx_path: Path to DOCX file to upload
+            name: Name for the new document
+            folder_id: Optional simulated folder ID
+            deduplicate: Reuse a document stored earlier with the same
+                content hash (in the same folder) instead of storing again
+            content_hash: Hash identifying the content. Defaults to a hash
+                of the DOCX file
+
+        Returns:
+            Dictionary containing file ID and web view link
+
+        Raises:
+            FileNotFoundError: If DOCX file not found
+            SimulatedDriveError: If an error is injected
+        """
+        if not os.path.exists(docx_path):
+            raise FileNotFoundError(f"DOCX file not found: {docx_path}")
+
+        with open(docx_path, "rb") as f:
+            return self.upload_docx_bytes_as_google_doc(
+                f.read(), name, folder_id, deduplicate, content_hash
+            )
+
+    def upload_docx_bytes_as_google_doc(
+        self,
+        content: bytes,
+        name: str,
+        folder_id: Optional[str] = None,
+        deduplicate: bool = False,
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Store in-memory DOCX content as a new local document.
+
+        Args:
+            content: DOCX file content
+            name: Name for the new document
+            folder_id: Optional simulated folder ID
+            deduplicate: Reuse a document stored earlier with the same
+                content hash (in the same folder) instead of storing again
+            content_hash: Hash identifying the content. Defaults to a hash
+                of the DOCX content
+
+        Returns:
+            Dictionary containing file ID and web view link
+
+        Raises:
+            SimulatedDriveError: If an error is injected
+        """
+        content_hash = content_hash or hash_bytes(content)
+        with timed_stage("drive.upload") as stage:
+            self._simulate_call("upload")
+            existing = (
+                self._find_by_content_hash(content_hash, folder_id)
+                if deduplicate
+                else None
+            )
+            if existing is not None:
+                if existing["name"] != name:
+                    existing["name"] = name
+                    self._write_metadata(existing)
+                return self._document_result(existing)
+            metadata = self._create(content, name, folder_id, content_hash)
+            stage.add_bytes(len(content))
+        return self._document_result(metadata)
+
+    def update_google_doc_from_docx(
+        self, file_id: str, docx_path: str, content_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Replace the content of a local document with a DOCX file.
+
+        Args:
+            file_id: Simulated file ID of the document to update
+            docx_path: Path to DOCX file with the new content
+            content_hash: Hash identifying the new content. Defaults to a
+                hash of the DOCX file
+
+        Returns:
+            Dictionary containing file ID and web view link
+
+        Raises:
+            FileNotFoundError: If the DOCX file or the document does not exist
+            SimulatedDriveError: If an error is injected
+        """
+        if not os.path.exists(docx_path):
+            raise FileNotFoundError(f"DOCX file not found: {docx_path}")
+
+        with open(docx_path, "rb") as f:
+            return self.update_google_doc_from_docx_bytes(
+                file_id, f.read(), content_hash
+            )
+
+    def update_google_doc_from_docx_bytes(
+        self, file_id: str, content: bytes, content_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Replace the content of a local document with DOCX content.
+
+        Args:
+            file_id: Simulated file ID of the document to update
+            content: DOCX file content
+            content_hash: Hash identifying the new content. Defaults to a
+                hash of the DOCX content
+
+        Returns:
+            Dictionary containing file ID and web view link
+
+        Raises:
+            FileNotFoundError: If the document does not exist
+            SimulatedDriveError: If an error is injected
+        """
+        with timed_stage("drive.update") as stage:
+            self._simulate_call("update")
+            metadata = self._read_metadata(file_id)
+            self._write_doc(file_id, content)
+            metadata["modifiedTime"] = _now()
+            metadata["appProperties"] = app_properties(
+                content_hash or hash_bytes(content)
+            )
+            self._write_metadata(metadata)
+            stage.add_bytes(len(content))
+        return self._document_result(metadata)
+
+    def get_file_info(self, file_id: str) -> Dict[str, Any]:
+        """Get metadata of a local document.
+
+        Args:
+            file_id: Simulated file ID
+
+        Returns:
+            Dictionary containing file metadata
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            SimulatedDriveError: If an error is injected
+        """
+        with timed_stage("drive.get_file_info"):
+            self._simulate_call("get_file_info")
+            metadata = self._read_metadata(file_id)
+        return {name: value for name, value in metadata.items() if name != "parents"}
+
+    def get_files_info(
+        self, file_ids: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get metadata of many local documents, simulating batch requests.
+
+        Latency and errors are applied once per batch of MAX_BATCH_SIZE.
+
+        Args:
+            file_ids: Simulated file IDs
+
+        Returns:
+            Dictionary mapping each file ID to its metadata, or to None if
+            the file does not exist
+
+        Raises:
+            SimulatedDriveError: If an error is injected
+        """
+        unique_ids = list(dict.fromkeys(file_ids))
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        for start in range(0, len(unique_ids), MAX_BATCH_SIZE):
+            with timed_stage("drive.batch_get_file_info"):
+                self._simulate_call("batch_get_file_info")
+                for file_id in unique_ids[start : start + MAX_BATCH_SIZE]:
+                    try:
+                        metadata = self._read_metadata(file_id)
+                    except FileNotFoundError:
+                        results[file_id] = None
+                        continue
+                    metadata.pop("parents", None)
+                    results[file_id] = metadata
+
+        return results
+
+    def resolve_folder_path(self, path: str, root_id: Optional[str] = None) -> str:
+        """Get the simulated folder ID of a folder path.
+
+        Simulated folders need no creating, so the ID is the path itself,
+        below root_id if given.
+
+        Args:
+            path: "/"-separated folder names
+            root_id: Optional simulated folder ID the path starts in
+
+        Returns:
+            Simulated folder ID
+        """
+        names = [name for name in path.split("/") if name]
+        if not names:
+            raise ValueError("Folder path must name at least one folder")
+        return "/".join([root_id, *names] if root_id else names)
+
+    def list_files_in_folder(self, folder_id: str) -> list[Dict[str, Any]]:
+        """List local documents in a simulated folder.
+
+        Args:
+            folder_id: Simulated folder ID
+
+        Returns:
+            List of file dictionaries
+
+        Raises:
+            SimulatedDriveError: If an error is injected
+        """
+        return list(self.iter_files_in_folder(folder_id))
+
+    def iter_files_in_folder(
+        self,
+        folder_id: str,
+        page_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        recursive: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream local documents in a simulated folder page by page.
+
+        Latency and errors are applied once per page. Simulated folders have
+        no subfolders, so ``recursive`` is accepted for interface parity only.
+
+        Args:
+            folder_id: Simulated folder ID
+            page_size: Files per simulated page
+            fields: File fields to return. Defaults to all metadata fields
+            recursive: Ignored; simulated folders have no subfolders
+
+        Yields:
+            File dictionaries
+
+        Raises:
+            SimulatedDriveError: If an error is injected
+        """
+        if not self.root_dir.exists():
+            return
+
+        doc_paths = sorted(self.root_dir.glob("*.docx"))
+        for start in range(0, max(len(doc_paths), 1), page_size):
+            page = []
+            with timed_stage("drive.list_files"):
+                self._simulate_call("list_files")
+                for doc_path in doc_paths[start : start + page_size]:
+                    metadata = self._read_metadata(doc_path.stem)
+                    if folder_id not in metadata.pop("parents", []):
+                        continue
+                    if fields:
+                        metadata = {
+                            name: metadata[name] for name in fields if name in metadata
+                        }
+                    page.append(metadata)
+            yield from page
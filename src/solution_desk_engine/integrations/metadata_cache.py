@@ -0,0 +1,290 @@
+"""TTL caches for Google Drive file metadata and folder listings."""
+
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Default time-to-live for cached metadata entries (5 minutes)
+DEFAULT_TTL_SECONDS = 300.0
+
+
+@dataclass
+class CacheEntry:
+    """Cached metadata value with its validator and expiry time."""
+
+    value: Any
+    etag: Optional[str]
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the entry can be served without asking Drive."""
+        return self.expires_at > time.time()
+
+
+@dataclass
+class MetadataCacheStats:
+    """Counters describing how lookups were served."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    invalidations: int = 0
+
+
+class MetadataCache:
+    """In-memory metadata cache with per-entry TTLs for one process.
+
+    Entries are served until their TTL expires. An expired entry that carries
+    a validator (e.g. the Drive file ``version``) is revalidated with a
+    cheap check and kept if the validator still matches; otherwise the value
+    is fetched again. Values must be JSON-serializable so that persistent
+    subclasses can store them.
+    """
+
+    def __init__(self, default_ttl: float = DEFAULT_TTL_SECONDS) -> None:
+        """Initialize metadata cache.
+
+        Args:
+            default_ttl: Time-to-live in seconds for entries stored without
+                an explicit TTL
+        """
+        self.default_ttl = default_ttl
+        self._stats = MetadataCacheStats()
+        self._stats_lock = threading.Lock()
+        self._entries: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> MetadataCacheStats:
+        """Snapshot of the hit, miss, revalidation and invalidation counters."""
+        with self._stats_lock:
+            return replace(self._stats)
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        """Increment one of the stats counters."""
+        with self._stats_lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + amount)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a fresh cached value, counting the lookup as a hit or miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            A copy of the cached value, or None if absent or expired
+        """
+        entry = self._load(key)
+        if entry is None or not entry.is_fresh:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return copy.deepcopy(entry.value)
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        etag: Optional[str] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            etag: Optional validator for conditional revalidation
+            ttl: Time-to-live in seconds. Defaults to default_ttl
+        """
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        self._store(key, CacheEntry(copy.deepcopy(value), etag, expires_at))
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Tuple[Any, Optional[str]]],
+        revalidate: Optional[Callable[[str], bool]] = None,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Get a value, revalidating or fetching it when the entry expired.
+
+        Args:
+            key: Cache key
+            fetch: Callable returning the current value and its validator
+            revalidate: Optional callable telling whether a validator is
+                still current, used before falling back to fetch
+            ttl: Time-to-live in seconds. Defaults to default_ttl
+
+        Returns:
+            A copy of the cached or freshly fetched value
+        """
+        entry = self._load(key)
+        if entry is not None and entry.is_fresh:
+            self._count("hits")
+            return copy.deepcopy(entry.value)
+
+        if entry is not None and entry.etag is not None and revalidate is not None:
+            if revalidate(entry.etag):
+                self._count("revalidations")
+                self.put(key, entry.value, entry.etag, ttl)
+                return copy.deepcopy(entry.value)
+
+        self._count("misses")
+        value, etag = fetch()
+        self.put(key, value, etag, ttl)
+        return value
+
+    def invalidate(self, key: str) -> None:
+        """Remove one entry."""
+        self._delete(key)
+        self._count("invalidations")
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Remove every entry whose key starts with a prefix."""
+        self._delete_prefix(prefix)
+        self._count("invalidations")
+
+    def clear(self) -> int:
+        """Remove every entry.
+
+        Returns:
+            Number of removed entries
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+        return count
+
+    def __len__(self) -> int:
+        """Get the number of stored entries, including expired ones."""
+        with self._lock:
+            return len(self._entries)
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        """Read an entry from storage."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        """Write an entry to storage."""
+        with self._lock:
+            self._entries[key] = entry
+
+    def _delete(self, key: str) -> None:
+        """Delete an entry from storage."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _delete_prefix(self, prefix: str) -> None:
+        """Delete entries with a key prefix from storage."""
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+
+class SQLiteMetadataCache(MetadataCache):
+    """Metadata cache persisted in a SQLite file, shared across processes."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        default_ttl: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """Initialize SQLite metadata cache.
+
+        Args:
+            db_path: Path to the SQLite database. Defaults to
+                ~/.solution-desk-engine/cache/metadata.sqlite3
+            default_ttl: Time-to-live in seconds for entries stored without
+                an explicit TTL
+        """
+        super().__init__(default_ttl)
+        self.db_path = db_path or self._get_default_db_path()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _get_default_db_path(self) -> Path:
+        """Get default metadata cache database path."""
+        return Path(
+            os.path.expanduser("~/.solution-desk-engine/cache/metadata.sqlite3")
+        )
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Get the database connection, creating the database on first use.
+
+        Callers must hold self._lock.
+        """
+        if self._db is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(
+                self.db_path, check_same_thread=False, timeout=30
+            )
+            with self._db:
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS metadata ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, etag TEXT, "
+                    "expires_at REAL NOT NULL)"
+                )
+        return self._db
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def clear(self) -> int:
+        """Remove every entry.
+
+        Returns:
+            Number of removed entries
+        """
+        with self._lock, self._connection:
+            return self._connection.execute("DELETE FROM metadata").rowcount
+
+    def __len__(self) -> int:
+        """Get the number of stored entries, including expired ones."""
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM metadata").fetchone()
+        return int(row[0])
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        """Read an entry from the database."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, etag, expires_at FROM metadata WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1], row[2])
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        """Write an entry to the database."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO metadata (key, value, etag, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(entry.value), entry.etag, entry.expires_at),
+            )
+
+    def _delete(self, key: str) -> None:
+        """Delete an entry from the database."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM metadata WHERE key = ?", (key,))
+
+    def _delete_prefix(self, prefix: str) -> None:
+        """Delete entries with a key prefix from the database."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM metadata WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
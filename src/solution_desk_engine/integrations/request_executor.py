@@ -0,0 +1,249 @@
+"""Rate-limited, retrying executor for Google API requests."""
+
+import email.utils
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from googleapiclient.errors import HttpError  # type: ignore
+
+# Drive's default per-user quota is 12,000 queries per minute
+DRIVE_QUERIES_PER_MINUTE = 12000
+# The Docs API allows 60 write requests per minute per user
+DOCS_WRITES_PER_MINUTE = 60
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Statuses of requests for files that are deleted or never existed
+GONE_STATUSES = {404, 410}
+RATE_LIMIT_REASONS = {"userRateLimitExceeded", "rateLimitExceeded"}
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the rate of outgoing requests."""
+
+    def __init__(self, rate_per_second: float, capacity: Optional[float] = None):
+        """Initialize token bucket.
+
+        Args:
+            rate_per_second: Tokens added per second
+            capacity: Maximum burst size. Defaults to one second of tokens
+        """
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity if capacity is not None else max(rate_per_second, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, blocking until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate_per_second,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate_per_second
+            time.sleep(delay)
+            waited += delay
+
+
+@dataclass
+class RetryPolicy:
+    """Truncated exponential backoff settings."""
+
+    max_attempts: int = 6
+    base_delay: float = 1.0
+    max_delay: float = 64.0
+
+
+@dataclass
+class EndpointStats:
+    """Counters for requests to one API endpoint."""
+
+    calls: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    failures: int = 0
+    wait_seconds: float = 0.0
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether an error is a 429 or a 403 quota error."""
+    status = _status(error)
+    return status == 429 or (status == 403 and _reason(error) in RATE_LIMIT_REASONS)
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Whether a request failing with this error may succeed when retried."""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    return _status(error) in RETRYABLE_STATUSES or is_rate_limit_error(error)
+
+
+def is_not_found_error(error: Exception) -> bool:
+    """Whether an error says the requested file no longer exists."""
+    return _status(error) in GONE_STATUSES
+
+
+def _status(error: Exception) -> Optional[int]:
+    """Get the HTTP status of an HttpError."""
+    if not isinstance(error, HttpError):
+        return None
+    status = getattr(getattr(error, "resp", None), "status", None)
+    return int(status) if status is not None else None
+
+
+def _reason(error: Exception) -> Optional[str]:
+    """Get the reason of the first error in an HttpError's JSON body."""
+    try:
+        content = error.content  # type: ignore[attr-defined]
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        errors = json.loads(content)["error"]["errors"]
+        return str(errors[0]["reason"])
+    except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+        return None
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Get the delay requested by an error response's Retry-After header."""
+    resp = getattr(error, "resp", None) or {}
+    value = resp.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RequestExecutor:
+    """Runs Google API requests under a rate limit, retrying transient errors.
+
+    Every request first takes a token from a bucket sized to the API's
+    per-user quota. Requests failing with 429, a 403 rate-limit reason, a 5xx
+    status or a connection error are retried with exponential backoff and
+    full jitter, waiting at least as long as the response's Retry-After
+    header asks. Calls, retries and waits are counted per endpoint.
+    """
+
+    def __init__(
+        self,
+        queries_per_minute: float = DRIVE_QUERIES_PER_MINUTE,
+        burst: Optional[float] = None,
+        policy: Optional[RetryPolicy] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize request executor.
+
+        Args:
+            queries_per_minute: Sustained request rate to stay under
+            burst: Maximum burst of requests. Defaults to one second's worth
+            policy: Retry policy. Defaults to RetryPolicy()
+            sleep: Function used to wait between attempts
+        """
+        self.bucket = TokenBucket(queries_per_minute / 60, burst)
+        self.policy = policy or RetryPolicy()
+        self._sleep = sleep
+        self._random = random.Random()
+        self._stats: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, EndpointStats]:
+        """Snapshot of the per-endpoint counters."""
+        with self._lock:
+            return {name: replace(stats) for name, stats in self._stats.items()}
+
+    def _record(self, endpoint: str, **increments: float) -> None:
+        """Add to an endpoint's counters."""
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, EndpointStats())
+            for name, amount in increments.items():
+                setattr(stats, name, getattr(stats, name) + amount)
+
+    def execute(self, request: Any, endpoint: Optional[str] = None) -> Any:
+        """Execute a googleapiclient request.
+
+        Args:
+            request: HttpRequest or BatchHttpRequest
+            endpoint: Counter name. Defaults to the request's method ID,
+                e.g. "drive.files.get"
+
+        Returns:
+            The request's response
+        """
+        if endpoint is None:
+            method_id = getattr(request, "methodId", None)
+            endpoint = method_id if isinstance(method_id, str) else "unknown"
+        return self.call(request.execute, endpoint)
+
+    def call(self, function: Callable[[], T], endpoint: str) -> T:
+        """Call a function issuing one API request, e.g. a next_chunk() step.
+
+        Args:
+            function: Callable performing the request
+            endpoint: Counter name
+
+        Returns:
+            The function's result
+
+        Raises:
+            Exception: The last error, once it is not retryable or the
+                retry policy is exhausted
+        """
+        attempt = 0
+        while True:
+            self._record(endpoint, calls=1, wait_seconds=self.bucket.acquire())
+            try:
+                return function()
+            except Exception as error:
+                attempt += 1
+                if not is_retryable_error(error) or attempt >= self.policy.max_attempts:
+                    self._record(endpoint, failures=1)
+                    raise
+                self.wait_before_retry(attempt, error, endpoint)
+
+    def wait_before_retry(
+        self, attempt: int, error: Optional[Exception], endpoint: str
+    ) -> None:
+        """Sleep before retrying a failed request.
+
+        Args:
+            attempt: Number of failed attempts so far (1 for the first retry)
+            error: The error that caused the retry, if any
+            endpoint: Counter name
+        """
+        ceiling = min(
+            self.policy.max_delay, self.policy.base_delay * 2 ** (attempt - 1)
+        )
+        delay = self._random.uniform(0, ceiling)
+        if error is not None:
+            delay = max(delay, retry_after_seconds(error) or 0.0)
+        rate_limited = 1 if error is not None and is_rate_limit_error(error) else 0
+
+        self._record(endpoint, retries=1, rate_limited=rate_limited)
+        self._record(endpoint, wait_seconds=delay)
+        self._sleep(delay)
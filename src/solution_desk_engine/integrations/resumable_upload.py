@@ -0,0 +1,224 @@
+"""Resumable chunked uploads whose sessions survive process restarts."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from googleapiclient.errors import HttpError  # type: ignore
+
+from .request_executor import RequestExecutor
+
+# Drive requires upload chunks to be a multiple of 256 KiB
+CHUNK_SIZE_UNIT = 256 * 1024
+DEFAULT_CHUNK_SIZE = 32 * CHUNK_SIZE_UNIT
+
+# Drive keeps an unfinished resumable upload session for one week
+SESSION_LIFETIME_SECONDS = 7 * 24 * 60 * 60
+
+
+def validate_chunk_size(chunk_size: int) -> int:
+    """Check that a chunk size is accepted by Drive.
+
+    Args:
+        chunk_size: Upload chunk size in bytes
+
+    Returns:
+        The chunk size
+
+    Raises:
+        ValueError: If the chunk size is not a positive multiple of 256 KiB
+    """
+    if chunk_size <= 0 or chunk_size % CHUNK_SIZE_UNIT:
+        raise ValueError(
+            f"Upload chunk size must be a positive multiple of {CHUNK_SIZE_UNIT} "
+            f"bytes, got {chunk_size}"
+        )
+    return chunk_size
+
+
+@dataclass
+class UploadReport:
+    """Size and duration of one upload."""
+
+    name: str
+    bytes: int
+    seconds: float
+    resumed_from: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second sent by this process."""
+        sent = self.bytes - self.resumed_from
+        return sent / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class UploadSession:
+    """Resumable upload session recorded in the journal."""
+
+    uri: str
+    size: int
+    created_at: float
+
+
+class UploadJournal:
+    """JSON journal of unfinished resumable upload sessions.
+
+    A session is recorded as soon as Drive opens it and removed once the
+    upload completes, so after a crash or interruption the next run can ask
+    Drive how much of the file arrived and send only the rest.
+    """
+
+    def __init__(self, journal_path: Optional[Path] = None) -> None:
+        """Initialize upload journal.
+
+        Args:
+            journal_path: Path to the journal JSON file. Defaults to
+                ~/.solution-desk-engine/upload_journal.json
+        """
+        self.journal_path = journal_path or self._get_default_journal_path()
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, UploadSession] = self._load()
+
+    def _get_default_journal_path(self) -> Path:
+        """Get default upload journal path."""
+        return Path(os.path.expanduser("~/.solution-desk-engine/upload_journal.json"))
+
+    def _load(self) -> Dict[str, UploadSession]:
+        """Load unexpired sessions, starting empty if the file is unreadable."""
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            sessions = {
+                key: UploadSession(**session)
+                for key, session in data.get("sessions", {}).items()
+            }
+        except (OSError, ValueError, TypeError):
+            return {}
+        cutoff = time.time() - SESSION_LIFETIME_SECONDS
+        return {
+            key: session
+            for key, session in sessions.items()
+            if session.created_at >= cutoff
+        }
+
+    def get(self, key: str) -> Optional[UploadSession]:
+        """Get the unexpired session recorded for an upload, if any."""
+        with self._lock:
+            session = self._sessions.get(key)
+        if session is None:
+            return None
+        if time.time() - session.created_at > SESSION_LIFETIME_SECONDS:
+            self.remove(key)
+            return None
+        return session
+
+    def record(self, key: str, uri: str, size: int) -> None:
+        """Record the session of an upload that has started."""
+        with self._lock:
+            self._sessions[key] = UploadSession(uri, size, time.time())
+            self._save()
+
+    def remove(self, key: str) -> None:
+        """Forget the session of an upload."""
+        with self._lock:
+            if self._sessions.pop(key, None) is not None:
+                self._save()
+
+    def __len__(self) -> int:
+        """Get the number of recorded sessions."""
+        with self._lock:
+            return len(self._sessions)
+
+    def _save(self) -> None:
+        """Write the journal atomically. Callers must hold self._lock."""
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "sessions": {
+                key: asdict(session) for key, session in self._sessions.items()
+            }
+        }
+
+        fd, temp_path = tempfile.mkstemp(dir=self.journal_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, self.journal_path)
+
+
+def upload_resumable(
+    request: Any,
+    executor: RequestExecutor,
+    name: str,
+    endpoint: str,
+    journal: Optional[UploadJournal] = None,
+    key: Optional[str] = None,
+) -> Tuple[Dict[str, Any], UploadReport]:
+    """Send a resumable upload request chunk by chunk.
+
+    With a journal, the session is recorded under the key once Drive opens
+    it. If the journal already holds an unexpired session for the key and
+    the same size, Drive is asked how much of it arrived and the upload
+    continues from there; an expired session is replaced by a new one.
+
+    Args:
+        request: googleapiclient HttpRequest with resumable media
+        executor: Executor retrying failed chunks
+        name: File name for the report
+        endpoint: Counter name for the executor
+        journal: Optional journal of upload sessions
+        key: Key identifying this upload in the journal
+
+    Returns:
+        The API response and the upload report
+
+    Raises:
+        HttpError: If the upload fails
+    """
+    size = request.resumable.size()
+    start = time.perf_counter()
+    resumed_from = 0
+    response = None
+
+    journaled = journal is not None and bool(key)
+    recorded_uri = None
+
+    session = journal.get(key) if journal is not None and key else None
+    if session is not None and session.size == size:
+        uri = session.uri
+        try:
+            _, response = executor.call(
+                lambda: _query_session(request, uri, size), endpoint
+            )
+            resumed_from = size if response is not None else request.resumable_progress
+            recorded_uri = uri
+        except HttpError as error:
+            if getattr(error.resp, "status", None) not in (404, 410):
+                raise
+            # The session expired on Drive's side; start a new one
+            request.resumable_uri = None
+            request.resumable_progress = 0
+
+    while response is None:
+        _, response = executor.call(request.next_chunk, endpoint)
+        if journaled and response is None and request.resumable_uri != recorded_uri:
+            recorded_uri = request.resumable_uri
+            journal.record(key, recorded_uri, size)  # type: ignore[union-attr,arg-type]
+
+    if journaled:
+        journal.remove(key)  # type: ignore[union-attr,arg-type]
+    return response, UploadReport(name, size, time.perf_counter() - start, resumed_from)
+
+
+def _query_session(request: Any, uri: str, size: int) -> Tuple[Any, Any]:
+    """Ask Drive how much of a resumable upload session it has received."""
+    request.resumable_uri = uri
+    resp, content = request.http.request(
+        uri, "PUT", headers={"Content-Range": f"bytes */{size}", "content-length": "0"}
+    )
+    # Updates resumable_progress from the Range header, as next_chunk() does
+    return request._process_response(resp, content)  # type: ignore
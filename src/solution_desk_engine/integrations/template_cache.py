@@ -0,0 +1,226 @@
+"""On-disk cache of exported Google Docs templates."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+# Default upper bound for the cache directory size (256 MiB)
+DEFAULT_MAX_SIZE_BYTES = 256 * 1024 * 1024
+
+
+def _digest(value: str) -> str:
+    """Return a filesystem-safe digest for a cache key component."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:32]
+
+
+class TemplateCache:
+    """Content-addressed DOCX cache keyed by Drive file ID and version.
+
+    Each template gets its own directory holding the DOCX export for its
+    current version and, once extracted, the template's variable schema; a
+    new version replaces the old one. When the cache grows past
+    ``max_size_bytes`` the least recently used exports are evicted.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+    ) -> None:
+        """Initialize template cache.
+
+        Args:
+            cache_dir: Cache directory. Defaults to
+                ~/.solution-desk-engine/cache/templates
+            max_size_bytes: Maximum total size of cached files
+        """
+        self.cache_dir = cache_dir or self._get_default_cache_dir()
+        self.max_size_bytes = max_size_bytes
+
+    def _get_default_cache_dir(self) -> Path:
+        """Get default template cache directory."""
+        return Path(os.path.expanduser("~/.solution-desk-engine/cache/templates"))
+
+    def _entry_dir(self, file_id: str) -> Path:
+        """Get the cache directory for a Drive file."""
+        return self.cache_dir / _digest(file_id)
+
+    def _entry_path(self, file_id: str, version: str) -> Path:
+        """Get the cached DOCX path for a Drive file version."""
+        return self._entry_dir(file_id) / f"{_digest(version)}.docx"
+
+    def _schema_path(self, file_id: str, version: str) -> Path:
+        """Get the cached variable schema path for a Drive file version."""
+        return self._entry_dir(file_id) / f"{_digest(version)}.schema.json"
+
+    def get(self, file_id: str, version: str) -> Optional[Path]:
+        """Look up a cached template export.
+
+        Args:
+            file_id: Google Drive file ID
+            version: Version marker, e.g. the Drive modifiedTime
+
+        Returns:
+            Path to the cached DOCX, or None on a miss
+        """
+        path = self._entry_path(file_id, version)
+        if not path.exists():
+            return None
+
+        # Touch the entry so LRU eviction sees it as recently used
+        os.utime(path)
+        return path
+
+    def put(self, file_id: str, version: str, source_path: str) -> Path:
+        """Store a template export, replacing older versions of the file.
+
+        Args:
+            file_id: Google Drive file ID
+            version: Version marker, e.g. the Drive modifiedTime
+            source_path: Path to the freshly exported DOCX
+
+        Returns:
+            Path to the cached DOCX
+        """
+        with open(source_path, "rb") as f:
+            return self.put_bytes(file_id, version, f.read())
+
+    def put_bytes(self, file_id: str, version: str, content: bytes) -> Path:
+        """Store in-memory template content, replacing older versions.
+
+        Args:
+            file_id: Google Drive file ID
+            version: Version marker, e.g. the Drive modifiedTime
+            content: DOCX file content
+
+        Returns:
+            Path to the cached DOCX
+        """
+        entry_dir = self._entry_dir(file_id)
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(file_id, version)
+
+        # Write to a temporary file first so readers never see partial files
+        fd, temp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+        self._remove_stale(entry_dir, keep=(path, self._schema_path(file_id, version)))
+        self.evict()
+        return path
+
+    def get_schema(self, file_id: str, version: str) -> Optional[List[str]]:
+        """Look up the cached variable schema of a template version.
+
+        Args:
+            file_id: Google Drive file ID
+            version: Version marker, e.g. the Drive modifiedTime
+
+        Returns:
+            Sorted template variable names, or None on a miss
+        """
+        return self._read_schema(self._schema_path(file_id, version))
+
+    def get_latest_schema(self, file_id: str) -> Optional[List[str]]:
+        """Look up the most recently cached variable schema of a template.
+
+        Unlike get_schema this needs no version, so it can be used without
+        asking Drive whether the template changed.
+
+        Args:
+            file_id: Google Drive file ID
+
+        Returns:
+            Sorted template variable names, or None if no schema is cached
+        """
+        entry_dir = self._entry_dir(file_id)
+        if not entry_dir.exists():
+            return None
+
+        schemas = sorted(
+            entry_dir.glob("*.schema.json"), key=lambda path: path.stat().st_mtime
+        )
+        return self._read_schema(schemas[-1]) if schemas else None
+
+    def put_schema(self, file_id: str, version: str, variables: Iterable[str]) -> None:
+        """Store the variable schema of a template version.
+
+        Args:
+            file_id: Google Drive file ID
+            version: Version marker, e.g. the Drive modifiedTime
+            variables: Template variable names
+        """
+        entry_dir = self._entry_dir(file_id)
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        path = self._schema_path(file_id, version)
+
+        fd, temp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"variables": sorted(variables)}, f)
+        os.replace(temp_path, path)
+
+        self._remove_stale(entry_dir, keep=(path, self._entry_path(file_id, version)))
+
+    def _read_schema(self, path: Path) -> Optional[List[str]]:
+        """Read a schema file, treating unreadable files as a miss."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return list(json.load(f)["variables"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _remove_stale(self, entry_dir: Path, keep: Tuple[Path, ...]) -> None:
+        """Remove files left behind by older versions of a template."""
+        for stale in entry_dir.glob("*"):
+            if stale not in keep and stale.suffix != ".tmp":
+                stale.unlink(missing_ok=True)
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """List cached files as (last used, size, path) tuples."""
+        if not self.cache_dir.exists():
+            return []
+
+        entries = []
+        for path in self.cache_dir.glob("*/*.docx"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        """Get total size of cached files in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """Evict least recently used entries until the cache fits its limit.
+
+        Returns:
+            Number of evicted entries
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+
+        for _, size, path in entries:
+            if total <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+
+        return evicted
+
+    def clear(self) -> int:
+        """Remove every cached template.
+
+        Returns:
+            Number of removed entries
+        """
+        count = len(self._entries())
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
+        return count
@@ -0,0 +1,107 @@
+"""Loading of SOW batch files (CSV, YAML or JSON Lines)."""
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml  # type: ignore[import-untyped]
+
+from .sow_generator import SOWBatchItem, SOWGenerator
+
+REQUIRED_FIELDS = ("customer_name", "project_name")
+
+
+def load_batch_file(path: Path) -> List[SOWBatchItem]:
+    """Load SOW batch items from a CSV, YAML or JSON Lines file.
+
+    Each row holds SOWContext fields plus optional ``output_name`` and
+    ``output_folder_id`` columns. YAML files may contain either a list of
+    rows or a mapping with a ``contexts`` list.
+
+    Args:
+        path: Path to the batch file
+
+    Returns:
+        List of SOWBatchItem, in file order
+
+    Raises:
+        FileNotFoundError: If the batch file does not exist
+        ValueError: If the format is unsupported or a row is invalid
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Batch file not found: {path}")
+
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        rows = _read_csv(path)
+    elif suffix in (".yaml", ".yml"):
+        rows = _read_yaml(path)
+    elif suffix in (".jsonl", ".ndjson"):
+        rows = _read_jsonl(path)
+    else:
+        raise ValueError(f"Unsupported batch file format: {path.suffix}")
+
+    return [_row_to_item(row, number) for number, row in enumerate(rows, start=1)]
+
+
+def _read_csv(path: Path) -> List[Dict[str, Any]]:
+    """Read rows from a CSV file, dropping empty cells so defaults apply."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return [
+            {
+                key: value
+                for key, value in row.items()
+                if key and value not in ("", None)
+            }
+            for row in csv.DictReader(f)
+        ]
+
+
+def _read_yaml(path: Path) -> List[Dict[str, Any]]:
+    """Read rows from a YAML file."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or []
+
+    if isinstance(data, dict):
+        data = data.get("contexts", [])
+    if not isinstance(data, list):
+        raise ValueError(f"Expected a list of SOW contexts in {path}")
+
+    return data
+
+
+def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """Read rows from a JSON Lines file, skipping blank lines."""
+    rows = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Invalid JSON on line {line_number}: {error}")
+    return rows
+
+
+def _row_to_item(row: Any, number: int) -> SOWBatchItem:
+    """Convert a raw row into a SOWBatchItem."""
+    if not isinstance(row, dict):
+        raise ValueError(f"Row {number}: expected a mapping, got {type(row).__name__}")
+
+    missing = [field for field in REQUIRED_FIELDS if not row.get(field)]
+    if missing:
+        raise ValueError(f"Row {number}: missing required fields: {', '.join(missing)}")
+
+    config = {key: str(value) for key, value in row.items() if value is not None}
+    context = SOWGenerator.create_context_from_config(config)
+    output_name = config.get(
+        "output_name", f"{context.customer_name} SOW - {context.project_name}"
+    )
+
+    return SOWBatchItem(
+        context=context,
+        output_name=output_name,
+        output_folder_id=config.get("output_folder_id"),
+    )
@@ -0,0 +1,123 @@
+"""Compile-once, render-many DOCX templates for SOW generation."""
+
+import copy
+import io
+import threading
+from typing import IO, Any, Dict, Optional, Union
+
+from docx import Document  # type: ignore
+from docxtpl import DocxTemplate  # type: ignore
+from jinja2 import Environment, Template
+
+
+class _CompilingEnvironment(Environment):
+    """Jinja environment that compiles each distinct source string only once."""
+
+    def __init__(self, **options: Any) -> None:
+        super().__init__(**options)
+        self._compiled: Dict[str, Template] = {}
+        self._lock = threading.Lock()
+
+    def from_string(self, source: Any, *args: Any, **kwargs: Any) -> Template:
+        if args or kwargs or not isinstance(source, str):
+            return super().from_string(source, *args, **kwargs)
+
+        template = self._compiled.get(source)
+        if template is None:
+            template = super().from_string(source)
+            with self._lock:
+                self._compiled[source] = template
+        return template
+
+
+class _ClonedDocxTemplate(DocxTemplate):  # type: ignore[misc]
+    """DocxTemplate working on a clone of a CompiledTemplate's parsed package."""
+
+    docx: Any
+    is_rendered: bool
+
+    def __init__(self, compiled: "CompiledTemplate") -> None:
+        super().__init__(io.BytesIO(compiled.template_bytes))
+        self._compiled = compiled
+
+    def init_docx(self, reload: bool = True) -> None:
+        if not self.docx or (self.is_rendered and reload):
+            self.docx = self._compiled._clone_document()
+            self.is_rendered = False
+
+    def patch_xml(self, src_xml: str) -> str:
+        return self._compiled._patch_xml(src_xml, super().patch_xml)
+
+
+class CompiledTemplate:
+    """A DOCX template parsed and compiled once, rendered many times.
+
+    The template package is unzipped and parsed a single time and kept in
+    memory. Each render works on a deep copy of that parsed package, and the
+    cleaned-up template XML and compiled Jinja templates are reused across
+    renders, so rendering N contexts never re-reads the template from disk.
+    Rendering is safe to call from multiple threads.
+    """
+
+    def __init__(
+        self,
+        template_file: Union[str, bytes, IO[bytes]],
+        jinja_options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Load and parse a DOCX template.
+
+        Args:
+            template_file: Path, raw bytes or binary stream of the DOCX template
+            jinja_options: Optional keyword arguments for the Jinja environment
+        """
+        if isinstance(template_file, bytes):
+            self.template_bytes = template_file
+        elif isinstance(template_file, str):
+            with open(template_file, "rb") as f:
+                self.template_bytes = f.read()
+        else:
+            self.template_bytes = template_file.read()
+
+        self.jinja_env = _CompilingEnvironment(**(jinja_options or {}))
+        self._document = Document(io.BytesIO(self.template_bytes))
+        self._patched: Dict[str, str] = {}
+        self._patched_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+    def _clone_document(self) -> Any:
+        """Get a private copy of the parsed template package."""
+        with self._lock:
+            return copy.deepcopy(self._document)
+
+    def _patch_xml(self, src_xml: str, patch: Any) -> str:
+        """Return docxtpl's cleaned-up XML for a part, computing it once."""
+        with self._patched_lock:
+            patched = self._patched.get(src_xml)
+            if patched is None:
+                patched = patch(src_xml)
+                self._patched[src_xml] = patched
+        return patched  # type: ignore
+
+    def render(self, context: Dict[str, Any], output: Union[str, IO[bytes]]) -> None:
+        """Render a context and save the document.
+
+        Args:
+            context: Template context data
+            output: Output path or writable binary stream
+        """
+        doc = _ClonedDocxTemplate(self)
+        doc.render(context, self.jinja_env)
+        doc.save(output)
+
+    def render_bytes(self, context: Dict[str, Any]) -> bytes:
+        """Render a context and return the document as DOCX bytes.
+
+        Args:
+            context: Template context data
+
+        Returns:
+            Rendered DOCX content
+        """
+        output = io.BytesIO()
+        self.render(context, output)
+        return output.getvalue()
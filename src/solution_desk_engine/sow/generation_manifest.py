@@ -0,0 +1,125 @@
+"""Manifest of generated SOW documents for idempotent regeneration."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import docxtpl  # type: ignore
+
+# Bump when rendering output changes so existing SOWs are regenerated
+RENDERER_VERSION = 1
+ENGINE_VERSION = f"{RENDERER_VERSION}+docxtpl-{docxtpl.__version__}"
+
+
+@dataclass
+class ManifestEntry:
+    """Last generation recorded for one output document."""
+
+    fingerprint: str
+    document: Dict[str, Any]
+    updated_at: str
+
+
+class GenerationManifest:
+    """JSON manifest mapping SOW outputs to their generated Google Docs.
+
+    Each output is identified by template, output folder and output name, and
+    records a fingerprint of (template version, context, engine version)
+    together with the generated document. Re-running an unchanged output can
+    then be skipped, and a changed one can update the existing document.
+    """
+
+    def __init__(self, manifest_path: Optional[Path] = None) -> None:
+        """Initialize generation manifest.
+
+        Args:
+            manifest_path: Path to the manifest JSON file. Defaults to
+                ~/.solution-desk-engine/sow_manifest.json
+        """
+        self.manifest_path = manifest_path or self._get_default_manifest_path()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, ManifestEntry] = self._load()
+
+    def _get_default_manifest_path(self) -> Path:
+        """Get default generation manifest path."""
+        return Path(os.path.expanduser("~/.solution-desk-engine/sow_manifest.json"))
+
+    def _load(self) -> Dict[str, ManifestEntry]:
+        """Load manifest entries, starting empty if the file is unreadable."""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {
+                key: ManifestEntry(**entry)
+                for key, entry in data.get("entries", {}).items()
+            }
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    @staticmethod
+    def key(
+        template_file_id: str, output_name: str, output_folder_id: Optional[str]
+    ) -> str:
+        """Build the manifest key identifying one output document."""
+        return f"{template_file_id}|{output_folder_id or ''}|{output_name}"
+
+    @staticmethod
+    def fingerprint(template_version: str, context: Dict[str, Any]) -> str:
+        """Hash the inputs that determine a generated document's content."""
+        payload = json.dumps(
+            {
+                "template_version": template_version,
+                "context": context,
+                "engine_version": ENGINE_VERSION,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ManifestEntry]:
+        """Get the recorded entry for an output, if any."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def record(self, key: str, fingerprint: str, document: Dict[str, Any]) -> None:
+        """Record a generated document and persist the manifest.
+
+        Args:
+            key: Manifest key from key()
+            fingerprint: Input fingerprint from fingerprint()
+            document: Generated document info (ID, link, name)
+        """
+        with self._lock:
+            self._entries[key] = ManifestEntry(
+                fingerprint=fingerprint,
+                document={
+                    name: value for name, value in document.items() if name != "status"
+                },
+                updated_at=datetime.now().isoformat(),
+            )
+            self._save()
+
+    def _save(self) -> None:
+        """Write the manifest atomically."""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "entries": {
+                key: {
+                    "fingerprint": entry.fingerprint,
+                    "document": entry.document,
+                    "updated_at": entry.updated_at,
+                }
+                for key, entry in self._entries.items()
+            }
+        }
+
+        fd, temp_path = tempfile.mkstemp(dir=self.manifest_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, self.manifest_path)
@@ -1,13 +1,26 @@
 """SOW document generator using Google Docs templates."""
 
+import io
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from docxtpl import DocxTemplate  # type: ignore
+from googleapiclient.errors import HttpError  # type: ignore
 
-from ..integrations.google_drive import GoogleDriveClient
+from ..integrations.google_drive import GOOGLE_DOC_MIME_TYPE, GoogleDriveClient
+from ..integrations.local_drive import LocalDriveClient
+from ..integrations.request_executor import is_not_found_error
+from ..timing import StageTimer, timed_stage
+from .compiled_template import CompiledTemplate
+from .generation_manifest import GenerationManifest
+from .template_schema import (
+    ContextValidation,
+    extract_template_variables,
+    validate_context,
+)
 
 
 @dataclass
@@ -41,16 +54,78 @@ class SOWContext:
         }
 
 
+@dataclass
+class SOWBatchItem:
+    """A single SOW to produce as part of a batch run."""
+
+    context: SOWContext
+    output_name: str
+    output_folder_id: Optional[str] = None
+
+
+@dataclass
+class SOWBatchResult:
+    """Outcome of generating one SOW within a batch run."""
+
+    index: int
+    output_name: str
+    success: bool
+    document: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class _GenerationPlan:
+    """Manifest lookup for one output document."""
+
+    key: str
+    fingerprint: str
+    existing_document: Optional[Dict[str, Any]]
+    unchanged: bool
+    deduplicate: bool = False
+
+
 class SOWGenerator:
     """Generate customized SOW documents from Google Docs templates."""
 
-    def __init__(self, google_drive_client: Optional[GoogleDriveClient] = None) -> None:
+    def __init__(
+        self,
+        google_drive_client: Optional[
+            Union[GoogleDriveClient, LocalDriveClient]
+        ] = None,
+        in_memory: bool = False,
+        check_variables: bool = False,
+        manifest: Optional[GenerationManifest] = None,
+        collect_timings: bool = False,
+        deduplicate: bool = False,
+    ) -> None:
         """Initialize SOW generator.
 
         Args:
-            google_drive_client: Optional Google Drive client instance
+            google_drive_client: Optional Google Drive client instance, or a
+                LocalDriveClient to run without the Drive API
+            in_memory: Keep template and generated documents in memory instead
+                of round-tripping them through temporary files. Leave disabled
+                for very large templates.
+            check_variables: Validate every context against the template's
+                variables before rendering or uploading anything
+            manifest: Optional generation manifest. Outputs whose template
+                version and context are unchanged are skipped, and changed
+                outputs update their existing Google Doc in place.
+            collect_timings: Add per-stage wall-clock and byte counters to
+                generate_sow() results under a "timings" key
+            deduplicate: Stamp generated Google Docs with a fingerprint of
+                their template version and context, and reuse a document
+                with the same fingerprint in the output folder instead of
+                uploading a copy, e.g. when the manifest was lost
         """
         self.google_drive = google_drive_client or GoogleDriveClient()
+        self.in_memory = in_memory
+        self.check_variables = check_variables
+        self.manifest = manifest
+        self.collect_timings = collect_timings
+        self.deduplicate = deduplicate
+        self._template_variables: Dict[Tuple[str, str], Set[str]] = {}
 
     def generate_sow(
         self,
@@ -58,6 +133,7 @@ class SOWGenerator:
         context: SOWContext,
         output_name: str,
         output_folder_id: Optional[str] = None,
+        force: bool = False,
     ) -> Dict[str, Any]:
         """Generate SOW document from Google Docs template.
 
@@ -66,34 +142,412 @@ class SOWGenerator:
             context: SOW context data for template rendering
             output_name: Name for the generated SOW document
             output_folder_id: Optional Google Drive folder ID for output
+            force: Regenerate even if the manifest says nothing changed
 
         Returns:
-            Dictionary containing generated document info (ID, link, name)
+            Dictionary containing generated document info (ID, link, name).
+            With a manifest it also has a "status" of created, updated or
+            unchanged, and with collect_timings a "timings" summary.
 
         Raises:
             Exception: If SOW generation fails
         """
+        if not self.collect_timings:
+            return self._generate_sow(
+                template_file_id, context, output_name, output_folder_id, force
+            )
+
+        timer = StageTimer()
+        with timer.activate():
+            result = self._generate_sow(
+                template_file_id, context, output_name, output_folder_id, force
+            )
+        result["timings"] = timer.as_dict()
+        return result
+
+    def _generate_sow(
+        self,
+        template_file_id: str,
+        context: SOWContext,
+        output_name: str,
+        output_folder_id: Optional[str],
+        force: bool,
+    ) -> Dict[str, Any]:
+        """Generate a single SOW; see generate_sow()."""
+        template_bytes = None
+        try:
+            with timed_stage("metadata"):
+                version = self._template_version(template_file_id)
+            if self.check_variables:
+                with timed_stage("validate"):
+                    variables, template_bytes = self._load_template_variables(
+                        template_file_id, version
+                    )
+                    validation = self._validate(variables, [context])[0]
+                if not validation.is_valid:
+                    raise ValueError(self._missing_message(validation))
+            plan = self._plan(
+                template_file_id, version, output_name, output_folder_id, context, force
+            )
+        except Exception as error:
+            raise Exception(f"Failed to generate SOW: {error}")
+
+        if plan is not None and plan.unchanged and plan.existing_document:
+            return dict(plan.existing_document, status="unchanged")
+
+        if self.in_memory:
+            try:
+                # 1. Download template from Google Drive as DOCX bytes,
+                # unless checking its variables already did
+                if template_bytes is None:
+                    with timed_stage("download") as stage:
+                        template_bytes = self.google_drive.download_doc_as_bytes(
+                            template_file_id
+                        )
+                        stage.add_bytes(len(template_bytes))
+
+                # 2. Process template with context data
+                with timed_stage("render") as stage:
+                    document_bytes = self._process_template_bytes(
+                        template_bytes, context
+                    )
+                    stage.add_bytes(len(document_bytes))
+
+                # 3. Upload processed document back to Google Drive
+                with timed_stage("upload") as stage:
+                    stage.add_bytes(len(document_bytes))
+                    return self._publish(
+                        document_bytes, output_name, output_folder_id, plan
+                    )
+
+            except Exception as error:
+                raise Exception(f"Failed to generate SOW: {error}")
+
         with tempfile.TemporaryDirectory() as temp_dir:
             template_path = os.path.join(temp_dir, "template.docx")
             output_path = os.path.join(temp_dir, "generated_sow.docx")
 
             try:
-                # 1. Download template from Google Drive as DOCX
-                self.google_drive.download_doc_as_docx(template_file_id, template_path)
+                # 1. Download template from Google Drive as DOCX, unless
+                # checking its variables already did
+                if template_bytes is not None:
+                    with open(template_path, "wb") as f:
+                        f.write(template_bytes)
+                else:
+                    with timed_stage("download"):
+                        self.google_drive.download_doc_as_docx(
+                            template_file_id, template_path
+                        )
 
                 # 2. Process template with context data
-                self._process_template(template_path, context, output_path)
+                with timed_stage("render"):
+                    self._process_template(template_path, context, output_path)
 
                 # 3. Upload processed document back to Google Drive
-                result = self.google_drive.upload_docx_as_google_doc(
-                    output_path, output_name, output_folder_id
-                )
+                with timed_stage("upload"):
+                    result = self._publish(
+                        output_path, output_name, output_folder_id, plan
+                    )
 
                 return result
 
             except Exception as error:
                 raise Exception(f"Failed to generate SOW: {error}")
 
+    def generate_many(
+        self,
+        template_file_id: str,
+        items: List[SOWBatchItem],
+        output_folder_id: Optional[str] = None,
+        max_workers: int = 4,
+        force: bool = False,
+    ) -> List[SOWBatchResult]:
+        """Generate many SOW documents from a single template download.
+
+        The template is fetched and compiled once; every item is then rendered
+        from the compiled template and uploaded on a bounded thread pool. A
+        failing item is recorded in its result and does not stop the batch.
+        Unless the Drive client is thread-safe, such as
+        PooledGoogleDriveClient, items are generated one at a time.
+
+        Args:
+            template_file_id: Google Drive file ID of the SOW template
+            items: SOWs to generate, in order
+            output_folder_id: Default Google Drive folder ID for items without one
+            max_workers: Maximum number of concurrent render/upload workers;
+                ignored for clients that are not thread-safe
+            force: Regenerate items even if the manifest says nothing changed
+
+        Returns:
+            One SOWBatchResult per item, in input order
+
+        Raises:
+            Exception: If the template cannot be downloaded
+        """
+        if not items:
+            return []
+
+        max_workers = self._batch_workers(max_workers)
+
+        version = self._template_version(template_file_id)
+
+        template_bytes = None
+        preflight_errors: Dict[int, str] = {}
+        if self.check_variables:
+            variables, template_bytes = self._load_template_variables(
+                template_file_id, version
+            )
+            validations = self._validate(variables, [item.context for item in items])
+            preflight_errors = {
+                index: self._missing_message(validation)
+                for index, validation in enumerate(validations)
+                if not validation.is_valid
+            }
+
+        plans: Dict[int, Optional[_GenerationPlan]] = {
+            index: self._plan(
+                template_file_id,
+                version,
+                item.output_name,
+                item.output_folder_id or output_folder_id,
+                item.context,
+                force,
+            )
+            for index, item in enumerate(items)
+        }
+        unchanged = {
+            index: dict(plan.existing_document, status="unchanged")
+            for index, plan in plans.items()
+            if plan is not None and plan.unchanged and plan.existing_document
+        }
+
+        if len(preflight_errors.keys() | unchanged.keys()) == len(items):
+            return self._run_batch(
+                items, None, max_workers, preflight_errors, unchanged
+            )
+
+        if self.in_memory:
+            if template_bytes is None:
+                try:
+                    template_bytes = self.google_drive.download_doc_as_bytes(
+                        template_file_id
+                    )
+                except Exception as error:
+                    raise Exception(f"Failed to download SOW template: {error}")
+
+            template = self._compile_template(template_bytes)
+
+            def generate_in_memory(index: int, item: SOWBatchItem) -> Dict[str, Any]:
+                return self._publish(
+                    template.render_bytes(item.context.to_dict()),
+                    item.output_name,
+                    item.output_folder_id or output_folder_id,
+                    plans[index],
+                )
+
+            return self._run_batch(
+                items, generate_in_memory, max_workers, preflight_errors, unchanged
+            )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            template_path = os.path.join(temp_dir, "template.docx")
+
+            try:
+                if template_bytes is not None:
+                    with open(template_path, "wb") as f:
+                        f.write(template_bytes)
+                else:
+                    self.google_drive.download_doc_as_docx(
+                        template_file_id, template_path
+                    )
+            except Exception as error:
+                raise Exception(f"Failed to download SOW template: {error}")
+
+            template = self._compile_template(template_path)
+
+            def generate_on_disk(index: int, item: SOWBatchItem) -> Dict[str, Any]:
+                output_path = os.path.join(temp_dir, f"generated_sow_{index}.docx")
+                try:
+                    template.render(item.context.to_dict(), output_path)
+                    return self._publish(
+                        output_path,
+                        item.output_name,
+                        item.output_folder_id or output_folder_id,
+                        plans[index],
+                    )
+                finally:
+                    if os.path.exists(output_path):
+                        os.remove(output_path)
+
+            return self._run_batch(
+                items, generate_on_disk, max_workers, preflight_errors, unchanged
+            )
+
+    def _template_version(self, template_file_id: str) -> Optional[str]:
+        """Get the template's modifiedTime if checks or fingerprints need it."""
+        if not self.check_variables and self.manifest is None and not self.deduplicate:
+            return None
+        return str(
+            self.google_drive.get_file_info(template_file_id).get("modifiedTime", "")
+        )
+
+    def _plan(
+        self,
+        template_file_id: str,
+        version: Optional[str],
+        output_name: str,
+        output_folder_id: Optional[str],
+        context: SOWContext,
+        force: bool,
+    ) -> Optional[_GenerationPlan]:
+        """Look up an output in the manifest and decide whether it changed."""
+        if self.manifest is None and not self.deduplicate:
+            return None
+
+        key = GenerationManifest.key(template_file_id, output_name, output_folder_id)
+        fingerprint = GenerationManifest.fingerprint(version or "", context.to_dict())
+        entry = self.manifest.get(key) if self.manifest is not None else None
+
+        return _GenerationPlan(
+            key=key,
+            fingerprint=fingerprint,
+            existing_document=entry.document if entry else None,
+            unchanged=bool(entry and entry.fingerprint == fingerprint and not force),
+            deduplicate=self.deduplicate and not force,
+        )
+
+    def _publish(
+        self,
+        document: Union[str, bytes],
+        output_name: str,
+        output_folder_id: Optional[str],
+        plan: Optional[_GenerationPlan],
+    ) -> Dict[str, Any]:
+        """Upload a rendered SOW, updating its previous Google Doc if known.
+
+        Args:
+            document: Path to the rendered DOCX or its content
+            output_name: Name for a newly created Google Doc
+            output_folder_id: Optional Google Drive folder ID for a new doc
+            plan: Manifest plan for the output, if a manifest or
+                deduplication is in use
+
+        Returns:
+            Dictionary containing generated document info (ID, link, name)
+
+        Raises:
+            Exception: If the previous document exists but cannot be updated
+        """
+        existing_id = (plan.existing_document or {}).get("id") if plan else None
+        # Rendered DOCX files embed timestamps, so documents are stamped with
+        # their input fingerprint for deduplication rather than a DOCX hash
+        content_hash = plan.fingerprint if plan and self.deduplicate else None
+        result = None
+
+        if existing_id:
+            try:
+                if isinstance(document, bytes):
+                    result = self.google_drive.update_google_doc_from_docx_bytes(
+                        existing_id, document, content_hash=content_hash
+                    )
+                else:
+                    result = self.google_drive.update_google_doc_from_docx(
+                        existing_id, document, content_hash=content_hash
+                    )
+                result["status"] = "updated"
+            except (HttpError, FileNotFoundError) as error:
+                # Only a deleted previous document is replaced by a new one;
+                # any other failure would leave a duplicate behind
+                if not (
+                    isinstance(error, FileNotFoundError) or is_not_found_error(error)
+                ):
+                    raise
+                result = None
+
+        if result is None:
+            deduplicate = bool(plan and plan.deduplicate)
+            if isinstance(document, bytes):
+                result = self.google_drive.upload_docx_bytes_as_google_doc(
+                    document,
+                    output_name,
+                    output_folder_id,
+                    deduplicate=deduplicate,
+                    content_hash=content_hash,
+                )
+            else:
+                result = self.google_drive.upload_docx_as_google_doc(
+                    document,
+                    output_name,
+                    output_folder_id,
+                    deduplicate=deduplicate,
+                    content_hash=content_hash,
+                )
+            if self.manifest is not None:
+                result["status"] = "created"
+
+        if plan is not None and self.manifest is not None:
+            self.manifest.record(plan.key, plan.fingerprint, result)
+
+        return result
+
+    def _compile_template(self, template: Union[str, bytes]) -> CompiledTemplate:
+        """Compile a downloaded template for rendering many contexts."""
+        try:
+            return CompiledTemplate(template)
+        except Exception as error:
+            raise Exception(f"Failed to process template: {error}")
+
+    def _run_batch(
+        self,
+        items: List[SOWBatchItem],
+        generate: Optional[Callable[[int, SOWBatchItem], Dict[str, Any]]],
+        max_workers: int,
+        preflight_errors: Optional[Dict[int, str]] = None,
+        unchanged: Optional[Dict[int, Dict[str, Any]]] = None,
+    ) -> List[SOWBatchResult]:
+        """Run generate() for every item on a thread pool, isolating failures.
+
+        Items with a pre-flight error are reported as failed and unchanged
+        items as succeeded with their existing document, without running.
+        Items run one at a time unless the Drive client is thread-safe.
+        """
+        preflight_errors = preflight_errors or {}
+        unchanged = unchanged or {}
+
+        def run(index: int, item: SOWBatchItem) -> SOWBatchResult:
+            try:
+                if index in preflight_errors:
+                    raise ValueError(preflight_errors[index])
+                if index in unchanged or generate is None:
+                    document = unchanged[index]
+                else:
+                    document = generate(index, item)
+                return SOWBatchResult(
+                    index=index,
+                    output_name=item.output_name,
+                    success=True,
+                    document=document,
+                )
+            except Exception as error:
+                return SOWBatchResult(
+                    index=index,
+                    output_name=item.output_name,
+                    success=False,
+                    error=str(error),
+                )
+
+        with ThreadPoolExecutor(
+            max_workers=self._batch_workers(max_workers)
+        ) as executor:
+            return list(executor.map(run, range(len(items)), items))
+
+    def _batch_workers(self, max_workers: int) -> int:
+        """Get how many threads a batch may run on with this Drive client."""
+        if not getattr(self.google_drive, "thread_safe", False):
+            # The client shares one HTTP connection between threads
+            return 1
+        return max(1, max_workers)
+
     def _process_template(
         self, template_path: str, context: SOWContext, output_path: str
     ) -> None:
@@ -120,6 +574,116 @@ class SOWGenerator:
         except Exception as error:
             raise Exception(f"Failed to process template: {error}")
 
+    def _process_template_bytes(
+        self, template_bytes: bytes, context: SOWContext
+    ) -> bytes:
+        """Process in-memory DOCX template with context data.
+
+        Args:
+            template_bytes: Template DOCX content
+            context: SOW context data
+
+        Returns:
+            Processed DOCX content
+
+        Raises:
+            Exception: If template processing fails
+        """
+        try:
+            doc = DocxTemplate(io.BytesIO(template_bytes))
+            doc.render(context.to_dict())
+
+            output = io.BytesIO()
+            doc.save(output)
+            return output.getvalue()
+
+        except Exception as error:
+            raise Exception(f"Failed to process template: {error}")
+
+    def get_template_variables(
+        self, template_file_id: str, template_version: Optional[str] = None
+    ) -> Set[str]:
+        """Get the variables a template expects, extracting them once per version.
+
+        Schemas are memoized per (file ID, modifiedTime) and, when the Drive
+        client has a template cache, stored next to the cached export so later
+        runs skip the download entirely.
+
+        Args:
+            template_file_id: Google Drive file ID of the template
+            template_version: The template's modifiedTime, if already known
+
+        Returns:
+            Names of the template's undeclared Jinja variables
+        """
+        return self._load_template_variables(template_file_id, template_version)[0]
+
+    def _load_template_variables(
+        self, template_file_id: str, template_version: Optional[str]
+    ) -> Tuple[Set[str], Optional[bytes]]:
+        """Get a template's variables and the template, if it was downloaded.
+
+        Callers that go on to render reuse the returned content rather than
+        exporting the template a second time.
+        """
+        version = template_version
+        if version is None:
+            version = self.google_drive.get_file_info(template_file_id).get(
+                "modifiedTime", ""
+            )
+        key = (template_file_id, version)
+        if key in self._template_variables:
+            return self._template_variables[key], None
+
+        template_cache = getattr(self.google_drive, "template_cache", None)
+        cached = (
+            template_cache.get_schema(template_file_id, version)
+            if template_cache is not None and version
+            else None
+        )
+        template_bytes = None
+        if cached is not None:
+            variables = set(cached)
+        else:
+            template_bytes = self.google_drive.download_doc_as_bytes(template_file_id)
+            variables = extract_template_variables(template_bytes)
+            if template_cache is not None and version:
+                template_cache.put_schema(template_file_id, version, variables)
+
+        self._template_variables[key] = variables
+        return variables, template_bytes
+
+    def validate_contexts(
+        self,
+        template_file_id: str,
+        contexts: List[SOWContext],
+        template_version: Optional[str] = None,
+    ) -> List[ContextValidation]:
+        """Validate contexts against a template's variables before rendering.
+
+        Args:
+            template_file_id: Google Drive file ID of the template
+            contexts: SOW contexts to check
+            template_version: The template's modifiedTime, if already known
+
+        Returns:
+            One ContextValidation per context, in order
+        """
+        variables = self.get_template_variables(template_file_id, template_version)
+        return self._validate(variables, contexts)
+
+    @staticmethod
+    def _validate(
+        variables: Set[str], contexts: List[SOWContext]
+    ) -> List[ContextValidation]:
+        """Validate contexts against known template variables."""
+        return [validate_context(variables, context.to_dict()) for context in contexts]
+
+    @staticmethod
+    def _missing_message(validation: ContextValidation) -> str:
+        """Describe the template variables a context does not provide."""
+        return f"Context is missing template variables: {', '.join(validation.missing)}"
+
     def get_template_info(self, template_file_id: str) -> Dict[str, Any]:
         """Get information about a SOW template.
 
@@ -143,10 +707,36 @@ class SOWGenerator:
         try:
             file_info = self.google_drive.get_file_info(template_file_id)
             # Check if it's a Google Doc
-            return file_info.get("mimeType") == "application/vnd.google-apps.document"
+            return file_info.get("mimeType") == GOOGLE_DOC_MIME_TYPE
         except Exception:
             return False
 
+    def validate_templates(
+        self, template_file_ids: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Validate many templates, fetching their metadata in batches.
+
+        Unlike calling validate_template() and get_template_info() per
+        template, each template's metadata is fetched only once, and lookups
+        are grouped into Drive batch requests.
+
+        Args:
+            template_file_ids: Google Drive file IDs of the templates
+
+        Returns:
+            Dictionary mapping each template ID to its metadata if it is an
+            accessible Google Doc, or to None otherwise
+        """
+        files_info = self.google_drive.get_files_info(template_file_ids)
+        return {
+            file_id: (
+                info
+                if info is not None and info.get("mimeType") == GOOGLE_DOC_MIME_TYPE
+                else None
+            )
+            for file_id, info in files_info.items()
+        }
+
     @staticmethod
     def create_context_from_config(config: Dict[str, Any]) -> SOWContext:
         """Create SOW context from configuration dictionary.
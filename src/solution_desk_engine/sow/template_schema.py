@@ -0,0 +1,55 @@
+"""Template variable introspection and SOW context validation."""
+
+import io
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Set, Union
+
+from docxtpl import DocxTemplate  # type: ignore
+
+
+@dataclass
+class ContextValidation:
+    """Result of checking a context against a template's variables."""
+
+    missing: List[str] = field(default_factory=list)
+    blank: List[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the context provides every variable the template uses."""
+        return not self.missing
+
+
+def extract_template_variables(template: Union[str, bytes]) -> Set[str]:
+    """Extract the undeclared Jinja variables used by a DOCX template.
+
+    Args:
+        template: Path to the template DOCX file or its content
+
+    Returns:
+        Names of the variables the template expects from its context
+    """
+    source = io.BytesIO(template) if isinstance(template, bytes) else template
+    return set(DocxTemplate(source).get_undeclared_template_variables())
+
+
+def validate_context(
+    variables: Iterable[str], context: Dict[str, Any]
+) -> ContextValidation:
+    """Check that a context provides values for every template variable.
+
+    Args:
+        variables: Variables used by the template
+        context: Context data that will be rendered into the template
+
+    Returns:
+        ContextValidation listing missing variables (which render as blanks
+        and fail validation) and variables the context leaves empty
+    """
+    result = ContextValidation()
+    for name in sorted(variables):
+        if name not in context:
+            result.missing.append(name)
+        elif context[name] in ("", None):
+            result.blank.append(name)
+    return result
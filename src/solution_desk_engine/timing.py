@@ -0,0 +1,128 @@
+"""Per-stage wall-clock and byte counters for SOW generation runs."""
+
+import contextvars
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+_current_timer: contextvars.ContextVar[Optional["StageTimer"]] = contextvars.ContextVar(
+    "solution_desk_engine_stage_timer", default=None
+)
+
+
+@dataclass
+class StageTiming:
+    """Accumulated measurements for one named stage."""
+
+    seconds: float = 0.0
+    calls: int = 0
+    bytes: int = 0
+
+    def add_bytes(self, count: int) -> None:
+        """Count bytes transferred or produced by the stage."""
+        self.bytes += count
+
+
+class _NullStageTiming(StageTiming):
+    """StageTiming that ignores measurements when no timer is active."""
+
+    def add_bytes(self, count: int) -> None:
+        """Discard the byte count."""
+
+
+class StageTimer:
+    """Collects wall-clock time, call counts and byte counts per stage.
+
+    Stages may nest (a Drive export inside the template download stage), so
+    stage times are not expected to add up to the total.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty timer."""
+        self.stages: Dict[str, StageTiming] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageTiming]:
+        """Measure a block of work as (part of) the named stage.
+
+        Args:
+            name: Stage name, e.g. "render" or "drive.export"
+
+        Yields:
+            A StageTiming for the block, to record byte counts on
+        """
+        measurement = StageTiming(calls=1)
+        start = time.perf_counter()
+        try:
+            yield measurement
+        finally:
+            measurement.seconds = time.perf_counter() - start
+            with self._lock:
+                total = self.stages.setdefault(name, StageTiming())
+                total.seconds += measurement.seconds
+                total.calls += measurement.calls
+                total.bytes += measurement.bytes
+
+    @contextmanager
+    def activate(self) -> Iterator["StageTimer"]:
+        """Make this timer the target of timed_stage() in the current context."""
+        token = _current_timer.set(self)
+        try:
+            yield self
+        finally:
+            _current_timer.reset(token)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Summarize the measurements for results and logs."""
+        with self._lock:
+            return {
+                "total_seconds": round(time.perf_counter() - self._started, 6),
+                "stages": {
+                    name: {
+                        "seconds": round(timing.seconds, 6),
+                        "calls": timing.calls,
+                        "bytes": timing.bytes,
+                    }
+                    for name, timing in self.stages.items()
+                },
+            }
+
+
+@contextmanager
+def timed_stage(name: str) -> Iterator[StageTiming]:
+    """Measure a block into the active StageTimer, if there is one.
+
+    Args:
+        name: Stage name
+
+    Yields:
+        A StageTiming to record byte counts on (discarded when no timer is
+        active)
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        yield _NullStageTiming()
+        return
+
+    with timer.stage(name) as measurement:
+        yield measurement
+
+
+def append_timings_record(log_path: Path, record: Dict[str, Any]) -> None:
+    """Append one run's timings to a JSON-lines log.
+
+    Args:
+        log_path: Path to the JSON-lines file
+        record: Run details, typically including a "timings" summary
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps({"timestamp": datetime.now().isoformat(), **record})
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
@@ -1,9 +1,18 @@
 """Tests for CLI commands."""
 
+import json
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 from click.testing import CliRunner
+from docx import Document  # type: ignore
 
 from solution_desk_engine.cli import cli
+from solution_desk_engine.integrations.downloads import DownloadResult
+from solution_desk_engine.integrations.drive_index import FOLDER_MIME_TYPE, SyncResult
+from solution_desk_engine.sow.generation_manifest import GenerationManifest
+from solution_desk_engine.sow.sow_generator import SOWBatchResult
 
 
 @pytest.fixture
@@ -33,7 +42,446 @@ def test_invalid_command(runner: CliRunner) -> None:
     assert result.exit_code != 0
 
 
+def test_sow_batch_command(runner: CliRunner, tmp_path: Path) -> None:
+    """Test sow batch reports per-row results and fails if any row failed."""
+    batch_file = tmp_path / "batch.jsonl"
+    batch_file.write_text(
+        '{"customer_name": "Penske", "project_name": "Leases"}\n'
+        '{"customer_name": "Acme", "project_name": "Data"}\n'
+    )
+
+    with patch("solution_desk_engine.cli.SOWGenerator") as mock_generator:
+        mock_generator.return_value.generate_many.return_value = [
+            SOWBatchResult(0, "Penske SOW - Leases", True, {"web_view_link": "link"}),
+            SOWBatchResult(1, "Acme SOW - Data", False, error="Upload failed"),
+        ]
+        result = runner.invoke(
+            cli,
+            ["sow", "batch", "--template-id", "tpl", "--input", str(batch_file)],
+        )
+
+    assert result.exit_code != 0
+    assert "Penske SOW - Leases" in result.output
+    assert "Upload failed" in result.output
+    assert "1 succeeded, 1 failed" in result.output
+    items = mock_generator.return_value.generate_many.call_args.kwargs["items"]
+    assert len(items) == 2
+
+
+def test_sow_batch_output_folder_path(runner: CliRunner, tmp_path: Path) -> None:
+    """Test sow batch saves into the folder resolved from --output-folder-path."""
+    batch_file = tmp_path / "batch.jsonl"
+    batch_file.write_text('{"customer_name": "Penske", "project_name": "Leases"}\n')
+
+    with patch("solution_desk_engine.cli.SOWGenerator") as mock_generator:
+        generator = mock_generator.return_value
+        generator.google_drive.resolve_folder_path.return_value = "sows-folder"
+        generator.generate_many.return_value = []
+        result = runner.invoke(
+            cli,
+            [
+                "sow",
+                "batch",
+                "--template-id",
+                "tpl",
+                "--input",
+                str(batch_file),
+                "--output-folder-id",
+                "shared-drive",
+                "--output-folder-path",
+                "Customers/Penske",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    generator.google_drive.resolve_folder_path.assert_called_once_with(
+        "Customers/Penske", "shared-drive"
+    )
+    assert generator.generate_many.call_args.kwargs["output_folder_id"] == (
+        "sows-folder"
+    )
+
+
+def test_sow_generate_timings(runner: CliRunner, tmp_path: Path) -> None:
+    """Test sow generate prints stage timings and appends them to a log."""
+    log_path = tmp_path / "timings.jsonl"
+    timings = {
+        "total_seconds": 1.5,
+        "stages": {"render": {"seconds": 0.5, "calls": 1, "bytes": 2048}},
+    }
+
+    with patch("solution_desk_engine.cli.SOWGenerator") as mock_generator:
+        mock_generator.return_value.validate_template.return_value = True
+        mock_generator.return_value.generate_sow.return_value = {
+            "id": "doc_id",
+            "name": "Penske SOW - Leases",
+            "web_view_link": "link",
+            "status": "created",
+            "timings": timings,
+        }
+        result = runner.invoke(
+            cli,
+            [
+                "sow",
+                "generate",
+                "--template-id",
+                "tpl",
+                "--customer-name",
+                "Penske",
+                "--project-name",
+                "Leases",
+                "--timings",
+                "--timings-log",
+                str(log_path),
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "render" in result.output
+    assert "2.0 KB" in result.output
+    assert mock_generator.call_args.kwargs["collect_timings"] is True
+    record = json.loads(log_path.read_text())
+    assert record["template_id"] == "tpl"
+    assert record["timings"] == timings
+
+
+def test_sow_generate_local_backend(runner: CliRunner, tmp_path: Path) -> None:
+    """Test sow generate runs end to end against a local directory."""
+    template = Document()
+    template.add_paragraph("Statement of Work for {{ customer_name }}")
+    template.save(tmp_path / "template.docx")
+
+    manifest = GenerationManifest(tmp_path / "state" / "manifest.json")
+
+    with (
+        patch("solution_desk_engine.cli.GenerationManifest", return_value=manifest),
+        patch("solution_desk_engine.cli.TemplateCache", return_value=None),
+    ):
+        result = runner.invoke(
+            cli,
+            [
+                "sow",
+                "generate",
+                "--template-id",
+                "template",
+                "--customer-name",
+                "Penske",
+                "--project-name",
+                "Leases",
+                "--backend",
+                "local",
+                "--local-root",
+                str(tmp_path),
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    generated = list(tmp_path.glob("local-*.docx"))
+    assert len(generated) == 1
+    paragraphs = [p.text for p in Document(str(generated[0])).paragraphs]
+    assert paragraphs == ["Statement of Work for Penske"]
+
+
+def test_cache_clear_command(runner: CliRunner) -> None:
+    """Test cache clear reports the number of removed templates."""
+    with (
+        patch("solution_desk_engine.cli.TemplateCache") as mock_cache,
+        patch("solution_desk_engine.cli.SQLiteMetadataCache") as mock_metadata_cache,
+    ):
+        mock_cache.return_value.clear.return_value = 3
+        mock_metadata_cache.return_value.clear.return_value = 5
+        result = runner.invoke(cli, ["cache", "clear"])
+
+    assert result.exit_code == 0
+    assert "Removed 3 cached templates" in result.output
+    assert "Removed 5 cached metadata entries" in result.output
+
+
+def test_drive_sync_command(runner: CliRunner) -> None:
+    """Test drive sync reports what changed in each folder tree."""
+    with (
+        patch("solution_desk_engine.cli.DriveIndex") as mock_index,
+        patch("solution_desk_engine.cli.GoogleDriveClient") as mock_client,
+    ):
+        mock_client.return_value.sync_folder.side_effect = [
+            SyncResult("first", full=True, added=12),
+            SyncResult("second", full=False, added=1, updated=2, removed=3),
+        ]
+        result = runner.invoke(
+            cli, ["drive", "sync", "--folder-id", "first", "--folder-id", "second"]
+        )
+
+    assert result.exit_code == 0
+    assert "first: 12 added, 0 updated, 0 removed (full listing)" in result.output
+    assert "second: 1 added, 2 updated, 3 removed (changes)" in result.output
+    mock_client.assert_called_once_with(drive_index=mock_index.return_value)
+    mock_index.return_value.close.assert_called_once()
+
+
+def test_drive_download_command(runner: CliRunner, tmp_path: Path) -> None:
+    """Test drive download fetches a folder's files and reports failures."""
+    with patch("solution_desk_engine.cli.PooledGoogleDriveClient") as mock_client:
+        client = mock_client.return_value
+        client.list_files_in_folder.return_value = [
+            {"id": "deck", "mimeType": "application/pdf"},
+            {"id": "sub", "mimeType": FOLDER_MIME_TYPE},
+        ]
+        client.download_many.return_value = [
+            DownloadResult("deck", "deck.pdf", True, tmp_path / "deck.pdf", 2048),
+            DownloadResult("doc", "doc", False, error="File not found"),
+        ]
+        result = runner.invoke(
+            cli,
+            [
+                "drive",
+                "download",
+                "--folder-id",
+                "source",
+                "--file-id",
+                "doc",
+                "--dest",
+                str(tmp_path),
+                "--max-workers",
+                "3",
+            ],
+        )
+
+    assert result.exit_code != 0
+    assert "doc: File not found" in result.output
+    assert "1 downloaded (2.0 KB), 1 failed" in result.output
+    args, kwargs = client.download_many.call_args
+    assert args == (["doc", "deck"], tmp_path)
+    assert kwargs["max_workers"] == 3
+
+
+def test_validate_template_fetches_metadata_once(runner: CliRunner) -> None:
+    """Test several templates are validated from one metadata lookup."""
+    with patch("solution_desk_engine.cli.SOWGenerator") as mock_generator:
+        mock_generator.return_value.validate_templates.return_value = {
+            "tpl": {"name": "SOW Template", "modifiedTime": "v1"},
+            "pdf": None,
+        }
+        mock_generator.return_value.get_template_variables.return_value = {
+            "customer_name"
+        }
+        result = runner.invoke(
+            cli,
+            [
+                "sow",
+                "validate-template",
+                "--template-id",
+                "tpl",
+                "--template-id",
+                "pdf",
+                "--show-variables",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "SOW Template" in result.output
+    assert "1 of 2 templates are valid" in result.output
+    generator = mock_generator.return_value
+    generator.validate_templates.assert_called_once_with(["tpl", "pdf"])
+    generator.get_template_variables.assert_called_once_with("tpl", "v1")
+    generator.get_template_info.assert_not_called()
+    generator.validate_template.assert_not_called()
+
+
+def test_validate_template_offline(runner: CliRunner, tmp_path: Path) -> None:
+    """Test offline validation checks a batch against the cached schema."""
+    batch_file = tmp_path / "batch.jsonl"
+    batch_file.write_text(
+        '{"customer_name": "Penske", "project_name": "Leases"}\n'
+        '{"customer_name": "Acme", "project_name": "Data"}\n'
+    )
+
+    with patch("solution_desk_engine.cli.TemplateCache") as mock_cache:
+        mock_cache.return_value.get_latest_schema.return_value = [
+            "customer_name",
+            "region",
+        ]
+        result = runner.invoke(
+            cli,
+            [
+                "sow",
+                "validate-template",
+                "--template-id",
+                "tpl",
+                "--offline",
+                "--show-variables",
+                "--input",
+                str(batch_file),
+            ],
+        )
+
+    assert result.exit_code != 0
+    assert "region (not a SOWContext field)" in result.output
+    assert "missing region" in result.output
+    assert "0 of 2 contexts are valid" in result.output
+
+
+def test_validate_template_offline_without_schema(runner: CliRunner) -> None:
+    """Test offline validation needs a previously cached schema."""
+    with patch("solution_desk_engine.cli.TemplateCache") as mock_cache:
+        mock_cache.return_value.get_latest_schema.return_value = None
+        result = runner.invoke(
+            cli, ["sow", "validate-template", "--template-id", "tpl", "--offline"]
+        )
+
+    assert result.exit_code != 0
+    assert "run once without --offline" in result.output
+
+
 # TODO: Add tests for new framework commands when implemented
 # def test_create_command(runner: CliRunner) -> None:
 # def test_analyze_command(runner: CliRunner) -> None:
 # def test_generate_command(runner: CliRunner) -> None:
+
+
+def test_export_command(runner: CliRunner, tmp_path: Path) -> None:
+    """Test export converts every markdown file of a directory."""
+    docs = tmp_path / "docs"
+    (docs / "phase").mkdir(parents=True)
+    (docs / "overview.md").write_text("# Overview\n")
+    (docs / "phase" / "plan.md").write_text("# Plan\n")
+    output_dir = tmp_path / "out" / "html"
+
+    result = runner.invoke(
+        cli,
+        [
+            "export",
+            str(docs),
+            "--format",
+            "html",
+            "--output-dir",
+            str(output_dir),
+            "--max-workers",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "2 exported, 0 failed" in result.output
+    assert sorted(
+        path.relative_to(output_dir).as_posix() for path in output_dir.glob("**/*.html")
+    ) == ["overview.html", "phase/plan.html"]
+
+    (docs / "overview.md").write_text("# Overview v2\n")
+    rerun = runner.invoke(
+        cli, ["export", str(docs), "--format", "html", "--output-dir", str(output_dir)]
+    )
+    assert rerun.exit_code == 0, rerun.output
+    assert "1 exported, 0 failed (100%), 1 unchanged" in rerun.output
+
+    forced = runner.invoke(
+        cli,
+        ["export", str(docs), "--format", "html", "--output-dir", str(output_dir)]
+        + ["--force"],
+    )
+    assert "2 exported, 0 failed" in forced.output
+
+
+def test_export_command_multiple_formats(runner: CliRunner, tmp_path: Path) -> None:
+    """Test export writes every requested format of each file."""
+    source = tmp_path / "overview.md"
+    source.write_text("# Overview\n\n- scope\n")
+    output_dir = tmp_path / "out"
+
+    result = runner.invoke(
+        cli,
+        [
+            "export",
+            str(source),
+            "--format",
+            "html",
+            "--format",
+            "docx",
+            "--format",
+            "md",
+            "--output-dir",
+            str(output_dir),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "3 exported, 0 failed" in result.output
+    assert sorted(path.name for path in output_dir.glob("overview.*")) == [
+        "overview.docx",
+        "overview.html",
+        "overview.md",
+    ]
+
+
+def test_export_command_shared_css(runner: CliRunner, tmp_path: Path) -> None:
+    """Test --shared-css links HTML pages to one stylesheet."""
+    source = tmp_path / "overview.md"
+    source.write_text("# Overview\n")
+    output_dir = tmp_path / "out"
+
+    result = runner.invoke(
+        cli,
+        [
+            "export",
+            str(source),
+            "--format",
+            "html",
+            "--output-dir",
+            str(output_dir),
+            "--shared-css",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (output_dir / "document-export.css").exists()
+    assert "document-export.css" in (output_dir / "overview.html").read_text()
+
+
+def test_export_command_keeps_directory_layout(
+    runner: CliRunner, tmp_path: Path
+) -> None:
+    """Test same-named files of a directory are exported side by side."""
+    docs = tmp_path / "docs"
+    for name in ("a", "b"):
+        (docs / name).mkdir(parents=True)
+        (docs / name / "README.md").write_text(f"# {name}\n")
+    output_dir = tmp_path / "out"
+
+    result = runner.invoke(
+        cli,
+        [
+            "export",
+            str(docs),
+            "--format",
+            "html",
+            "--output-dir",
+            str(output_dir),
+            "--max-workers",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "2 exported, 0 failed" in result.output
+    for name in ("a", "b"):
+        page = (output_dir / name / "README.html").read_text(encoding="utf-8")
+        assert f">{name}</h1>" in page
+
+
+def test_export_command_rejects_colliding_outputs(
+    runner: CliRunner, tmp_path: Path
+) -> None:
+    """Test sources exported to the same file fail before any export."""
+    sources = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "README.md").write_text(f"# {name}\n")
+        sources.append(str(tmp_path / name))
+    output_dir = tmp_path / "out"
+
+    result = runner.invoke(
+        cli, ["export", *sources, "--format", "html", "--output-dir", str(output_dir)]
+    )
+
+    assert result.exit_code != 0
+    assert "would both be exported to" in result.output
+    assert not list(output_dir.glob("**/*.html"))
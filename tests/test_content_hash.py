@@ -0,0 +1,47 @@
+"""Tests for upload content hashes."""
+
+import hashlib
+from pathlib import Path
+
+from solution_desk_engine.integrations.content_hash import (
+    APP_PROPERTY_HASH,
+    APP_PROPERTY_SOURCE,
+    MAX_APP_PROPERTY_BYTES,
+    app_properties,
+    content_hash_query,
+    hash_bytes,
+    hash_file,
+)
+
+
+def test_file_and_bytes_hashes_match(tmp_path: Path) -> None:
+    """Test a file hashes like its content."""
+    path = tmp_path / "doc.docx"
+    path.write_bytes(b"content" * 100_000)
+
+    assert hash_file(path) == hash_bytes(path.read_bytes())
+    assert hash_bytes(b"x") == hashlib.sha256(b"x").hexdigest()
+
+
+def test_long_source_paths_are_trimmed() -> None:
+    """Test source paths keep their end within Drive's property limit."""
+    source = "opportunity/" + "nested/" * 40 + "sow.md"
+
+    properties = app_properties("abc", source)
+
+    assert properties[APP_PROPERTY_HASH] == "abc"
+    assert source.endswith(properties[APP_PROPERTY_SOURCE])
+    assert (
+        len(APP_PROPERTY_SOURCE) + len(properties[APP_PROPERTY_SOURCE])
+        == MAX_APP_PROPERTY_BYTES
+    )
+
+
+def test_content_hash_query() -> None:
+    """Test the search query matches the hash and optionally the folder."""
+    query = content_hash_query("abc", "folder")
+
+    assert f"key='{APP_PROPERTY_HASH}' and value='abc'" in query
+    assert "trashed=false" in query
+    assert query.endswith("'folder' in parents")
+    assert "in parents" not in content_hash_query("abc")
@@ -0,0 +1,83 @@
+"""Tests for cached Google API service construction."""
+
+from typing import Iterator
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from solution_desk_engine.integrations import discovery
+from solution_desk_engine.integrations.discovery import (
+    build_service,
+    clear_service_cache,
+    get_discovery_document,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_services() -> Iterator[None]:
+    """Start every test without memoized services."""
+    clear_service_cache()
+    yield
+    clear_service_cache()
+
+
+def test_discovery_document_is_bundled() -> None:
+    """Test the Drive discovery document is read without the network."""
+    assert '"name": "drive"' in get_discovery_document("drive", "v3")
+
+
+def test_unknown_api_raises() -> None:
+    """Test an API without a bundled document is rejected."""
+    with pytest.raises(ValueError, match="No bundled discovery document"):
+        get_discovery_document("no-such-api", "v1")
+
+
+def test_services_are_memoized_per_credentials() -> None:
+    """Test one service is built per credentials object."""
+    credentials = Credentials(token="token")
+
+    service = build_service("drive", "v3", credentials=credentials)
+
+    assert build_service("drive", "v3", credentials=credentials) is service
+    assert build_service("drive", "v3", credentials=Credentials("other")) is not (
+        service
+    )
+    assert build_service("docs", "v1", credentials=credentials) is not service
+
+
+def test_least_recently_used_services_are_dropped(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the memo keeps services of recently used credentials only."""
+    monkeypatch.setattr(discovery, "MAX_CACHED_SERVICES", 2)
+    first, second, third = (Credentials(token=f"token-{i}") for i in range(3))
+    first_service = build_service("drive", "v3", credentials=first)
+    second_service = build_service("drive", "v3", credentials=second)
+
+    assert build_service("drive", "v3", credentials=first) is first_service
+    build_service("drive", "v3", credentials=third)
+
+    assert build_service("drive", "v3", credentials=first) is first_service
+    assert build_service("drive", "v3", credentials=second) is not second_service
+
+
+def test_services_on_explicit_transports_are_not_memoized() -> None:
+    """Test services for per-thread transports are built every time."""
+    http = object()
+
+    assert build_service("drive", "v3", http=http) is not build_service(
+        "drive", "v3", http=http
+    )
+
+
+def test_nested_resources_are_built_once() -> None:
+    """Test nested resources are reused and still build requests."""
+    service = build_service("drive", "v3", credentials=Credentials(token="token"))
+
+    files = service.files()
+    request = files.get(fileId="file_id", fields="id")
+
+    assert service.files() is files
+    assert request.methodId == "drive.files.get"
+    assert request.uri.startswith("https://www.googleapis.com/drive/v3/files/file_id")
+    assert callable(service.new_batch_http_request)
@@ -0,0 +1,177 @@
+"""Tests for bulk Drive downloads."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httplib2  # type: ignore
+import pytest
+
+from solution_desk_engine.integrations.discovery import build_service
+from solution_desk_engine.integrations.downloads import (
+    DownloadProgress,
+    download_file_name,
+)
+from solution_desk_engine.integrations.google_drive import GoogleDriveClient
+
+PDF_CONTENT = b"%PDF" + b"x" * (300 * 1024)
+CHUNK_SIZE = 256 * 1024
+
+
+class DriveMediaHttp:
+    """Stateless stand-in for Drive media downloads, keyed by file ID."""
+
+    def __init__(self, contents: Dict[str, bytes], delay: float = 0.0) -> None:
+        self.contents = contents
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> Tuple[httplib2.Response, bytes]:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            file_id = urlparse(uri).path.split("/files/")[1].split("/")[0]
+            if file_id not in self.contents:
+                return httplib2.Response({"status": "404"}), b"Not found"
+            content = self.contents[file_id]
+            first, last = (
+                int(part) for part in (headers or {})["range"][6:].split("-")
+            )
+            part = content[first : last + 1]
+            return (
+                httplib2.Response(
+                    {
+                        "status": "206",
+                        "content-range": f"bytes {first}-{first + len(part) - 1}/"
+                        f"{len(content)}",
+                    }
+                ),
+                part,
+            )
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def make_client(
+    http: DriveMediaHttp, files: Dict[str, Optional[Dict[str, Any]]]
+) -> GoogleDriveClient:
+    """Build a client answering metadata from a dict and media from http."""
+    client = GoogleDriveClient()
+    client._service = build_service("drive", "v3", http=http)
+    client.get_files_info = lambda file_ids: {  # type: ignore[method-assign]
+        file_id: files.get(file_id) for file_id in file_ids
+    }
+    return client
+
+
+def test_download_many(tmp_path: Path) -> None:
+    """Test exports, binary files and failures are reported in input order."""
+    http = DriveMediaHttp({"doc": b"docx", "pdf": PDF_CONTENT})
+    client = make_client(
+        http,
+        {
+            "doc": {
+                "id": "doc",
+                "name": "Plan",
+                "mimeType": "application/vnd.google-apps.document",
+            },
+            "pdf": {"id": "pdf", "name": "deck.pdf", "mimeType": "application/pdf"},
+            "form": {
+                "id": "form",
+                "name": "Survey",
+                "mimeType": "application/vnd.google-apps.form",
+            },
+        },
+    )
+    updates: List[DownloadProgress] = []
+
+    results = client.download_many(
+        ["doc", "pdf", "missing", "form", "pdf"],
+        tmp_path / "source",
+        chunk_size=CHUNK_SIZE,
+        progress=updates.append,
+    )
+
+    assert [(r.file_id, r.success) for r in results] == [
+        ("doc", True),
+        ("pdf", True),
+        ("missing", False),
+        ("form", False),
+    ]
+    assert results[0].path == tmp_path / "source" / "Plan.docx"
+    assert results[0].path.read_bytes() == b"docx"
+    assert results[1].path.read_bytes() == PDF_CONTENT  # type: ignore[union-attr]
+    assert results[1].bytes == len(PDF_CONTENT)
+    assert "cannot be downloaded" in results[3].error  # type: ignore[operator]
+    pdf_updates = [update for update in updates if update.file_id == "pdf"]
+    assert [update.bytes_done for update in pdf_updates] == [
+        CHUNK_SIZE,
+        len(PDF_CONTENT),
+    ]
+    assert pdf_updates[-1].done and pdf_updates[-1].total_bytes == len(PDF_CONTENT)
+    assert sorted(path.name for path in (tmp_path / "source").iterdir()) == [
+        "Plan.docx",
+        "deck.pdf",
+    ]
+
+
+def test_failed_download_leaves_no_partial_file(tmp_path: Path) -> None:
+    """Test a download rejected by Drive removes its temporary file."""
+    client = make_client(
+        DriveMediaHttp({}),
+        {"gone": {"id": "gone", "name": "gone.pdf", "mimeType": "application/pdf"}},
+    )
+
+    (result,) = client.download_many(["gone"], tmp_path)
+
+    assert not result.success
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(("thread_safe", "parallel"), [(True, True), (False, False)])
+def test_only_thread_safe_clients_download_in_parallel(
+    tmp_path: Path, thread_safe: bool, parallel: bool
+) -> None:
+    """Test downloads overlap only on clients that may be shared by threads."""
+    ids = [f"file-{number}" for number in range(4)]
+    http = DriveMediaHttp({file_id: b"data" for file_id in ids}, delay=0.05)
+    client = make_client(
+        http,
+        {
+            file_id: {"id": file_id, "name": file_id, "mimeType": "text/plain"}
+            for file_id in ids
+        },
+    )
+    client.thread_safe = thread_safe
+
+    results = client.download_many(ids, tmp_path, max_workers=4)
+
+    assert all(result.success for result in results)
+    assert (http.max_active > 1) is parallel
+
+
+def test_download_file_names() -> None:
+    """Test names are made safe, get export extensions and stay unique."""
+    used: set = set()
+    doc = {
+        "id": "d1",
+        "name": "Q1/Q2: plan",
+        "mimeType": "application/vnd.google-apps.document",
+    }
+
+    assert download_file_name(doc, used) == "Q1_Q2_ plan.docx"
+    assert download_file_name({**doc, "id": "d2"}, used) == "Q1_Q2_ plan (d2).docx"
+    assert download_file_name({"id": "x", "name": ".."}, used) == "x"
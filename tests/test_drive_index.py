@@ -0,0 +1,259 @@
+"""Tests for the local Drive index and folder sync."""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from unittest.mock import Mock
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from solution_desk_engine.integrations.drive_index import FOLDER_MIME_TYPE, DriveIndex
+from solution_desk_engine.integrations.google_drive import GoogleDriveClient
+
+
+def drive_file(file_id: str, parent: str, **fields: Any) -> Dict[str, Any]:
+    """Build Drive file metadata."""
+    return {
+        "id": file_id,
+        "name": file_id,
+        "mimeType": "application/vnd.google-apps.document",
+        "parents": [parent],
+        **fields,
+    }
+
+
+def drive_folder(folder_id: str, parent: str) -> Dict[str, Any]:
+    """Build Drive folder metadata."""
+    return drive_file(folder_id, parent, mimeType=FOLDER_MIME_TYPE)
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> Iterator[DriveIndex]:
+    """Provide an empty Drive index."""
+    drive_index = DriveIndex(tmp_path / "drive_index.sqlite3")
+    yield drive_index
+    drive_index.close()
+
+
+class TestDriveIndex:
+    """Test cases for DriveIndex."""
+
+    def test_replace_root_and_lookups(self, index: DriveIndex) -> None:
+        """Test a listed tree can be looked up by file and by folder."""
+        files = [
+            drive_folder("sub", "root"),
+            drive_file("a", "root"),
+            drive_file("b", "sub"),
+        ]
+
+        assert index.replace_root("root", files, "token-1") == 3
+
+        assert index.get_page_token("root") == "token-1"
+        assert list(index.roots()) == ["root"]
+        assert index.get_file("b") == drive_file("b", "sub")
+        assert [file["id"] for file in index.list_children("root")] == ["sub", "a"]
+        assert index.root_of("b") == "root"
+        assert index.root_of("root") == "root"
+        assert index.root_of("elsewhere") is None
+        assert index.contains_folder("root", "sub")
+        assert not index.contains_folder("root", "a")
+
+    def test_remove_folder_removes_subtree(self, index: DriveIndex) -> None:
+        """Test removing a folder drops everything indexed inside it."""
+        index.replace_root(
+            "root",
+            [
+                drive_folder("sub", "root"),
+                drive_folder("deep", "sub"),
+                drive_file("a", "deep"),
+                drive_file("b", "root"),
+            ],
+            "token-1",
+        )
+
+        assert index.remove("sub") == 3
+        assert len(index) == 1
+
+    def test_forget_root(self, index: DriveIndex) -> None:
+        """Test forgetting a root drops its files and page token."""
+        index.replace_root("root", [drive_file("a", "root")], "token-1")
+
+        assert index.forget("root") == 1
+        assert index.get_page_token("root") is None
+        assert index.roots() == {}
+
+
+class TestFolderSync:
+    """Test cases for GoogleDriveClient.sync_folder."""
+
+    @pytest.fixture
+    def client(self, index: DriveIndex) -> GoogleDriveClient:
+        """Provide a client with a mocked Drive service."""
+        client = GoogleDriveClient(drive_index=index)
+        client._service = Mock()
+        client._service.changes().getStartPageToken().execute.return_value = {
+            "startPageToken": "token-1"
+        }
+        return client
+
+    def set_listing(
+        self, client: GoogleDriveClient, listing: Dict[str, List[Dict[str, Any]]]
+    ) -> None:
+        """Answer folder listings from a mapping of folder ID to files."""
+
+        def list_files(**kwargs: Any) -> Mock:
+            folder_id = kwargs["q"].split("'")[1]
+            request = Mock()
+            request.execute.return_value = {"files": listing.get(folder_id, [])}
+            return request
+
+        client._service.files().list.side_effect = list_files
+
+    def set_changes(
+        self, client: GoogleDriveClient, pages: List[Dict[str, Any]]
+    ) -> None:
+        """Answer changes.list with the given pages in order."""
+        client._service.changes().list.reset_mock()
+        client._service.changes().list().execute.side_effect = pages
+
+    def test_first_sync_lists_tree(
+        self, client: GoogleDriveClient, index: DriveIndex
+    ) -> None:
+        """Test the first sync stores the whole tree and a start token."""
+        self.set_listing(
+            client,
+            {
+                "root": [drive_folder("sub", "root"), drive_file("a", "root")],
+                "sub": [drive_file("b", "sub")],
+            },
+        )
+
+        result = client.sync_folder("root")
+
+        assert (result.full, result.added) == (True, 3)
+        assert index.get_page_token("root") == "token-1"
+        assert index.get_file("b") is not None
+
+    def test_later_sync_applies_changes(
+        self, client: GoogleDriveClient, index: DriveIndex
+    ) -> None:
+        """Test later syncs apply only the changes since the stored token."""
+        self.set_listing(
+            client,
+            {
+                "root": [drive_file("a", "root"), drive_file("gone", "root")],
+                "new-sub": [drive_file("c", "new-sub")],
+            },
+        )
+        client.sync_folder("root")
+        self.set_changes(
+            client,
+            [
+                {
+                    "nextPageToken": "token-2",
+                    "changes": [
+                        {"fileId": "a", "file": drive_file("a", "root", name="A2")},
+                        {"fileId": "gone", "removed": True},
+                    ],
+                },
+                {
+                    "newStartPageToken": "token-3",
+                    "changes": [
+                        {"fileId": "new-sub", "file": drive_folder("new-sub", "root")},
+                        {"fileId": "x", "file": drive_file("x", "elsewhere")},
+                        {
+                            "fileId": "c",
+                            "file": drive_file("c", "new-sub", trashed=True),
+                        },
+                    ],
+                },
+            ],
+        )
+
+        result = client.sync_folder("root")
+
+        assert (result.full, result.added, result.updated) == (False, 2, 1)
+        assert result.removed == 2
+        assert index.get_page_token("root") == "token-3"
+        assert index.get_file("a")["name"] == "A2"  # type: ignore[index]
+        assert index.get_file("x") is None
+        assert index.get_file("c") is None
+        # The first call is the one made by set_changes
+        calls = client._service.changes().list.call_args_list[1:]
+        assert [call.kwargs["pageToken"] for call in calls] == ["token-1", "token-2"]
+
+    def test_lookups_are_answered_from_index(self, client: GoogleDriveClient) -> None:
+        """Test indexed files and folders are read without Drive requests."""
+        self.set_listing(client, {"root": [drive_file("a", "root")]})
+        client.sync_folder("root")
+        client._service.files().reset_mock()
+
+        assert client.get_file_info("a")["id"] == "a"
+        assert client.get_files_info(["a"]) == {"a": client.get_file_info("a")}
+        assert [file["id"] for file in client.list_files_in_folder("root")] == ["a"]
+        client._service.files().get.assert_not_called()
+        client._service.files().list.assert_not_called()
+        client._service.new_batch_http_request.assert_not_called()
+
+    def test_upload_syncs_tree_before_next_read(
+        self, client: GoogleDriveClient
+    ) -> None:
+        """Test a tree this client changed is synced before it is read."""
+        self.set_listing(client, {"root": []})
+        client.sync_folder("root")
+        client._service.files().create().execute.return_value = {"id": "new"}
+        self.set_changes(
+            client,
+            [
+                {
+                    "newStartPageToken": "token-2",
+                    "changes": [{"fileId": "new", "file": drive_file("new", "root")}],
+                }
+            ],
+        )
+
+        client.upload_docx_bytes_as_google_doc(b"docx", "SOW", "root")
+
+        assert [file["id"] for file in client.list_files_in_folder("root")] == ["new"]
+        client.list_files_in_folder("root")
+        assert client._service.changes().list().execute.call_count == 1
+
+    def test_expired_token_falls_back_to_full_sync(
+        self, client: GoogleDriveClient, index: DriveIndex
+    ) -> None:
+        """Test a page token Drive no longer accepts triggers a full listing."""
+        self.set_listing(client, {"root": [drive_file("a", "root")]})
+        client.sync_folder("root")
+        self.set_listing(client, {"root": [drive_file("b", "root")]})
+        client._service.changes().getStartPageToken().execute.return_value = {
+            "startPageToken": "token-2"
+        }
+        self.set_changes(
+            client,
+            [HttpError(httplib2.Response({"status": "410"}), b"Token expired")],
+        )
+
+        result = client.sync_folder("root")
+
+        assert (result.full, result.added) == (True, 1)
+        assert index.get_page_token("root") == "token-2"
+        assert index.get_file("a") is None
+        assert index.get_file("b") is not None
+
+    def test_sync_errors_keep_their_status(self, client: GoogleDriveClient) -> None:
+        """Test other changes errors propagate as the Drive error itself."""
+        self.set_listing(client, {"root": []})
+        client.sync_folder("root")
+        forbidden = HttpError(httplib2.Response({"status": "403"}), b"Forbidden")
+        self.set_changes(client, [forbidden])
+
+        with pytest.raises(HttpError) as raised:
+            client.sync_folder("root")
+
+        assert raised.value is forbidden
+
+    def test_sync_requires_index(self) -> None:
+        """Test syncing without an index is rejected."""
+        with pytest.raises(ValueError, match="Drive index"):
+            GoogleDriveClient().sync_folder("root")
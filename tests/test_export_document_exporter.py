@@ -1,14 +1,33 @@
 """Tests for the document export functionality."""
 
+import json
+import os
 import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
 
+import markdown
+import pytest
+from docx import Document
+from docx.shared import Pt
+
 from solution_desk_engine.export.document_exporter import (
     DocumentExporter,
     ExportFormat,
     ExportResult,
 )
+from solution_desk_engine.export.manifest import ExportManifest
+from solution_desk_engine.export.pandoc import PandocInfo
+
+
+def fake_weasyprint_modules(weasyprint: MagicMock) -> dict:
+    """Map weasyprint and its fonts module to a mock, for sys.modules."""
+    return {
+        "weasyprint": weasyprint,
+        "weasyprint.text": weasyprint.text,
+        "weasyprint.text.fonts": weasyprint.text.fonts,
+    }
 
 
 class TestExportFormat:
@@ -47,6 +66,15 @@ class TestExportResult:
 class TestDocumentExporter:
     """Test cases for DocumentExporter class."""
 
+    @pytest.fixture(autouse=True)
+    def pandoc_installed(self):
+        """Report a pandoc without server mode, so tests drive its CLI."""
+        with patch(
+            "solution_desk_engine.export.document_exporter.probe_pandoc",
+            return_value=PandocInfo(path="pandoc", version=(2, 19)),
+        ):
+            yield
+
     def test_exporter_initialization_default(self):
         """Test DocumentExporter initialization with default output directory."""
         with patch("pathlib.Path.mkdir"):
@@ -269,7 +297,7 @@ class TestDocumentExporter:
                 def side_effect(name, *args, **kwargs):
                     if name == "markdown":
                         return mock_markdown
-                    elif name == "weasyprint":
+                    elif name.startswith("weasyprint"):
                         return mock_weasyprint
                     return __import__(name, *args, **kwargs)
 
@@ -365,3 +393,511 @@ class TestDocumentExporter:
 
             assert successes == 2
             assert failures == 1
+
+
+class TestParallelExport:
+    """Test cases for exporting documents on a process pool."""
+
+    def test_parallel_export_keeps_input_order(self, tmp_path: Path) -> None:
+        """Test parallel results follow the input order and isolate failures."""
+        sources = []
+        for number in range(5):
+            source = tmp_path / f"doc{number}.md"
+            source.write_text(
+                f"# Document {number}\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+            )
+            sources.append(source)
+        sources.insert(2, tmp_path / "missing.md")
+        exporter = DocumentExporter(tmp_path / "out")
+
+        results = exporter.export_multiple_documents(
+            sources, ExportFormat.HTML, max_workers=3
+        )
+
+        assert list(results) == sources
+        assert [result.success for result in results.values()] == [
+            True,
+            True,
+            False,
+            True,
+            True,
+            True,
+        ]
+        assert "Source file not found" in results[sources[2]].error
+        html = (tmp_path / "out" / "doc4.html").read_text(encoding="utf-8")
+        assert '<h1 id="document-4">Document 4</h1>' in html
+        assert "<table>" in html
+
+    def test_parallel_export_matches_sequential(self, tmp_path: Path) -> None:
+        """Test both modes write the same outputs."""
+        sources = []
+        for number in range(3):
+            source = tmp_path / f"doc{number}.md"
+            source.write_text(f"# Document {number}\n")
+            sources.append(source)
+
+        DocumentExporter(tmp_path / "seq").export_multiple_documents(
+            sources, ExportFormat.MARKDOWN
+        )
+        DocumentExporter(tmp_path / "par").export_multiple_documents(
+            sources, ExportFormat.MARKDOWN, max_workers=2
+        )
+
+        for source in sources:
+            assert (tmp_path / "par" / source.name).read_bytes() == (
+                tmp_path / "seq" / source.name
+            ).read_bytes()
+
+
+class TestMultiFormatExport:
+    """Test cases for exporting one parse of a document to several formats."""
+
+    SOURCE = (
+        "# Scope &amp; Terms\n\n"
+        "Work is **fixed fee** and *time boxed*.\n\n"
+        "- Discovery\n"
+        "    - Interviews\n\n"
+        "```python\nprint('hi')\n```\n\n"
+        "| Item | Cost |\n|------|------|\n| Build | $10 |\n"
+    )
+
+    def test_multi_format_export_parses_once(self, tmp_path: Path) -> None:
+        """Test every format is rendered from a single markdown parse."""
+        source = tmp_path / "sow.md"
+        source.write_text(self.SOURCE, encoding="utf-8")
+        exporter = DocumentExporter(tmp_path / "out")
+
+        with patch.object(
+            markdown.Markdown,
+            "convert",
+            autospec=True,
+            side_effect=markdown.Markdown.convert,
+        ) as mock_convert:
+            results = exporter.export_document_multi(
+                source,
+                [ExportFormat.MARKDOWN, ExportFormat.HTML, ExportFormat.DOCX],
+            )
+
+        mock_convert.assert_called_once()
+        assert all(result.success for result in results.values())
+        out = tmp_path / "out"
+        assert (out / "sow.md").read_bytes() == source.read_bytes()
+        assert '<h1 id="scope-terms">Scope &amp; Terms</h1>' in (
+            out / "sow.html"
+        ).read_text(encoding="utf-8")
+
+        doc = Document(str(out / "sow.docx"))
+        paragraphs = [(p.style.name, p.text) for p in doc.paragraphs]
+        assert paragraphs == [
+            ("Heading 1", "Scope & Terms"),
+            ("Normal", "Work is fixed fee and time boxed."),
+            ("List Bullet", "Discovery"),
+            ("List Bullet 2", "Interviews"),
+            ("Normal", "print('hi')"),
+        ]
+        assert [(run.text, run.bold, run.italic) for run in doc.paragraphs[1].runs] == [
+            ("Work is ", None, None),
+            ("fixed fee", True, None),
+            (" and ", None, None),
+            ("time boxed", None, True),
+            (".", None, None),
+        ]
+        assert doc.paragraphs[4].runs[0].font.name == "Courier New"
+        assert [[cell.text for cell in row.cells] for row in doc.tables[0].rows] == [
+            ["Item", "Cost"],
+            ["Build", "$10"],
+        ]
+
+    def test_multi_format_pdf_uses_shared_html(self, tmp_path: Path) -> None:
+        """Test PDF is printed from the shared HTML without calling pandoc."""
+        source = tmp_path / "sow.md"
+        source.write_text(self.SOURCE, encoding="utf-8")
+        exporter = DocumentExporter(tmp_path / "out")
+        weasyprint = MagicMock()
+
+        with (
+            patch.dict(sys.modules, fake_weasyprint_modules(weasyprint)),
+            patch("subprocess.run") as mock_subprocess,
+        ):
+            results = exporter.export_document_multi(
+                source, [ExportFormat.PDF, ExportFormat.HTML]
+            )
+
+        assert results[ExportFormat.PDF].success is True
+        mock_subprocess.assert_not_called()
+        page = weasyprint.HTML.call_args.kwargs["string"]
+        assert '<h1 id="scope-terms">Scope &amp; Terms</h1>' in page
+        weasyprint.HTML.return_value.write_pdf.assert_called_once_with(
+            tmp_path / "out" / "sow.pdf",
+            stylesheets=[weasyprint.CSS.return_value],
+            font_config=weasyprint.text.fonts.FontConfiguration.return_value,
+        )
+
+    def test_multi_format_docx_uses_reference_doc(self, tmp_path: Path) -> None:
+        """Test DOCX takes the reference document's styles but not its text."""
+        reference = Document()
+        reference.styles["Heading 1"].font.size = Pt(30)
+        reference.add_paragraph("Reference body text")
+        styles = reference.styles.element
+        for name in ("Table Grid", "List Bullet", "List Bullet 2"):
+            styles.remove(reference.styles[name].element)
+        reference_path = tmp_path / "reference.docx"
+        reference.save(str(reference_path))
+        source = tmp_path / "sow.md"
+        source.write_text(self.SOURCE, encoding="utf-8")
+
+        with patch(
+            "solution_desk_engine.export.document_exporter.REFERENCE_DOC",
+            reference_path,
+        ):
+            results = DocumentExporter(tmp_path / "out").export_document_multi(
+                source, [ExportFormat.DOCX]
+            )
+
+        assert results[ExportFormat.DOCX].success is True
+        doc = Document(str(tmp_path / "out" / "sow.docx"))
+        assert doc.styles["Heading 1"].font.size == Pt(30)
+        texts = [paragraph.text for paragraph in doc.paragraphs]
+        assert "Reference body text" not in texts
+        assert texts[0] == "Scope & Terms"
+        assert "Discovery" in texts
+        assert len(doc.tables) == 1
+
+    def test_multi_format_pdf_uses_pdf_css(self, tmp_path: Path) -> None:
+        """Test PDF_CSS is applied after the default PDF stylesheet."""
+        css = tmp_path / "professional.css"
+        css.write_text("body { color: navy; }", encoding="utf-8")
+        source = tmp_path / "sow.md"
+        source.write_text(self.SOURCE, encoding="utf-8")
+        weasyprint = MagicMock()
+        weasyprint.CSS.side_effect = lambda **kwargs: kwargs
+
+        with (
+            patch.dict(sys.modules, fake_weasyprint_modules(weasyprint)),
+            patch("solution_desk_engine.export.document_exporter.PDF_CSS", css),
+        ):
+            results = DocumentExporter(tmp_path / "out").export_document_multi(
+                source, [ExportFormat.PDF]
+            )
+
+        assert results[ExportFormat.PDF].success is True
+        stylesheets = weasyprint.HTML.return_value.write_pdf.call_args.kwargs[
+            "stylesheets"
+        ]
+        assert "string" in stylesheets[0]
+        assert stylesheets[1]["filename"] == str(css)
+
+    def test_multi_format_missing_source(self, tmp_path: Path) -> None:
+        """Test a missing source fails every requested format."""
+        exporter = DocumentExporter(tmp_path / "out")
+
+        results = exporter.export_document_multi(
+            tmp_path / "missing.md", [ExportFormat.HTML, ExportFormat.DOCX]
+        )
+
+        assert list(results) == [ExportFormat.HTML, ExportFormat.DOCX]
+        assert all(
+            "Source file not found" in result.error for result in results.values()
+        )
+
+    def test_parallel_multi_format_export(self, tmp_path: Path) -> None:
+        """Test several documents export to several formats on a pool."""
+        sources = []
+        for number in range(3):
+            source = tmp_path / f"doc{number}.md"
+            source.write_text(f"# Document {number}\n", encoding="utf-8")
+            sources.append(source)
+        exporter = DocumentExporter(tmp_path / "out")
+
+        results = exporter.export_multiple_documents_multi(
+            sources, [ExportFormat.HTML, ExportFormat.DOCX], max_workers=2
+        )
+
+        assert list(results) == sources
+        assert all(
+            result.success
+            for format_results in results.values()
+            for result in format_results.values()
+        )
+        assert len(list((tmp_path / "out").iterdir())) == 6
+
+
+class TestIncrementalExport:
+    """Test cases for skipping exports recorded as current in the manifest."""
+
+    @staticmethod
+    def write_sources(directory: Path, count: int) -> list:
+        """Write numbered markdown sources into a directory."""
+        sources = []
+        for number in range(count):
+            source = directory / f"doc{number}.md"
+            source.write_text(f"# Document {number}\n", encoding="utf-8")
+            sources.append(source)
+        return sources
+
+    def test_only_changed_documents_are_exported(self, tmp_path: Path) -> None:
+        """Test a rerun exports changed sources and skips the rest."""
+        sources = self.write_sources(tmp_path, 3)
+        out = tmp_path / "out"
+        first = DocumentExporter(out, incremental=True).export_multiple_documents(
+            sources, ExportFormat.HTML
+        )
+        assert not any(result.skipped for result in first.values())
+
+        sources[1].write_text("# Changed\n", encoding="utf-8")
+        (out / "doc2.html").unlink()
+        exporter = DocumentExporter(out, incremental=True)
+        with patch.object(
+            DocumentExporter, "_export_format", wraps=exporter._export_format
+        ) as mock_export:
+            second = exporter.export_multiple_documents(sources, ExportFormat.HTML)
+
+        assert [result.skipped for result in second.values()] == [True, False, False]
+        assert all(result.success for result in second.values())
+        assert [call.args[0] for call in mock_export.call_args_list] == sources[1:]
+        assert "Changed" in (out / "doc1.html").read_text(encoding="utf-8")
+        assert exporter.get_export_summary(second)["skipped"] == 1
+
+        forced = exporter.export_multiple_documents(
+            sources, ExportFormat.HTML, force=True
+        )
+        assert not any(result.skipped for result in forced.values())
+
+    def test_style_change_invalidates_outputs(self, tmp_path: Path) -> None:
+        """Test a new reference document re-exports DOCX but not HTML."""
+        reference = tmp_path / "reference.docx"
+        Document().save(str(reference))
+        (source,) = self.write_sources(tmp_path, 1)
+        formats = [ExportFormat.HTML, ExportFormat.DOCX]
+        exporter = DocumentExporter(tmp_path / "out", incremental=True)
+
+        with patch(
+            "solution_desk_engine.export.document_exporter.REFERENCE_DOC", reference
+        ):
+            exporter.export_document_multi(source, formats)
+            restyled = Document()
+            restyled.styles["Normal"].font.size = Pt(13)
+            restyled.save(str(reference))
+            results = exporter.export_document_multi(source, formats)
+
+        assert results[ExportFormat.HTML].skipped
+        assert not results[ExportFormat.DOCX].skipped
+        assert results[ExportFormat.DOCX].success
+
+    def test_current_document_is_not_parsed(self, tmp_path: Path) -> None:
+        """Test a document with every output current is not parsed again."""
+        (source,) = self.write_sources(tmp_path, 1)
+        formats = [ExportFormat.MARKDOWN, ExportFormat.HTML]
+        exporter = DocumentExporter(tmp_path / "out", incremental=True)
+        exporter.export_document_multi(source, formats)
+
+        with patch.object(markdown.Markdown, "convert") as mock_convert:
+            results = exporter.export_document_multi(source, formats)
+
+        mock_convert.assert_not_called()
+        assert all(result.skipped for result in results.values())
+
+    def test_parallel_rerun_starts_no_workers(self, tmp_path: Path) -> None:
+        """Test a parallel rerun with nothing to do skips the process pool."""
+        sources = self.write_sources(tmp_path, 3)
+        exporter = DocumentExporter(tmp_path / "out", incremental=True)
+        exporter.export_multiple_documents(sources, ExportFormat.HTML, max_workers=2)
+        assert len(exporter.manifest) == 3
+
+        with patch(
+            "solution_desk_engine.export.document_exporter.ProcessPoolExecutor"
+        ) as mock_pool:
+            results = exporter.export_multiple_documents(
+                sources, ExportFormat.HTML, max_workers=2
+            )
+
+        mock_pool.assert_not_called()
+        assert list(results) == sources
+        assert all(result.skipped for result in results.values())
+
+    def test_same_named_outputs_are_recorded_apart(self, tmp_path: Path) -> None:
+        """Test outputs in different subdirectories keep their own entries."""
+        sources = []
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            sources.append(tmp_path / name / "README.md")
+            sources[-1].write_text(f"# {name}\n", encoding="utf-8")
+        output_names = {sources[0]: "a/README", sources[1]: "b/README"}
+        out = tmp_path / "out"
+        DocumentExporter(out, incremental=True).export_multiple_documents(
+            sources, ExportFormat.HTML, output_names=output_names
+        )
+
+        sources[0].write_text("# a v2\n", encoding="utf-8")
+        results = DocumentExporter(out, incremental=True).export_multiple_documents(
+            sources, ExportFormat.HTML, output_names=output_names
+        )
+
+        assert [result.skipped for result in results.values()] == [False, True]
+        assert "a v2" in (out / "a" / "README.html").read_text(encoding="utf-8")
+
+    def test_output_of_another_source_is_not_current(self, tmp_path: Path) -> None:
+        """Test an output written from one source is stale for another."""
+        sources = []
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            sources.append(tmp_path / name / "README.md")
+            sources[-1].write_text("# Same content\n", encoding="utf-8")
+        out = tmp_path / "out"
+        DocumentExporter(out, incremental=True).export_document(
+            sources[0], ExportFormat.HTML
+        )
+
+        result = DocumentExporter(out, incremental=True).export_document(
+            sources[1], ExportFormat.HTML
+        )
+
+        assert result.success is True and result.skipped is False
+        manifest = ExportManifest(out)
+        assert len(manifest) == 1
+        entry = json.loads(manifest.manifest_path.read_text())["outputs"]
+        assert entry["README.html"]["source"] == str(sources[1].resolve())
+
+
+class TestSharedStyles:
+    """Test cases for stylesheets shared by the documents of a batch."""
+
+    @staticmethod
+    def write_sources(directory: Path, count: int) -> list:
+        """Write numbered markdown sources into a directory."""
+        sources = []
+        for number in range(count):
+            source = directory / f"doc{number}.md"
+            source.write_text(f"# Document {number}\n", encoding="utf-8")
+            sources.append(source)
+        return sources
+
+    def test_pdf_stylesheets_are_parsed_once(self, tmp_path: Path) -> None:
+        """Test a batch of PDFs shares parsed stylesheets and fonts."""
+        sources = self.write_sources(tmp_path, 3)
+        exporter = DocumentExporter(tmp_path / "out")
+        weasyprint = MagicMock()
+        fonts = weasyprint.text.fonts
+
+        with patch.dict(sys.modules, fake_weasyprint_modules(weasyprint)):
+            results = exporter.export_multiple_documents_multi(
+                sources, [ExportFormat.PDF, ExportFormat.HTML]
+            )
+
+        assert all(
+            result.success
+            for format_results in results.values()
+            for result in format_results.values()
+        )
+        fonts.FontConfiguration.assert_called_once_with()
+        weasyprint.CSS.assert_called_once()
+        assert weasyprint.CSS.call_args.kwargs["font_config"] is (
+            fonts.FontConfiguration.return_value
+        )
+        write_pdf = weasyprint.HTML.return_value.write_pdf
+        assert write_pdf.call_count == 3
+        for call in write_pdf.call_args_list:
+            assert call.kwargs["stylesheets"] == [weasyprint.CSS.return_value]
+            assert call.kwargs["font_config"] is fonts.FontConfiguration.return_value
+        page = weasyprint.HTML.call_args.kwargs["string"]
+        assert "<style>" not in page
+
+    def test_render_context_is_not_pickled(self, tmp_path: Path) -> None:
+        """Test workers build their own render context."""
+        exporter = DocumentExporter(tmp_path / "out")
+        exporter._pdf_context = MagicMock()
+
+        assert exporter.__getstate__()["_pdf_context"] is None
+
+    def test_html_pages_inline_stylesheet_by_default(self, tmp_path: Path) -> None:
+        """Test HTML pages are self-contained unless the CSS is shared."""
+        (source,) = self.write_sources(tmp_path, 1)
+        exporter = DocumentExporter(tmp_path / "out")
+
+        result = exporter.export_document(source, ExportFormat.HTML)
+
+        assert result.success is True
+        page = (tmp_path / "out" / "doc0.html").read_text(encoding="utf-8")
+        assert "<style>" in page and "border-collapse: collapse" in page
+        assert not (tmp_path / "out" / "document-export.css").exists()
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_html_pages_link_shared_stylesheet(
+        self, tmp_path: Path, max_workers: int
+    ) -> None:
+        """Test HTML pages link one stylesheet written once."""
+        sources = self.write_sources(tmp_path, 3)
+        output_dir = tmp_path / "out"
+        exporter = DocumentExporter(output_dir, shared_css=True)
+
+        with patch("os.replace", wraps=os.replace) as mock_replace:
+            results = exporter.export_multiple_documents(
+                sources, ExportFormat.HTML, max_workers=max_workers
+            )
+
+        assert all(result.success for result in results.values())
+        css_path = output_dir / "document-export.css"
+        assert "border-collapse: collapse" in css_path.read_text(encoding="utf-8")
+        mock_replace.assert_called_once()
+        for number in range(3):
+            page = (output_dir / f"doc{number}.html").read_text(encoding="utf-8")
+            assert '<link rel="stylesheet" href="document-export.css">' in page
+            assert "<style>" not in page
+
+        DocumentExporter(output_dir, shared_css=True).export_document(
+            sources[0], ExportFormat.HTML
+        )
+        assert len(list(output_dir.glob("*.css"))) == 1
+
+    def test_shared_stylesheet_invalidates_html(self, tmp_path: Path) -> None:
+        """Test switching to a shared stylesheet re-exports current pages."""
+        (source,) = self.write_sources(tmp_path, 1)
+        output_dir = tmp_path / "out"
+        DocumentExporter(output_dir, incremental=True).export_document(
+            source, ExportFormat.HTML
+        )
+
+        result = DocumentExporter(
+            output_dir, incremental=True, shared_css=True
+        ).export_document(source, ExportFormat.HTML)
+
+        assert result.success is True and result.skipped is False
+        page = (output_dir / "doc0.html").read_text(encoding="utf-8")
+        assert "document-export.css" in page
+
+    def test_nested_pages_link_shared_stylesheet(self, tmp_path: Path) -> None:
+        """Test pages in subdirectories link the stylesheet relatively."""
+        (source,) = self.write_sources(tmp_path, 1)
+        output_dir = tmp_path / "out"
+        exporter = DocumentExporter(output_dir, shared_css=True)
+
+        results = exporter.export_multiple_documents(
+            [source], ExportFormat.HTML, output_names={source: "phase/doc0"}
+        )
+
+        assert results[source].output_path == output_dir / "phase" / "doc0.html"
+        page = results[source].output_path.read_text(encoding="utf-8")
+        assert 'href="../document-export.css"' in page
+
+
+def test_batch_rejects_sources_with_one_output(tmp_path: Path) -> None:
+    """Test a batch fails up front when two sources share an output file."""
+    sources = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        sources.append(tmp_path / name / "README.md")
+        sources[-1].write_text("# Readme\n", encoding="utf-8")
+    exporter = DocumentExporter(tmp_path / "out")
+
+    with pytest.raises(ValueError, match="would both be exported"):
+        exporter.export_multiple_documents_multi(
+            sources, [ExportFormat.HTML, ExportFormat.MARKDOWN]
+        )
+    assert not list((tmp_path / "out").iterdir())
+
+    results = exporter.export_multiple_documents(
+        sources,
+        ExportFormat.HTML,
+        output_names={sources[0]: "a/README", sources[1]: "b/README"},
+    )
+    assert all(result.success for result in results.values())
@@ -0,0 +1,278 @@
+"""Tests for the persistent Drive folder resolver."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+from unittest.mock import Mock
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from solution_desk_engine.integrations.folder_resolver import FolderResolver
+from solution_desk_engine.integrations.google_drive import GoogleDriveClient
+
+
+class FakeDrive:
+    """Folder lookups and creations that count their calls."""
+
+    def __init__(self, existing: Optional[dict] = None, delay: float = 0.0) -> None:
+        self.existing = existing or {}
+        self.delay = delay
+        self.finds: List[Tuple[str, Optional[str]]] = []
+        self.creates: List[Tuple[str, Optional[str]]] = []
+        self.lock = threading.Lock()
+
+    def find(self, name: str, parent_id: Optional[str]) -> Optional[str]:
+        with self.lock:
+            self.finds.append((name, parent_id))
+        time.sleep(self.delay)
+        return self.existing.get((name, parent_id))
+
+    def create(self, name: str, parent_id: Optional[str]) -> str:
+        with self.lock:
+            self.creates.append((name, parent_id))
+        time.sleep(self.delay)
+        return f"{parent_id or 'root'}>{name}"
+
+
+def test_resolve_persists_across_runs(tmp_path: Path) -> None:
+    """Test resolved folders are reused by a later resolver without Drive."""
+    drive = FakeDrive(existing={("Customers", None): "customers"})
+    cache_path = tmp_path / "drive_folders.json"
+
+    folder_id = FolderResolver(cache_path).resolve(
+        "Customers/Penske", drive.find, drive.create
+    )
+
+    assert folder_id == "customers>Penske"
+    assert drive.creates == [("Penske", "customers")]
+
+    later = FakeDrive()
+    resolver = FolderResolver(cache_path)
+    assert resolver.resolve(["Customers", "Penske"], later.find, later.create) == (
+        folder_id
+    )
+    assert later.finds == [] and later.creates == []
+    assert resolver.get("Customers/Penske") == folder_id
+    assert resolver.get("Customers/Acme") is None
+
+
+def test_concurrent_resolution_creates_each_folder_once(tmp_path: Path) -> None:
+    """Test parallel workers share one creation per missing folder."""
+    drive = FakeDrive(delay=0.02)
+    resolver = FolderResolver(tmp_path / "drive_folders.json")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        ids = list(
+            executor.map(
+                lambda _: resolver.resolve("Docs/Phase 1", drive.find, drive.create),
+                range(16),
+            )
+        )
+
+    assert set(ids) == {"root>Docs>Phase 1"}
+    assert drive.creates == [("Docs", None), ("Phase 1", "root>Docs")]
+
+
+def test_failed_resolution_is_not_stored(tmp_path: Path) -> None:
+    """Test a failed creation is raised and retried by the next call."""
+    drive = FakeDrive()
+    failing = Mock(side_effect=RuntimeError("quota"))
+    resolver = FolderResolver(tmp_path / "drive_folders.json")
+
+    with pytest.raises(RuntimeError, match="quota"):
+        resolver.resolve("Docs", drive.find, failing)
+
+    assert resolver.resolve("Docs", drive.find, drive.create) == "root>Docs"
+
+
+def test_forget_drops_folder_and_subtree(tmp_path: Path) -> None:
+    """Test forgetting a folder drops everything resolved inside it."""
+    drive = FakeDrive()
+    resolver = FolderResolver(tmp_path / "drive_folders.json")
+    resolver.resolve("A/B/C", drive.find, drive.create)
+    resolver.resolve("D", drive.find, drive.create)
+
+    assert resolver.forget("root>A>B") == 2
+    assert resolver.get("A") == "root>A"
+    assert resolver.get("A/B") is None
+    assert len(FolderResolver(resolver.cache_path)) == 2
+
+
+def test_memory_only_resolver_writes_nothing(tmp_path: Path) -> None:
+    """Test a non-persistent resolver leaves no file behind."""
+    drive = FakeDrive()
+    resolver = FolderResolver(tmp_path / "drive_folders.json", persist=False)
+
+    resolver.resolve("Docs", drive.find, drive.create)
+
+    assert len(resolver) == 1
+    assert not resolver.cache_path.exists()
+
+
+def test_client_resolves_folder_paths(tmp_path: Path) -> None:
+    """Test GoogleDriveClient finds or creates each folder of a path."""
+    client = GoogleDriveClient(
+        folder_resolver=FolderResolver(tmp_path / "drive_folders.json")
+    )
+    client._service = Mock()
+    client._service.files().list().execute.side_effect = [
+        {"files": [{"id": "customers"}]},
+        {"files": []},
+    ]
+    client._service.files().create().execute.return_value = {"id": "penske"}
+    client._service.files().list.reset_mock()
+    client._service.files().create.reset_mock()
+
+    assert client.resolve_folder_path("Customers/Penske's SOWs") == "penske"
+    assert client.resolve_folder_path("Customers/Penske's SOWs") == "penske"
+
+    queries = [call.kwargs["q"] for call in client._service.files().list.call_args_list]
+    assert queries[0].startswith("name='Customers'")
+    assert "'root' in parents" not in queries[0]
+    assert queries[1].startswith("name='Penske\\'s SOWs'")
+    assert queries[1].endswith("'customers' in parents")
+    client._service.files().create.assert_called_once()
+    body = client._service.files().create.call_args.kwargs["body"]
+    assert body["parents"] == ["customers"]
+
+
+def test_gone_stored_folder_is_resolved_again(tmp_path: Path) -> None:
+    """Test a stored folder deleted on Drive is forgotten and recreated."""
+    cache_path = tmp_path / "drive_folders.json"
+    FolderResolver(cache_path).resolve("A/B", FakeDrive().find, FakeDrive().create)
+    drive = FakeDrive()
+    checked: List[str] = []
+
+    def exists(folder_id: str) -> bool:
+        checked.append(folder_id)
+        return folder_id != "root>A>B"
+
+    resolver = FolderResolver(cache_path)
+    assert resolver.resolve("A/B", drive.find, drive.create, exists=exists) == (
+        "root>A>B"
+    )
+    assert resolver.resolve("A/B", drive.find, drive.create, exists=exists) == (
+        "root>A>B"
+    )
+
+    assert checked == ["root>A>B", "root>A"]
+    assert drive.creates == [("B", "root>A")]
+
+
+def test_lookup_in_gone_parent_resolves_again(tmp_path: Path) -> None:
+    """Test a lookup failing in a deleted stored parent recreates the path."""
+    cache_path = tmp_path / "drive_folders.json"
+    stale = FakeDrive(existing={("A", None): "old-a"})
+    FolderResolver(cache_path).resolve("A", stale.find, stale.create)
+    drive = FakeDrive()
+    gone = {"old-a"}
+
+    def find(name: str, parent_id: Optional[str]) -> Optional[str]:
+        if parent_id in gone:
+            raise LookupError(f"File not found: {parent_id}")
+        return drive.find(name, parent_id)
+
+    resolver = FolderResolver(cache_path)
+    folder_id = resolver.resolve(
+        "A/B", find, drive.create, exists=lambda folder_id: folder_id not in gone
+    )
+
+    assert folder_id == "root>A>B"
+    assert drive.creates == [("A", None), ("B", "root>A")]
+    assert resolver.get("A") == "root>A"
+    with pytest.raises(LookupError):
+        FolderResolver(persist=False).resolve(
+            "C", find, drive.create, "old-a", exists=lambda folder_id: False
+        )
+
+
+def test_concurrent_runs_keep_each_others_folders(tmp_path: Path) -> None:
+    """Test resolvers sharing a file merge their changes on every write."""
+    cache_path = tmp_path / "drive_folders.json"
+    drive = FakeDrive()
+    first = FolderResolver(cache_path)
+    second = FolderResolver(cache_path)
+    first.resolve("A", drive.find, drive.create)
+    first.resolve("Old", drive.find, drive.create)
+
+    second.resolve("B", drive.find, drive.create)
+    first.forget("root>Old")
+    first.resolve("C", drive.find, drive.create)
+
+    stored = FolderResolver(cache_path)
+    assert [stored.get(name) for name in ("A", "B", "C", "Old")] == [
+        "root>A",
+        "root>B",
+        "root>C",
+        None,
+    ]
+
+
+@pytest.mark.parametrize(
+    ("response", "exists"),
+    [({"id": "f", "trashed": False}, True), ({"id": "f", "trashed": True}, False)],
+)
+def test_client_checks_folder_exists(response: dict, exists: bool) -> None:
+    """Test trashed folders count as gone."""
+    client = GoogleDriveClient()
+    client._service = Mock()
+    client._service.files().get().execute.return_value = response
+
+    assert client.folder_exists("f") is exists
+
+
+def test_client_treats_deleted_folder_as_gone() -> None:
+    """Test a 404 for a folder means it is gone, other errors are raised."""
+    client = GoogleDriveClient()
+    client._service = Mock()
+    client._service.files().get().execute.side_effect = [
+        HttpError(httplib2.Response({"status": "404"}), b"File not found"),
+        HttpError(httplib2.Response({"status": "403"}), b"Forbidden"),
+    ]
+
+    assert client.folder_exists("deleted") is False
+    with pytest.raises(HttpError):
+        client.folder_exists("forbidden")
+
+
+def test_client_resolves_again_in_deleted_parent(tmp_path: Path) -> None:
+    """Test a 404 listing a stored parent reaches the resolver's recheck."""
+    cache_path = tmp_path / "drive_folders.json"
+    FolderResolver(cache_path).resolve(
+        "Customers", lambda name, parent_id: "old", FakeDrive().create
+    )
+    client = GoogleDriveClient(folder_resolver=FolderResolver(cache_path))
+    client._service = Mock()
+    not_found = HttpError(httplib2.Response({"status": "404"}), b"File not found")
+
+    def list_files(**kwargs):
+        if "'old' in parents" in kwargs["q"]:
+            return Mock(execute=Mock(side_effect=not_found))
+        return Mock(execute=Mock(return_value={"files": []}))
+
+    client._service.files().list.side_effect = list_files
+    client._service.files().get().execute.side_effect = not_found
+    client._service.files().create().execute.side_effect = [
+        {"id": "customers"},
+        {"id": "penske"},
+    ]
+
+    assert client.resolve_folder_path("Customers/Penske") == "penske"
+    assert client.folder_resolver.get("Customers") == "customers"
+
+
+def test_client_folder_errors_keep_their_status() -> None:
+    """Test a failed folder lookup raises the Drive error itself."""
+    client = GoogleDriveClient()
+    client._service = Mock()
+    forbidden = HttpError(httplib2.Response({"status": "403"}), b"Forbidden")
+    client._service.files().list().execute.side_effect = forbidden
+
+    with pytest.raises(HttpError) as raised:
+        client.find_folder("Customers")
+
+    assert raised.value is forbidden
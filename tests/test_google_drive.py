@@ -1,11 +1,21 @@
 """Tests for Google Drive integration."""
 
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, mock_open, patch
 
+import httplib2  # type: ignore
 import pytest
+from googleapiclient.errors import HttpError  # type: ignore
 
-from solution_desk_engine.integrations.google_drive import GoogleDriveClient
+from solution_desk_engine.integrations.google_drive import (
+    GoogleDriveClient,
+    PooledGoogleDriveClient,
+)
+from solution_desk_engine.integrations.metadata_cache import MetadataCache
+from solution_desk_engine.integrations.request_executor import RequestExecutor
+from solution_desk_engine.integrations.template_cache import TemplateCache
 
 
 class TestGoogleDriveClient:
@@ -37,7 +47,7 @@ class TestGoogleDriveClient:
         assert client.credentials_path == custom_creds
         assert client.token_path == custom_token
 
-    @patch("solution_desk_engine.integrations.google_drive.build")
+    @patch("solution_desk_engine.integrations.google_drive.build_service")
     @patch(
         "solution_desk_engine.integrations.google_drive.Credentials.from_authorized_user_file"
     )
@@ -88,11 +98,102 @@ class TestGoogleDriveClient:
         mock_download.assert_called_once()
         assert mock_downloader.next_chunk.call_count == 2
 
+    def test_download_doc_served_from_cache(self, tmp_path) -> None:
+        """Test unchanged templates are served from the cache without export."""
+        cache = TemplateCache(tmp_path / "cache")
+        source = tmp_path / "cached.docx"
+        source.write_bytes(b"cached template")
+        cache.put("test_file_id", "2025-01-01T00:00:00Z", str(source))
+
+        client = GoogleDriveClient(template_cache=cache)
+        mock_service = Mock()
+        mock_service.files().get().execute.return_value = {
+            "modifiedTime": "2025-01-01T00:00:00Z"
+        }
+        client._service = mock_service
+
+        output_path = tmp_path / "template.docx"
+        client.download_doc_as_docx("test_file_id", str(output_path))
+
+        assert output_path.read_bytes() == b"cached template"
+        mock_service.files().export_media.assert_not_called()
+
+    @patch("solution_desk_engine.integrations.google_drive.MediaIoBaseDownload")
+    def test_download_doc_populates_cache(self, mock_download, tmp_path) -> None:
+        """Test a cache miss exports the template and stores it."""
+        cache = TemplateCache(tmp_path / "cache")
+        client = GoogleDriveClient(template_cache=cache)
+        mock_service = Mock()
+        mock_service.files().get().execute.return_value = {
+            "modifiedTime": "2025-01-01T00:00:00Z"
+        }
+        client._service = mock_service
+        mock_download.return_value.next_chunk.return_value = (None, True)
+
+        output_path = tmp_path / "template.docx"
+        client.download_doc_as_docx("test_file_id", str(output_path))
+
+        mock_service.files().export_media.assert_called_once()
+        assert cache.get("test_file_id", "2025-01-01T00:00:00Z") is not None
+
+    @patch("solution_desk_engine.integrations.google_drive.MediaIoBaseDownload")
+    def test_download_doc_as_bytes(self, mock_download, tmp_path) -> None:
+        """Test exporting a Google Doc into memory and caching the bytes."""
+        cache = TemplateCache(tmp_path / "cache")
+        client = GoogleDriveClient(template_cache=cache)
+        mock_service = Mock()
+        mock_service.files().get().execute.return_value = {"modifiedTime": "v1"}
+        client._service = mock_service
+
+        def fake_download(fh, request):
+            fh.write(b"docx bytes")
+            downloader = Mock()
+            downloader.next_chunk.return_value = (None, True)
+            return downloader
+
+        mock_download.side_effect = fake_download
+
+        assert client.download_doc_as_bytes("test_file_id") == b"docx bytes"
+        assert client.download_doc_as_bytes("test_file_id") == b"docx bytes"
+
+        # Second call is served from the cache
+        mock_download.assert_called_once()
+        assert not list(tmp_path.glob("*.docx"))
+
+    @patch("solution_desk_engine.integrations.google_drive.MediaIoBaseUpload")
+    def test_upload_docx_bytes_as_google_doc(self, mock_media_upload) -> None:
+        """Test uploading in-memory DOCX content as Google Doc."""
+        mock_service = Mock()
+        mock_service.files().create().execute.return_value = {
+            "id": "new_doc_id",
+            "webViewLink": "link",
+            "name": "Test SOW",
+        }
+        self.client._service = mock_service
+
+        result = self.client.upload_docx_bytes_as_google_doc(
+            b"docx bytes", "Test SOW", "folder_id"
+        )
+
+        assert result == {
+            "id": "new_doc_id",
+            "web_view_link": "link",
+            "name": "Test SOW",
+        }
+        stream = mock_media_upload.call_args.args[0]
+        assert stream.read() == b"docx bytes"
+        body = mock_service.files().create.call_args.kwargs["body"]
+        assert body["parents"] == ["folder_id"]
+
     @patch("solution_desk_engine.integrations.google_drive.MediaFileUpload")
     @patch("os.path.exists")
-    def test_upload_docx_as_google_doc(self, mock_exists, mock_media_upload) -> None:
+    def test_upload_docx_as_google_doc(
+        self, mock_exists, mock_media_upload, tmp_path
+    ) -> None:
         """Test uploading DOCX as Google Doc."""
         mock_exists.return_value = True
+        docx_path = tmp_path / "test.docx"
+        docx_path.write_bytes(b"docx bytes")
 
         # Mock the service
         mock_service = Mock()
@@ -109,7 +210,7 @@ class TestGoogleDriveClient:
         mock_media_upload.return_value = mock_media
 
         # Test upload
-        result = self.client.upload_docx_as_google_doc("/tmp/test.docx", "Test SOW")
+        result = self.client.upload_docx_as_google_doc(str(docx_path), "Test SOW")
 
         # Verify result
         assert result["id"] == "new_doc_id"
@@ -131,6 +232,109 @@ class TestGoogleDriveClient:
             call_args[1]["body"]["mimeType"] == "application/vnd.google-apps.document"
         )
         assert call_args[1]["body"]["name"] == "Test SOW"
+        assert call_args[1]["body"]["appProperties"] == {
+            "sdeContentSha256": hashlib.sha256(b"docx bytes").hexdigest(),
+            "sdeSourcePath": str(docx_path),
+        }
+
+    def test_upload_reuses_document_with_same_content(self) -> None:
+        """Test a deduplicated upload reuses a document with the same hash."""
+        mock_service = Mock()
+        mock_service.files().list().execute.return_value = {
+            "files": [{"id": "old_id", "name": "Old name", "webViewLink": "link"}]
+        }
+        mock_service.files().update().execute.return_value = {
+            "id": "old_id",
+            "name": "Test SOW",
+            "webViewLink": "link",
+        }
+        mock_service.files().list.reset_mock()
+        mock_service.files().update.reset_mock()
+        self.client._service = mock_service
+
+        result = self.client.upload_docx_bytes_as_google_doc(
+            b"docx bytes", "Test SOW", "folder_id", deduplicate=True
+        )
+
+        assert result == {"id": "old_id", "web_view_link": "link", "name": "Test SOW"}
+        query = mock_service.files().list.call_args.kwargs["q"]
+        assert hashlib.sha256(b"docx bytes").hexdigest() in query
+        assert "'folder_id' in parents" in query
+        mock_service.files().create.assert_not_called()
+        assert mock_service.files().update.call_args.kwargs["body"] == {
+            "name": "Test SOW"
+        }
+
+    def test_upload_without_duplicate_creates_document(self) -> None:
+        """Test a deduplicated upload creates a document when none matches."""
+        mock_service = Mock()
+        mock_service.files().list().execute.return_value = {"files": []}
+        mock_service.files().create().execute.return_value = {"id": "new_id"}
+        self.client._service = mock_service
+
+        result = self.client.upload_docx_bytes_as_google_doc(
+            b"docx bytes", "Test SOW", deduplicate=True
+        )
+
+        assert result["id"] == "new_id"
+        body = mock_service.files().create.call_args.kwargs["body"]
+        assert body["appProperties"] == {
+            "sdeContentSha256": hashlib.sha256(b"docx bytes").hexdigest()
+        }
+
+    def test_upload_deduplicates_on_given_content_hash(self) -> None:
+        """Test a caller's content hash is searched for and stamped."""
+        mock_service = Mock()
+        mock_service.files().list().execute.return_value = {"files": []}
+        mock_service.files().create().execute.return_value = {"id": "new_id"}
+        self.client._service = mock_service
+
+        self.client.upload_docx_bytes_as_google_doc(
+            b"docx bytes", "Test SOW", deduplicate=True, content_hash="inputs"
+        )
+
+        assert "value='inputs'" in mock_service.files().list.call_args.kwargs["q"]
+        body = mock_service.files().create.call_args.kwargs["body"]
+        assert body["appProperties"] == {"sdeContentSha256": "inputs"}
+
+    def test_duplicate_lookup_errors_keep_their_status(self) -> None:
+        """Test a failed duplicate search raises Drive's own error."""
+        forbidden = HttpError(
+            httplib2.Response({"status": "403"}), b'{"error": {"code": 403}}'
+        )
+        mock_service = Mock()
+        mock_service.files().list().execute.side_effect = forbidden
+        self.client._service = mock_service
+
+        with pytest.raises(HttpError) as raised:
+            self.client.upload_docx_bytes_as_google_doc(
+                b"docx bytes", "Test SOW", deduplicate=True
+            )
+
+        assert raised.value is forbidden
+
+    @patch("solution_desk_engine.integrations.google_drive.MediaIoBaseUpload")
+    def test_update_google_doc_from_docx_bytes(self, mock_media_upload) -> None:
+        """Test replacing an existing Google Doc's content in place."""
+        mock_service = Mock()
+        mock_service.files().update().execute.return_value = {
+            "id": "doc_id",
+            "webViewLink": "link",
+            "name": "Test SOW",
+        }
+        self.client._service = mock_service
+
+        result = self.client.update_google_doc_from_docx_bytes("doc_id", b"docx")
+
+        assert result == {"id": "doc_id", "web_view_link": "link", "name": "Test SOW"}
+        call_args = mock_service.files().update.call_args
+        assert call_args.kwargs["fileId"] == "doc_id"
+        assert call_args.kwargs["media_body"] == mock_media_upload.return_value
+
+    def test_update_nonexistent_file_raises_error(self) -> None:
+        """Test that updating from a non-existent DOCX raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            self.client.update_google_doc_from_docx("doc_id", "/nonexistent.docx")
 
     def test_upload_nonexistent_file_raises_error(self) -> None:
         """Test that uploading non-existent file raises FileNotFoundError."""
@@ -196,7 +400,281 @@ class TestGoogleDriveClient:
         assert len(list_calls) == 1
         call_args = list_calls[0]
         assert call_args.kwargs["q"] == "'folder_id' in parents and trashed=false"
-        assert (
-            call_args.kwargs["fields"]
-            == "files(id,name,mimeType,createdTime,modifiedTime,webViewLink)"
+        assert call_args.kwargs["fields"] == (
+            "nextPageToken,"
+            "files(id,name,mimeType,createdTime,modifiedTime,webViewLink)"
+        )
+
+    def test_iter_files_in_folder_follows_page_tokens_lazily(self) -> None:
+        """Test pages are fetched one at a time as the caller consumes them."""
+        mock_service = Mock()
+        mock_service.files().list().execute.side_effect = [
+            {"files": [{"id": "file1"}], "nextPageToken": "page2"},
+            {"files": [{"id": "file2"}]},
+        ]
+        mock_service.files().list.reset_mock()
+        self.client._service = mock_service
+
+        files = self.client.iter_files_in_folder(
+            "folder_id", page_size=1, fields=["id", "name"]
+        )
+
+        assert next(files) == {"id": "file1"}
+        assert mock_service.files().list.call_count == 1
+        assert [file["id"] for file in files] == ["file2"]
+        first, second = mock_service.files().list.call_args_list
+        assert first.kwargs["fields"] == "nextPageToken,files(id,name)"
+        assert first.kwargs["pageSize"] == 1
+        assert first.kwargs["pageToken"] is None
+        assert second.kwargs["pageToken"] == "page2"
+
+    def test_iter_files_in_folder_recursive(self) -> None:
+        """Test recursive listing walks subfolders once each."""
+        folder_mime_type = "application/vnd.google-apps.folder"
+        children = {
+            "root": [
+                {"id": "sub", "mimeType": folder_mime_type},
+                {"id": "doc1", "mimeType": "doc"},
+            ],
+            "sub": [
+                {"id": "doc2", "mimeType": "doc"},
+                {"id": "root", "mimeType": folder_mime_type},
+            ],
+        }
+
+        def list_files(**kwargs):
+            folder_id = kwargs["q"].split("'")[1]
+            return Mock(execute=Mock(return_value={"files": children[folder_id]}))
+
+        mock_service = Mock()
+        mock_service.files().list.side_effect = list_files
+        self.client._service = mock_service
+
+        files = self.client.iter_files_in_folder(
+            "root", fields=["name"], recursive=True
+        )
+
+        assert [file["id"] for file in files] == ["sub", "doc1", "doc2", "root"]
+        fields = mock_service.files().list.call_args.kwargs["fields"]
+        assert fields == "nextPageToken,files(name,id,mimeType)"
+
+    def test_get_files_info_batches_lookups(self) -> None:
+        """Test lookups are grouped into batches of at most 100 calls."""
+        batches = []
+
+        class FakeBatch:
+            def __init__(self, callback) -> None:
+                self.callback = callback
+                self.requests = []
+                batches.append(self)
+
+            def add(self, request, request_id) -> None:
+                self.requests.append((request_id, request))
+
+            def execute(self) -> None:
+                for request_id, request in self.requests:
+                    file_id = request.kwargs["fileId"]
+                    if file_id == "missing":
+                        self.callback(request_id, None, Exception("404"))
+                    else:
+                        self.callback(request_id, {"id": file_id}, None)
+
+        mock_service = Mock()
+        mock_service.new_batch_http_request.side_effect = FakeBatch
+        mock_service.files().get.side_effect = lambda **kwargs: Mock(kwargs=kwargs)
+        self.client._service = mock_service
+        file_ids = [f"file{index}" for index in range(150)] + ["missing", "file0"]
+
+        result = self.client.get_files_info(file_ids)
+
+        assert [len(batch.requests) for batch in batches] == [100, 51]
+        assert len(result) == 151
+        assert result["file149"] == {"id": "file149"}
+        assert result["missing"] is None
+
+    def test_get_files_info_retries_rate_limited_lookups(self) -> None:
+        """Test lookups throttled inside a batch are sent again after a backoff."""
+        throttled = HttpError(
+            httplib2.Response({"status": "429"}), b'{"error": {"code": 429}}'
+        )
+        batches = []
+
+        class FakeBatch:
+            def __init__(self, callback) -> None:
+                self.callback = callback
+                self.requests = []
+                batches.append(self)
+
+            def add(self, request, request_id) -> None:
+                self.requests.append((request_id, request))
+
+            def execute(self) -> None:
+                for request_id, request in self.requests:
+                    file_id = request.kwargs["fileId"]
+                    if file_id == "busy" and len(batches) == 1:
+                        self.callback(request_id, None, throttled)
+                    else:
+                        self.callback(request_id, {"id": file_id}, None)
+
+        sleeps: list[float] = []
+        client = GoogleDriveClient(
+            request_executor=RequestExecutor(sleep=sleeps.append)
         )
+        mock_service = Mock()
+        mock_service.new_batch_http_request.side_effect = FakeBatch
+        mock_service.files().get.side_effect = lambda **kwargs: Mock(kwargs=kwargs)
+        client._service = mock_service
+
+        result = client.get_files_info(["idle", "busy"])
+
+        assert result == {"idle": {"id": "idle"}, "busy": {"id": "busy"}}
+        assert [len(batch.requests) for batch in batches] == [2, 1]
+        assert len(sleeps) == 1
+        assert client.request_executor.stats["drive.batch"].retries == 1
+
+    def test_get_files_info_raises_when_retries_run_out(self) -> None:
+        """Test lookups throttled on every attempt raise, not report None."""
+        throttled = HttpError(
+            httplib2.Response({"status": "429"}), b'{"error": {"code": 429}}'
+        )
+
+        class FakeBatch:
+            def __init__(self, callback) -> None:
+                self.callback = callback
+                self.requests = []
+
+            def add(self, request, request_id) -> None:
+                self.requests.append((request_id, request))
+
+            def execute(self) -> None:
+                for request_id, request in self.requests:
+                    if request.kwargs["fileId"] == "busy":
+                        self.callback(request_id, None, throttled)
+                    else:
+                        self.callback(request_id, {"id": "idle"}, None)
+
+        sleeps: list[float] = []
+        client = GoogleDriveClient(
+            request_executor=RequestExecutor(sleep=sleeps.append)
+        )
+        mock_service = Mock()
+        mock_service.new_batch_http_request.side_effect = FakeBatch
+        mock_service.files().get.side_effect = lambda **kwargs: Mock(kwargs=kwargs)
+        client._service = mock_service
+
+        with pytest.raises(HttpError) as raised:
+            client.get_files_info(["idle", "busy"])
+
+        assert raised.value is throttled
+        assert len(sleeps) == client.request_executor.policy.max_attempts - 1
+
+    def test_get_files_info_batch_errors_keep_their_status(self) -> None:
+        """Test a failed batch request raises Drive's own error."""
+        forbidden = HttpError(
+            httplib2.Response({"status": "403"}), b'{"error": {"code": 403}}'
+        )
+        mock_service = Mock()
+        mock_service.new_batch_http_request().execute.side_effect = forbidden
+        self.client._service = mock_service
+
+        with pytest.raises(HttpError) as raised:
+            self.client.get_files_info(["file_id"])
+
+        assert raised.value is forbidden
+
+    def test_get_file_info_uses_metadata_cache(self) -> None:
+        """Test cached metadata is served, revalidated and invalidated."""
+        cache = MetadataCache(default_ttl=60)
+        client = GoogleDriveClient(metadata_cache=cache)
+        mock_service = Mock()
+        mock_service.files().get().execute.return_value = {
+            "id": "file_id",
+            "version": "3",
+        }
+        mock_service.files().get.reset_mock()
+        client._service = mock_service
+
+        client.get_file_info("file_id")
+        client.get_file_info("file_id")
+        assert mock_service.files().get.call_count == 1
+
+        # Once expired, a version-only request revalidates the entry
+        cache.put("file:file_id", {"id": "file_id", "version": "3"}, "3", ttl=-1)
+        assert client.get_file_info("file_id")["version"] == "3"
+        assert mock_service.files().get.call_args.kwargs["fields"] == "version"
+        assert cache.stats.revalidations == 1
+
+        mock_service.files().update().execute.return_value = {"id": "file_id"}
+        client.update_google_doc_from_docx_bytes("file_id", b"docx")
+        assert cache.get("file:file_id") is None
+
+    def test_get_files_info_skips_cached_files(self) -> None:
+        """Test batched lookups only request files missing from the cache."""
+        cache = MetadataCache()
+        cache.put("file:cached", {"id": "cached"})
+        client = GoogleDriveClient(metadata_cache=cache)
+        mock_service = Mock()
+        client._service = mock_service
+
+        result = client.get_files_info(["cached"])
+
+        assert result == {"cached": {"id": "cached"}}
+        mock_service.new_batch_http_request.assert_not_called()
+
+    def test_list_files_in_folder_cached_until_upload(self) -> None:
+        """Test folder listings are cached and dropped on upload."""
+        client = GoogleDriveClient(metadata_cache=MetadataCache())
+        mock_service = Mock()
+        mock_service.files().list().execute.return_value = {"files": [{"id": "a"}]}
+        mock_service.files().create().execute.return_value = {"id": "b"}
+        mock_service.files().list.reset_mock()
+        client._service = mock_service
+
+        client.list_files_in_folder("folder_id")
+        client.list_files_in_folder("folder_id")
+        assert mock_service.files().list.call_count == 1
+
+        client.upload_docx_bytes_as_google_doc(b"docx", "SOW", "folder_id")
+        client.list_files_in_folder("folder_id")
+        assert mock_service.files().list.call_count == 2
+
+
+class TestPooledGoogleDriveClient:
+    """Test cases for PooledGoogleDriveClient."""
+
+    @patch("solution_desk_engine.integrations.google_drive.AuthorizedHttp")
+    @patch("solution_desk_engine.integrations.google_drive.build_service")
+    def test_service_per_thread_with_shared_credentials(
+        self, mock_build, mock_authorized_http
+    ) -> None:
+        """Test each thread gets its own transport but authenticates once."""
+        mock_build.side_effect = lambda *args, **kwargs: Mock()
+        mock_creds = Mock(valid=True)
+        client = PooledGoogleDriveClient(http_factory=Mock)
+
+        with patch.object(
+            client, "_authenticate", return_value=mock_creds
+        ) as mock_authenticate:
+            main_service = client._get_service()
+            assert client._get_service() is main_service
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                worker_service = executor.submit(client._get_service).result()
+
+        assert worker_service is not main_service
+        mock_authenticate.assert_called_once()
+        assert mock_build.call_count == 2
+        for call in mock_authorized_http.call_args_list:
+            assert call.args[0] is mock_creds
+
+    def test_expired_credentials_refreshed(self) -> None:
+        """Test shared credentials are refreshed once they expire."""
+        mock_creds = Mock(valid=True, refresh_token="token")
+        client = PooledGoogleDriveClient()
+
+        with patch.object(client, "_authenticate", return_value=mock_creds):
+            client._get_credentials()
+            mock_creds.valid = False
+            client._get_credentials()
+
+        mock_creds.refresh.assert_called_once()
@@ -0,0 +1,120 @@
+"""Tests for the filesystem-backed Drive client."""
+
+from pathlib import Path
+
+import pytest
+
+from solution_desk_engine.integrations.google_drive import GOOGLE_DOC_MIME_TYPE
+from solution_desk_engine.integrations.local_drive import (
+    LocalDriveClient,
+    SimulatedDriveError,
+)
+
+
+class TestLocalDriveClient:
+    """Test cases for LocalDriveClient."""
+
+    def test_upload_download_roundtrip(self, tmp_path: Path) -> None:
+        """Test uploaded content is listed and downloaded unchanged."""
+        client = LocalDriveClient(tmp_path)
+
+        result = client.upload_docx_bytes_as_google_doc(b"docx", "SOW", "folder")
+
+        assert result["name"] == "SOW"
+        assert client.download_doc_as_bytes(result["id"]) == b"docx"
+        output_path = tmp_path / "out.docx"
+        client.download_doc_as_docx(result["id"], str(output_path))
+        assert output_path.read_bytes() == b"docx"
+        assert [f["id"] for f in client.list_files_in_folder("folder")] == [
+            result["id"]
+        ]
+        assert client.list_files_in_folder("other") == []
+
+    def test_update_bumps_modified_time(self, tmp_path: Path) -> None:
+        """Test updating a document replaces content and changes its version."""
+        client = LocalDriveClient(tmp_path)
+        file_id = client.upload_docx_bytes_as_google_doc(b"v1", "SOW")["id"]
+        before = client.get_file_info(file_id)
+
+        client.update_google_doc_from_docx_bytes(file_id, b"v2")
+
+        after = client.get_file_info(file_id)
+        assert client.download_doc_as_bytes(file_id) == b"v2"
+        assert after["createdTime"] == before["createdTime"]
+        assert after["modifiedTime"] >= before["modifiedTime"]
+
+    def test_deduplicated_upload_reuses_stamped_document(self, tmp_path: Path) -> None:
+        """Test an upload with a known content hash reuses its document."""
+        client = LocalDriveClient(tmp_path)
+        first = client.upload_docx_bytes_as_google_doc(
+            b"v1", "SOW", "folder", content_hash="inputs"
+        )
+
+        again = client.upload_docx_bytes_as_google_doc(
+            b"v2", "SOW (copy)", "folder", deduplicate=True, content_hash="inputs"
+        )
+        elsewhere = client.upload_docx_bytes_as_google_doc(
+            b"v2", "SOW", "other", deduplicate=True, content_hash="inputs"
+        )
+
+        assert again == {**first, "name": "SOW (copy)"}
+        assert client.download_doc_as_bytes(first["id"]) == b"v1"
+        assert elsewhere["id"] != first["id"]
+
+    def test_plain_docx_is_served_by_file_name(self, tmp_path: Path) -> None:
+        """Test a DOCX dropped into the directory is usable as a template."""
+        (tmp_path / "template.docx").write_bytes(b"docx")
+
+        info = LocalDriveClient(tmp_path).get_file_info("template")
+
+        assert info["id"] == "template"
+        assert info["mimeType"] == GOOGLE_DOC_MIME_TYPE
+        assert info["modifiedTime"].endswith("Z")
+
+    def test_get_files_info(self, tmp_path: Path) -> None:
+        """Test batched lookups map missing files to None."""
+        (tmp_path / "template.docx").write_bytes(b"docx")
+
+        result = LocalDriveClient(tmp_path).get_files_info(["template", "missing"])
+
+        assert result["template"]["id"] == "template"
+        assert result["missing"] is None
+
+    def test_iter_files_in_folder_pages_and_fields(self, tmp_path: Path) -> None:
+        """Test simulated pages only return the requested fields."""
+        client = LocalDriveClient(tmp_path)
+        for index in range(3):
+            client.upload_docx_bytes_as_google_doc(b"docx", f"SOW {index}", "folder")
+
+        files = list(
+            client.iter_files_in_folder("folder", page_size=2, fields=["name"])
+        )
+
+        assert sorted(file["name"] for file in files) == ["SOW 0", "SOW 1", "SOW 2"]
+        assert all(set(file) == {"name"} for file in files)
+
+    def test_resolve_folder_path(self, tmp_path: Path) -> None:
+        """Test folder paths map to simulated folder IDs."""
+        client = LocalDriveClient(tmp_path)
+
+        assert client.resolve_folder_path("/Customers/Penske/") == "Customers/Penske"
+        assert client.resolve_folder_path("SOWs", "shared") == "shared/SOWs"
+        with pytest.raises(ValueError):
+            client.resolve_folder_path("/")
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test unknown file IDs raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            LocalDriveClient(tmp_path).download_doc_as_bytes("missing")
+
+    def test_injected_errors(self, tmp_path: Path) -> None:
+        """Test an error rate of 1 fails every call."""
+        client = LocalDriveClient(tmp_path, error_rate=1.0, seed=0)
+
+        with pytest.raises(SimulatedDriveError):
+            client.upload_docx_bytes_as_google_doc(b"docx", "SOW")
+
+    def test_invalid_error_rate(self) -> None:
+        """Test error rates outside 0-1 are rejected."""
+        with pytest.raises(ValueError):
+            LocalDriveClient(error_rate=1.5)
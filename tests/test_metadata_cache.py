@@ -0,0 +1,104 @@
+"""Tests for the Drive metadata caches."""
+
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from solution_desk_engine.integrations.metadata_cache import (
+    MetadataCache,
+    SQLiteMetadataCache,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path: Path) -> Iterator[MetadataCache]:
+    """Provide each cache implementation."""
+    if request.param == "memory":
+        yield MetadataCache(default_ttl=60)
+        return
+
+    sqlite_cache = SQLiteMetadataCache(tmp_path / "metadata.sqlite3", default_ttl=60)
+    yield sqlite_cache
+    sqlite_cache.close()
+
+
+class TestMetadataCache:
+    """Test cases shared by MetadataCache and SQLiteMetadataCache."""
+
+    def test_fresh_entry_is_served_from_cache(self, cache: MetadataCache) -> None:
+        """Test a fresh entry is returned without fetching."""
+        fetch = Mock(return_value=({"id": "file"}, "1"))
+
+        assert cache.get_or_fetch("file:file", fetch) == {"id": "file"}
+        assert cache.get_or_fetch("file:file", fetch) == {"id": "file"}
+
+        fetch.assert_called_once()
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_expired_entry_is_revalidated(self, cache: MetadataCache) -> None:
+        """Test an expired entry with a current validator is kept."""
+        cache.put("file:file", {"id": "file"}, etag="1", ttl=-1)
+        fetch = Mock()
+        revalidate = Mock(return_value=True)
+
+        assert cache.get_or_fetch("file:file", fetch, revalidate) == {"id": "file"}
+
+        revalidate.assert_called_once_with("1")
+        fetch.assert_not_called()
+        assert cache.stats.revalidations == 1
+        assert cache.get("file:file") == {"id": "file"}
+
+    def test_changed_entry_is_fetched_again(self, cache: MetadataCache) -> None:
+        """Test an expired entry with a stale validator is re-fetched."""
+        cache.put("file:file", {"name": "old"}, etag="1", ttl=-1)
+        fetch = Mock(return_value=({"name": "new"}, "2"))
+
+        value = cache.get_or_fetch("file:file", fetch, Mock(return_value=False))
+
+        assert value == {"name": "new"}
+        assert cache.stats.misses == 1
+
+    def test_invalidation(self, cache: MetadataCache) -> None:
+        """Test entries can be invalidated by key, prefix or all at once."""
+        cache.put("file:a", {"id": "a"})
+        cache.put("folder:x", [])
+        cache.put("folder:y", [])
+
+        cache.invalidate("file:a")
+        assert cache.get("file:a") is None
+        cache.invalidate_prefix("folder:")
+        assert len(cache) == 0
+        cache.put("file:b", {"id": "b"})
+        assert cache.clear() == 1
+
+    def test_cached_values_are_copies(self, cache: MetadataCache) -> None:
+        """Test callers cannot mutate cached values."""
+        cache.put("file:a", {"id": "a"})
+
+        cache.get("file:a")["id"] = "changed"  # type: ignore[index]
+
+        assert cache.get("file:a") == {"id": "a"}
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path: Path) -> None:
+    """Test SQLite entries are visible to a new cache instance."""
+    db_path = tmp_path / "metadata.sqlite3"
+    writer = SQLiteMetadataCache(db_path)
+    writer.put("file:a", {"id": "a"}, etag="7")
+    writer.close()
+
+    reader = SQLiteMetadataCache(db_path)
+    assert reader.get("file:a") == {"id": "a"}
+    reader.close()
+
+
+def test_sqlite_cache_creates_database_lazily(tmp_path: Path) -> None:
+    """Test constructing a SQLite cache does not touch the filesystem."""
+    db_path = tmp_path / "cache" / "metadata.sqlite3"
+
+    SQLiteMetadataCache(db_path)
+
+    assert not db_path.parent.exists()
@@ -0,0 +1,189 @@
+"""Tests for pandoc detection and the pandoc server pool."""
+
+import os
+import stat
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from solution_desk_engine.export import pandoc
+from solution_desk_engine.export.document_exporter import DocumentExporter, ExportFormat
+from solution_desk_engine.export.pandoc import (
+    PandocError,
+    PandocInfo,
+    PandocServerPool,
+    probe_pandoc,
+)
+
+# Stand-in for pandoc 3: `--version`, a command line and a `server` that
+# upper-case markdown into "docx" and wrap it in "html5", logging each run
+FAKE_PANDOC = """#!{python}
+import base64, json, os, sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+if sys.argv[1] == "--version":
+    print("pandoc {version}")
+    sys.exit(0)
+with open(os.environ["FAKE_PANDOC_LOG"], "a") as log:
+    log.write(sys.argv[1] == "server" and "start\\n" or "cli\\n")
+if sys.argv[1] != "server":
+    with open(sys.argv[1]) as source, open(sys.argv[3], "w") as output:
+        output.write(source.read().upper())
+    sys.exit(0)
+if os.environ.get("FAKE_PANDOC_NO_SERVER"):
+    sys.exit(3)
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if request["text"] == "fail":
+            result = {{"error": "cannot convert"}}
+        elif request["to"] == "docx":
+            output = request["text"].upper().encode()
+            output += base64.b64decode(request.get("files", {{}}).get(
+                request.get("reference-doc"), ""
+            ))
+            result = {{"output": base64.b64encode(output).decode(), "base64": True}}
+        else:
+            result = {{"output": "<p>" + request["text"] + "</p>", "base64": False}}
+        body = json.dumps(result).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+HTTPServer(("127.0.0.1", int(sys.argv[3])), Handler).serve_forever()
+"""
+
+
+def install_fake_pandoc(directory: Path, version: str = "3.1.9") -> Path:
+    """Write an executable fake pandoc into a directory."""
+    path = directory / "pandoc"
+    path.write_text(FAKE_PANDOC.format(python=sys.executable, version=version))
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return path
+
+
+@pytest.fixture
+def fake_pandoc(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Put a fake pandoc 3 first on PATH and log its server starts."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    install_fake_pandoc(bin_dir)
+    log = tmp_path / "starts.log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_PANDOC_LOG", str(log))
+    monkeypatch.setattr(pandoc, "_server_pool", None)
+    probe_pandoc.cache_clear()
+    yield log
+    if pandoc._server_pool is not None:
+        pandoc._server_pool.close()
+    probe_pandoc.cache_clear()
+
+
+def test_probe_runs_once_per_process(fake_pandoc: Path) -> None:
+    """Test pandoc is looked up and versioned once, then cached."""
+    with patch("shutil.which", wraps=pandoc.shutil.which) as mock_which:
+        info = probe_pandoc()
+        assert probe_pandoc() is info
+
+    mock_which.assert_called_once_with("pandoc")
+    assert info is not None
+    assert info.version == (3, 1, 9)
+    assert info.has_server
+
+
+def test_probe_without_pandoc(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a missing pandoc is reported as None."""
+    monkeypatch.setattr(pandoc.shutil, "which", lambda name: None)
+    probe_pandoc.cache_clear()
+    try:
+        assert probe_pandoc() is None
+    finally:
+        probe_pandoc.cache_clear()
+
+
+def test_pool_reuses_servers(fake_pandoc: Path, tmp_path: Path) -> None:
+    """Test many conversions share servers and reference files are sent."""
+    info = probe_pandoc()
+    assert info is not None
+    reference = tmp_path / "reference.docx"
+    reference.write_bytes(b"+REF")
+    pool = PandocServerPool(info, max_servers=2)
+    try:
+        assert pool.convert("one", "html5") == b"<p>one</p>"
+        docx = pool.convert(
+            "two", "docx", {"reference-doc": "ref.docx"}, {"ref.docx": reference}
+        )
+        assert docx == b"TWO+REF"
+
+        barrier = threading.Barrier(4)
+
+        def convert(number: int) -> bytes:
+            barrier.wait()
+            return pool.convert(f"doc {number}", "html5")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outputs = list(executor.map(convert, range(4)))
+
+        assert outputs == [f"<p>doc {number}</p>".encode() for number in range(4)]
+        with pytest.raises(PandocError, match="cannot convert"):
+            pool.convert("fail", "html5")
+        servers = len(pool)
+    finally:
+        pool.close()
+
+    assert 1 <= servers <= 2
+    assert fake_pandoc.read_text().count("start") == servers
+
+
+def test_pool_requires_pandoc_3() -> None:
+    """Test pandoc 2 has no server mode to pool."""
+    with pytest.raises(ValueError, match="3.0"):
+        PandocServerPool(PandocInfo(path="pandoc", version=(2, 19)))
+
+
+def test_exporter_converts_on_one_server(fake_pandoc: Path, tmp_path: Path) -> None:
+    """Test a batch export starts a single pandoc for every document."""
+    sources = []
+    for number in range(3):
+        source = tmp_path / f"doc{number}.md"
+        source.write_text(f"doc {number}", encoding="utf-8")
+        sources.append(source)
+    exporter = DocumentExporter(tmp_path / "out", use_pandoc_server=True)
+
+    results = exporter.export_multiple_documents(sources, ExportFormat.DOCX)
+
+    assert all(result.success for result in results.values())
+    assert (tmp_path / "out" / "doc2.docx").read_bytes() == b"DOC 2"
+    assert fake_pandoc.read_text().splitlines() == ["start"]
+
+
+def test_exporter_falls_back_to_command_line(
+    fake_pandoc: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a server that fails to start is tried once, then pandoc runs."""
+    monkeypatch.setenv("FAKE_PANDOC_NO_SERVER", "1")
+    sources = []
+    for number in range(2):
+        source = tmp_path / f"doc{number}.md"
+        source.write_text(f"doc {number}", encoding="utf-8")
+        sources.append(source)
+    exporter = DocumentExporter(tmp_path / "out", use_pandoc_server=True)
+
+    results = exporter.export_multiple_documents(sources, ExportFormat.DOCX)
+
+    assert all(result.success for result in results.values())
+    assert (tmp_path / "out" / "doc1.docx").read_text() == "DOC 1"
+    assert fake_pandoc.read_text().splitlines() == ["start", "cli", "cli"]
@@ -0,0 +1,167 @@
+"""Tests for the rate-limited, retrying request executor."""
+
+import json
+from typing import List, Optional
+from unittest.mock import Mock
+
+import httplib2  # type: ignore
+import pytest
+from googleapiclient.errors import HttpError  # type: ignore
+
+from solution_desk_engine.integrations.request_executor import (
+    RequestExecutor,
+    RetryPolicy,
+    TokenBucket,
+    is_rate_limit_error,
+    is_retryable_error,
+    retry_after_seconds,
+)
+
+
+def http_error(
+    status: int, reason: Optional[str] = None, retry_after: Optional[str] = None
+) -> HttpError:
+    """Build an HttpError like the ones googleapiclient raises."""
+    headers = {"status": str(status)}
+    if retry_after is not None:
+        headers["retry-after"] = retry_after
+    errors = [{"reason": reason}] if reason else []
+    content = json.dumps({"error": {"code": status, "errors": errors}})
+    return HttpError(httplib2.Response(headers), content.encode("utf-8"))
+
+
+@pytest.fixture
+def sleeps() -> List[float]:
+    """Collect the delays the executor sleeps for."""
+    return []
+
+
+@pytest.fixture
+def executor(sleeps: List[float]) -> RequestExecutor:
+    """Provide an executor that records sleeps instead of sleeping."""
+    return RequestExecutor(
+        policy=RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=8.0),
+        sleep=sleeps.append,
+    )
+
+
+class TestErrorClassification:
+    """Test cases for deciding which errors to retry."""
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_transient_statuses_are_retryable(self, status: int) -> None:
+        """Test 429 and 5xx responses are retried."""
+        assert is_retryable_error(http_error(status))
+
+    @pytest.mark.parametrize("reason", ["userRateLimitExceeded", "rateLimitExceeded"])
+    def test_403_rate_limits_are_retryable(self, reason: str) -> None:
+        """Test 403 responses are retried only for rate-limit reasons."""
+        assert is_rate_limit_error(http_error(403, reason))
+        assert is_retryable_error(http_error(403, reason))
+
+    @pytest.mark.parametrize(
+        "error",
+        [http_error(403, "insufficientPermissions"), http_error(404), ValueError()],
+    )
+    def test_other_errors_are_not_retryable(self, error: Exception) -> None:
+        """Test permanent errors are not retried."""
+        assert not is_retryable_error(error)
+
+    def test_retry_after_seconds(self) -> None:
+        """Test Retry-After is read as seconds or as an HTTP date."""
+        assert retry_after_seconds(http_error(429, retry_after="7")) == 7
+        assert retry_after_seconds(http_error(429)) is None
+        past = "Wed, 21 Oct 2015 07:28:00 GMT"
+        assert retry_after_seconds(http_error(429, retry_after=past)) == 0
+
+
+class TestRequestExecutor:
+    """Test cases for RequestExecutor."""
+
+    def test_execute_returns_response(self, executor: RequestExecutor) -> None:
+        """Test a successful request is executed once and counted."""
+        request = Mock(methodId="drive.files.get")
+        request.execute.return_value = {"id": "file"}
+
+        assert executor.execute(request) == {"id": "file"}
+
+        stats = executor.stats["drive.files.get"]
+        assert (stats.calls, stats.retries, stats.failures) == (1, 0, 0)
+
+    def test_retries_rate_limited_request(
+        self, executor: RequestExecutor, sleeps: List[float]
+    ) -> None:
+        """Test a throttled request is retried, honoring Retry-After."""
+        request = Mock()
+        request.execute.side_effect = [
+            http_error(429, retry_after="5"),
+            http_error(403, "userRateLimitExceeded"),
+            {"id": "file"},
+        ]
+
+        assert executor.execute(request, "drive.files.get") == {"id": "file"}
+
+        assert sleeps[0] >= 5
+        assert 0 <= sleeps[1] <= 2
+        stats = executor.stats["drive.files.get"]
+        assert (stats.calls, stats.retries, stats.rate_limited) == (3, 2, 2)
+        assert stats.wait_seconds >= sum(sleeps)
+
+    def test_backoff_is_capped(
+        self, executor: RequestExecutor, sleeps: List[float]
+    ) -> None:
+        """Test delays stay within the exponential ceiling and max_delay."""
+        for attempt in range(1, 8):
+            executor.wait_before_retry(attempt, None, "drive.files.get")
+
+        assert all(0 <= delay <= 8.0 for delay in sleeps)
+        assert sleeps[0] <= 1.0
+
+    def test_gives_up_after_max_attempts(
+        self, executor: RequestExecutor, sleeps: List[float]
+    ) -> None:
+        """Test the last error is raised once the retry policy is exhausted."""
+        function = Mock(side_effect=http_error(503))
+
+        with pytest.raises(HttpError):
+            executor.call(function, "drive.files.export")
+
+        assert function.call_count == 4
+        assert len(sleeps) == 3
+        assert executor.stats["drive.files.export"].failures == 1
+
+    def test_permanent_error_is_not_retried(
+        self, executor: RequestExecutor, sleeps: List[float]
+    ) -> None:
+        """Test a 404 is raised immediately."""
+        function = Mock(side_effect=http_error(404))
+
+        with pytest.raises(HttpError):
+            executor.call(function, "drive.files.get")
+
+        function.assert_called_once()
+        assert sleeps == []
+
+    def test_stats_are_a_snapshot(self, executor: RequestExecutor) -> None:
+        """Test callers cannot modify the executor's counters."""
+        executor.call(lambda: None, "drive.files.get")
+        executor.stats["drive.files.get"].calls = 100
+
+        assert executor.stats["drive.files.get"].calls == 1
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_burst_is_served_without_waiting(self) -> None:
+        """Test requests within the burst capacity do not wait."""
+        bucket = TokenBucket(rate_per_second=1, capacity=3)
+
+        assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+
+    def test_waits_when_empty(self) -> None:
+        """Test an empty bucket blocks until a token is refilled."""
+        bucket = TokenBucket(rate_per_second=100, capacity=1)
+        bucket.acquire()
+
+        assert bucket.acquire() > 0
@@ -0,0 +1,188 @@
+"""Tests for resumable chunked uploads and the upload journal."""
+
+import io
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from googleapiclient.errors import HttpError  # type: ignore
+from googleapiclient.http import HttpMockSequence, MediaIoBaseUpload  # type: ignore
+
+from solution_desk_engine.integrations.discovery import build_service
+from solution_desk_engine.integrations.google_drive import GoogleDriveClient
+from solution_desk_engine.integrations.request_executor import (
+    RequestExecutor,
+    RetryPolicy,
+)
+from solution_desk_engine.integrations.resumable_upload import (
+    CHUNK_SIZE_UNIT,
+    SESSION_LIFETIME_SECONDS,
+    UploadJournal,
+    UploadReport,
+    upload_resumable,
+    validate_chunk_size,
+)
+
+SESSION_URI = "https://www.googleapis.com/upload/drive/v3/files?upload_id=abc"
+CONTENT = b"x" * (CHUNK_SIZE_UNIT * 2 + 1000)
+CREATED = json.dumps({"id": "doc", "name": "SOW"})
+
+
+class RecordingHttp(HttpMockSequence):  # type: ignore[misc]
+    """HttpMockSequence that records each request's method, URI and headers."""
+
+    def __init__(self, responses: List[Tuple[Dict[str, str], str]]) -> None:
+        super().__init__(responses)
+        self.requests: List[Tuple[str, str, Dict[str, str]]] = []
+
+    def request(self, uri: str, method: str = "GET", *args: Any, **kwargs: Any) -> Any:
+        self.requests.append((method, uri, dict(kwargs.get("headers") or {})))
+        return super().request(uri, method, *args, **kwargs)
+
+
+def create_request(http: RecordingHttp) -> Any:
+    """Build a resumable files.create request sent through an HTTP mock."""
+    media = MediaIoBaseUpload(
+        io.BytesIO(CONTENT),
+        mimetype="application/octet-stream",
+        chunksize=CHUNK_SIZE_UNIT,
+        resumable=True,
+    )
+    service = build_service("drive", "v3", http=http)
+    return service.files().create(body={"name": "SOW"}, media_body=media)
+
+
+@pytest.fixture
+def journal(tmp_path: Path) -> UploadJournal:
+    """Provide an empty upload journal."""
+    return UploadJournal(tmp_path / "upload_journal.json")
+
+
+@pytest.fixture
+def executor() -> RequestExecutor:
+    """Provide an executor that gives up after the first failure."""
+    return RequestExecutor(policy=RetryPolicy(max_attempts=1), sleep=lambda _: None)
+
+
+def test_interrupted_upload_resumes_in_next_run(
+    journal: UploadJournal, executor: RequestExecutor
+) -> None:
+    """Test a restarted upload continues from where Drive's session stopped."""
+    first_run = RecordingHttp(
+        [
+            ({"status": "200", "location": SESSION_URI}, ""),
+            ({"status": "308", "range": f"bytes=0-{CHUNK_SIZE_UNIT - 1}"}, ""),
+            ({"status": "503"}, ""),
+        ]
+    )
+    with pytest.raises(HttpError):
+        upload_resumable(
+            create_request(first_run), executor, "SOW", "upload", journal, "key"
+        )
+
+    session = UploadJournal(journal.journal_path).get("key")
+    assert session is not None
+    assert (session.uri, session.size) == (SESSION_URI, len(CONTENT))
+
+    second_run = RecordingHttp(
+        [
+            ({"status": "308", "range": f"bytes=0-{CHUNK_SIZE_UNIT - 1}"}, ""),
+            ({"status": "308", "range": f"bytes=0-{2 * CHUNK_SIZE_UNIT - 1}"}, ""),
+            ({"status": "200"}, CREATED),
+        ]
+    )
+    file, report = upload_resumable(
+        create_request(second_run), executor, "SOW", "upload", journal, "key"
+    )
+
+    assert file["id"] == "doc"
+    assert report.resumed_from == CHUNK_SIZE_UNIT
+    assert report.bytes == len(CONTENT)
+    method, uri, headers = second_run.requests[0]
+    assert (method, uri) == ("PUT", SESSION_URI)
+    assert headers["Content-Range"] == f"bytes */{len(CONTENT)}"
+    assert second_run.requests[1][2]["Content-Range"].startswith(
+        f"bytes {CHUNK_SIZE_UNIT}-"
+    )
+    assert len(journal) == 0
+
+
+def test_expired_session_starts_a_new_upload(
+    journal: UploadJournal, executor: RequestExecutor
+) -> None:
+    """Test a session Drive no longer knows is replaced by a new one."""
+    journal.record("key", SESSION_URI, len(CONTENT))
+    http = RecordingHttp(
+        [
+            ({"status": "404"}, ""),
+            ({"status": "200", "location": SESSION_URI + "2"}, ""),
+            ({"status": "308", "range": f"bytes=0-{CHUNK_SIZE_UNIT - 1}"}, ""),
+            ({"status": "308", "range": f"bytes=0-{2 * CHUNK_SIZE_UNIT - 1}"}, ""),
+            ({"status": "200"}, CREATED),
+        ]
+    )
+
+    file, report = upload_resumable(
+        create_request(http), executor, "SOW", "upload", journal, "key"
+    )
+
+    assert file["id"] == "doc"
+    assert report.resumed_from == 0
+    assert http.requests[1][0] == "POST"
+    assert len(journal) == 0
+
+
+def test_journal_drops_expired_sessions(journal: UploadJournal) -> None:
+    """Test sessions older than Drive keeps them are not resumed."""
+    journal.record("old", SESSION_URI, 1)
+    journal.record("new", SESSION_URI, 1)
+    journal._sessions["old"].created_at = time.time() - SESSION_LIFETIME_SECONDS - 1
+    with journal._lock:
+        journal._save()
+
+    assert len(UploadJournal(journal.journal_path)) == 1
+    assert journal.get("old") is None
+    assert journal.get("new") is not None
+
+
+def test_upload_report_throughput() -> None:
+    """Test throughput counts only the bytes sent by this process."""
+    assert UploadReport("a", 3000, 2.0, resumed_from=1000).throughput == 1000
+    assert UploadReport("a", 3000, 0.0).throughput == 0
+
+
+def test_validate_chunk_size() -> None:
+    """Test chunk sizes must be positive multiples of 256 KiB."""
+    assert validate_chunk_size(4 * CHUNK_SIZE_UNIT) == 4 * CHUNK_SIZE_UNIT
+    with pytest.raises(ValueError, match="multiple"):
+        validate_chunk_size(1000)
+    with pytest.raises(ValueError):
+        GoogleDriveClient(chunk_size=-CHUNK_SIZE_UNIT)
+
+
+def test_client_sends_chunked_uploads(
+    journal: UploadJournal, executor: RequestExecutor
+) -> None:
+    """Test a client with a chunk size uploads in chunks and reports it."""
+    client = GoogleDriveClient(
+        request_executor=executor, chunk_size=CHUNK_SIZE_UNIT, upload_journal=journal
+    )
+    http = RecordingHttp(
+        [
+            ({"status": "200", "location": SESSION_URI}, ""),
+            ({"status": "308", "range": f"bytes=0-{CHUNK_SIZE_UNIT - 1}"}, ""),
+            ({"status": "308", "range": f"bytes=0-{2 * CHUNK_SIZE_UNIT - 1}"}, ""),
+            ({"status": "200"}, CREATED),
+        ]
+    )
+    client._service = build_service("drive", "v3", http=http)
+
+    result = client.upload_docx_bytes_as_google_doc(CONTENT, "SOW")
+
+    assert result["id"] == "doc"
+    assert [request[0] for request in http.requests] == ["POST", "PUT", "PUT", "PUT"]
+    (report,) = client.upload_reports
+    assert (report.name, report.bytes) == ("SOW", len(CONTENT))
+    assert len(journal) == 0
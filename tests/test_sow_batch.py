@@ -0,0 +1,87 @@
+"""Tests for SOW batch file loading."""
+
+from pathlib import Path
+
+import pytest
+
+from solution_desk_engine.sow.batch import load_batch_file
+
+
+class TestLoadBatchFile:
+    """Test cases for load_batch_file."""
+
+    def test_load_csv(self, tmp_path: Path) -> None:
+        """Test loading a CSV batch file with default output names."""
+        batch_file = tmp_path / "batch.csv"
+        batch_file.write_text(
+            "customer_name,project_name,contractor_name,output_name\n"
+            "Penske,Lease Management,,\n"
+            "Acme,Data Platform,Partner Co,Acme Custom SOW\n"
+        )
+
+        items = load_batch_file(batch_file)
+
+        assert len(items) == 2
+        assert items[0].context.customer_name == "Penske"
+        assert items[0].context.contractor_name == "Capgemini"  # Empty cell
+        assert items[0].output_name == "Penske SOW - Lease Management"
+        assert items[1].context.contractor_name == "Partner Co"
+        assert items[1].output_name == "Acme Custom SOW"
+
+    def test_load_yaml_mapping(self, tmp_path: Path) -> None:
+        """Test loading a YAML batch file with a contexts key."""
+        batch_file = tmp_path / "batch.yaml"
+        batch_file.write_text(
+            "contexts:\n"
+            "  - customer_name: Penske\n"
+            "    project_name: Lease Management\n"
+            "    max_total_cost: 500000\n"
+            "    output_folder_id: folder_1\n"
+        )
+
+        items = load_batch_file(batch_file)
+
+        assert items[0].context.max_total_cost == "500000"
+        assert items[0].output_folder_id == "folder_1"
+
+    def test_load_jsonl(self, tmp_path: Path) -> None:
+        """Test loading a JSON Lines batch file, skipping blank lines."""
+        batch_file = tmp_path / "batch.jsonl"
+        batch_file.write_text(
+            '{"customer_name": "Penske", "project_name": "Leases"}\n'
+            "\n"
+            '{"customer_name": "Acme", "project_name": "Data"}\n'
+        )
+
+        items = load_batch_file(batch_file)
+
+        assert [item.context.customer_name for item in items] == ["Penske", "Acme"]
+
+    def test_missing_required_fields(self, tmp_path: Path) -> None:
+        """Test rows without customer or project name are rejected."""
+        batch_file = tmp_path / "batch.jsonl"
+        batch_file.write_text('{"customer_name": "Penske"}\n')
+
+        with pytest.raises(ValueError, match="Row 1: missing required fields"):
+            load_batch_file(batch_file)
+
+    def test_invalid_json_line(self, tmp_path: Path) -> None:
+        """Test malformed JSON Lines input reports the line number."""
+        batch_file = tmp_path / "batch.jsonl"
+        batch_file.write_text("{not json}\n")
+
+        with pytest.raises(ValueError, match="line 1"):
+            load_batch_file(batch_file)
+
+    def test_unsupported_format(self, tmp_path: Path) -> None:
+        """Test unsupported file extensions are rejected."""
+        batch_file = tmp_path / "batch.txt"
+        batch_file.write_text("")
+
+        with pytest.raises(ValueError, match="Unsupported batch file format"):
+            load_batch_file(batch_file)
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test a missing batch file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_batch_file(tmp_path / "missing.csv")
@@ -0,0 +1,129 @@
+"""Tests for compiled SOW templates."""
+
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from docx import Document  # type: ignore
+from docxtpl import DocxTemplate  # type: ignore
+
+from solution_desk_engine.sow.compiled_template import CompiledTemplate
+
+
+def _template_bytes() -> bytes:
+    """Build a small DOCX template with body, table and header variables."""
+    doc = Document()
+    doc.add_paragraph("Statement of Work for {{ customer_name }}")
+    doc.add_paragraph("Project: {{ project_name }}")
+    table = doc.add_table(rows=1, cols=1)
+    table.rows[0].cells[0].text = "{{ contractor_name }}"
+    doc.sections[0].header.paragraphs[0].text = "{{ customer_name }} - Confidential"
+    output = io.BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+def _texts(docx_bytes: bytes) -> list:
+    """Extract paragraph, table and header text from a DOCX."""
+    doc = Document(io.BytesIO(docx_bytes))
+    return (
+        [paragraph.text for paragraph in doc.paragraphs]
+        + [doc.tables[0].rows[0].cells[0].text]
+        + [doc.sections[0].header.paragraphs[0].text]
+    )
+
+
+class TestCompiledTemplate:
+    """Test cases for CompiledTemplate."""
+
+    def test_render_many_contexts(self) -> None:
+        """Test each render starts from the pristine template."""
+        template = CompiledTemplate(_template_bytes())
+
+        first = template.render_bytes(
+            {
+                "customer_name": "Penske",
+                "project_name": "Leases",
+                "contractor_name": "A",
+            }
+        )
+        second = template.render_bytes(
+            {"customer_name": "Acme", "project_name": "Data", "contractor_name": "B"}
+        )
+
+        assert _texts(first) == [
+            "Statement of Work for Penske",
+            "Project: Leases",
+            "A",
+            "Penske - Confidential",
+        ]
+        assert _texts(second) == [
+            "Statement of Work for Acme",
+            "Project: Data",
+            "B",
+            "Acme - Confidential",
+        ]
+
+    def test_load_from_path_and_render_to_path(self, tmp_path: Path) -> None:
+        """Test loading from disk once and saving to an output path."""
+        template_path = tmp_path / "template.docx"
+        template_path.write_bytes(_template_bytes())
+        template = CompiledTemplate(str(template_path))
+        template_path.unlink()  # Rendering must not re-read the template file
+
+        output_path = tmp_path / "output.docx"
+        template.render({"customer_name": "Penske"}, str(output_path))
+
+        assert _texts(output_path.read_bytes())[0] == "Statement of Work for Penske"
+
+    def test_jinja_templates_compiled_once(self) -> None:
+        """Test repeated renders reuse the compiled Jinja templates."""
+        template = CompiledTemplate(_template_bytes())
+
+        template.render_bytes({"customer_name": "A"})
+        compiled_count = len(template.jinja_env._compiled)
+        template.render_bytes({"customer_name": "B"})
+
+        assert compiled_count > 0
+        assert len(template.jinja_env._compiled) == compiled_count
+
+    def test_concurrent_renders(self) -> None:
+        """Test rendering from several threads yields independent documents."""
+        template = CompiledTemplate(_template_bytes())
+        names = [f"Customer {i}" for i in range(8)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outputs = list(
+                executor.map(
+                    lambda name: template.render_bytes({"customer_name": name}), names
+                )
+            )
+
+        assert [_texts(output)[0] for output in outputs] == [
+            f"Statement of Work for {name}" for name in names
+        ]
+
+    def test_concurrent_renders_patch_each_part_once(self) -> None:
+        """Test threads racing on a part share one cleaned-up XML."""
+        template = CompiledTemplate(_template_bytes())
+        original_patch = DocxTemplate.patch_xml
+
+        def slow_patch(doc: Any, src_xml: str) -> str:
+            time.sleep(0.01)
+            return original_patch(doc, src_xml)  # type: ignore
+
+        with patch.object(
+            DocxTemplate, "patch_xml", autospec=True, side_effect=slow_patch
+        ) as mock_patch:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(
+                    executor.map(
+                        lambda name: template.render_bytes({"customer_name": name}),
+                        ["A", "B", "C", "D"],
+                    )
+                )
+
+        assert mock_patch.call_count == len(template._patched)
@@ -0,0 +1,58 @@
+"""Tests for the SOW generation manifest."""
+
+import json
+from pathlib import Path
+
+from solution_desk_engine.sow.generation_manifest import GenerationManifest
+
+
+class TestGenerationManifest:
+    """Test cases for GenerationManifest."""
+
+    def test_fingerprint_tracks_template_version_and_context(self) -> None:
+        """Test fingerprints change with the template version or context."""
+        base = GenerationManifest.fingerprint("v1", {"customer_name": "Penske"})
+
+        assert base == GenerationManifest.fingerprint("v1", {"customer_name": "Penske"})
+        assert base != GenerationManifest.fingerprint("v2", {"customer_name": "Penske"})
+        assert base != GenerationManifest.fingerprint("v1", {"customer_name": "Acme"})
+
+    def test_key_identifies_output(self) -> None:
+        """Test keys combine template, folder and output name."""
+        assert GenerationManifest.key("tpl", "SOW", None) == "tpl||SOW"
+        assert GenerationManifest.key("tpl", "SOW", "folder") == "tpl|folder|SOW"
+
+    def test_record_persists_across_instances(self, tmp_path: Path) -> None:
+        """Test recorded entries are saved and reloaded."""
+        manifest_path = tmp_path / "manifest.json"
+        manifest = GenerationManifest(manifest_path)
+
+        manifest.record(
+            "tpl||SOW", "abc", {"id": "doc_id", "name": "SOW", "status": "created"}
+        )
+
+        entry = GenerationManifest(manifest_path).get("tpl||SOW")
+        assert entry is not None
+        assert entry.fingerprint == "abc"
+        assert entry.document == {"id": "doc_id", "name": "SOW"}
+
+    def test_unreadable_manifest_starts_empty(self, tmp_path: Path) -> None:
+        """Test a corrupt manifest file is treated as empty."""
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text("{not json")
+
+        assert GenerationManifest(manifest_path).get("tpl||SOW") is None
+
+    def test_default_path(self) -> None:
+        """Test default manifest location."""
+        manifest = GenerationManifest()
+        assert manifest.manifest_path.name == "sow_manifest.json"
+        assert manifest.manifest_path.parent.name == ".solution-desk-engine"
+
+    def test_saved_file_format(self, tmp_path: Path) -> None:
+        """Test the manifest file is plain JSON keyed by output."""
+        manifest_path = tmp_path / "nested" / "manifest.json"
+        GenerationManifest(manifest_path).record("key", "abc", {"id": "doc_id"})
+
+        data = json.loads(manifest_path.read_text())
+        assert data["entries"]["key"]["document"] == {"id": "doc_id"}
@@ -1,10 +1,18 @@
 """Tests for SOW generator."""
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
+import httplib2
 import pytest
+from googleapiclient.errors import HttpError
 
-from solution_desk_engine.sow.sow_generator import SOWContext, SOWGenerator
+from solution_desk_engine.sow.generation_manifest import GenerationManifest
+from solution_desk_engine.sow.sow_generator import (
+    SOWBatchItem,
+    SOWContext,
+    SOWGenerator,
+)
 
 
 class TestSOWContext:
@@ -176,6 +184,23 @@ class TestSOWGenerator:
 
         assert result is False
 
+    def test_validate_templates(self) -> None:
+        """Test many templates are validated with one batched lookup."""
+        doc_info = {"id": "doc", "mimeType": "application/vnd.google-apps.document"}
+        self.mock_google_drive.get_files_info.return_value = {
+            "doc": doc_info,
+            "pdf": {"id": "pdf", "mimeType": "application/pdf"},
+            "missing": None,
+        }
+
+        result = self.generator.validate_templates(["doc", "pdf", "missing"])
+
+        assert result == {"doc": doc_info, "pdf": None, "missing": None}
+        self.mock_google_drive.get_files_info.assert_called_once_with(
+            ["doc", "pdf", "missing"]
+        )
+        self.mock_google_drive.get_file_info.assert_not_called()
+
     def test_generate_sow_with_folder_id(self) -> None:
         """Test SOW generation with output folder specified."""
         with (
@@ -212,3 +237,434 @@ class TestSOWGenerator:
             self.generator._process_template(
                 "/tmp/template.docx", context, "/tmp/output.docx"
             )
+
+    @patch("solution_desk_engine.sow.sow_generator.CompiledTemplate")
+    def test_generate_many_downloads_template_once(self, mock_compiled) -> None:
+        """Test batch generation fetches the template a single time."""
+        self.mock_google_drive.upload_docx_as_google_doc.side_effect = [
+            {"id": "doc_1", "web_view_link": "link_1", "name": "SOW 1"},
+            {"id": "doc_2", "web_view_link": "link_2", "name": "SOW 2"},
+        ]
+        items = [
+            SOWBatchItem(SOWContext("Customer A", "Project"), "SOW 1"),
+            SOWBatchItem(SOWContext("Customer B", "Project"), "SOW 2", "folder_b"),
+        ]
+
+        results = self.generator.generate_many(
+            "template_id", items, output_folder_id="default_folder", max_workers=1
+        )
+
+        self.mock_google_drive.download_doc_as_docx.assert_called_once()
+        mock_compiled.assert_called_once()
+        assert mock_compiled.return_value.render.call_count == 2
+        assert [result.success for result in results] == [True, True]
+        assert results[0].document["id"] == "doc_1"
+        folders = [
+            call.args[2]
+            for call in self.mock_google_drive.upload_docx_as_google_doc.call_args_list
+        ]
+        assert folders == ["default_folder", "folder_b"]
+
+    @patch("solution_desk_engine.sow.sow_generator.CompiledTemplate")
+    def test_generate_many_isolates_failures(self, mock_compiled) -> None:
+        """Test a failing row does not stop the rest of the batch."""
+        self.mock_google_drive.upload_docx_as_google_doc.side_effect = [
+            Exception("Upload quota exceeded"),
+            {"id": "doc_2", "web_view_link": "link_2", "name": "SOW 2"},
+        ]
+        items = [
+            SOWBatchItem(SOWContext("Customer A", "Project"), "SOW 1"),
+            SOWBatchItem(SOWContext("Customer B", "Project"), "SOW 2"),
+        ]
+
+        results = self.generator.generate_many("template_id", items, max_workers=1)
+
+        assert results[0].success is False
+        assert "Upload quota exceeded" in results[0].error
+        assert results[1].success is True
+        assert [result.index for result in results] == [0, 1]
+
+    @pytest.mark.parametrize(("thread_safe", "workers"), [(False, 1), (True, 4)])
+    @patch("solution_desk_engine.sow.sow_generator.CompiledTemplate")
+    def test_generate_many_workers_follow_thread_safety(
+        self, mock_compiled, thread_safe: bool, workers: int
+    ) -> None:
+        """Test only a thread-safe Drive client is shared between threads."""
+        self.mock_google_drive.thread_safe = thread_safe
+        self.mock_google_drive.upload_docx_as_google_doc.return_value = {"id": "doc"}
+        items = [SOWBatchItem(SOWContext("Customer", "Project"), "SOW")] * 2
+
+        with patch(
+            "solution_desk_engine.sow.sow_generator.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as mock_executor:
+            results = self.generator.generate_many("template_id", items, max_workers=4)
+
+        assert [result.success for result in results] == [True, True]
+        mock_executor.assert_called_once_with(max_workers=workers)
+
+    def test_generate_many_template_download_error(self) -> None:
+        """Test batch generation fails fast when the template is unavailable."""
+        self.mock_google_drive.download_doc_as_docx.side_effect = Exception("404")
+        items = [SOWBatchItem(SOWContext("Customer", "Project"), "SOW")]
+
+        with pytest.raises(Exception, match="Failed to download SOW template"):
+            self.generator.generate_many("template_id", items)
+
+    def test_generate_many_empty(self) -> None:
+        """Test batch generation with no items does not touch Drive."""
+        assert self.generator.generate_many("template_id", []) == []
+        self.mock_google_drive.download_doc_as_docx.assert_not_called()
+
+
+class TestSOWGeneratorInMemory:
+    """Test cases for SOWGenerator in in-memory mode."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.mock_google_drive = Mock()
+        self.mock_google_drive.download_doc_as_bytes.return_value = b"template"
+        self.generator = SOWGenerator(
+            google_drive_client=self.mock_google_drive, in_memory=True
+        )
+
+    @patch("solution_desk_engine.sow.sow_generator.DocxTemplate")
+    @patch("tempfile.TemporaryDirectory")
+    def test_generate_sow_without_temp_files(
+        self, mock_temp_dir, mock_docx_template
+    ) -> None:
+        """Test in-memory generation never touches the filesystem."""
+        mock_docx_template.return_value.save.side_effect = lambda output: output.write(
+            b"rendered"
+        )
+        expected_result = {"id": "doc_id", "web_view_link": "link", "name": "SOW"}
+        self.mock_google_drive.upload_docx_bytes_as_google_doc.return_value = (
+            expected_result
+        )
+        context = SOWContext("Customer", "Project")
+
+        result = self.generator.generate_sow("template_id", context, "SOW", "folder")
+
+        assert result == expected_result
+        mock_temp_dir.assert_not_called()
+        self.mock_google_drive.download_doc_as_docx.assert_not_called()
+        mock_docx_template.return_value.render.assert_called_once_with(
+            context.to_dict()
+        )
+        self.mock_google_drive.upload_docx_bytes_as_google_doc.assert_called_once_with(
+            b"rendered", "SOW", "folder", deduplicate=False, content_hash=None
+        )
+
+    @patch("solution_desk_engine.sow.sow_generator.DocxTemplate")
+    def test_generate_sow_collects_timings(self, mock_docx_template) -> None:
+        """Test per-stage timings are added to the result when enabled."""
+        mock_docx_template.return_value.save.side_effect = lambda output: output.write(
+            b"rendered"
+        )
+        self.mock_google_drive.upload_docx_bytes_as_google_doc.return_value = {
+            "id": "doc_id"
+        }
+        self.generator.collect_timings = True
+
+        result = self.generator.generate_sow(
+            "template_id", SOWContext("Customer", "Project"), "SOW"
+        )
+
+        stages = result["timings"]["stages"]
+        assert set(stages) == {"metadata", "download", "render", "upload"}
+        assert stages["download"]["bytes"] == len(b"template")
+        assert stages["render"]["bytes"] == len(b"rendered")
+
+    def test_generate_sow_error(self) -> None:
+        """Test in-memory generation wraps download errors."""
+        self.mock_google_drive.download_doc_as_bytes.side_effect = Exception("404")
+
+        with pytest.raises(Exception, match="Failed to generate SOW"):
+            self.generator.generate_sow(
+                "template_id", SOWContext("Customer", "Project"), "SOW"
+            )
+
+    @patch("solution_desk_engine.sow.sow_generator.CompiledTemplate")
+    @patch("tempfile.TemporaryDirectory")
+    def test_generate_many_in_memory(self, mock_temp_dir, mock_compiled) -> None:
+        """Test in-memory batches compile from bytes and upload bytes."""
+        mock_compiled.return_value.render_bytes.return_value = b"rendered"
+        self.mock_google_drive.upload_docx_bytes_as_google_doc.return_value = {
+            "id": "doc_id"
+        }
+        items = [
+            SOWBatchItem(SOWContext("Customer A", "Project"), "SOW 1"),
+            SOWBatchItem(SOWContext("Customer B", "Project"), "SOW 2"),
+        ]
+
+        results = self.generator.generate_many("template_id", items, max_workers=2)
+
+        mock_temp_dir.assert_not_called()
+        mock_compiled.assert_called_once_with(b"template")
+        assert [result.success for result in results] == [True, True]
+        assert self.mock_google_drive.upload_docx_bytes_as_google_doc.call_count == 2
+
+
+class TestSOWGeneratorVariableCheck:
+    """Test cases for pre-flight template variable checks."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.mock_google_drive = Mock()
+        self.mock_google_drive.template_cache = None
+        self.mock_google_drive.get_file_info.return_value = {"modifiedTime": "v1"}
+        self.mock_google_drive.download_doc_as_bytes.return_value = b"template"
+        self.generator = SOWGenerator(
+            google_drive_client=self.mock_google_drive,
+            in_memory=True,
+            check_variables=True,
+        )
+
+    @patch(
+        "solution_desk_engine.sow.sow_generator.extract_template_variables",
+        return_value={"customer_name"},
+    )
+    def test_template_variables_extracted_once_per_version(self, mock_extract) -> None:
+        """Test the schema is memoized by template version."""
+        assert self.generator.get_template_variables("template_id") == {"customer_name"}
+        self.generator.get_template_variables("template_id")
+
+        mock_extract.assert_called_once_with(b"template")
+
+        self.mock_google_drive.get_file_info.return_value = {"modifiedTime": "v2"}
+        self.generator.get_template_variables("template_id")
+        assert mock_extract.call_count == 2
+
+    @patch(
+        "solution_desk_engine.sow.sow_generator.extract_template_variables",
+        return_value={"customer_name"},
+    )
+    @patch("solution_desk_engine.sow.sow_generator.DocxTemplate")
+    def test_checked_generation_downloads_template_once(
+        self, mock_docx_template, mock_extract
+    ) -> None:
+        """Test the template exported for the check is the one rendered."""
+        mock_docx_template.return_value.save.side_effect = lambda output: output.write(
+            b"rendered"
+        )
+        self.mock_google_drive.upload_docx_bytes_as_google_doc.return_value = {}
+
+        self.generator.generate_sow("template_id", SOWContext("Customer", "P"), "SOW")
+
+        self.mock_google_drive.download_doc_as_bytes.assert_called_once_with(
+            "template_id"
+        )
+        assert mock_docx_template.call_args.args[0].getvalue() == b"template"
+
+    @patch(
+        "solution_desk_engine.sow.sow_generator.extract_template_variables",
+        return_value={"customer_name"},
+    )
+    @patch("solution_desk_engine.sow.sow_generator.CompiledTemplate")
+    def test_checked_batch_on_disk_downloads_template_once(
+        self, mock_compiled, mock_extract
+    ) -> None:
+        """Test an on-disk batch renders from the template checked first."""
+        template_contents = []
+
+        def compile_template(path: str) -> None:
+            with open(path, "rb") as f:
+                template_contents.append(f.read())
+
+        mock_compiled.side_effect = compile_template
+        self.generator.in_memory = False
+        items = [SOWBatchItem(SOWContext("Customer", "Project"), "SOW")]
+
+        self.generator.generate_many("template_id", items, max_workers=1)
+
+        self.mock_google_drive.download_doc_as_bytes.assert_called_once()
+        self.mock_google_drive.download_doc_as_docx.assert_not_called()
+        assert template_contents == [b"template"]
+
+    @patch("solution_desk_engine.sow.sow_generator.extract_template_variables")
+    def test_template_variables_from_cached_schema(self, mock_extract) -> None:
+        """Test a cached schema avoids downloading the template."""
+        self.mock_google_drive.template_cache = Mock()
+        self.mock_google_drive.template_cache.get_schema.return_value = ["region"]
+
+        assert self.generator.get_template_variables("template_id") == {"region"}
+        mock_extract.assert_not_called()
+        self.mock_google_drive.download_doc_as_bytes.assert_not_called()
+
+    @patch(
+        "solution_desk_engine.sow.sow_generator.extract_template_variables",
+        return_value={"customer_name", "region"},
+    )
+    @patch("solution_desk_engine.sow.sow_generator.DocxTemplate")
+    def test_generate_sow_rejects_missing_variables(
+        self, mock_docx_template, mock_extract
+    ) -> None:
+        """Test nothing is rendered or uploaded when variables are missing."""
+        with pytest.raises(Exception, match="missing template variables: region"):
+            self.generator.generate_sow(
+                "template_id", SOWContext("Customer", "Project"), "SOW"
+            )
+
+        mock_docx_template.assert_not_called()
+        self.mock_google_drive.upload_docx_bytes_as_google_doc.assert_not_called()
+
+    @patch(
+        "solution_desk_engine.sow.sow_generator.extract_template_variables",
+        return_value={"customer_name", "region"},
+    )
+    @patch("solution_desk_engine.sow.sow_generator.CompiledTemplate")
+    def test_generate_many_reports_invalid_rows(
+        self, mock_compiled, mock_extract
+    ) -> None:
+        """Test invalid rows fail individually and nothing is downloaded."""
+        items = [SOWBatchItem(SOWContext("Customer", "Project"), "SOW")]
+
+        results = self.generator.generate_many("template_id", items, max_workers=1)
+
+        assert results[0].success is False
+        assert "region" in results[0].error
+        mock_compiled.assert_not_called()
+        self.mock_google_drive.upload_docx_bytes_as_google_doc.assert_not_called()
+
+
+class TestSOWGeneratorManifest:
+    """Test cases for idempotent regeneration with a manifest."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.mock_google_drive = Mock()
+        self.mock_google_drive.get_file_info.return_value = {"modifiedTime": "v1"}
+        self.mock_google_drive.download_doc_as_bytes.return_value = b"template"
+        self.mock_google_drive.upload_docx_bytes_as_google_doc.side_effect = (
+            lambda content, name, folder, **kwargs: {"id": "new_doc", "name": name}
+        )
+        self.mock_google_drive.update_google_doc_from_docx_bytes.side_effect = (
+            lambda file_id, content, **kwargs: {"id": file_id, "name": "SOW"}
+        )
+
+    def _generator(self, tmp_path) -> SOWGenerator:
+        """Create an in-memory generator with a manifest under tmp_path."""
+        return SOWGenerator(
+            google_drive_client=self.mock_google_drive,
+            in_memory=True,
+            manifest=GenerationManifest(tmp_path / "manifest.json"),
+        )
+
+    @patch("solution_desk_engine.sow.sow_generator.DocxTemplate")
+    def test_unchanged_rerun_is_noop(self, mock_docx_template, tmp_path) -> None:
+        """Test re-running with identical inputs skips render and upload."""
+        context = SOWContext("Customer", "Project")
+
+        first = self._generator(tmp_path).generate_sow("tpl", context, "SOW")
+        second = self._generator(tmp_path).generate_sow("tpl", context, "SOW")
+
+        assert first["status"] == "created"
+        assert second == {"id": "new_doc", "name": "SOW", "status": "unchanged"}
+        assert mock_docx_template.call_count == 1
+        self.mock_google_drive.upload_docx_bytes_as_google_doc.assert_called_once()
+        self.mock_google_drive.download_doc_as_bytes.assert_called_once()
+
+    @patch("solution_desk_engine.sow.sow_generator.DocxTemplate")
+    def test_changed_context_updates_in_place(
+        self, mock_docx_template, tmp_path
+    ) -> None:
+        """Test a changed context updates the existing document."""
+        generator = self._generator(tmp_path)
+        generator.generate_sow("tpl", SOWContext("Customer", "Project"), "SOW")
+
+        result = generator.generate_sow(
+            "tpl", SOWContext("Customer", "Project", max_total_cost="$1"), "SOW"
+        )
+
+        assert result["status"] == "updated"
+        self.mock_google_drive.update_google_doc_from_docx_bytes.assert_called_once()
+        assert (
+            self.mock_google_drive.update_google_doc_from_docx_bytes.call_args.args[0]
+            == "new_doc"
+        )
+        self.mock_google_drive.upload_docx_bytes_as_google_doc.assert_called_once()
+
+    @patch("solution_desk_engine.sow.sow_generator.DocxTemplate")
+    def test_force_updates_unchanged_output(self, mock_docx_template, tmp_path) -> None:
+        """Test force regenerates an unchanged output in place."""
+        generator = self._generator(tmp_path)
+        context = SOWContext("Customer", "Project")
+        generator.generate_sow("tpl", context, "SOW")
+
+        result = generator.generate_sow("tpl", context, "SOW", force=True)
+
+        assert result["status"] == "updated"
+
+    @patch("solution_desk_engine.sow.sow_generator.DocxTemplate")
+    def test_deleted_document_is_recreated(self, mock_docx_template, tmp_path) -> None:
+        """Test an update of a deleted doc falls back to creating a new doc."""
+        generator = self._generator(tmp_path)
+        generator.generate_sow("tpl", SOWContext("Customer", "Project"), "SOW")
+        self.mock_google_drive.get_file_info.return_value = {"modifiedTime": "v2"}
+        self.mock_google_drive.update_google_doc_from_docx_bytes.side_effect = (
+            HttpError(httplib2.Response({"status": "404"}), b"File not found")
+        )
+
+        result = generator.generate_sow("tpl", SOWContext("Customer", "Project"), "SOW")
+
+        assert result["status"] == "created"
+        assert self.mock_google_drive.upload_docx_bytes_as_google_doc.call_count == 2
+
+    @patch("solution_desk_engine.sow.sow_generator.DocxTemplate")
+    def test_failed_update_does_not_create(self, mock_docx_template, tmp_path) -> None:
+        """Test an update failing for another reason creates no duplicate."""
+        generator = self._generator(tmp_path)
+        generator.generate_sow("tpl", SOWContext("Customer", "Project"), "SOW")
+        self.mock_google_drive.get_file_info.return_value = {"modifiedTime": "v2"}
+        self.mock_google_drive.update_google_doc_from_docx_bytes.side_effect = (
+            HttpError(httplib2.Response({"status": "500"}), b"Backend error")
+        )
+
+        with pytest.raises(Exception, match="Backend error"):
+            generator.generate_sow("tpl", SOWContext("Customer", "Project"), "SOW")
+
+        self.mock_google_drive.upload_docx_bytes_as_google_doc.assert_called_once()
+
+    @patch("solution_desk_engine.sow.sow_generator.DocxTemplate")
+    def test_deduplicate_stamps_input_fingerprint(self, mock_docx_template) -> None:
+        """Test uploads are deduplicated on inputs, not on rendered bytes."""
+        generator = SOWGenerator(
+            google_drive_client=self.mock_google_drive,
+            in_memory=True,
+            deduplicate=True,
+        )
+        context = SOWContext("Customer", "Project")
+
+        first = generator.generate_sow("tpl", context, "SOW", "folder")
+        generator.generate_sow("tpl", context, "SOW", "folder", force=True)
+
+        upload = self.mock_google_drive.upload_docx_bytes_as_google_doc
+        fingerprint = GenerationManifest.fingerprint("v1", context.to_dict())
+        assert "status" not in first
+        assert upload.call_args_list[0].kwargs == {
+            "deduplicate": True,
+            "content_hash": fingerprint,
+        }
+        assert upload.call_args_list[1].kwargs == {
+            "deduplicate": False,
+            "content_hash": fingerprint,
+        }
+
+    @patch("solution_desk_engine.sow.sow_generator.CompiledTemplate")
+    def test_generate_many_skips_unchanged(self, mock_compiled, tmp_path) -> None:
+        """Test a fully unchanged batch does not download the template."""
+        mock_compiled.return_value.render_bytes.return_value = b"rendered"
+        items = [
+            SOWBatchItem(SOWContext("Customer A", "Project"), "SOW A"),
+            SOWBatchItem(SOWContext("Customer B", "Project"), "SOW B"),
+        ]
+        self._generator(tmp_path).generate_many("tpl", items, max_workers=1)
+
+        results = self._generator(tmp_path).generate_many("tpl", items, max_workers=1)
+
+        assert [result.document["status"] for result in results] == [
+            "unchanged",
+            "unchanged",
+        ]
+        self.mock_google_drive.download_doc_as_bytes.assert_called_once()
+        assert self.mock_google_drive.upload_docx_bytes_as_google_doc.call_count == 2
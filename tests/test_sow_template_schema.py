@@ -0,0 +1,60 @@
+"""Tests for template variable introspection and context validation."""
+
+import io
+from pathlib import Path
+
+from docx import Document  # type: ignore
+
+from solution_desk_engine.sow.template_schema import (
+    extract_template_variables,
+    validate_context,
+)
+
+
+def _template_bytes() -> bytes:
+    """Build a DOCX template using body and header variables."""
+    doc = Document()
+    doc.add_paragraph("SOW for {{ customer_name }} ({{ project_name }})")
+    doc.add_paragraph("{% if special_terms %}{{ special_terms }}{% endif %}")
+    doc.sections[0].header.paragraphs[0].text = "{{ region }}"
+    output = io.BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+class TestTemplateSchema:
+    """Test cases for template schema helpers."""
+
+    def test_extract_from_bytes(self) -> None:
+        """Test variables are extracted from body and headers."""
+        assert extract_template_variables(_template_bytes()) == {
+            "customer_name",
+            "project_name",
+            "special_terms",
+            "region",
+        }
+
+    def test_extract_from_path(self, tmp_path: Path) -> None:
+        """Test variables are extracted from a template file."""
+        template_path = tmp_path / "template.docx"
+        template_path.write_bytes(_template_bytes())
+
+        assert "region" in extract_template_variables(str(template_path))
+
+    def test_validate_context(self) -> None:
+        """Test missing and blank variables are reported separately."""
+        result = validate_context(
+            {"customer_name", "project_name", "region"},
+            {"customer_name": "Penske", "project_name": ""},
+        )
+
+        assert result.missing == ["region"]
+        assert result.blank == ["project_name"]
+        assert result.is_valid is False
+
+    def test_validate_complete_context(self) -> None:
+        """Test a context providing every variable is valid."""
+        result = validate_context({"customer_name"}, {"customer_name": "Penske"})
+
+        assert result.is_valid is True
+        assert result.blank == []
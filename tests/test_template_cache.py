@@ -0,0 +1,101 @@
+"""Tests for the on-disk template cache."""
+
+import os
+from pathlib import Path
+
+from solution_desk_engine.integrations.template_cache import TemplateCache
+
+
+class TestTemplateCache:
+    """Test cases for TemplateCache."""
+
+    def _source(self, tmp_path: Path, name: str, size: int) -> str:
+        """Create a source DOCX of the given size."""
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        return str(path)
+
+    def test_default_cache_dir(self) -> None:
+        """Test default cache location."""
+        cache = TemplateCache()
+        assert cache.cache_dir == Path(
+            os.path.expanduser("~/.solution-desk-engine/cache/templates")
+        )
+
+    def test_miss_then_hit(self, tmp_path: Path) -> None:
+        """Test cached exports are keyed by file ID and version."""
+        cache = TemplateCache(tmp_path / "cache")
+        source = self._source(tmp_path, "template.docx", 10)
+
+        assert cache.get("file_id", "2025-01-01T00:00:00Z") is None
+
+        cache.put("file_id", "2025-01-01T00:00:00Z", source)
+
+        cached = cache.get("file_id", "2025-01-01T00:00:00Z")
+        assert cached is not None
+        assert cached.read_bytes() == b"x" * 10
+        assert cache.get("file_id", "2025-02-01T00:00:00Z") is None
+        assert cache.get("other_id", "2025-01-01T00:00:00Z") is None
+
+    def test_new_version_replaces_old(self, tmp_path: Path) -> None:
+        """Test storing a new version drops the stale export."""
+        cache = TemplateCache(tmp_path / "cache")
+        source = self._source(tmp_path, "template.docx", 10)
+
+        cache.put("file_id", "v1", source)
+        cache.put("file_id", "v2", source)
+
+        assert cache.get("file_id", "v1") is None
+        assert cache.get("file_id", "v2") is not None
+        assert cache.size() == 10
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test least recently used entries are evicted over the size limit."""
+        cache = TemplateCache(tmp_path / "cache", max_size_bytes=25)
+        source = self._source(tmp_path, "template.docx", 10)
+
+        first = cache.put("first", "v1", source)
+        second = cache.put("second", "v1", source)
+        os.utime(first, (1, 1))
+        os.utime(second, (2, 2))
+        cache.get("first", "v1")  # Mark first as recently used
+
+        cache.put("third", "v1", source)
+
+        assert cache.get("first", "v1") is not None
+        assert cache.get("second", "v1") is None
+        assert cache.get("third", "v1") is not None
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test clearing the cache removes every entry."""
+        cache = TemplateCache(tmp_path / "cache")
+        source = self._source(tmp_path, "template.docx", 10)
+        cache.put("first", "v1", source)
+        cache.put("second", "v1", source)
+
+        assert cache.clear() == 2
+        assert cache.size() == 0
+        assert cache.clear() == 0
+
+    def test_schema_round_trip(self, tmp_path: Path) -> None:
+        """Test variable schemas are cached per template version."""
+        cache = TemplateCache(tmp_path / "cache")
+
+        assert cache.get_schema("file_id", "v1") is None
+        assert cache.get_latest_schema("file_id") is None
+
+        cache.put_schema("file_id", "v1", {"project_name", "customer_name"})
+
+        assert cache.get_schema("file_id", "v1") == ["customer_name", "project_name"]
+        assert cache.get_schema("file_id", "v2") is None
+        assert cache.get_latest_schema("file_id") == ["customer_name", "project_name"]
+
+    def test_new_export_version_drops_stale_schema(self, tmp_path: Path) -> None:
+        """Test caching a newer export removes the older version's schema."""
+        cache = TemplateCache(tmp_path / "cache")
+        cache.put_schema("file_id", "v1", {"customer_name"})
+
+        cache.put_bytes("file_id", "v2", b"new export")
+
+        assert cache.get_latest_schema("file_id") is None
+        assert cache.get("file_id", "v2") is not None
@@ -0,0 +1,63 @@
+"""Tests for per-stage timing instrumentation."""
+
+import json
+from pathlib import Path
+
+from solution_desk_engine.timing import (
+    StageTimer,
+    append_timings_record,
+    timed_stage,
+)
+
+
+class TestStageTimer:
+    """Test cases for StageTimer."""
+
+    def test_stages_accumulate_calls_and_bytes(self) -> None:
+        """Test repeated stages are summed into one entry."""
+        timer = StageTimer()
+
+        with timer.activate():
+            with timed_stage("drive.export") as stage:
+                stage.add_bytes(100)
+            with timed_stage("drive.export") as stage:
+                stage.add_bytes(50)
+
+        timings = timer.as_dict()
+        assert timings["stages"]["drive.export"]["calls"] == 2
+        assert timings["stages"]["drive.export"]["bytes"] == 150
+        assert timings["total_seconds"] >= timings["stages"]["drive.export"]["seconds"]
+
+    def test_timed_stage_without_active_timer_is_noop(self) -> None:
+        """Test measurements are discarded when no timer is active."""
+        timer = StageTimer()
+
+        with timed_stage("render") as stage:
+            stage.add_bytes(10)
+
+        assert timer.as_dict()["stages"] == {}
+
+    def test_failed_stage_is_still_recorded(self) -> None:
+        """Test a stage raising an exception still counts its time."""
+        timer = StageTimer()
+
+        with timer.activate():
+            try:
+                with timed_stage("upload"):
+                    raise RuntimeError("boom")
+            except RuntimeError:
+                pass
+
+        assert timer.as_dict()["stages"]["upload"]["calls"] == 1
+
+
+def test_append_timings_record(tmp_path: Path) -> None:
+    """Test timings are appended as JSON lines."""
+    log_path = tmp_path / "logs" / "timings.jsonl"
+
+    append_timings_record(log_path, {"template_id": "a", "timings": {}})
+    append_timings_record(log_path, {"template_id": "b", "timings": {}})
+
+    records = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert [record["template_id"] for record in records] == ["a", "b"]
+    assert "timestamp" in records[0]